@@ -1,7 +1,7 @@
 """Abstract base class for Beads client implementations."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .models import BeadsStatus, BeadsTask, BeadsTaskCreate
 
@@ -101,6 +101,30 @@ class BeadsClient(ABC):
         """
         pass
 
+    def iter_tasks(
+        self,
+        status: Optional[BeadsStatus] = None,
+        parent_id: Optional[str] = None,
+        page_size: int = 500,
+    ) -> Iterator[BeadsTask]:
+        """Iterate tasks lazily with optional filters.
+
+        Unlike list_tasks(), implementations build tasks a page at a time,
+        so memory stays flat on large databases and callers can stop early.
+        The default implementation falls back to list_tasks().
+
+        Args:
+            status: Filter by status
+            parent_id: Filter by parent ID (for sub-tasks)
+            page_size: Tasks built per page
+
+        Yields:
+            Matching tasks
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size}")
+        yield from self.list_tasks(status=status, parent_id=parent_id)
+
     @abstractmethod
     def update_metadata(self, task_id: str, metadata: dict[str, object]) -> None:
         """Update task metadata.
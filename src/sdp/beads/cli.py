@@ -3,10 +3,11 @@
 import json
 import subprocess
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 from .base import BeadsClient
 from .exceptions import BeadsClientError
+from .json_stream import run_json_array
 from .models import BeadsStatus, BeadsTask, BeadsTaskCreate
 
 
@@ -137,14 +138,7 @@ class CLIBeadsClient(BeadsClient):
         Example:
             bd list --status open --json
         """
-        cmd = ["bd", "list", "--json"]
-
-        if status:
-            cmd.extend(["--status", status.value])
-
-        if parent_id:
-            cmd.extend(["--parent", parent_id])
-
+        cmd = self._list_command(status, parent_id)
         result = self._run_command(cmd, capture_output=True)
         data = json.loads(result.stdout)
         # bd list --json returns array directly
@@ -153,6 +147,33 @@ class CLIBeadsClient(BeadsClient):
         else:
             return [BeadsTask.from_dict(t) for t in data.get("tasks", [])]
 
+    def iter_tasks(
+        self,
+        status: Optional[BeadsStatus] = None,
+        parent_id: Optional[str] = None,
+        page_size: int = 500,
+    ) -> Iterator[BeadsTask]:
+        """Stream tasks from ``bd list --json``.
+
+        The JSON array is decoded incrementally as bd writes it and tasks
+        are built ``page_size`` at a time, so memory does not grow with
+        the database. Closing the iterator early terminates bd.
+
+        Example:
+            for task in client.iter_tasks(status=BeadsStatus.OPEN):
+                ...
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size}")
+
+        page: List[dict[str, Any]] = []
+        for item in run_json_array(self._list_command(status, parent_id), self.project_dir):
+            page.append(item)
+            if len(page) >= page_size:
+                yield from (BeadsTask.from_dict(t) for t in page)
+                page = []
+        yield from (BeadsTask.from_dict(t) for t in page)
+
     def update_metadata(self, task_id: str, metadata: dict[str, Any]) -> None:
         """Update task metadata via Beads CLI.
 
@@ -162,6 +183,20 @@ class CLIBeadsClient(BeadsClient):
         cmd = ["bd", "update", task_id, "--metadata", json.dumps(metadata)]
         self._run_command(cmd)
 
+    def _list_command(
+        self, status: Optional[BeadsStatus], parent_id: Optional[str]
+    ) -> List[str]:
+        """Build the ``bd list`` command for the given filters."""
+        cmd = ["bd", "list", "--json"]
+
+        if status:
+            cmd.extend(["--status", status.value])
+
+        if parent_id:
+            cmd.extend(["--parent", parent_id])
+
+        return cmd
+
     def _run_command(
         self, cmd: List[str], capture_output: bool = False
     ) -> subprocess.CompletedProcess[str]:
@@ -5,6 +5,7 @@ This module is split into smaller modules for better maintainability.
 Import from sub-modules:
 - models: ExecutionMode, OneshotResult
 - destructive: DestructiveOperations, DestructiveOperationDetector
+- destructive_rules: DestructiveRule, DestructiveFinding, RULE_PACKS
 - audit: AuditLogEntry, AuditLogger
 
 This module remains for backward compatibility.
@@ -12,6 +13,7 @@ This module remains for backward compatibility.
 
 from .audit import AuditLogEntry, AuditLogger  # noqa: F401
 from .destructive import DestructiveOperationDetector, DestructiveOperations  # noqa: F401
+from .destructive_rules import DestructiveFinding, DestructiveRule  # noqa: F401
 from .models import ExecutionMode, OneshotResult  # noqa: F401
 
 __all__ = [
@@ -19,6 +21,8 @@ __all__ = [
     "OneshotResult",
     "DestructiveOperations",
     "DestructiveOperationDetector",
+    "DestructiveRule",
+    "DestructiveFinding",
     "AuditLogEntry",
     "AuditLogger",
 ]
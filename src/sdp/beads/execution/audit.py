@@ -2,15 +2,33 @@
 Audit logging for execution tracking.
 
 Tracks execution history for compliance and debugging.
+
+The active log is a JSONL file. Once it exceeds ``max_bytes`` or its
+first entry is older than ``rotate_after``, it is gzipped into a numbered,
+indexed segment (see ``audit_segments``). Recent reads seek backwards
+from the end of the active file, and time-range reads only open segments
+whose range overlaps the query, so both stay bounded as history grows.
 """
 
 import json
+import os
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, List, Optional
 
+from .audit_segments import AuditSegments, as_utc, first_timestamp, parse_timestamp, tail_lines
+from .audit_segments import read_segment as _read_segment
 from .models import ExecutionMode
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_ROTATE_AFTER = timedelta(days=7)
+
 
 @dataclass
 class AuditLogEntry:
@@ -40,13 +58,29 @@ class AuditLogEntry:
 class AuditLogger:
     """Audit logger for tracking --auto-approve executions."""
 
-    def __init__(self, audit_file: str = ".sdp/audit.log"):
+    def __init__(
+        self,
+        audit_file: str = ".sdp/audit.log",
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        rotate_after: Optional[timedelta] = DEFAULT_ROTATE_AFTER,
+        keep_segments: Optional[int] = None,
+    ):
         """Initialize audit logger.
 
         Args:
             audit_file: Path to audit log file
+            max_bytes: Rotate once the active file reaches this size (None = never)
+            rotate_after: Rotate once the oldest active entry is this old (None = never)
+            keep_segments: Delete the oldest rotated segments beyond this
+                many (None = keep all)
         """
         self.audit_file = audit_file
+        self.max_bytes = max_bytes
+        self.rotate_after = rotate_after
+        self.keep_segments = keep_segments
+        self.segments = AuditSegments(audit_file, keep_segments)
+        self.index_file = self.segments.index_file
+        self.lock_file = f"{audit_file}.lock"
 
     def log_execution(
         self,
@@ -68,7 +102,6 @@ class AuditLogger:
             deployment_target: Deployment target ("production" or "sandbox")
         """
         import getpass
-        import os
 
         # Ensure audit directory exists
         os.makedirs(
@@ -81,8 +114,9 @@ class AuditLogger:
             user = getpass.getuser()
 
         # Create log entry
+        now = datetime.now(timezone.utc)
         entry = AuditLogEntry(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=now.isoformat(),
             user=user,
             feature=feature_id,
             mode=mode.value,
@@ -91,27 +125,116 @@ class AuditLogger:
             deployment_target=deployment_target,
         )
 
-        # Append to audit log
-        with open(self.audit_file, "a") as f:
-            f.write(json.dumps(entry.to_dict()) + "\n")
+        # Append to audit log, rotating first if the active file is due
+        with self._locked():
+            if self._rotation_due(now):
+                self.segments.rotate()
+            with open(self.audit_file, "a") as f:
+                f.write(json.dumps(entry.to_dict()) + "\n")
 
     def read_recent(self, count: int = 10) -> List[dict[str, Any]]:
         """Read recent audit log entries.
 
+        Reads backwards from the end of the active file in fixed-size
+        blocks, continuing into the newest segments only if the active
+        file holds fewer than ``count`` entries.
+
         Args:
             count: Number of recent entries to read
 
         Returns:
             List of audit log entries (most recent last)
         """
+        if count <= 0:
+            return []
+
+        lines = tail_lines(self.audit_file, count)
+        if len(lines) >= count:
+            return [json.loads(line) for line in lines]
+
+        for segment, _ in reversed(self.segments.list()):
+            if len(lines) >= count:
+                break
+            older = _read_segment(self.segments.path(segment))
+            lines = older[-(count - len(lines)) :] + lines
+
+        return [json.loads(line) for line in lines]
+
+    def read_between(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List[dict[str, Any]]:
+        """Read entries with start <= timestamp <= end, oldest first.
+
+        Only segments whose indexed time range overlaps the query are
+        decompressed.
+
+        Args:
+            start: Earliest timestamp (None = unbounded, naive = UTC)
+            end: Latest timestamp (None = unbounded, naive = UTC)
+
+        Returns:
+            Matching audit log entries (most recent last)
+        """
+        start = as_utc(start) if start else None
+        end = as_utc(end) if end else None
+
+        def overlaps(first: datetime, last: datetime) -> bool:
+            return (start is None or last >= start) and (end is None or first <= end)
+
+        lines: List[str] = []
+        for segment, (first, last) in self.segments.list():
+            if overlaps(first, last):
+                lines.extend(_read_segment(self.segments.path(segment)))
         try:
             with open(self.audit_file, "r") as f:
-                lines = f.readlines()
+                lines.extend(line for line in f if line.strip())
+        except FileNotFoundError:
+            pass
 
-            # Get last N lines
-            recent_lines = lines[-count:] if len(lines) >= count else lines
+        entries = []
+        for line in lines:
+            entry = json.loads(line)
+            timestamp = parse_timestamp(entry["timestamp"])
+            if overlaps(timestamp, timestamp):
+                entries.append(entry)
+        return entries
 
-            return [json.loads(line.strip()) for line in recent_lines if line.strip()]
+    def rotate(self) -> Optional[str]:
+        """Force rotation of the active file.
 
+        Returns:
+            Path of the new gzipped segment, or None if nothing to rotate
+        """
+        with self._locked():
+            return self.segments.rotate()
+
+    def _rotation_due(self, now: datetime) -> bool:
+        """Whether the active file must be rotated before the next append."""
+        try:
+            size = os.path.getsize(self.audit_file)
         except FileNotFoundError:
-            return []
+            return False
+        if size == 0:
+            return False
+        if self.max_bytes is not None and size >= self.max_bytes:
+            return True
+        if self.rotate_after is not None:
+            first = first_timestamp(self.audit_file)
+            return first is not None and now - first >= self.rotate_after
+        return False
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive advisory lock for append and rotation."""
+        if fcntl is None:
+            yield
+            return
+
+        os.makedirs(os.path.dirname(self.lock_file) or ".", exist_ok=True)
+        with open(self.lock_file, "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
@@ -0,0 +1,196 @@
+"""
+Rotated audit log segments.
+
+Rotation gzips the active JSONL file into a numbered segment
+(``audit.log.000001.gz``, ...) and appends the segment's time range to a
+sparse index (``audit.log.idx``), so time-range reads can skip segments
+that cannot match.
+"""
+
+import gzip
+import json
+import os
+import re
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+TAIL_BLOCK_SIZE = 8192
+
+Segment = Tuple[str, Tuple[datetime, datetime]]
+
+
+class AuditSegments:
+    """Gzipped segments of an audit log and their time index.
+
+    Not locked: callers serialize rotation (see AuditLogger).
+    """
+
+    def __init__(self, audit_file: str, keep_segments: Optional[int] = None) -> None:
+        """Initialize segment store.
+
+        Args:
+            audit_file: Path of the active audit log
+            keep_segments: Delete the oldest segments beyond this many (None = keep all)
+        """
+        self.audit_file = audit_file
+        self.keep_segments = keep_segments
+        self.index_file = f"{audit_file}.idx"
+
+    def path(self, name: str) -> str:
+        """Path of a segment."""
+        return f"{self.audit_file}.{name}.gz"
+
+    def rotate(self) -> Optional[str]:
+        """Gzip the active file into the next segment and index it.
+
+        Returns:
+            Path of the new segment, or None if the active file is empty
+        """
+        try:
+            with open(self.audit_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        lines = [line for line in data.decode().splitlines() if line.strip()]
+        if not lines:
+            return None
+
+        segments = self.list()
+        number = int(segments[-1][0]) + 1 if segments else 1
+        name = f"{number:06d}"
+        segment_path = self.path(name)
+
+        tmp_path = f"{segment_path}.tmp"
+        with open(tmp_path, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                gz.write(data)
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, segment_path)
+
+        first = json.loads(lines[0])["timestamp"]
+        last = json.loads(lines[-1])["timestamp"]
+        self._append_index(name, first, last)
+        os.remove(self.audit_file)
+
+        if self.keep_segments is not None:
+            self._prune(segments + [(name, (parse_timestamp(first), parse_timestamp(last)))])
+        return segment_path
+
+    def list(self) -> List[Segment]:
+        """Indexed segments, oldest first, as (name, (first, last))."""
+        segments = {}
+        try:
+            with open(self.index_file, "r") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    segments[record["segment"]] = (
+                        parse_timestamp(record["first"]),
+                        parse_timestamp(record["last"]),
+                    )
+        except FileNotFoundError:
+            pass
+
+        # Segments the index doesn't know about (e.g. index lost) are scanned
+        # once and added to the index
+        for name in self._names():
+            if name not in segments:
+                lines = read_segment(self.path(name))
+                if lines:
+                    first = json.loads(lines[0])["timestamp"]
+                    last = json.loads(lines[-1])["timestamp"]
+                    self._append_index(name, first, last)
+                    segments[name] = (parse_timestamp(first), parse_timestamp(last))
+        return sorted(
+            (item for item in segments.items() if os.path.exists(self.path(item[0]))),
+            key=lambda item: item[0],
+        )
+
+    def _append_index(self, name: str, first: str, last: str) -> None:
+        """Record a segment's time range in the index."""
+        with open(self.index_file, "a") as f:
+            f.write(json.dumps({"segment": name, "first": first, "last": last}) + "\n")
+
+    def _prune(self, segments: List[Segment]) -> None:
+        """Drop the oldest segments beyond keep_segments."""
+        assert self.keep_segments is not None
+        drop = len(segments) - self.keep_segments
+        if drop <= 0:
+            return
+        for segment, _ in segments[:drop]:
+            try:
+                os.remove(self.path(segment))
+            except FileNotFoundError:
+                pass
+        tmp_path = f"{self.index_file}.tmp"
+        with open(tmp_path, "w") as f:
+            for segment, (first, last) in segments[drop:]:
+                record = {"segment": segment, "first": first.isoformat(), "last": last.isoformat()}
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, self.index_file)
+
+    def _names(self) -> List[str]:
+        """Names of gzipped segments on disk."""
+        directory = os.path.dirname(self.audit_file) or "."
+        pattern = re.compile(re.escape(os.path.basename(self.audit_file)) + r"\.(\d{6})\.gz$")
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+        return sorted(m.group(1) for m in map(pattern.match, names) if m)
+
+
+def tail_lines(path: str, count: int) -> List[str]:
+    """Return the last ``count`` non-empty lines, reading backwards in blocks."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return []
+
+    with f:
+        position = f.seek(0, os.SEEK_END)
+        head = b""  # Possibly partial first line of what has been read
+        lines: List[bytes] = []
+        while position > 0 and len(lines) < count:
+            step = min(TAIL_BLOCK_SIZE, position)
+            position -= step
+            f.seek(position)
+            head, *complete = (f.read(step) + head).split(b"\n")
+            lines = [line for line in complete if line.strip()] + lines
+        if position == 0 and head.strip():
+            lines.insert(0, head)
+
+    return [line.decode() for line in lines[-count:]]
+
+
+def read_segment(path: str) -> List[str]:
+    """Non-empty lines of a gzipped segment."""
+    try:
+        with gzip.open(path, "rt") as f:
+            return [line for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def first_timestamp(path: str) -> Optional[datetime]:
+    """Timestamp of the first entry in a JSONL file (None if unreadable)."""
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    return parse_timestamp(json.loads(line)["timestamp"])
+                except (ValueError, KeyError, TypeError):
+                    return None
+    return None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an entry timestamp (naive = UTC)."""
+    return as_utc(datetime.fromisoformat(value))
+
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -2,10 +2,22 @@
 Destructive operations detection.
 
 Identifies potentially dangerous operations that require user confirmation.
+
+Created and deleted files are judged by path; added content is checked
+against the rule packs of destructive_rules.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+import re
+from dataclasses import dataclass, field
+from typing import Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .destructive_rules import (  # noqa: F401
+    DEFAULT_RULE_PACKS,
+    RULE_PACKS,
+    DestructiveFinding,
+    DestructiveRule,
+    load_rule_matcher,
+)
 
 
 @dataclass
@@ -16,23 +28,47 @@ class DestructiveOperations:
     operation_types: List[str]
     files_affected: List[str]
     details: Optional[str] = None
+    findings: List[DestructiveFinding] = field(default_factory=list)
+
+
+_MIGRATION_PATH = re.compile(
+    r"(?:^|/)(?:migrations?|alembic)(?:/|$)|(?:^|/)[^/]*migration[^/]*\.(?:py|sql)$",
+    re.IGNORECASE,
+)
 
 
 class DestructiveOperationDetector:
     """Detect destructive operations that require user confirmation."""
 
-    # Patterns that indicate destructive operations
+    # Keywords for task titles/descriptions (see oneshot.destructive_checker)
     DESTRUCTIVE_PATTERNS = {
         "database_migration": ["migration", "migrate", "schema", "alembic"],
         "file_deletion": ["delete", "remove", "rm"],
         "data_loss": ["drop", "truncate", "wipe"],
     }
 
+    def __init__(
+        self,
+        rule_packs: Sequence[str] = DEFAULT_RULE_PACKS,
+        extra_rules: Sequence[DestructiveRule] = (),
+    ):
+        """Initialize detector.
+
+        Args:
+            rule_packs: Names of RULE_PACKS to apply
+            extra_rules: Additional project-specific rules
+
+        Raises:
+            ValueError: If a rule pack name is unknown
+        """
+        self._matcher = load_rule_matcher(tuple(rule_packs), tuple(extra_rules))
+
     def check_operations(
         self,
         files_to_create: List[str],
         files_to_modify: List[str],
         files_to_delete: List[str],
+        changes: Optional[Mapping[str, str]] = None,
     ) -> DestructiveOperations:
         """Check if operations are destructive.
 
@@ -40,12 +76,54 @@ class DestructiveOperationDetector:
             files_to_create: List of file paths to be created
             files_to_modify: List of file paths to be modified
             files_to_delete: List of file paths to be deleted
+            changes: Added text per path (full content of a created file,
+                added lines of a modified one). Files without an entry
+                are judged by path only.
 
         Returns:
             DestructiveOperations with check result
         """
-        operation_types = []
-        files_affected = []
+        changes = changes or {}
+        added = (
+            (path, changes[path], 1)
+            for path in [*files_to_create, *files_to_modify]
+            if path in changes
+        )
+        return self._classify(files_to_create, files_to_delete, added)
+
+    def check_diff(self, diff: str) -> DestructiveOperations:
+        """Check a unified diff (``git diff`` output) in one pass.
+
+        Created, modified and deleted files are taken from the diff
+        headers; only added lines of each hunk are scanned.
+
+        Args:
+            diff: Unified diff text
+
+        Returns:
+            DestructiveOperations with check result and line-level findings
+        """
+        created: List[str] = []
+        deleted: List[str] = []
+        hunks: List[Tuple[str, str, int]] = []
+        for path, status, hunk_lines in _iter_diff_files(diff):
+            if status == "deleted":
+                deleted.append(path)
+                continue
+            if status == "created":
+                created.append(path)
+            hunks.extend((path, text, line) for line, text in hunk_lines)
+        return self._classify(created, deleted, iter(hunks))
+
+    def _classify(
+        self,
+        files_to_create: List[str],
+        files_to_delete: List[str],
+        added: Iterator[Tuple[str, str, int]],
+    ) -> DestructiveOperations:
+        """Combine path checks with content findings."""
+        operation_types: List[str] = []
+        files_affected: List[str] = []
 
         # Check file deletions (always destructive)
         if files_to_delete:
@@ -58,34 +136,96 @@ class DestructiveOperationDetector:
                 operation_types.append("database_migration")
                 files_affected.append(file_path)
 
-        # Check for destructive patterns in modified files
-        for file_path in files_to_modify:
-            if self._has_destructive_changes(file_path):
-                operation_types.append("data_loss")
-                files_affected.append(file_path)
+        # Check added content against the rule packs
+        findings: List[DestructiveFinding] = []
+        for file_path, text, first_line in added:
+            findings.extend(self._matcher.scan(file_path, text, first_line))
+        for finding in findings:
+            operation_types.append(finding.category)
+            files_affected.append(finding.file_path)
 
+        operation_types = list(dict.fromkeys(operation_types))  # Deduplicate
         return DestructiveOperations(
             has_destructive_operations=len(operation_types) > 0,
-            operation_types=list(set(operation_types)),  # Deduplicate
-            files_affected=list(set(files_affected)),  # Deduplicate
+            operation_types=operation_types,
+            files_affected=list(dict.fromkeys(files_affected)),
             details=f"Found {len(operation_types)} destructive operation types",
+            findings=findings,
         )
 
     def _is_database_migration(self, file_path: str) -> bool:
         """Check if file is a database migration."""
-        path_lower = file_path.lower()
-        return any(
-            pattern in path_lower
-            for patterns in self.DESTRUCTIVE_PATTERNS.values()
-            for pattern in patterns
-            if pattern in path_lower
-        )
-
-    def _has_destructive_changes(self, file_path: str) -> bool:
-        """Check if file modification involves destructive changes."""
-        # Simplified check - in real implementation would read file content
-        path_lower = file_path.lower()
-        return any(
-            pattern in path_lower
-            for pattern in self.DESTRUCTIVE_PATTERNS.get("data_loss", [])
-        )
+        return _MIGRATION_PATH.search(file_path.replace("\\", "/")) is not None
+
+
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+
+
+def _iter_diff_files(diff: str) -> Iterator[Tuple[str, str, List[Tuple[int, str]]]]:
+    """Yield (path, status, added hunks) per file of a unified diff.
+
+    Status is "created", "modified" or "deleted". Each added hunk is
+    (first new-file line number, consecutive added lines).
+    """
+    parser = _DiffFile(None)
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            if parser.path is not None:
+                yield parser.finish()
+            parser = _DiffFile(line.rsplit(" b/", 1)[-1])
+        elif line.startswith("@@"):
+            parser.start_hunk(line)
+        elif parser.in_hunk:
+            parser.hunk_line(line)
+        else:
+            parser.header_line(line)
+    if parser.path is not None:
+        yield parser.finish()
+
+
+class _DiffFile:
+    """Parse state for one file section of a unified diff."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.status = "modified"
+        self.in_hunk = False
+        self.hunks: List[Tuple[int, str]] = []
+        self._run: List[str] = []
+        self._run_start = 0
+        self._line_no = 0
+
+    def header_line(self, line: str) -> None:
+        if line == "--- /dev/null" or line.startswith("new file mode"):
+            self.status = "created"
+        elif line == "+++ /dev/null" or line.startswith("deleted file mode"):
+            self.status = "deleted"
+        elif line.startswith("+++ "):
+            self.path = line[4:].removeprefix("b/")
+
+    def start_hunk(self, line: str) -> None:
+        self._close_run()
+        header = _HUNK_HEADER.match(line)
+        self._line_no = int(header.group(1)) if header else 0
+        self.in_hunk = True
+
+    def hunk_line(self, line: str) -> None:
+        if line.startswith("+"):
+            if not self._run:
+                self._run_start = self._line_no
+            self._run.append(line[1:])
+            self._line_no += 1
+        elif not line.startswith("\\"):  # "\ No newline at end of file"
+            self._close_run()
+            if not line.startswith("-"):
+                self._line_no += 1
+
+    def finish(self) -> Tuple[str, str, List[Tuple[int, str]]]:
+        self._close_run()
+        assert self.path is not None
+        return self.path, self.status, self.hunks
+
+    def _close_run(self) -> None:
+        if self._run:
+            self.hunks.append((self._run_start, "\n".join(self._run)))
+            self._run = []
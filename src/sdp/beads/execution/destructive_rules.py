@@ -0,0 +1,176 @@
+"""
+Content rules for destructive operations detection.
+
+Rule packs cover SQL DDL, shell deletion, Python filesystem removal and
+truncation. All rules of the selected packs are compiled once per process
+into a single combined pattern, so every added line of a changeset is
+scanned in one pass regardless of how many rules there are.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class DestructiveRule:
+    """One content pattern that marks a change as destructive."""
+
+    name: str
+    category: str
+    pattern: str  # Regex, matched case-insensitively per line
+    keywords: Tuple[str, ...] = ()  # Lowercase literals, one of which every match contains
+
+
+@dataclass(frozen=True)
+class DestructiveFinding:
+    """A rule match in an added line."""
+
+    file_path: str
+    line: int
+    rule: str
+    category: str
+    text: str
+
+
+RULE_PACKS: Dict[str, Tuple[DestructiveRule, ...]] = {
+    "sql": (
+        DestructiveRule(
+            "sql_drop",
+            "data_loss",
+            r"\bdrop\s+(?:table|database|schema|view|index|column)\b",
+            ("drop",),
+        ),
+        DestructiveRule(
+            "sql_truncate", "data_loss", r"\btruncate\s+(?:table\s+)?\w", ("truncate",)
+        ),
+        DestructiveRule(
+            "sql_delete_all", "data_loss", r"\bdelete\s+from\s+[\w.\"`]+\s*(?:;|$)", ("delete",)
+        ),
+        DestructiveRule(
+            "sql_alter_drop", "data_loss", r"\balter\s+table\s+\S+\s+drop\b", ("alter",)
+        ),
+        DestructiveRule(
+            "alembic_drop", "data_loss", r"\bop\.drop_(?:table|column|index)\s*\(", ("drop",)
+        ),
+    ),
+    "shell": (
+        DestructiveRule(
+            "rm_recursive",
+            "file_deletion",
+            r"\brm\s+(?:-[a-z]*r[a-z]*f?|-[a-z]*f[a-z]*r|--recursive)\b",
+            ("rm",),
+        ),
+        DestructiveRule("git_clean", "file_deletion", r"\bgit\s+clean\s+-[a-z]*f", ("clean",)),
+        DestructiveRule("git_reset_hard", "data_loss", r"\bgit\s+reset\s+--hard\b", ("reset",)),
+    ),
+    "python": (
+        DestructiveRule("shutil_rmtree", "file_deletion", r"\bshutil\.rmtree\s*\(", ("rmtree",)),
+        DestructiveRule(
+            "os_remove",
+            "file_deletion",
+            r"\bos\.(?:remove|unlink|rmdir|removedirs)\s*\(",
+            ("remove", "unlink", "rmdir"),
+        ),
+        DestructiveRule(
+            "path_unlink", "file_deletion", r"\.(?:unlink|rmdir)\s*\(\s*\)", ("unlink", "rmdir")
+        ),
+    ),
+    "truncation": (
+        DestructiveRule(
+            "file_truncate", "data_loss", r"\.truncate\s*\(|\bos\.truncate\s*\(", ("truncate",)
+        ),
+        DestructiveRule("shell_truncate", "data_loss", r"\btruncate\s+-s\s*0\b", ("truncate",)),
+    ),
+}
+
+DEFAULT_RULE_PACKS: Tuple[str, ...] = tuple(RULE_PACKS)
+
+
+class RuleMatcher:
+    """All rules of a rule set compiled into one alternation.
+
+    Python's ``re`` has no multi-literal automaton, so scanning runs in
+    two stages: a literal prefilter finds lines containing any rule
+    keyword (``str.find``, which is memchr-fast), and only those lines
+    are run through the combined pattern. Rules without keywords disable
+    the prefilter and every line is matched.
+    """
+
+    def __init__(self, rules: Sequence[DestructiveRule]):
+        self.rules = {f"r{i}": rule for i, rule in enumerate(rules)}
+        combined = "|".join(f"(?P<{group}>{rule.pattern})" for group, rule in self.rules.items())
+        self._pattern = re.compile(combined or r"(?!)", re.IGNORECASE | re.MULTILINE)
+        self._keywords: Optional[Tuple[str, ...]] = None
+        if all(rule.keywords for rule in rules):
+            self._keywords = tuple(dict.fromkeys(k for rule in rules for k in rule.keywords))
+
+    def scan(self, file_path: str, text: str, first_line: int = 1) -> List[DestructiveFinding]:
+        """Find rule matches in text, at most one finding per rule and line."""
+        findings = []
+        line_starts: Optional[List[int]] = None
+        for start, end in self._candidate_lines(text):
+            seen = set()
+            for match in self._pattern.finditer(text, start, end):
+                rule = self.rules[match.lastgroup or ""]
+                if rule.name in seen:
+                    continue
+                seen.add(rule.name)
+                if line_starts is None:  # Only index lines once something matched
+                    line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+                findings.append(
+                    DestructiveFinding(
+                        file_path=file_path,
+                        line=first_line + bisect_right(line_starts, start) - 1,
+                        rule=rule.name,
+                        category=rule.category,
+                        text=text[start:end].strip(),
+                    )
+                )
+        return findings
+
+    def _candidate_lines(self, text: str) -> List[Tuple[int, int]]:
+        """(start, end) offsets of lines that may contain a match, in order."""
+        lowered = text.lower()
+        if self._keywords is None or len(lowered) != len(text):
+            return _line_spans(text, [0] + [m.end() for m in re.finditer("\n", text)])
+
+        starts = set()
+        for keyword in self._keywords:
+            index = lowered.find(keyword)
+            while index != -1:
+                line_start = lowered.rfind("\n", 0, index) + 1
+                starts.add(line_start)
+                line_end = lowered.find("\n", index)
+                if line_end == -1:
+                    break
+                index = lowered.find(keyword, line_end)
+        return _line_spans(text, sorted(starts))
+
+
+def _line_spans(text: str, starts: List[int]) -> List[Tuple[int, int]]:
+    """Extend line start offsets to (start, end) spans."""
+    spans = []
+    for start in starts:
+        end = text.find("\n", start)
+        spans.append((start, end if end != -1 else len(text)))
+    return spans
+
+
+@lru_cache(maxsize=None)
+def load_rule_matcher(
+    packs: Tuple[str, ...] = DEFAULT_RULE_PACKS,
+    extra_rules: Tuple[DestructiveRule, ...] = (),
+) -> RuleMatcher:
+    """Compile rule packs once per process.
+
+    Raises:
+        ValueError: If a pack name is unknown
+    """
+    unknown = [name for name in packs if name not in RULE_PACKS]
+    if unknown:
+        raise ValueError(f"Unknown rule packs: {', '.join(unknown)}")
+    rules = [rule for name in packs for rule in RULE_PACKS[name]]
+    return RuleMatcher(rules + list(extra_rules))
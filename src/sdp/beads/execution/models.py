@@ -6,7 +6,7 @@ Defines core types for @oneshot execution configuration and results.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class ExecutionMode(Enum):
@@ -52,3 +52,4 @@ class OneshotResult:
     pr_created: bool = False
     preview_only: bool = False
     tasks_preview: List[str] = field(default_factory=list)
+    merge_conflicts: Dict[str, List[str]] = field(default_factory=dict)
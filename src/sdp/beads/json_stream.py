@@ -0,0 +1,122 @@
+"""Incremental decoding of JSON arrays streamed by the bd CLI."""
+
+import codecs
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Iterator, List, Optional
+
+from .exceptions import BeadsClientError
+
+
+def run_json_array(cmd: List[str], cwd: Optional[Path] = None) -> Iterator[dict[str, Any]]:
+    """Run a command and yield the items of the JSON array it prints.
+
+    Items are yielded while the command is still running. Closing the
+    iterator early terminates the command.
+
+    Raises:
+        BeadsClientError: If the command fails or prints invalid JSON
+    """
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, cwd=cwd)
+        except OSError as e:
+            raise BeadsClientError(f"Command failed: {e}") from e
+
+        assert proc.stdout is not None
+        try:
+            yield from iter_json_array(proc.stdout)
+            if proc.wait() != 0:
+                stderr.seek(0)
+                error_msg = stderr.read().decode(errors="replace")
+                raise BeadsClientError(f"Command failed: {error_msg}")
+        except json.JSONDecodeError as e:
+            raise BeadsClientError(f"Invalid JSON response: {e.msg}") from e
+        finally:
+            if proc.poll() is None:
+                proc.kill()  # Caller stopped early
+            proc.stdout.close()
+            proc.wait()
+
+
+def iter_json_array(stream: IO[bytes], chunk_size: int = 1 << 16) -> Iterator[dict[str, Any]]:
+    """Decode the items of a top-level JSON array while it is being read.
+
+    Input is consumed as soon as it arrives (not in full chunks), so an
+    item is yielded as soon as bd has written it. Only the item currently
+    being decoded is buffered. The legacy
+    ``{"tasks": [...]}`` wrapper is not streamable and is read whole.
+
+    Raises:
+        json.JSONDecodeError: If the stream is not valid JSON
+    """
+    return _JSONArrayReader(stream, chunk_size).items()
+
+
+class _JSONArrayReader:
+    """Incremental reader for a JSON array on a UTF-8 byte stream."""
+
+    _WHITESPACE = " \t\r\n"
+
+    def __init__(self, stream: IO[bytes], chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.text = codecs.getincrementaldecoder("utf-8")()
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def items(self) -> Iterator[dict[str, Any]]:
+        """Yield array items one by one."""
+        self._skip(self._WHITESPACE)
+        if self.pos >= len(self.buf):
+            return  # Empty output
+        if self.buf[self.pos] == "{":
+            rest = self.text.decode(self.stream.read(), final=True)
+            data = json.loads(self.buf[self.pos :] + rest)
+            yield from data.get("tasks", [])
+            return
+        if self.buf[self.pos] != "[":
+            raise json.JSONDecodeError("Expected JSON array", self.buf, self.pos)
+        self.pos += 1
+
+        while True:
+            self._skip(self._WHITESPACE + ",")
+            if self.pos >= len(self.buf):
+                raise json.JSONDecodeError("Unterminated JSON array", self.buf, self.pos)
+            if self.buf[self.pos] == "]":
+                return
+            item = self._decode_item()
+            if item is not None:
+                yield item
+
+    def _decode_item(self) -> Optional[dict[str, Any]]:
+        """Decode the item at pos, or read more input (returns None)."""
+        try:
+            item, self.pos = self.decoder.raw_decode(self.buf, self.pos)
+        except json.JSONDecodeError:
+            if self.eof:
+                raise
+            self._fill()  # Item continues in the next chunk
+            return None
+        return item  # type: ignore[no-any-return]
+
+    def _fill(self) -> None:
+        """Drop consumed input and read the next chunk."""
+        read = getattr(self.stream, "read1", self.stream.read)
+        raw = read(self.chunk_size)
+        self.eof = not raw
+        chunk = self.text.decode(raw, final=self.eof)
+        self.buf, self.pos = self.buf[self.pos :] + chunk, 0
+
+    def _skip(self, chars: str) -> None:
+        """Advance past ``chars``, reading more input as needed."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in chars:
+                self.pos += 1
+            if self.pos < len(self.buf) or self.eof:
+                return
+            self._fill()
@@ -1,6 +1,7 @@
 """Mock Beads client implementation for testing/development."""
 
-from typing import List, Optional
+import threading
+from typing import Iterator, List, Optional
 
 from .base import BeadsClient
 from .exceptions import BeadsClientError
@@ -21,6 +22,18 @@ class MockBeadsClient(BeadsClient):
         """Initialize mock client with empty task store."""
         self._tasks: dict[str, BeadsTask] = {}
         self._id_counter = 0
+        self._id_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, object]:
+        """Support pickling (e.g. for process-isolated execution)."""
+        state = self.__dict__.copy()
+        del state["_id_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore state and recreate the ID lock."""
+        self.__dict__.update(state)
+        self._id_lock = threading.Lock()
 
     def _generate_id(self) -> str:  # noqa: ANN202
         """Generate a mock Beads-style ID.
@@ -28,9 +41,10 @@ class MockBeadsClient(BeadsClient):
         In real Beads, this would be a content-addressed hash.
         For mocking, we use a simple counter.
         """
-        self._id_counter += 1
-        # Simulate hash format: bd-XXXX
-        return f"bd-{self._id_counter:04x}"
+        with self._id_lock:
+            self._id_counter += 1
+            # Simulate hash format: bd-XXXX
+            return f"bd-{self._id_counter:04x}"
 
     def create_task(self, params: BeadsTaskCreate) -> BeadsTask:
         """Create a new task (mock)."""
@@ -126,6 +140,28 @@ class MockBeadsClient(BeadsClient):
 
         return tasks
 
+    def iter_tasks(
+        self,
+        status: Optional[BeadsStatus] = None,
+        parent_id: Optional[str] = None,
+        page_size: int = 500,
+    ) -> Iterator[BeadsTask]:
+        """Iterate tasks page by page with filters (mock)."""
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size}")
+
+        task_ids = list(self._tasks)
+        for start in range(0, len(task_ids), page_size):
+            for task_id in task_ids[start : start + page_size]:
+                task = self._tasks.get(task_id)
+                if task is None:
+                    continue  # Deleted while iterating
+                if status and task.status != status:
+                    continue
+                if parent_id and task.parent_id != parent_id:
+                    continue
+                yield task
+
     def update_metadata(self, task_id: str, metadata: dict[str, object]) -> None:
         """Update task metadata (mock)."""
         task = self._tasks.get(task_id)
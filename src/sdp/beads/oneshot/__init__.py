@@ -6,5 +6,18 @@ using multiple agents in parallel with Beads dependency tracking.
 """
 
 from .executor import MultiAgentExecutor
+from .integration import MergeResult, WorktreeError
+from .isolation import IsolatedWorkstreamExecutor
+from .task_process import ResourceLimits, TaskIsolationError
+from .worktree import Worktree, WorktreePool
 
-__all__ = ["MultiAgentExecutor"]
+__all__ = [
+    "MultiAgentExecutor",
+    "IsolatedWorkstreamExecutor",
+    "ResourceLimits",
+    "TaskIsolationError",
+    "WorktreePool",
+    "Worktree",
+    "MergeResult",
+    "WorktreeError",
+]
@@ -4,15 +4,23 @@ Multi-agent executor for @oneshot execution.
 Coordinates parallel execution of feature workstreams with Beads dependency tracking.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, List, Optional
 
 from ..client import BeadsClient
 from ..execution_mode import AuditLogger, ExecutionMode, OneshotResult
+from ..models import BeadsStatus
 from ..skills_build import WorkstreamExecutor
 from .destructive_checker import check_destructive_operations_confirmation
 from .dry_run import execute_dry_run
-from .task_filter import execute_single_task, filter_feature_tasks
+from .isolation import IsolatedWorkstreamExecutor
+from .task_filter import (
+    execute_single_task,
+    execute_task_in_worktree,
+    filter_feature_tasks,
+)
+from .task_process import ResourceLimits
+from .worktree import WorktreePool
 
 if TYPE_CHECKING:
     pass
@@ -25,6 +33,13 @@ class MultiAgentExecutor:
     and executes them in parallel using ThreadPoolExecutor.
 
     Enhanced with execution modes for workflow efficiency (F014).
+
+    With a ``worktree_pool`` every task builds in its own git worktree and
+    results are integrated back round by round (dependency order), so
+    agents never clobber each other's files; the worktrees are removed
+    when the feature is done. With ``limits`` every TDD cycle runs in its
+    own child process; a task that hangs or exceeds its limits is marked
+    BLOCKED while the rest of the run continues.
     """
 
     def __init__(
@@ -32,6 +47,8 @@ class MultiAgentExecutor:
         client: BeadsClient,
         num_agents: int = 3,
         audit_logger: Optional[AuditLogger] = None,
+        worktree_pool: Optional[WorktreePool] = None,
+        limits: Optional[ResourceLimits] = None,
     ):
         """Initialize multi-agent executor.
 
@@ -39,11 +56,18 @@ class MultiAgentExecutor:
             client: BeadsClient instance (mock or real)
             num_agents: Maximum number of parallel agents
             audit_logger: Optional audit logger for auto-approve mode
+            worktree_pool: Optional pool enabling isolated worktree execution
+            limits: Optional per-task limits enabling process isolation
         """
         self.client = client
         self.num_agents = num_agents
-        self.build_executor = WorkstreamExecutor(client)
+        self.build_executor: WorkstreamExecutor = (
+            IsolatedWorkstreamExecutor(client, limits)
+            if limits is not None
+            else WorkstreamExecutor(client)
+        )
         self.audit_logger = audit_logger or AuditLogger()
+        self.worktree_pool = worktree_pool
 
     def execute_feature(  # noqa: C901
         self,
@@ -95,6 +119,7 @@ class MultiAgentExecutor:
         # Execute workstreams
         total_executed = 0
         failed_tasks = []
+        merge_conflicts: dict[str, list[str]] = {}
 
         try:
             with ThreadPoolExecutor(max_workers=self.num_agents) as executor:
@@ -113,29 +138,34 @@ class MultiAgentExecutor:
 
                     # Execute ready tasks in parallel
                     futures = {
-                        executor.submit(
-                            execute_single_task,
-                            self.build_executor,
-                            task_id,
-                            mock_success,
-                        ): task_id
+                        self._submit(executor, task_id, mock_success): task_id
                         for task_id in feature_tasks
                     }
 
                     # Wait for completion and collect results
+                    succeeded = set()
                     for future in as_completed(futures):
                         task_id = futures[future]
                         try:
                             success = future.result()
                             total_executed += 1
 
-                            if not success:
+                            if success:
+                                succeeded.add(task_id)
+                            else:
                                 failed_tasks.append(task_id)
 
                         except Exception:
                             failed_tasks.append(task_id)
                             total_executed += 1
 
+                    # Integrate worktree branches before the next round starts
+                    if self.worktree_pool is not None:
+                        round_order = [t for t in feature_tasks if t in succeeded]
+                        conflicts = self._integrate_round(round_order)
+                        merge_conflicts.update(conflicts)
+                        failed_tasks.extend(conflicts)
+
             # Determine if PR was created
             pr_created = mode == ExecutionMode.STANDARD
 
@@ -150,6 +180,7 @@ class MultiAgentExecutor:
                     mode=mode,
                     deployment_target=deployment_target,
                     pr_created=pr_created,
+                    merge_conflicts=merge_conflicts,
                 )
             else:
                 result = OneshotResult(
@@ -182,3 +213,45 @@ class MultiAgentExecutor:
                 mode=mode,
                 deployment_target=deployment_target,
             )
+        finally:
+            # Task branches that failed to integrate are kept for manual resolution
+            if self.worktree_pool is not None:
+                self.worktree_pool.cleanup()
+
+    def _submit(
+        self, executor: ThreadPoolExecutor, task_id: str, mock_success: bool
+    ) -> "Future[bool]":
+        """Submit a task in shared-checkout or isolated worktree mode."""
+        if self.worktree_pool is not None:
+            return executor.submit(
+                execute_task_in_worktree,
+                self.build_executor,
+                self.worktree_pool,
+                task_id,
+                mock_success,
+            )
+        return executor.submit(
+            execute_single_task, self.build_executor, task_id, mock_success
+        )
+
+    def _integrate_round(self, task_ids: List[str]) -> dict[str, List[str]]:
+        """Integrate one round of worktree branches in order.
+
+        Args:
+            task_ids: Successful task IDs in dependency (ready) order
+
+        Returns:
+            Conflicting paths keyed by task ID (tasks that failed to integrate)
+        """
+        assert self.worktree_pool is not None
+        conflicts: dict[str, List[str]] = {}
+
+        for task_id in task_ids:
+            merge = self.worktree_pool.integrate(task_id)
+            if merge.success:
+                continue
+
+            conflicts[task_id] = merge.conflicts or [merge.error or "integration failed"]
+            self.client.update_task_status(task_id, BeadsStatus.BLOCKED)
+
+        return conflicts
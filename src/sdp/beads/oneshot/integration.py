@@ -0,0 +1,127 @@
+"""
+Git operations for integrating task branches into the main checkout.
+
+A task branch is either merged (``--no-ff``) or rebased onto the main
+HEAD and fast-forwarded. On conflict the main checkout is restored and
+the conflicting paths are reported. Integration refuses to run while the
+main checkout has uncommitted changes, so it never discards user work.
+"""
+
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+
+class WorktreeError(Exception):
+    """Git worktree operation failed."""
+
+    pass
+
+
+@dataclass
+class MergeResult:
+    """Result of integrating a task branch into the main checkout."""
+
+    task_id: str
+    success: bool
+    branch: Optional[str] = None
+    commit: Optional[str] = None
+    conflicts: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def merge_branch(repo_dir: Path, task_id: str, branch: str) -> MergeResult:
+    """Merge task branch into main checkout."""
+    proc = run_git(repo_dir, "merge", "--no-ff", "--no-edit", branch)
+    if proc.returncode == 0:
+        return MergeResult(task_id=task_id, success=True, branch=branch, commit=head(repo_dir))
+
+    conflicts = _conflicted_paths(repo_dir)
+    run_git(repo_dir, "merge", "--abort")
+    return MergeResult(
+        task_id=task_id,
+        success=False,
+        branch=branch,
+        conflicts=conflicts,
+        error=proc.stderr.strip() or proc.stdout.strip() or "Merge failed",
+    )
+
+
+def rebase_branch(repo_dir: Path, task_id: str, branch: str) -> MergeResult:
+    """Rebase task branch onto main HEAD, then fast-forward main."""
+    base = head(repo_dir)
+    original = _current_ref(repo_dir)
+    proc = run_git(repo_dir, "rebase", base, branch)
+
+    if proc.returncode != 0:
+        conflicts = _conflicted_paths(repo_dir)
+        run_git(repo_dir, "rebase", "--abort")
+        git(repo_dir, "checkout", original)
+        return MergeResult(
+            task_id=task_id,
+            success=False,
+            branch=branch,
+            conflicts=conflicts,
+            error=proc.stderr.strip() or proc.stdout.strip() or "Rebase failed",
+        )
+
+    # `git rebase <base> <branch>` leaves the main checkout on the task
+    # branch; switch back and fast-forward the original ref
+    tip = head(repo_dir)
+    git(repo_dir, "checkout", original)
+    git(repo_dir, "merge", "--ff-only", tip)
+    return MergeResult(task_id=task_id, success=True, branch=branch, commit=tip)
+
+
+def require_clean(cwd: Path) -> None:
+    """Check that a checkout has no uncommitted changes to tracked files.
+
+    Raises:
+        WorktreeError: If tracked files are modified or staged
+    """
+    dirty = git(cwd, "status", "--porcelain", "--untracked-files=no").splitlines()
+    if dirty:
+        paths = ", ".join(line[3:] for line in dirty)
+        raise WorktreeError(f"Main checkout has uncommitted changes: {paths}")
+
+
+def head(cwd: Path) -> str:
+    """Get a checkout's current HEAD commit."""
+    return git(cwd, "rev-parse", "HEAD").strip()
+
+
+def git(cwd: Path, *args: str) -> str:
+    """Run git and return stdout.
+
+    Raises:
+        WorktreeError: If git exits non-zero
+    """
+    proc = run_git(cwd, *args)
+    if proc.returncode != 0:
+        raise WorktreeError(
+            f"git {' '.join(args)} failed: {proc.stderr.strip() or proc.stdout.strip()}"
+        )
+    return proc.stdout
+
+
+def run_git(cwd: Path, *args: str) -> "subprocess.CompletedProcess[str]":
+    """Run git without raising on failure."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _current_ref(cwd: Path) -> str:
+    """Get a checkout's branch name (or SHA when detached)."""
+    proc = run_git(cwd, "symbolic-ref", "--short", "-q", "HEAD")
+    return proc.stdout.strip() if proc.returncode == 0 else head(cwd)
+
+
+def _conflicted_paths(cwd: Path) -> List[str]:
+    """List unmerged paths in a checkout."""
+    proc = run_git(cwd, "diff", "--name-only", "--diff-filter=U")
+    return [line for line in proc.stdout.splitlines() if line.strip()]
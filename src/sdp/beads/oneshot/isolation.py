@@ -0,0 +1,179 @@
+"""
+Process-isolated workstream execution for @oneshot.
+
+Runs each TDD cycle in its own child process with a wall-clock timeout
+and optional memory/CPU limits, so a hung or memory-hungry workstream
+cannot stall or OOM the whole oneshot run. Status transitions stay in the
+parent process; only the cycle itself is isolated.
+"""
+
+import multiprocessing
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from ..client import BeadsClient
+from ..skills_build import WorkstreamExecutor
+from .task_process import (
+    ResourceLimits,
+    TaskIsolationError,
+    child_main,
+    diagnose,
+    stop_process,
+    wait_for_result,
+)
+
+# fork copies only the calling thread: locks held by other threads (worktree
+# pool, loggers) would stay locked in the child forever
+DEFAULT_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+class IsolatedWorkstreamExecutor(WorkstreamExecutor):
+    """WorkstreamExecutor that runs each TDD cycle in a child process.
+
+    A task that times out, exceeds its limits, crashes or is cancelled
+    raises TaskIsolationError from execute_tdd_cycle(); the inherited
+    execute() then marks it BLOCKED with the diagnostics as its error.
+    Other tasks keep running in their own processes.
+
+    Example:
+        executor = IsolatedWorkstreamExecutor(
+            client, ResourceLimits(timeout=600, max_memory_mb=2048)
+        )
+        result = executor.execute("bd-0001.1")
+    """
+
+    def __init__(
+        self,
+        client: BeadsClient,
+        limits: Optional[ResourceLimits] = None,
+        project_dir: Optional[Path] = None,
+        start_method: Optional[str] = None,
+    ):
+        """Initialize isolated executor.
+
+        Args:
+            client: BeadsClient instance (mock or real)
+            limits: Per-task limits (defaults to no limits)
+            project_dir: Checkout to build in (defaults to current dir)
+            start_method: multiprocessing start method (defaults to
+                DEFAULT_START_METHOD; the executor must be picklable)
+        """
+        super().__init__(client, project_dir=project_dir)
+        self.limits = limits or ResourceLimits()
+        self.start_method = start_method or DEFAULT_START_METHOD
+        self._running: dict[str, Any] = {}
+        self._cancelled: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop process bookkeeping when sent to a child process."""
+        state = self.__dict__.copy()
+        state["_running"] = {}
+        state["_cancelled"] = set()
+        state["_lock"] = None
+        return state
+
+    def __copy__(self) -> "IsolatedWorkstreamExecutor":
+        """Share process bookkeeping with copies (see for_workdir).
+
+        Without this, copy.copy() would go through __getstate__ and the
+        copy would have no lock.
+        """
+        executor = type(self).__new__(type(self))
+        executor.__dict__.update(self.__dict__)
+        return executor
+
+    def run_tdd_cycle(self, task_id: str, mock_tdd_success: bool = True) -> bool:
+        """Run the TDD cycle body (executed inside the child process).
+
+        Override this, not execute_tdd_cycle(), to customize what runs
+        in isolation.
+        """
+        return super().execute_tdd_cycle(task_id, mock_tdd_success)
+
+    def execute_tdd_cycle(self, task_id: str, mock_tdd_success: bool = True) -> bool:
+        """Execute the TDD cycle in a child process with limits.
+
+        Args:
+            task_id: Beads task ID
+            mock_tdd_success: Mock success for testing
+
+        Returns:
+            True if cycle succeeded, False otherwise
+
+        Raises:
+            TaskIsolationError: If the task timed out, hit a limit,
+                crashed or was cancelled
+        """
+        ctx: Any = multiprocessing.get_context(self.start_method)
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        proc = ctx.Process(
+            target=child_main,
+            args=(child_conn, self, task_id, mock_tdd_success, self.limits),
+            name=f"sdp-task-{task_id}",
+            daemon=True,
+        )
+
+        with self._lock:
+            self._cancelled.discard(task_id)
+            proc.start()
+            self._running[task_id] = proc
+        child_conn.close()
+
+        message, timed_out = None, False
+        try:
+            message, timed_out = wait_for_result(parent_conn, self.limits.timeout)
+        finally:
+            parent_conn.close()
+            stop_process(proc)
+            with self._lock:
+                self._running.pop(task_id, None)
+                cancelled = task_id in self._cancelled
+                self._cancelled.discard(task_id)
+
+        if message is None:
+            raise TaskIsolationError(
+                diagnose(task_id, proc.exitcode, timed_out, cancelled, self.limits)
+            )
+        if message["status"] == "ok":
+            return bool(message["success"])
+
+        detail = f"{message['error_type']}: {message['message']}"
+        if message.get("traceback"):
+            detail += f"\n{message['traceback']}"
+        raise TaskIsolationError(f"Task {task_id} failed in isolated process: {detail}")
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a running task.
+
+        Args:
+            task_id: Beads task ID
+
+        Returns:
+            True if a running process was terminated
+        """
+        with self._lock:
+            proc = self._running.get(task_id)
+            if proc is None:
+                return False
+            self._cancelled.add(task_id)
+        proc.terminate()
+        return True
+
+    def cancel_all(self) -> list[str]:
+        """Cancel all running tasks.
+
+        Returns:
+            IDs of cancelled tasks
+        """
+        with self._lock:
+            task_ids = list(self._running)
+        return [task_id for task_id in task_ids if self.cancel(task_id)]
+
+    def running_tasks(self) -> list[str]:
+        """Get IDs of tasks currently running in child processes."""
+        with self._lock:
+            return list(self._running)
@@ -6,9 +6,13 @@ Handles filtering and execution of individual workstream tasks.
 
 from typing import TYPE_CHECKING, List
 
+from ..models import BeadsStatus
+from .integration import WorktreeError
+
 if TYPE_CHECKING:
     from ..client import BeadsClient
     from ..skills_build import WorkstreamExecutor
+    from .worktree import WorktreePool
 
 
 def filter_feature_tasks(
@@ -49,3 +53,40 @@ def execute_single_task(
     """
     result = build_executor.execute(task_id, mock_tdd_success=mock_success)
     return result.success
+
+
+def execute_task_in_worktree(
+    build_executor: "WorkstreamExecutor",
+    pool: "WorktreePool",
+    task_id: str,
+    mock_success: bool,
+) -> bool:
+    """Execute a single workstream in its own pooled git worktree.
+
+    Changes are committed to the task branch; integration into the main
+    checkout happens later, in dependency order. A task that gets no
+    worktree is marked BLOCKED.
+
+    Args:
+        build_executor: WorkstreamExecutor instance
+        pool: Worktree pool to borrow a checkout from
+        task_id: Beads task ID
+        mock_success: Mock success for testing
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        worktree = pool.acquire(task_id)
+    except WorktreeError:
+        build_executor.client.update_task_status(task_id, BeadsStatus.BLOCKED)
+        return False
+
+    try:
+        executor = build_executor.for_workdir(worktree.path)
+        result = executor.execute(task_id, mock_tdd_success=mock_success)
+        if result.success:
+            pool.commit(worktree)
+        return result.success
+    finally:
+        pool.release(worktree)
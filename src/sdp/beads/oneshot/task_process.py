@@ -0,0 +1,145 @@
+"""
+Child process handling for isolated workstream execution.
+
+The child applies its resource limits, switches to the executor's
+checkout (``project_dir``), runs the TDD cycle and reports the outcome
+over a pipe. The parent waits for that report, stops the process and
+turns a missing report into diagnostics.
+"""
+
+import os
+import signal
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Optional
+
+
+class TaskIsolationError(Exception):
+    """Isolated task did not finish normally.
+
+    Raised when a task times out, exceeds a resource limit, crashes or is
+    cancelled. The message carries diagnostics for the BLOCKED task.
+    """
+
+    pass
+
+
+@dataclass
+class ResourceLimits:
+    """Per-task limits for isolated execution.
+
+    Attributes:
+        timeout: Wall-clock seconds before the task is killed
+        max_memory_mb: Address-space limit (RLIMIT_AS), approximates RSS cap
+        max_cpu_seconds: CPU time limit (RLIMIT_CPU)
+    """
+
+    timeout: Optional[float] = None
+    max_memory_mb: Optional[int] = None
+    max_cpu_seconds: Optional[int] = None
+
+
+def apply_limits(limits: ResourceLimits) -> None:
+    """Apply rlimits in the child process (no-op where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return  # resource is POSIX-only
+
+    if limits.max_memory_mb is not None:
+        max_bytes = limits.max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, max_bytes))
+    if limits.max_cpu_seconds is not None:
+        # Soft limit delivers SIGXCPU, hard limit one second later SIGKILL
+        cpu = limits.max_cpu_seconds
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+
+
+def child_main(
+    conn: Connection,
+    executor: Any,
+    task_id: str,
+    mock_tdd_success: bool,
+    limits: ResourceLimits,
+) -> None:
+    """Child process entry point: run the cycle and report over the pipe.
+
+    ``executor`` is the pickled IsolatedWorkstreamExecutor.
+    """
+    try:
+        apply_limits(limits)
+        if executor.project_dir is not None:
+            os.chdir(executor.project_dir)  # Own process: safe to switch checkout
+        success = executor.run_tdd_cycle(task_id, mock_tdd_success)
+        conn.send({"status": "ok", "success": bool(success)})
+    except MemoryError:
+        conn.send(
+            {
+                "status": "error",
+                "error_type": "MemoryError",
+                "message": f"memory limit of {limits.max_memory_mb} MB exceeded",
+                "traceback": "",
+            }
+        )
+    except BaseException as e:  # noqa: BLE001 - report everything to parent
+        conn.send(
+            {
+                "status": "error",
+                "error_type": type(e).__name__,
+                "message": str(e),
+                "traceback": traceback.format_exc(),
+            }
+        )
+    finally:
+        conn.close()
+
+
+def wait_for_result(
+    conn: Connection, timeout: Optional[float]
+) -> tuple[Optional[dict[str, Any]], bool]:
+    """Wait for the child's message, up to the wall-clock timeout.
+
+    Returns:
+        Tuple of (message or None, whether the timeout expired)
+    """
+    if not conn.poll(timeout):
+        return None, True
+    try:
+        message: dict[str, Any] = conn.recv()
+        return message, False
+    except EOFError:
+        return None, False  # Child died without reporting
+
+
+def stop_process(proc: Any) -> None:
+    """Make sure the child process is gone."""
+    proc.join(timeout=1)
+    if proc.is_alive():
+        proc.terminate()
+        proc.join(timeout=1)
+    if proc.is_alive():
+        proc.kill()
+        proc.join()
+
+
+def diagnose(
+    task_id: str,
+    exitcode: Optional[int],
+    timed_out: bool,
+    cancelled: bool,
+    limits: ResourceLimits,
+) -> str:
+    """Build diagnostics for a task that did not report a result."""
+    if cancelled:
+        return f"Task {task_id} cancelled"
+    if timed_out:
+        return f"Task {task_id} exceeded wall-clock timeout of {limits.timeout}s"
+
+    if exitcode is not None and exitcode < 0:
+        name = signal.Signals(-exitcode).name
+        if name in ("SIGXCPU", "SIGKILL") and limits.max_cpu_seconds is not None:
+            return f"Task {task_id} exceeded CPU limit of {limits.max_cpu_seconds}s ({name})"
+        return f"Task {task_id} killed by {name}"
+
+    return f"Task {task_id} process exited with code {exitcode} without a result"
@@ -0,0 +1,242 @@
+"""
+Git worktree pool for isolated @oneshot execution.
+
+Gives each parallel agent its own checkout so workstreams never clobber
+each other's files. Worktrees are created lazily, reused between tasks,
+and results are merged (or rebased) back into the main checkout.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .integration import (
+    MergeResult,
+    WorktreeError,
+    git,
+    head,
+    merge_branch,
+    rebase_branch,
+    require_clean,
+    run_git,
+)
+
+
+@dataclass
+class Worktree:
+    """A pooled git worktree slot."""
+
+    path: Path
+    slot: int
+    task_id: Optional[str] = None
+    branch: Optional[str] = None
+
+
+class WorktreePool:
+    """Pool of reusable git worktrees, one per parallel agent.
+
+    Each acquired worktree is reset to the main checkout's current HEAD and
+    switched to a task branch (``sdp/ws/<task_id>``). After the build the
+    changes are committed on that branch and integrated back with
+    :meth:`integrate`, which reports conflicts per task.
+
+    Example:
+        pool = WorktreePool(Path("."), size=8)
+        wt = pool.acquire("bd-0001.1")
+        ...  # run build in wt.path
+        pool.commit(wt)
+        pool.release(wt)
+        result = pool.integrate("bd-0001.1")
+        pool.cleanup()
+    """
+
+    VALID_STRATEGIES = ("merge", "rebase")
+
+    def __init__(
+        self,
+        repo_dir: Path,
+        size: int = 3,
+        root: Optional[Path] = None,
+        strategy: str = "merge",
+        branch_prefix: str = "sdp/ws",
+    ):
+        """Initialize worktree pool.
+
+        Args:
+            repo_dir: Main git checkout results are integrated into
+            size: Maximum number of worktrees (parallel agents)
+            root: Directory holding worktrees (defaults to .sdp/worktrees)
+            strategy: How to integrate task branches ("merge" or "rebase")
+            branch_prefix: Prefix for per-task branches
+
+        Raises:
+            ValueError: If size or strategy is invalid
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be >= 1, got {size}")
+        if strategy not in self.VALID_STRATEGIES:
+            raise ValueError(
+                f"Unknown strategy '{strategy}', expected one of {self.VALID_STRATEGIES}"
+            )
+
+        self.repo_dir = Path(repo_dir).resolve()
+        self.size = size
+        self.root = Path(root) if root else self.repo_dir / ".sdp" / "worktrees"
+        self.strategy = strategy
+        self.branch_prefix = branch_prefix
+
+        self._slots: "queue.Queue[Worktree]" = queue.Queue()
+        self._created: List[Worktree] = []
+        self._branches: dict[str, str] = {}
+        # Guards shared repository metadata (worktree list, main checkout)
+        self._lock = threading.Lock()
+
+    def branch_for(self, task_id: str) -> str:
+        """Get branch name used for a task."""
+        return f"{self.branch_prefix}/{task_id}"
+
+    def acquire(self, task_id: str, timeout: Optional[float] = None) -> Worktree:
+        """Acquire a clean worktree checked out on the task branch.
+
+        Creates a new worktree while the pool is below its size, otherwise
+        blocks until another agent releases one.
+
+        Args:
+            task_id: Beads task ID to build in the worktree
+            timeout: Seconds to wait for a free worktree (None = forever)
+
+        Returns:
+            Worktree ready for the build
+
+        Raises:
+            WorktreeError: If no worktree becomes free or git fails
+        """
+        worktree = self._take_slot(timeout)
+
+        try:
+            base = self.head()
+            branch = self.branch_for(task_id)
+            git(worktree.path, "checkout", "--force", "-B", branch, base)
+            git(worktree.path, "clean", "-fd")
+        except WorktreeError:
+            self._slots.put(worktree)
+            raise
+
+        worktree.task_id = task_id
+        worktree.branch = branch
+        return worktree
+
+    def release(self, worktree: Worktree) -> None:
+        """Return a worktree to the pool.
+
+        The worktree is detached so its task branch can be merged and
+        deleted independently.
+
+        Args:
+            worktree: Worktree previously returned by acquire()
+        """
+        if worktree.task_id and worktree.branch:
+            self._branches[worktree.task_id] = worktree.branch
+        try:
+            git(worktree.path, "checkout", "--force", "--detach")
+        except WorktreeError:
+            pass  # Next acquire() force-checks out a fresh branch anyway
+        worktree.task_id = None
+        worktree.branch = None
+        self._slots.put(worktree)
+
+    def commit(self, worktree: Worktree, message: Optional[str] = None) -> Optional[str]:
+        """Commit all changes in a worktree to its task branch.
+
+        Args:
+            worktree: Acquired worktree
+            message: Commit message (defaults to task reference)
+
+        Returns:
+            Commit SHA, or None if the build left no changes
+        """
+        status = git(worktree.path, "status", "--porcelain")
+        if not status.strip():
+            return None
+
+        git(worktree.path, "add", "-A")
+        git(
+            worktree.path,
+            "commit",
+            "--no-verify",
+            "-m",
+            message or f"{worktree.task_id}: oneshot build",
+        )
+        return git(worktree.path, "rev-parse", "HEAD").strip()
+
+    def integrate(self, task_id: str) -> MergeResult:
+        """Integrate a task branch into the main checkout.
+
+        Call in dependency order. On conflict the main checkout is restored
+        and the task branch is kept for manual resolution. Fails without
+        touching the main checkout if it has uncommitted changes.
+
+        Args:
+            task_id: Beads task ID whose branch to integrate
+
+        Returns:
+            MergeResult with conflicting paths if integration failed
+        """
+        branch = self._branches.get(task_id, self.branch_for(task_id))
+
+        with self._lock:
+            try:
+                require_clean(self.repo_dir)
+                integrate = rebase_branch if self.strategy == "rebase" else merge_branch
+                result = integrate(self.repo_dir, task_id, branch)
+            except WorktreeError as e:
+                return MergeResult(task_id=task_id, success=False, branch=branch, error=str(e))
+
+            if result.success:
+                run_git(self.repo_dir, "branch", "-D", branch)
+                self._branches.pop(task_id, None)
+            return result
+
+    def head(self) -> str:
+        """Get the main checkout's current HEAD commit."""
+        return head(self.repo_dir)
+
+    def cleanup(self) -> None:
+        """Remove all worktrees created by this pool."""
+        with self._lock:
+            for worktree in self._created:
+                run_git(
+                    self.repo_dir, "worktree", "remove", "--force", str(worktree.path)
+                )
+            run_git(self.repo_dir, "worktree", "prune")
+            self._created.clear()
+            self._slots = queue.Queue()
+
+    def _take_slot(self, timeout: Optional[float]) -> Worktree:
+        """Take a free worktree, creating one if the pool has room."""
+        try:
+            return self._slots.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._created) < self.size:
+                return self._create_slot(len(self._created))
+
+        try:
+            return self._slots.get(timeout=timeout)
+        except queue.Empty as e:
+            raise WorktreeError(f"No free worktree after {timeout}s") from e
+
+    def _create_slot(self, slot: int) -> Worktree:
+        """Create a detached worktree for a new slot (caller holds lock)."""
+        path = self.root / f"agent-{slot}"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            git(self.repo_dir, "worktree", "add", "--detach", str(path), "HEAD")
+
+        worktree = Worktree(path=path, slot=slot)
+        self._created.append(worktree)
+        return worktree
@@ -4,17 +4,34 @@ Manages which files a workstream is allowed to modify by storing
 scope information in Beads task metadata.
 """
 
-from typing import List, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+from uuid import uuid4
 
 from sdp.beads.base import BeadsClient
 from sdp.beads.exceptions import BeadsClientError
 
+SCOPE_FILES_KEY = "scope_files"
+SCOPE_VERSION_KEY = "scope_version"
+SCOPE_WRITER_KEY = "scope_writer"
+
+
+class ScopeConflictError(ValueError):
+    """Scope was changed by another writer.
+
+    Raised when the stored scope version does not match the expected
+    version, or concurrent writers kept overwriting each other.
+    """
+
+    pass
+
 
 class ScopeManager:
     """Manage workstream file scope via Beads metadata.
 
     Scope determines which files a workstream can modify. Stored in
-    task metadata under 'scope_files' key.
+    task metadata under 'scope_files' key, with a 'scope_version'
+    counter bumped on every write and a 'scope_writer' token identifying
+    the write, for optimistic concurrency.
     """
 
     def __init__(self, client: BeadsClient):
@@ -37,12 +54,17 @@ class ScopeManager:
         Raises:
             ValueError: If workstream not found
         """
-        task = self._client.get_task(ws_id)
-        if not task:
-            raise ValueError(f"Workstream not found: {ws_id}")
+        _, scope, _ = self._read(ws_id)
+        return scope
 
-        scope = task.sdp_metadata.get("scope_files", [])
-        return cast(List[str], scope if isinstance(scope, list) else [])
+    def get_scope_version(self, ws_id: str) -> int:
+        """Get the scope version for workstream (0 if never written).
+
+        Raises:
+            ValueError: If workstream not found
+        """
+        _, _, version = self._read(ws_id)
+        return version
 
     def set_scope(self, ws_id: str, files: List[str]) -> None:
         """Set scope files for workstream.
@@ -54,18 +76,84 @@ class ScopeManager:
         Raises:
             ValueError: If workstream not found
         """
-        task = self._client.get_task(ws_id)
-        if not task:
-            raise ValueError(f"Workstream not found: {ws_id}")
+        metadata, _, version = self._read(ws_id)
+        self._write(ws_id, metadata, list(files), version + 1)
+
+    def apply_scope_patch(
+        self,
+        ws_id: str,
+        add: Optional[Iterable[str]] = None,
+        remove: Optional[Iterable[str]] = None,
+        expected_version: Optional[int] = None,
+        max_retries: int = 3,
+        verify: bool = False,
+    ) -> int:
+        """Add and remove scope files with one read and one write.
+
+        The patch is applied as set operations on the current scope
+        (existing order is kept, new files are appended).
+
+        Beads has no conditional update. With ``verify`` (implied by
+        ``expected_version``), the task is read back after the write: every
+        write carries a unique writer token, and unless our token, version
+        and scope are all still stored, the patch is re-applied on top of
+        the other writer's scope, up to ``max_retries`` times. This costs
+        one more read per attempt and is best-effort: a write landing after
+        our read-back cannot be detected without compare-and-swap.
 
-        # Update metadata
-        metadata = task.sdp_metadata.copy()
-        metadata["scope_files"] = files
+        Args:
+            ws_id: Workstream/task ID
+            add: File paths to add (already present ones are ignored)
+            remove: File paths to remove (missing ones are ignored)
+            expected_version: Fail instead of merging if the stored
+                scope version differs (from get_scope_version)
+            max_retries: Re-applications allowed after a lost update
+            verify: Read back to detect concurrent writers (see above)
 
-        try:
-            self._client.update_metadata(ws_id, metadata)
-        except BeadsClientError as e:
-            raise ValueError(f"Failed to update scope for {ws_id}: {e}") from e
+        Returns:
+            Scope version after the patch
+
+        Raises:
+            ValueError: If workstream not found, a file is both added and
+                removed, or the update fails
+            ScopeConflictError: If expected_version does not match or
+                the retries are exhausted
+        """
+        to_add = list(dict.fromkeys(add or []))
+        to_remove = set(remove or [])
+        overlap = to_remove.intersection(to_add)
+        if overlap:
+            raise ValueError(f"Files both added and removed: {', '.join(sorted(overlap))}")
+
+        metadata, scope, version = self._read(ws_id)
+        for _ in range(max_retries + 1):
+            if expected_version is not None and version != expected_version:
+                raise ScopeConflictError(
+                    f"Scope for {ws_id} is at version {version}, expected {expected_version}"
+                )
+
+            current = set(scope)
+            patched = [f for f in scope if f not in to_remove]
+            patched.extend(f for f in to_add if f not in current)
+            if patched == scope:
+                return version  # Nothing to write
+
+            token = self._write(ws_id, metadata, patched, version + 1)
+            if not verify and expected_version is None:
+                return version + 1
+
+            metadata, scope, stored = self._read(ws_id)
+            ours = metadata.get(SCOPE_WRITER_KEY) == token
+            if ours and stored == version + 1 and scope == patched:
+                return stored
+
+            if expected_version is not None:
+                raise ScopeConflictError(f"Scope for {ws_id} was changed concurrently")
+            version = stored  # Lost update: re-apply on the other writer's scope
+
+        raise ScopeConflictError(
+            f"Scope for {ws_id} kept changing, gave up after {max_retries} retries"
+        )
 
     def add_file(self, ws_id: str, file_path: str) -> None:
         """Add file to workstream scope.
@@ -77,10 +165,7 @@ class ScopeManager:
         Raises:
             ValueError: If workstream not found or update fails
         """
-        scope = self.get_scope(ws_id)
-        if file_path not in scope:
-            scope.append(file_path)
-            self.set_scope(ws_id, scope)
+        self.apply_scope_patch(ws_id, add=[file_path])
 
     def remove_file(self, ws_id: str, file_path: str) -> None:
         """Remove file from workstream scope.
@@ -92,10 +177,7 @@ class ScopeManager:
         Raises:
             ValueError: If workstream not found or update fails
         """
-        scope = self.get_scope(ws_id)
-        if file_path in scope:
-            scope.remove(file_path)
-            self.set_scope(ws_id, scope)
+        self.apply_scope_patch(ws_id, remove=[file_path])
 
     def is_in_scope(self, ws_id: str, file_path: str) -> bool:
         """Check if file is in workstream scope.
@@ -128,3 +210,36 @@ class ScopeManager:
             ValueError: If workstream not found or update fails
         """
         self.set_scope(ws_id, [])
+
+    def _read(self, ws_id: str) -> Tuple[Dict[str, Any], List[str], int]:
+        """Fetch (metadata, scope files, scope version) with one get_task."""
+        task = self._client.get_task(ws_id)
+        if not task:
+            raise ValueError(f"Workstream not found: {ws_id}")
+
+        metadata = task.sdp_metadata.copy()
+        scope = metadata.get(SCOPE_FILES_KEY, [])
+        version = metadata.get(SCOPE_VERSION_KEY, 0)
+        return (
+            metadata,
+            list(cast(List[str], scope)) if isinstance(scope, list) else [],
+            version if isinstance(version, int) else 0,
+        )
+
+    def _write(self, ws_id: str, metadata: Dict[str, Any], files: List[str], version: int) -> str:
+        """Write scope files, version and a fresh writer token with one update_metadata.
+
+        Returns:
+            The writer token stored with this write
+        """
+        token = uuid4().hex
+        metadata = dict(metadata)
+        metadata[SCOPE_FILES_KEY] = files
+        metadata[SCOPE_VERSION_KEY] = version
+        metadata[SCOPE_WRITER_KEY] = token
+
+        try:
+            self._client.update_metadata(ws_id, metadata)
+        except BeadsClientError as e:
+            raise ValueError(f"Failed to update scope for {ws_id}: {e}") from e
+        return token
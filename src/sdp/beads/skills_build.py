@@ -5,7 +5,9 @@ Implements @build skill logic: execute workstream with TDD discipline
 and update Beads status (OPEN → IN_PROGRESS → CLOSED/BLOCKED).
 """
 
+import copy
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Callable, List, Optional
 
 from .client import BeadsClient
@@ -28,15 +30,38 @@ class WorkstreamExecutor:
     Manages status transitions:
     OPEN → IN_PROGRESS → CLOSED (success)
     OPEN → IN_PROGRESS → BLOCKED (failure)
+
+    ``project_dir`` names the checkout to build in. This class only
+    records it; the isolated executor's child process switches into it
+    (see oneshot.task_process) so parallel agents never share a working
+    directory.
     """
 
-    def __init__(self, client: BeadsClient):
+    def __init__(self, client: BeadsClient, project_dir: Optional[Path] = None):
         """Initialize executor.
 
         Args:
             client: BeadsClient instance (mock or real)
+            project_dir: Checkout to build in (defaults to current dir)
         """
         self.client = client
+        self.project_dir = project_dir
+
+    def for_workdir(self, project_dir: Path) -> "WorkstreamExecutor":
+        """Get a copy of this executor that builds in another checkout.
+
+        Used by isolated (worktree) execution so parallel agents never
+        share a working directory.
+
+        Args:
+            project_dir: Checkout to build in
+
+        Returns:
+            Shallow copy sharing the Beads client
+        """
+        executor = copy.copy(self)
+        executor.project_dir = project_dir
+        return executor
 
     def execute(
         self,
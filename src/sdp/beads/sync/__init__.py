@@ -12,20 +12,40 @@ Mapping:
 - SDP dependencies (list of WS IDs) ↔ Beads dependencies (type: "blocks")
 """
 
+from .incremental import SyncReport
 from .mapping import BeadsSyncError, MappingManager, resolve_ws_id_to_beads_id
+from .migration import (
+    MigrationEntry,
+    MigrationPlan,
+    MigrationReport,
+    migrate_workstreams,
+    plan_migration,
+)
 from .status_mapper import (
     map_beads_status_to_sdp,
     map_sdp_size_to_beads_priority,
     map_sdp_status_to_beads,
 )
+from .store import MappingStore, open_mapping_store
 from .sync_service import BeadsSyncService
+from .writeback import WriteBackChange, WriteBackReport
 
 __all__ = [
     "BeadsSyncError",
     "resolve_ws_id_to_beads_id",
     "MappingManager",
+    "MappingStore",
+    "open_mapping_store",
     "map_sdp_status_to_beads",
     "map_beads_status_to_sdp",
     "map_sdp_size_to_beads_priority",
     "BeadsSyncService",
+    "SyncReport",
+    "WriteBackChange",
+    "WriteBackReport",
+    "MigrationPlan",
+    "MigrationEntry",
+    "MigrationReport",
+    "plan_migration",
+    "migrate_workstreams",
 ]
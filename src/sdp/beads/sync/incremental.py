@@ -0,0 +1,195 @@
+"""
+Content hashes for incremental SDP → Beads sync.
+
+Each mapping journal entry carries the hash of the workstream file it
+was synced from plus one hash per pushable field group. An unchanged
+file is skipped without parsing; a changed file only pushes the field
+groups whose hash differs.
+
+Dependencies are only added: BeadsClient has no call to remove one, so
+a dependency dropped from a workstream stays on its Beads task until it
+is removed by hand (``bd dep remove``).
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..models import BeadsSyncResult
+from .status_mapper import SDP_STATUS_BACKLOG, map_sdp_status_to_beads
+from .task_builder import map_dependencies, task_metadata
+
+if TYPE_CHECKING:
+    from .sync_service import BeadsSyncService
+
+# Field groups that can be pushed to an existing Beads task
+FIELD_STATUS = "status"
+FIELD_DEPENDENCIES = "dependencies"
+FIELD_METADATA = "metadata"
+
+
+@dataclass
+class SyncReport:
+    """Outcome of syncing a set of workstream files to Beads."""
+
+    results: List[BeadsSyncResult] = field(default_factory=list)
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+
+def content_hash(data: bytes) -> str:
+    """Hash raw workstream file content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def field_hashes(fields: Dict[str, Any]) -> Dict[str, str]:
+    """Hash each pushable field group.
+
+    Args:
+        fields: Field group name → JSON-serializable value
+
+    Returns:
+        Field group name → short hash
+    """
+    hashes = {}
+    for name, value in fields.items():
+        encoded = json.dumps(value, sort_keys=True, default=str).encode()
+        hashes[name] = hashlib.sha256(encoded).hexdigest()[:16]
+    return hashes
+
+
+def sync_changed_files(
+    service: "BeadsSyncService",
+    ws_files: Iterable[Path],
+    changed_only: bool = True,
+    parse: Optional[Callable[[Path], Dict[str, Any]]] = None,
+) -> SyncReport:
+    """Sync workstream files to Beads, skipping unchanged files and fields.
+
+    See BeadsSyncService.sync_workstreams_to_beads.
+    """
+    parse = parse or _parse_workstream_file
+    entries = service.mapping_manager.entries()
+    by_file = {
+        entry["file_path"]: entry
+        for entry in entries.values()
+        if entry.get("file_path") and entry.get("content_hash")
+    }
+
+    report = SyncReport()
+    for ws_file in ws_files:
+        rel_path = service._relative_path(ws_file)
+        try:
+            digest = content_hash(ws_file.read_bytes())
+            known = by_file.get(rel_path)
+            if changed_only and known and known["content_hash"] == digest:
+                report.unchanged += 1
+                continue
+            ws_data = parse(ws_file)
+        except Exception as e:
+            report.failed += 1
+            report.results.append(
+                BeadsSyncResult(success=False, task_id=ws_file.name, error=str(e))
+            )
+            continue
+
+        previous = entries.get(ws_data.get("ws_id") or "") if changed_only else None
+        result, kind = _sync_changed_workstream(
+            service, ws_file, ws_data, {"file_path": rel_path, "content_hash": digest}, previous
+        )
+        report.results.append(result)
+        setattr(report, kind, getattr(report, kind) + 1)
+
+    return report
+
+
+def _sync_changed_workstream(
+    service: "BeadsSyncService",
+    ws_file: Path,
+    ws_data: Dict[str, Any],
+    extra: Dict[str, Any],
+    previous: Optional[Dict[str, Any]],
+) -> Tuple[BeadsSyncResult, str]:
+    """Create or field-wise update one task; returns (result, report counter)."""
+    ws_id = ws_data.get("ws_id")
+    if not ws_id:
+        error = "Missing ws_id in workstream data"
+        return BeadsSyncResult(success=False, task_id=ws_file.name, error=error), "failed"
+
+    fields = _pushable_fields(service, ws_id, ws_data, ws_file)
+    extra = {**extra, "fields": field_hashes(fields), "synced_status": fields[FIELD_STATUS]}
+
+    beads_id = service.mapping_manager.get_beads_id(ws_id)
+    if not beads_id:
+        result = service._create_new_task(ws_id, ws_data, ws_file, extra)
+        return result, "created" if result.success else "failed"
+
+    old_hashes = (previous or {}).get("fields")
+    if old_hashes is None:
+        # No recorded hashes (legacy entry or full sync): push status only
+        changed = [FIELD_STATUS]
+    else:
+        changed = [
+            name for name, digest in extra["fields"].items() if old_hashes.get(name) != digest
+        ]
+
+    try:
+        if FIELD_STATUS in changed:
+            service.client.update_task_status(
+                beads_id, map_sdp_status_to_beads(fields[FIELD_STATUS])
+            )
+        if FIELD_DEPENDENCIES in changed:
+            # Added only; removed dependencies are not propagated (see module docs)
+            for dep_beads_id in fields[FIELD_DEPENDENCIES]:
+                service.client.add_dependency(beads_id, dep_beads_id, "blocks")
+        if FIELD_METADATA in changed:
+            _push_metadata(service, beads_id, fields[FIELD_METADATA])
+    except Exception as e:
+        result = BeadsSyncResult(
+            success=False, task_id=ws_id, beads_id=beads_id, error=f"Failed to update: {e}"
+        )
+        return result, "failed"
+
+    service.mapping_manager.add_mapping(ws_id, beads_id, extra)
+    message = f"Updated fields: {', '.join(changed)}" if changed else "No Beads fields changed"
+    return (
+        BeadsSyncResult(success=True, task_id=ws_id, beads_id=beads_id, message=message),
+        "updated" if changed else "unchanged",
+    )
+
+
+def _push_metadata(service: "BeadsSyncService", beads_id: str, metadata: Dict[str, Any]) -> None:
+    """Merge SDP fields into the task's metadata.
+
+    ``bd update --metadata`` replaces the whole blob, so keys written by
+    others (e.g. ScopeManager's scope_files) are read and sent back.
+    """
+    task = service.client.get_task(beads_id)
+    current = task.sdp_metadata if task else {}
+    service.client.update_metadata(beads_id, {**current, **metadata})
+
+
+def _pushable_fields(
+    service: "BeadsSyncService", ws_id: str, ws_data: Dict[str, Any], ws_file: Path
+) -> Dict[str, Any]:
+    """Values of the field groups that can be pushed to an existing task."""
+    status = ws_data.get("status", SDP_STATUS_BACKLOG)
+    dependencies = map_dependencies(service.mapping_manager, ws_data)
+    return {
+        FIELD_STATUS: getattr(status, "value", str(status)),
+        FIELD_DEPENDENCIES: sorted(d.task_id for d in dependencies),
+        FIELD_METADATA: task_metadata(ws_id, ws_data, ws_file),
+    }
+
+
+def _parse_workstream_file(ws_file: Path) -> Dict[str, Any]:
+    """Parse a workstream markdown file into sync data."""
+    from dataclasses import asdict
+
+    from ...core.workstream import parse_workstream
+
+    return asdict(parse_workstream(ws_file))
@@ -0,0 +1,87 @@
+"""
+File operations on the ID mapping journal.
+
+The journal is JSONL, one mapping entry per line. Appends and snapshots
+are fsync'd; snapshots replace the file atomically (temp file + rename).
+Callers serialize access with ``file_lock`` on a sidecar lock file, which
+stays stable across snapshot renames.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None  # type: ignore[assignment]
+
+
+# Entry fields other than these are extra data (e.g. sync hashes)
+_ID_FIELDS = ("sdp_id", "beads_id", "updated_at")
+
+
+def make_entry(
+    sdp_id: str, beads_id: str, updated_at: str, extra: Optional[Dict[str, Any]] = None
+) -> dict[str, Any]:
+    """Build the journal entry of one mapping."""
+    return {**(extra or {}), "sdp_id": sdp_id, "beads_id": beads_id, "updated_at": updated_at}
+
+
+def split_entry(entry: Dict[str, Any]) -> Tuple[str, str, str, Dict[str, Any]]:
+    """Split a journal entry into (sdp_id, beads_id, updated_at, extra)."""
+    extra = {k: v for k, v in entry.items() if k not in _ID_FIELDS}
+    return (
+        str(entry.get("sdp_id")),
+        str(entry.get("beads_id")),
+        str(entry.get("updated_at", "")),
+        extra,
+    )
+
+
+def read_entries(path: Path) -> List[dict[str, object]]:
+    """Read all journal lines (caller holds the lock)."""
+    entries = []
+    with open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                entries.append(json.loads(line))
+    return entries
+
+
+def append_entries(path: Path, entries: Iterable[dict[str, Any]]) -> None:
+    """Append entries with a single write and fsync (caller holds the lock)."""
+    lines = "".join(json.dumps(entry) + "\n" for entry in entries)
+    with open(path, "a") as f:
+        f.write(lines)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def write_entries(path: Path, entries: Iterable[dict[str, Any]]) -> None:
+    """Atomically replace the journal with entries (caller holds the lock)."""
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+@contextmanager
+def file_lock(lock_file: Path, exclusive: bool) -> Iterator[None]:
+    """Hold an advisory lock on a lock file (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file, "a") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
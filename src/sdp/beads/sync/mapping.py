@@ -2,25 +2,39 @@
 ID mapping between SDP workstreams and Beads tasks.
 
 Maintains bidirectional mapping: PP-FFF-SS ↔ bd-XXXX
+
+The mapping file is an append-only journal (JSONL, last write wins).
+New mappings are buffered and appended in fsync'd batches under an
+advisory file lock; compaction periodically rewrites the journal with
+one line per workstream.
 """
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Any, ContextManager, Dict, List, Optional
+
+from .journal import (
+    append_entries,
+    file_lock,
+    make_entry,
+    read_entries,
+    split_entry,
+    write_entries,
+)
 
 
 class BeadsSyncError(Exception):
     """Exception raised during sync operations."""
 
-    pass
-
 
 def resolve_ws_id_to_beads_id(ws_id: str, mapping_file: Path | None = None) -> str | None:
     """Resolve SDP workstream ID (PP-FFF-SS) to Beads task ID.
 
     Beads uses hash-based IDs (e.g., sdp-4qq); guard activate accepts ws_id (00-020-03).
-    This function looks up the mapping in .beads-sdp-mapping.jsonl.
+    This function looks up the mapping in .beads-sdp-mapping.jsonl through
+    the shared indexed MappingStore.
 
     Args:
         ws_id: Workstream ID (PP-FFF-SS or beads_id)
@@ -29,73 +43,136 @@ def resolve_ws_id_to_beads_id(ws_id: str, mapping_file: Path | None = None) -> s
     Returns:
         Beads task ID if found, else None (caller may use ws_id as-is for beads_id format)
     """
+    from .store import open_mapping_store  # store builds on MappingManager
+
     path = mapping_file or Path.cwd() / ".beads-sdp-mapping.jsonl"
     if not path.exists():
         return None
     try:
-        with open(path, "r") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                entry = json.loads(line)
-                if entry.get("sdp_id") == ws_id:
-                    beads_id = entry.get("beads_id")
-                    return beads_id if isinstance(beads_id, str) else None
-    except (json.JSONDecodeError, IOError):
-        pass
-    return None
+        return open_mapping_store(path).get_beads_id(ws_id)
+    except BeadsSyncError:
+        return None
 
 
 class MappingManager:
-    """Manages bidirectional ID mapping between SDP and Beads."""
+    """Manages bidirectional ID mapping between SDP and Beads.
 
-    def __init__(self, mapping_file: Path):
+    add_mapping() only buffers a journal entry; entries are appended to
+    the mapping file (one write + fsync per batch) when the buffer reaches
+    ``batch_size`` or on flush(). Compaction rewrites the journal once it
+    holds ``compact_ratio`` times more lines than live mappings.
+    """
+
+    def __init__(
+        self,
+        mapping_file: Path,
+        batch_size: int = 64,
+        compact_ratio: float = 2.0,
+        compact_min_lines: int = 100,
+    ):
         """Initialize mapping manager.
 
         Args:
             mapping_file: Path to ID mapping table (JSONL format)
+            batch_size: Pending entries that trigger an automatic flush
+            compact_ratio: Journal lines per live mapping that trigger compaction
+            compact_min_lines: Never compact journals shorter than this
         """
         self.mapping_file = mapping_file
+        self.batch_size = batch_size
+        self.compact_ratio = compact_ratio
+        self.compact_min_lines = compact_min_lines
         self._mapping: Dict[str, str] = {}  # sdp_id → beads_id
         self._reverse_mapping: Dict[str, str] = {}  # beads_id → sdp_id
+        self._updated_at: Dict[str, str] = {}  # sdp_id → last write timestamp
+        self._extra: Dict[str, Dict[str, Any]] = {}  # sdp_id → extra entry fields
+        self._pending: List[dict[str, Any]] = []  # Journal entries not yet on disk
+        self._journal_lines = 0  # Lines currently in the mapping file
+        self._lock = threading.RLock()  # Guards state for concurrent migration
+
+    @property
+    def lock_file(self) -> Path:
+        """Sidecar lock file (stable across compaction renames)."""
+        return self.mapping_file.with_name(self.mapping_file.name + ".lock")
 
     def load(self) -> None:
-        """Load ID mapping from file."""
+        """Load ID mapping from file (replaying the journal)."""
         if not self.mapping_file.exists():
             return
 
         try:
-            with open(self.mapping_file, "r") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-
-                    entry = json.loads(line)
-                    sdp_id = entry.get("sdp_id")
-                    beads_id = entry.get("beads_id")
-
-                    if sdp_id and beads_id:
-                        self._mapping[sdp_id] = beads_id
-                        self._reverse_mapping[beads_id] = sdp_id
-
+            with self._lock, self._locked(exclusive=False):
+                self._journal_lines = self._replay(self._read_entries())
         except (json.JSONDecodeError, IOError) as e:
             raise BeadsSyncError(f"Failed to load mapping file: {e}") from e
 
     def save(self) -> None:
-        """Save ID mapping to file (overwrite with current state)."""
+        """Save ID mapping to file (overwrite with current state).
+
+        Writes a compacted snapshot atomically (temp file + rename) and
+        drops any pending journal entries.
+        """
         try:
-            with open(self.mapping_file, "w") as f:
-                for sdp_id, beads_id in self._mapping.items():
-                    entry = {
-                        "sdp_id": sdp_id,
-                        "beads_id": beads_id,
-                        "updated_at": datetime.utcnow().isoformat(),
-                    }
-                    f.write(json.dumps(entry) + "\n")
-
-        except IOError as e:
+            with self._lock:
+                with self._locked(exclusive=True):
+                    self._write_snapshot()
+                self._pending.clear()
+        except (IOError, OSError) as e:
             raise BeadsSyncError(f"Failed to save mapping file: {e}") from e
 
+    def flush(self) -> int:
+        """Append pending journal entries to the mapping file.
+
+        All pending entries are written with a single write and fsync.
+
+        Returns:
+            Number of entries written
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+
+            try:
+                with self._locked(exclusive=True):
+                    append_entries(self.mapping_file, self._pending)
+            except (IOError, OSError) as e:
+                raise BeadsSyncError(f"Failed to append to mapping file: {e}") from e
+
+            written = len(self._pending)
+            self._journal_lines += written
+            self._pending.clear()
+            return written
+
+    def needs_compaction(self) -> bool:
+        """Check whether the journal has accumulated enough stale lines."""
+        live = max(len(self._mapping), 1)
+        return (
+            self._journal_lines >= self.compact_min_lines
+            and self._journal_lines > live * self.compact_ratio
+        )
+
+    def compact(self) -> None:
+        """Rewrite the journal with one line per workstream (last write wins).
+
+        Re-reads the file under an exclusive lock first, so mappings
+        appended by other processes are preserved.
+        """
+        try:
+            with self._lock:
+                self.flush()
+                with self._locked(exclusive=True):
+                    if self.mapping_file.exists():
+                        self._replay(self._read_entries())
+                    self._write_snapshot()
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            raise BeadsSyncError(f"Failed to compact mapping file: {e}") from e
+
+    def persist(self) -> None:
+        """Flush pending entries and compact if the journal is bloated."""
+        self.flush()
+        if self.needs_compaction():
+            self.compact()
+
     def get_beads_id(self, sdp_id: str) -> str | None:
         """Get Beads ID for given SDP workstream ID."""
         return self._mapping.get(sdp_id)
@@ -104,7 +181,59 @@ class MappingManager:
         """Get SDP workstream ID for given Beads ID."""
         return self._reverse_mapping.get(beads_id)
 
-    def add_mapping(self, sdp_id: str, beads_id: str) -> None:
-        """Add a new ID mapping."""
+    def add_mapping(
+        self, sdp_id: str, beads_id: str, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add a new ID mapping (buffered as a journal entry).
+
+        Args:
+            sdp_id: SDP workstream ID
+            beads_id: Beads task ID
+            extra: Additional fields stored with the entry (e.g. sync hashes)
+        """
+        timestamp = datetime.utcnow().isoformat()
+        with self._lock:
+            self._set(sdp_id, beads_id, timestamp, extra)
+            self._pending.append(make_entry(sdp_id, beads_id, timestamp, extra))
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def _set(
+        self, sdp_id: str, beads_id: str, updated_at: str, extra: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Update in-memory state for one mapping."""
         self._mapping[sdp_id] = beads_id
         self._reverse_mapping[beads_id] = sdp_id
+        self._updated_at[sdp_id] = updated_at
+        if extra:
+            self._extra[sdp_id] = dict(extra)
+        else:
+            self._extra.pop(sdp_id, None)
+
+    def _read_entries(self) -> List[dict[str, object]]:
+        """Read all journal lines (caller holds the lock)."""
+        return read_entries(self.mapping_file)
+
+    def _replay(self, entries: List[dict[str, object]]) -> int:
+        """Apply journal entries in order; returns number of lines replayed."""
+        for entry in entries:
+            if entry.get("sdp_id") and entry.get("beads_id"):
+                self._set(*split_entry(entry))
+        return len(entries)
+
+    def _write_snapshot(self) -> None:
+        """Atomically replace the journal with current state (caller holds lock)."""
+        now = datetime.utcnow().isoformat()
+        updated = self._updated_at
+        write_entries(
+            self.mapping_file,
+            (
+                make_entry(sdp_id, beads_id, updated.get(sdp_id) or now, self._extra.get(sdp_id))
+                for sdp_id, beads_id in self._mapping.items()
+            ),
+        )
+        self._journal_lines = len(self._mapping)
+
+    def _locked(self, exclusive: bool) -> ContextManager[None]:
+        """Hold an advisory lock on the sidecar lock file."""
+        return file_lock(self.lock_file, exclusive)
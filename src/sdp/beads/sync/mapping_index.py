@@ -0,0 +1,159 @@
+"""
+SQLite index of the ID mapping journal.
+
+The index (``<journal>.idx``) holds the latest entry per sdp_id, looked
+up by sdp_id or beads_id, plus the journal position it reflects. Since
+the journal is append-only, only bytes past the indexed offset are
+replayed; a new inode or a changed head means the journal was compacted
+or rewritten and it is replayed from the start.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+from .mapping import BeadsSyncError
+
+# (inode, size, mtime_ns) of a journal version
+Signature = Tuple[int, int, int]
+
+# Bytes hashed to detect a journal rewritten in place (same inode)
+_HEAD_BYTES = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mapping (
+    sdp_id TEXT PRIMARY KEY,
+    beads_id TEXT NOT NULL,
+    updated_at TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_mapping_beads_id ON mapping(beads_id);
+CREATE TABLE IF NOT EXISTS journal_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    inode INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    head TEXT NOT NULL
+);
+"""
+
+
+def sync_index(conn: sqlite3.Connection, mapping_file: Path) -> Tuple[int, Optional[Signature]]:
+    """Bring the index up to date with the journal in one transaction.
+
+    Returns:
+        (journal lines, journal signature) the index now reflects
+
+    Raises:
+        BeadsSyncError: If the journal cannot be read or parsed
+    """
+    try:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if mapping_file.exists():
+                return _replay_tail(conn, mapping_file)
+            conn.execute("DELETE FROM mapping")
+            conn.execute("DELETE FROM journal_state")
+            return 0, None
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError, sqlite3.Error) as e:
+        raise BeadsSyncError(f"Failed to index mapping file: {e}") from e
+
+
+def _replay_tail(conn: sqlite3.Connection, mapping_file: Path) -> Tuple[int, Optional[Signature]]:
+    """Index journal bytes past the stored offset (inside a transaction).
+
+    Returns:
+        (journal lines, journal signature) after indexing
+    """
+    signature = stat_signature(mapping_file)
+    state = conn.execute(
+        "SELECT inode, offset, lines, head FROM journal_state WHERE id = 1"
+    ).fetchone()
+
+    with open(mapping_file, "rb") as f:
+        offset, lines = 0, 0
+        if state is not None and signature is not None:
+            inode, offset, lines, head = state
+            unchanged = (
+                inode == signature[0] and signature[1] >= offset and _head_digest(f, offset) == head
+            )
+            if not unchanged:
+                offset, lines = 0, 0
+        if offset == 0:
+            conn.execute("DELETE FROM mapping")
+
+        f.seek(offset)
+        data = f.read()
+        for raw in data.splitlines():
+            if not raw.strip():
+                continue
+            entry = json.loads(raw)
+            lines += 1
+            sdp_id, beads_id = entry.get("sdp_id"), entry.get("beads_id")
+            if isinstance(sdp_id, str) and isinstance(beads_id, str) and sdp_id:
+                conn.execute(
+                    "INSERT OR REPLACE INTO mapping "
+                    "(sdp_id, beads_id, updated_at, entry) VALUES (?, ?, ?, ?)",
+                    (sdp_id, beads_id, str(entry.get("updated_at", "")), raw.decode()),
+                )
+            elif isinstance(sdp_id, str) and sdp_id:
+                # Entry no longer maps to a usable ID (last write wins)
+                conn.execute("DELETE FROM mapping WHERE sdp_id = ?", (sdp_id,))
+
+        offset += len(data)
+        head = _head_digest(f, offset)
+
+    conn.execute(
+        "INSERT OR REPLACE INTO journal_state (id, inode, offset, lines, head) "
+        "VALUES (1, ?, ?, ?, ?)",
+        (signature[0] if signature else 0, offset, lines, head),
+    )
+    return lines, signature
+
+
+def stat_signature(path: Path) -> Optional[Signature]:
+    """Identify a journal version by (inode, size, mtime)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _head_digest(f: BinaryIO, offset: int) -> str:
+    """Hash the first bytes of the journal up to the indexed offset."""
+    f.seek(0)
+    return hashlib.sha1(f.read(min(offset, _HEAD_BYTES))).hexdigest()
+
+
+def open_index(index_file: Path) -> sqlite3.Connection:
+    """Open the SQLite index, recreating it if corrupt.
+
+    Falls back to an in-memory index when the sidecar cannot be written
+    (e.g. read-only checkout); lookups stay indexed within the process.
+    """
+    try:
+        return _connect(str(index_file))
+    except sqlite3.DatabaseError:
+        pass
+    try:
+        if index_file.is_file():
+            index_file.unlink()
+            return _connect(str(index_file))
+    except (OSError, sqlite3.DatabaseError):
+        pass
+    return _connect(":memory:")
+
+
+def _connect(database: str) -> sqlite3.Connection:
+    """Connect in autocommit mode (transactions are explicit) and ensure schema."""
+    conn = sqlite3.connect(database, timeout=30, isolation_level=None, check_same_thread=False)
+    try:
+        conn.executescript(_SCHEMA)
+    except sqlite3.DatabaseError:
+        conn.close()
+        raise
+    return conn
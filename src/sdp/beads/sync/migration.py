@@ -0,0 +1,218 @@
+"""
+Dependency-ordered migration of SDP workstreams to Beads.
+
+Builds the workstream dependency graph first, then creates tasks level by
+level in topological order. Tasks within a level are independent and are
+created concurrently, so every ``blocks`` edge can be resolved in a single
+pass and wall time scales with graph depth rather than node count.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from ..models import BeadsSyncResult
+
+if TYPE_CHECKING:
+    from .sync_service import BeadsSyncService
+
+WorkstreamItem = Tuple[Path, Dict[str, Any]]
+
+
+@dataclass
+class MigrationPlan:
+    """Topological levels for a set of workstreams."""
+
+    levels: List[List[str]] = field(default_factory=list)
+    cyclic: List[str] = field(default_factory=list)
+    external: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@dataclass
+class MigrationEntry:
+    """Outcome of migrating one workstream file."""
+
+    ws_file: Path
+    ws_id: Optional[str]
+    result: BeadsSyncResult
+
+
+@dataclass
+class MigrationReport:
+    """Outcome of a dependency-ordered migration."""
+
+    entries: List[MigrationEntry] = field(default_factory=list)
+    levels: int = 0
+    missing_dependencies: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> int:
+        """Number of successfully migrated workstreams."""
+        return sum(1 for e in self.entries if e.result.success)
+
+    @property
+    def failed(self) -> int:
+        """Number of workstreams that failed to migrate."""
+        return len(self.entries) - self.succeeded
+
+
+def plan_migration(dependencies: Dict[str, List[str]]) -> MigrationPlan:
+    """Group workstreams into topological levels (Kahn's algorithm, O(V+E)).
+
+    Dependencies on workstreams outside the set are reported in
+    ``external`` and do not constrain ordering.
+
+    Args:
+        dependencies: ws_id → list of ws_ids it depends on
+
+    Returns:
+        MigrationPlan with levels (sorted for determinism) and cycle members
+    """
+    in_degree: Dict[str, int] = {ws_id: 0 for ws_id in dependencies}
+    dependents: Dict[str, List[str]] = {ws_id: [] for ws_id in dependencies}
+    external: Dict[str, List[str]] = {}
+
+    for ws_id, deps in dependencies.items():
+        for dep in dict.fromkeys(deps):  # Dedupe, keep order
+            if dep in dependencies:
+                in_degree[ws_id] += 1
+                dependents[dep].append(ws_id)
+            else:
+                external.setdefault(ws_id, []).append(dep)
+
+    plan = MigrationPlan(external=external)
+    level = sorted(ws_id for ws_id, degree in in_degree.items() if degree == 0)
+
+    while level:
+        plan.levels.append(level)
+        next_level: List[str] = []
+        for ws_id in level:
+            for dependent in dependents[ws_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_level.append(dependent)
+        level = sorted(next_level)
+
+    plan.cyclic = sorted(ws_id for ws_id, degree in in_degree.items() if degree > 0)
+    return plan
+
+
+def migrate_workstreams(
+    sync: "BeadsSyncService",
+    workstreams: List[WorkstreamItem],
+    max_workers: int = 8,
+    on_result: Optional[Callable[[MigrationEntry], None]] = None,
+) -> MigrationReport:
+    """Migrate workstreams to Beads in dependency order.
+
+    Args:
+        sync: Sync service used to create/update each task
+        workstreams: (file, parsed data) pairs, data as for sync_workstream_to_beads
+        max_workers: Maximum concurrent task creations within a level
+        on_result: Optional callback invoked as each workstream finishes
+
+    Returns:
+        MigrationReport with per-file results in dependency order. Workstreams
+        depending (transitively) on one that failed are reported as failed
+        without being created.
+    """
+    by_id, no_id = _group_by_ws_id(workstreams)
+
+    # Union of dependencies across duplicate files for the same ws_id
+    dependencies = {
+        ws_id: [dep for _, data in items for dep in data.get("dependencies") or []]
+        for ws_id, items in by_id.items()
+    }
+    plan = plan_migration(dependencies)
+
+    report = MigrationReport(
+        levels=len(plan.levels), missing_dependencies=_missing_dependencies(sync, plan.external)
+    )
+
+    def record(entries: List[MigrationEntry]) -> None:
+        for entry in entries:
+            report.entries.append(entry)
+            if on_result:
+                on_result(entry)
+
+    def sync_node(ws_id: Optional[str], items: List[WorkstreamItem]) -> List[MigrationEntry]:
+        # Duplicate files for one ws_id run sequentially: first creates, rest update
+        return [
+            MigrationEntry(ws_file, ws_id, sync.sync_workstream_to_beads(ws_file, ws_data))
+            for ws_file, ws_data in items
+        ]
+
+    record([e for item in no_id for e in sync_node(None, [item])])
+
+    failed: set[str] = set()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for level in plan.levels:
+            # Dependents of a workstream that failed to migrate are not created
+            blocked = {ws_id: [d for d in dependencies[ws_id] if d in failed] for ws_id in level}
+            futures = {
+                ws_id: executor.submit(sync_node, ws_id, by_id[ws_id])
+                for ws_id in level
+                if not blocked[ws_id]
+            }
+            for ws_id in level:
+                entries = _blocked_entries(ws_id, blocked[ws_id], by_id[ws_id])
+                if ws_id in futures:
+                    entries = futures[ws_id].result()
+                if not any(e.result.success for e in entries):
+                    failed.add(ws_id)
+                record(entries)
+
+    record(_cycle_entries(plan.cyclic, by_id))
+    return report
+
+
+def _group_by_ws_id(
+    workstreams: List[WorkstreamItem],
+) -> Tuple[Dict[str, List[WorkstreamItem]], List[WorkstreamItem]]:
+    """Group items by ws_id; items without one are returned separately."""
+    by_id: Dict[str, List[WorkstreamItem]] = {}
+    no_id: List[WorkstreamItem] = []
+    for ws_file, ws_data in workstreams:
+        ws_id = ws_data.get("ws_id")
+        if ws_id:
+            by_id.setdefault(ws_id, []).append((ws_file, ws_data))
+        else:
+            no_id.append((ws_file, ws_data))
+    return by_id, no_id
+
+
+def _missing_dependencies(
+    sync: "BeadsSyncService", external: Dict[str, List[str]]
+) -> Dict[str, List[str]]:
+    """Keep the external dependencies that have no Beads task yet."""
+    missing = {
+        ws_id: [dep for dep in deps if not sync.mapping_manager.get_beads_id(dep)]
+        for ws_id, deps in external.items()
+    }
+    return {ws_id: deps for ws_id, deps in missing.items() if deps}
+
+
+def _blocked_entries(
+    ws_id: str, failed_deps: List[str], items: List[WorkstreamItem]
+) -> List[MigrationEntry]:
+    """Build failed entries for a workstream whose dependencies failed to migrate."""
+    error = f"Blocked by failed dependencies: {', '.join(dict.fromkeys(failed_deps))}"
+    return [
+        MigrationEntry(ws_file, ws_id, BeadsSyncResult(success=False, task_id=ws_id, error=error))
+        for ws_file, _ in items
+    ]
+
+
+def _cycle_entries(
+    cyclic: List[str], by_id: Dict[str, List[WorkstreamItem]]
+) -> List[MigrationEntry]:
+    """Build failed entries for workstreams caught in a dependency cycle."""
+    error = f"Dependency cycle involving: {', '.join(cyclic)}"
+    return [
+        MigrationEntry(
+            ws_file, ws_id, BeadsSyncResult(success=False, task_id=ws_id, error=error)
+        )
+        for ws_id in cyclic
+        for ws_file, _ in by_id[ws_id]
+    ]
@@ -0,0 +1,232 @@
+"""
+Indexed ID mapping store shared by guard, sync, traceability and status.
+
+The JSONL journal (.beads-sdp-mapping.jsonl) stays the source of truth;
+a SQLite sidecar (see mapping_index) indexes it by both sdp_id and
+beads_id. Lookups are a stat() plus a B-tree probe instead of a linear
+scan of the whole file.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .mapping import MappingManager
+from .mapping_index import Signature, open_index, stat_signature, sync_index
+
+DEFAULT_MAPPING_FILE = ".beads-sdp-mapping.jsonl"
+
+
+class MappingStore(MappingManager):
+    """MappingManager whose lookups go through an on-disk index.
+
+    Writes keep the journal semantics of MappingManager (buffered,
+    fsync'd appends, compaction). Unflushed mappings of this instance
+    are served from memory; everything else comes from the index, so
+    several processes and commands see one consistent mapping.
+
+    Example:
+        store = open_mapping_store()
+        store.get_beads_id("00-020-03")  # "sdp-4qq"
+        store.get_sdp_id("sdp-4qq")      # "00-020-03"
+    """
+
+    def __init__(
+        self,
+        mapping_file: Path,
+        batch_size: int = 64,
+        compact_ratio: float = 2.0,
+        compact_min_lines: int = 100,
+        index_file: Optional[Path] = None,
+    ):
+        """Initialize mapping store.
+
+        Args:
+            mapping_file: Path to ID mapping journal (JSONL format)
+            batch_size: Pending entries that trigger an automatic flush
+            compact_ratio: Journal lines per live mapping that trigger compaction
+            compact_min_lines: Never compact journals shorter than this
+            index_file: SQLite index path (defaults to ``<mapping_file>.idx``)
+        """
+        super().__init__(mapping_file, batch_size, compact_ratio, compact_min_lines)
+        self.index_file = index_file or mapping_file.with_name(mapping_file.name + ".idx")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._signature: Optional[Signature] = None
+        self._synced = False  # Index reflects the journal at _signature
+
+    def load(self) -> None:
+        """Bring the index up to date with the journal."""
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Index journal lines appended since the last refresh.
+
+        Raises:
+            BeadsSyncError: If the journal cannot be read or parsed
+        """
+        with self._lock:
+            if self._is_current():
+                return
+            with self._locked(exclusive=False):
+                self._sync_index()
+
+    def flush(self) -> int:
+        """Append pending journal entries and index them.
+
+        Returns:
+            Number of entries written
+        """
+        with self._lock:
+            written = super().flush()
+            if written:
+                self._clear_overlay()
+                self.refresh()
+            return written
+
+    def needs_compaction(self) -> bool:
+        """Check whether the journal has accumulated enough stale lines."""
+        with self._lock:
+            self.refresh()
+            live = max(self.count(), 1)
+            return (
+                self._journal_lines >= self.compact_min_lines
+                and self._journal_lines > live * self.compact_ratio
+            )
+
+    def get_beads_id(self, sdp_id: str) -> str | None:
+        """Get Beads ID for given SDP workstream ID."""
+        with self._lock:
+            if sdp_id in self._mapping:
+                return self._mapping[sdp_id]
+            rows = self._query("SELECT beads_id FROM mapping WHERE sdp_id = ?", sdp_id)
+            return rows[0][0] if rows else None
+
+    def get_sdp_id(self, beads_id: str) -> str | None:
+        """Get SDP workstream ID for given Beads ID."""
+        with self._lock:
+            if beads_id in self._reverse_mapping:
+                return self._reverse_mapping[beads_id]
+            rows = self._query(
+                "SELECT sdp_id FROM mapping WHERE beads_id = ? ORDER BY updated_at DESC LIMIT 1",
+                beads_id,
+            )
+            return rows[0][0] if rows else None
+
+    def get_entry(self, sdp_id: str) -> Optional[Dict[str, Any]]:
+        """Get the latest journal entry for a workstream.
+
+        Returns:
+            Entry dict as written to the journal, or None if unmapped
+        """
+        with self._lock:
+            for entry in reversed(self._pending):
+                if entry["sdp_id"] == sdp_id:
+                    return dict(entry)
+            rows = self._query("SELECT entry FROM mapping WHERE sdp_id = ?", sdp_id)
+            return json.loads(rows[0][0]) if rows else None
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Get the latest journal entry of every mapped workstream.
+
+        One indexed scan; pending entries override flushed ones.
+
+        Returns:
+            sdp_id → entry dict
+        """
+        with self._lock:
+            rows = self._query("SELECT sdp_id, entry FROM mapping")
+            entries = {sdp_id: json.loads(raw) for sdp_id, raw in rows}
+            for entry in self._pending:
+                entries[entry["sdp_id"]] = dict(entry)
+            return entries
+
+    def count(self) -> int:
+        """Number of mapped workstreams (flushed and pending)."""
+        with self._lock:
+            (indexed, known), *_ = self._query(
+                "SELECT COUNT(*), SUM(sdp_id IN (SELECT value FROM json_each(?))) FROM mapping",
+                json.dumps(list(self._mapping)),
+            )
+            return int(indexed) + len(self._mapping) - int(known or 0)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Iterate (sdp_id, beads_id) pairs ordered by sdp_id."""
+        with self._lock:
+            merged = dict(self._query("SELECT sdp_id, beads_id FROM mapping"))
+            merged.update(self._mapping)
+        for sdp_id in sorted(merged):
+            yield sdp_id, merged[sdp_id]
+
+    def close(self) -> None:
+        """Close the index connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._synced = False
+
+    def _write_snapshot(self) -> None:
+        """Snapshot indexed plus pending mappings (caller holds lock)."""
+        self._sync_index()
+        rows = self._connection().execute("SELECT sdp_id, entry FROM mapping").fetchall()
+        for sdp_id, raw in rows:
+            if sdp_id not in self._mapping:
+                self._replay([json.loads(raw)])
+        super()._write_snapshot()
+        self._clear_overlay()
+        self._sync_index()
+
+    def _clear_overlay(self) -> None:
+        """Drop in-memory mappings once they are on disk."""
+        self._mapping.clear()
+        self._reverse_mapping.clear()
+        self._updated_at.clear()
+        self._extra.clear()
+
+    def _is_current(self) -> bool:
+        """Cheap check (one stat) whether the journal changed since last sync."""
+        return self._synced and self._signature == stat_signature(self.mapping_file)
+
+    def _sync_index(self) -> None:
+        """Replay new journal bytes into the index (caller holds file lock)."""
+        self._synced = False
+        self._journal_lines, self._signature = sync_index(self._connection(), self.mapping_file)
+        self._synced = True
+
+    def _query(self, sql: str, *params: Any) -> List[Tuple[Any, ...]]:
+        """Run a query against the refreshed index (caller holds lock)."""
+        self.refresh()
+        return self._connection().execute(sql, params).fetchall()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open (or reuse) the index connection."""
+        if self._conn is None:
+            self._conn = open_index(self.index_file)
+        return self._conn
+
+
+_stores: Dict[Path, MappingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_mapping_store(mapping_file: Optional[Path] = None) -> MappingStore:
+    """Get the shared mapping store for a journal.
+
+    Stores are cached per resolved path, so repeated lookups within one
+    process reuse a single index connection.
+
+    Args:
+        mapping_file: Path to mapping journal (default: .beads-sdp-mapping.jsonl in cwd)
+
+    Returns:
+        MappingStore for the journal
+    """
+    path = Path(mapping_file or Path.cwd() / DEFAULT_MAPPING_FILE).resolve()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = MappingStore(path)
+            _stores[path] = store
+        return store
@@ -6,18 +6,18 @@ Handles conversion between:
 - Beads task format (JSONL with hash-based IDs)
 """
 
+import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from ..client import BeadsClient
-from ..models import BeadsDependency, BeadsDependencyType, BeadsSyncResult, BeadsTaskCreate
-from .mapping import MappingManager
-from .status_mapper import (
-    SDP_STATUS_BACKLOG,
-    map_beads_status_to_sdp,
-    map_sdp_size_to_beads_priority,
-    map_sdp_status_to_beads,
-)
+from ..models import BeadsSyncResult
+from .incremental import SyncReport, sync_changed_files
+from .status_mapper import SDP_STATUS_BACKLOG, map_sdp_status_to_beads
+from .store import MappingStore
+from .task_builder import task_params
+from .writeback import WriteBackReport
+from .writeback_sync import write_back_all, write_back_task
 
 
 class BeadsSyncService:
@@ -43,14 +43,18 @@ class BeadsSyncService:
         """
         self.client = client
         mapping_path = mapping_file or Path.cwd() / ".beads-sdp-mapping.jsonl"
-        self.mapping_manager = MappingManager(mapping_path)
+        self.mapping_manager = MappingStore(mapping_path)
 
         # Load existing mapping
         self.mapping_manager.load()
 
     def persist_mapping(self) -> None:
-        """Persist ID mapping to file (deduplicates and overwrites)."""
-        self.mapping_manager.save()
+        """Persist ID mapping to file.
+
+        Appends buffered journal entries and compacts the journal
+        (deduplicating superseded lines) once it has grown enough.
+        """
+        self.mapping_manager.persist()
 
     def sync_workstream_to_beads(
         self,
@@ -117,39 +121,49 @@ class BeadsSyncService:
                 error=f"Failed to update: {e}",
             )
 
+    def sync_workstreams_to_beads(
+        self,
+        ws_files: Iterable[Path],
+        changed_only: bool = True,
+        parse: Optional[Callable[[Path], dict[str, Any]]] = None,
+    ) -> SyncReport:
+        """Sync many workstream files → Beads, skipping unchanged ones.
+
+        Files whose content hash matches the one recorded in the mapping
+        are skipped without parsing. For changed files only the field
+        groups (status, dependencies, metadata) whose hash differs are
+        pushed. Call persist_mapping() afterwards to store the hashes.
+
+        Args:
+            ws_files: Workstream markdown files
+            changed_only: Skip unchanged files and unchanged fields
+                (False re-syncs every file like sync_workstream_to_beads)
+            parse: File → workstream data (defaults to parse_workstream)
+
+        Returns:
+            SyncReport with per-file results for files that were synced
+        """
+        return sync_changed_files(self, ws_files, changed_only, parse)
+
+    def _relative_path(self, ws_file: Path) -> str:
+        """Path of a workstream file relative to the mapping file's directory."""
+        root = self.mapping_manager.mapping_file.parent.resolve()
+        return os.path.relpath(ws_file.resolve(), root)
+
     def _create_new_task(
-        self, ws_id: str, ws_data: dict[str, Any], ws_file: Path
+        self,
+        ws_id: str,
+        ws_data: dict[str, Any],
+        ws_file: Path,
+        extra: Optional[dict[str, Any]] = None,
     ) -> BeadsSyncResult:
         """Create new Beads task from SDP workstream."""
         try:
-            # Build description from workstream content
-            description = self._build_description(ws_data)
-
-            # Map dependencies
-            dependencies = self._map_dependencies(ws_data)
-
-            # Create task (Beads limits title to 500 chars)
-            full_title = f"{ws_id}: {ws_data.get('title', '')}"
-            title = full_title[:497] + "..." if len(full_title) > 500 else full_title
-
-            params = BeadsTaskCreate(
-                title=title,
-                description=description,
-                priority=map_sdp_size_to_beads_priority(ws_data.get("size", "MEDIUM")),
-                dependencies=dependencies,
-                external_ref=f"PP-FFF-SS:{ws_id}",
-                sdp_metadata={
-                    "ws_id": ws_id,
-                    "feature": ws_data.get("feature"),
-                    "file_path": str(ws_file),
-                },
-            )
-
+            params = task_params(self.mapping_manager, ws_id, ws_data, ws_file)
             task = self.client.create_task(params)
 
-            # Store mapping
-            self.mapping_manager.add_mapping(ws_id, task.id)
-            self.mapping_manager.save()
+            # Store mapping (journaled; flushed in batches / by persist_mapping)
+            self.mapping_manager.add_mapping(ws_id, task.id, extra)
 
             return BeadsSyncResult(
                 success=True,
@@ -165,39 +179,6 @@ class BeadsSyncService:
                 error=f"Failed to create: {e}",
             )
 
-    def _build_description(self, ws_data: dict[str, Any]) -> str:
-        """Build Beads task description from workstream data."""
-        description = f"**Goal:**\n{ws_data.get('goal', '')}\n\n"
-
-        if ws_data.get("context"):
-            description += f"**Context:**\n{ws_data['context']}\n\n"
-
-        if ws_data.get("acceptance_criteria"):
-            description += "**Acceptance Criteria:**\n"
-            for ac in ws_data["acceptance_criteria"]:
-                checked = "✓" if ac.get("checked") else "☐"
-                text = ac.get("description") or ac.get("text", "")
-                description += f"{checked} {text}\n"
-
-        return description
-
-    def _map_dependencies(self, ws_data: dict[str, Any]) -> list[BeadsDependency]:
-        """Map SDP dependencies to Beads dependencies."""
-        dependencies = []
-
-        for dep_ws_id in ws_data.get("dependencies", []):
-            # Check if dependency already synced
-            dep_beads_id = self.mapping_manager.get_beads_id(dep_ws_id)
-            if dep_beads_id:
-                dependencies.append(
-                    BeadsDependency(
-                        task_id=dep_beads_id,
-                        type=BeadsDependencyType.BLOCKS,
-                    )
-                )
-
-        return dependencies
-
     def sync_beads_to_workstream(
         self,
         beads_id: str,
@@ -215,32 +196,30 @@ class BeadsSyncService:
         Note:
             SDP is authoritative for content (title, goal, acceptance criteria).
             This method only updates status from Beads.
+            Use sync_beads_to_workstreams() to write back many tasks at once.
         """
-        try:
-            # Get Beads task
-            task = self.client.get_task(beads_id)
-            if not task:
-                return BeadsSyncResult(
-                    success=False,
-                    task_id=beads_id,
-                    error=f"Beads task not found: {beads_id}",
-                )
-
-            # Map Beads status → SDP status
-            sdp_status = map_beads_status_to_sdp(task.status)
-
-            # Update workstream frontmatter
-            # (Implementation would read yaml, update status field, write back)
-            # For now, just return success with mapped status
-            return BeadsSyncResult(
-                success=True,
-                task_id=beads_id,
-                message=f"Status would be updated to: {sdp_status}",
-            )
+        return write_back_task(self, beads_id, ws_file)
 
-        except Exception as e:
-            return BeadsSyncResult(
-                success=False,
-                task_id=beads_id,
-                error=f"Failed to sync: {e}",
-            )
+    def sync_beads_to_workstreams(
+        self,
+        ws_root: Path,
+        move_files: bool = False,
+        dry_run: bool = False,
+    ) -> WriteBackReport:
+        """Write Beads statuses back to all mapped workstreams in bulk.
+
+        Streams every task with a single iter_tasks() call, diffs it with
+        the frontmatter status and the status recorded at the last sync,
+        then rewrites all changed files in one atomic batch. A workstream
+        whose status also changed in markdown is left alone (a conflict, or
+        pending for the forward sync).
+
+        Args:
+            ws_root: Workstreams directory (e.g. docs/workstreams)
+            move_files: Move files between backlog/, in_progress/ and completed/
+            dry_run: Only compute the report, write nothing
+
+        Returns:
+            WriteBackReport with updated, conflicting and skipped workstreams
+        """
+        return write_back_all(self, ws_root, move_files, dry_run)
@@ -0,0 +1,70 @@
+"""
+Beads task contents built from SDP workstream data.
+"""
+
+from pathlib import Path
+from typing import Any
+
+from ..models import BeadsDependency, BeadsDependencyType, BeadsTaskCreate
+from .status_mapper import map_sdp_size_to_beads_priority
+from .store import MappingStore
+
+# Beads limits task titles to 500 characters
+MAX_TITLE_LENGTH = 500
+
+
+def build_description(ws_data: dict[str, Any]) -> str:
+    """Build Beads task description from workstream data."""
+    description = f"**Goal:**\n{ws_data.get('goal', '')}\n\n"
+
+    if ws_data.get("context"):
+        description += f"**Context:**\n{ws_data['context']}\n\n"
+
+    if ws_data.get("acceptance_criteria"):
+        description += "**Acceptance Criteria:**\n"
+        for ac in ws_data["acceptance_criteria"]:
+            checked = "✓" if ac.get("checked") else "☐"
+            text = ac.get("description") or ac.get("text", "")
+            description += f"{checked} {text}\n"
+
+    return description
+
+
+def map_dependencies(store: MappingStore, ws_data: dict[str, Any]) -> list[BeadsDependency]:
+    """Map SDP dependencies to Beads dependencies (skipping unsynced ones)."""
+    dependencies = []
+
+    for dep_ws_id in ws_data.get("dependencies", []):
+        dep_beads_id = store.get_beads_id(dep_ws_id)
+        if dep_beads_id:
+            dependencies.append(
+                BeadsDependency(
+                    task_id=dep_beads_id,
+                    type=BeadsDependencyType.BLOCKS,
+                )
+            )
+
+    return dependencies
+
+
+def task_metadata(ws_id: str, ws_data: dict[str, Any], ws_file: Path) -> dict[str, Any]:
+    """SDP metadata stored on a Beads task."""
+    return {"ws_id": ws_id, "feature": ws_data.get("feature"), "file_path": str(ws_file)}
+
+
+def task_params(
+    store: MappingStore, ws_id: str, ws_data: dict[str, Any], ws_file: Path
+) -> BeadsTaskCreate:
+    """Parameters for creating the Beads task of a workstream."""
+    full_title = f"{ws_id}: {ws_data.get('title', '')}"
+    if len(full_title) > MAX_TITLE_LENGTH:
+        full_title = full_title[: MAX_TITLE_LENGTH - 3] + "..."
+
+    return BeadsTaskCreate(
+        title=full_title,
+        description=build_description(ws_data),
+        priority=map_sdp_size_to_beads_priority(ws_data.get("size", "MEDIUM")),
+        dependencies=map_dependencies(store, ws_data),
+        external_ref=f"PP-FFF-SS:{ws_id}",
+        sdp_metadata=task_metadata(ws_id, ws_data, ws_file),
+    )
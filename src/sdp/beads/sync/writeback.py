@@ -0,0 +1,140 @@
+"""
+Bulk Beads → markdown status write-back.
+
+Diffs every mapped Beads task against the ``status`` in its workstream's
+frontmatter and the status recorded at the last sync, then rewrites all
+changed files in one batch: every new file is written to a temp file and
+fsync'd first, and only then are the temp files renamed into place
+(optionally into the ``backlog/``, ``in_progress/`` or ``completed/``
+directory matching the new status).
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Directory a workstream lives in for each SDP status (None = don't move)
+STATUS_DIRS: Dict[str, Optional[str]] = {
+    "backlog": "backlog",
+    "active": "in_progress",
+    "completed": "completed",
+    "blocked": None,
+}
+
+_FRONTMATTER = re.compile(r"\A---\n(.*?\n)---", re.DOTALL)
+_STATUS_LINE = re.compile(r"^status:[ \t]*(\S*)[ \t]*$", re.MULTILINE)
+_WS_ID_LINE = re.compile(r"^ws_id:[ \t]*['\"]?([^'\"\s]+)", re.MULTILINE)
+
+
+@dataclass
+class WriteBackChange:
+    """One workstream whose status differs between Beads and markdown."""
+
+    ws_id: str
+    beads_id: str
+    ws_file: Path
+    file_status: str
+    beads_status: str
+    target: Path
+
+
+@dataclass
+class WriteBackReport:
+    """Outcome of a bulk Beads → markdown write-back."""
+
+    updated: List[WriteBackChange] = field(default_factory=list)
+    conflicts: List[WriteBackChange] = field(default_factory=list)
+    pending_push: List[str] = field(default_factory=list)  # Changed only in markdown
+    unchanged: int = 0
+    missing_tasks: List[str] = field(default_factory=list)
+    missing_files: List[str] = field(default_factory=list)
+
+    @property
+    def moved(self) -> List[WriteBackChange]:
+        """Updated workstreams whose file changed directory."""
+        return [c for c in self.updated if c.target != c.ws_file]
+
+
+def read_ws_header(ws_file: Path) -> Tuple[Optional[str], Optional[str], str]:
+    """Read ws_id and status from a workstream's frontmatter.
+
+    Returns:
+        Tuple of (ws_id, status, full file content)
+    """
+    content = ws_file.read_text(encoding="utf-8")
+    match = _FRONTMATTER.match(content)
+    if not match:
+        return None, None, content
+    header = match.group(1)
+    ws_id = _WS_ID_LINE.search(header)
+    status = _STATUS_LINE.search(header)
+    return (
+        ws_id.group(1) if ws_id else None,
+        status.group(1).lower() if status else None,
+        content,
+    )
+
+
+def set_frontmatter_status(content: str, status: str) -> str:
+    """Replace the ``status`` field inside the frontmatter only."""
+    match = _FRONTMATTER.match(content)
+    if not match:
+        raise ValueError("Workstream has no frontmatter")
+    header = match.group(1)
+    if _STATUS_LINE.search(header):
+        header = _STATUS_LINE.sub(f"status: {status}", header, count=1)
+    else:
+        header += f"status: {status}\n"
+    return f"---\n{header}---{content[match.end() :]}"
+
+
+def target_path(ws_file: Path, ws_root: Path, status: str, move_files: bool) -> Path:
+    """Where a workstream file belongs after a status change.
+
+    Files are only moved when they live directly in one of the status
+    directories under ``ws_root`` and the new status has a directory.
+    """
+    if not move_files:
+        return ws_file
+    status_dir = STATUS_DIRS.get(status)
+    if status_dir is None:
+        return ws_file
+    if ws_file.parent.parent.resolve() != ws_root.resolve():
+        return ws_file
+    if ws_file.parent.name not in {d for d in STATUS_DIRS.values() if d}:
+        return ws_file
+    return ws_root / status_dir / ws_file.name
+
+
+def apply_write_back(changes: List[Tuple[WriteBackChange, str]]) -> None:
+    """Atomically rewrite a batch of workstream files.
+
+    All new contents are staged as fsync'd temp files next to their
+    targets before any file is replaced, so a failure while staging
+    leaves every workstream untouched.
+
+    Args:
+        changes: (change, new file content) pairs
+    """
+    staged: List[Tuple[Path, WriteBackChange]] = []
+    try:
+        for change, content in changes:
+            change.target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = change.target.with_name(f".{change.target.name}.tmp")
+            staged.append((tmp, change))
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+    except OSError:
+        for tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+
+    for tmp, change in staged:
+        os.replace(tmp, change.target)
+        if change.target != change.ws_file:
+            change.ws_file.unlink(missing_ok=True)
+
@@ -0,0 +1,195 @@
+"""
+Beads → markdown status write-back for BeadsSyncService.
+
+Bulk write-back streams every mapped task once, diffs it with the
+frontmatter status and the status recorded at the last sync, and
+rewrites all changed files in one atomic batch (see ``writeback``).
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+from ..models import BeadsSyncResult, BeadsTask
+from .incremental import FIELD_STATUS, content_hash, field_hashes
+from .status_mapper import map_beads_status_to_sdp
+from .writeback import (
+    WriteBackChange,
+    WriteBackReport,
+    apply_write_back,
+    read_ws_header,
+    set_frontmatter_status,
+    target_path,
+)
+
+if TYPE_CHECKING:
+    from .sync_service import BeadsSyncService
+
+
+def write_back_task(service: "BeadsSyncService", beads_id: str, ws_file: Path) -> BeadsSyncResult:
+    """Write one Beads task's status to its workstream file.
+
+    See BeadsSyncService.sync_beads_to_workstream.
+    """
+    try:
+        # Get Beads task
+        task = service.client.get_task(beads_id)
+        if not task:
+            return BeadsSyncResult(
+                success=False,
+                task_id=beads_id,
+                error=f"Beads task not found: {beads_id}",
+            )
+
+        # Map Beads status → SDP status
+        sdp_status = map_beads_status_to_sdp(task.status)
+
+        if not ws_file.exists():
+            return BeadsSyncResult(
+                success=True,
+                task_id=beads_id,
+                message=f"Workstream file not found, status not written: {sdp_status}",
+            )
+
+        ws_id, file_status, content = read_ws_header(ws_file)
+        if file_status == sdp_status:
+            return BeadsSyncResult(
+                success=True,
+                task_id=beads_id,
+                message=f"Status already {sdp_status}",
+            )
+
+        change = WriteBackChange(
+            ws_id=ws_id or ws_file.stem,
+            beads_id=beads_id,
+            ws_file=ws_file,
+            file_status=file_status or "",
+            beads_status=sdp_status,
+            target=ws_file,
+        )
+        new_content = set_frontmatter_status(content, sdp_status)
+        apply_write_back([(change, new_content)])
+        if ws_id and service.mapping_manager.get_beads_id(ws_id) == beads_id:
+            record_write_back(service, change, new_content)
+
+        return BeadsSyncResult(
+            success=True,
+            task_id=beads_id,
+            message=f"Status updated to: {sdp_status}",
+        )
+
+    except Exception as e:
+        return BeadsSyncResult(
+            success=False,
+            task_id=beads_id,
+            error=f"Failed to sync: {e}",
+        )
+
+
+def write_back_all(
+    service: "BeadsSyncService", ws_root: Path, move_files: bool, dry_run: bool
+) -> WriteBackReport:
+    """Write Beads statuses back to all mapped workstreams.
+
+    See BeadsSyncService.sync_beads_to_workstreams.
+    """
+    entries = service.mapping_manager.entries()
+    mapped = {entry["beads_id"] for entry in entries.values()}
+    tasks = {task.id: task for task in service.client.iter_tasks() if task.id in mapped}
+    report, batch = plan_write_back(entries, tasks, ws_root, move_files)
+    if batch and not dry_run:
+        apply_write_back(batch)
+        for change, new_content in batch:
+            record_write_back(service, change, new_content)
+    return report
+
+
+def record_write_back(
+    service: "BeadsSyncService", change: WriteBackChange, new_content: str
+) -> None:
+    """Record the written status (and new file hash) in the mapping."""
+    entry = service.mapping_manager.get_entry(change.ws_id) or {}
+    extra = {k: v for k, v in entry.items() if k not in ("sdp_id", "beads_id", "updated_at")}
+    extra["synced_status"] = change.beads_status
+    if "content_hash" in extra:
+        # Our own rewrite must not look like a local edit to `sync --changed`
+        extra["content_hash"] = content_hash(new_content.encode("utf-8"))
+        extra["file_path"] = service._relative_path(change.target)
+    if "fields" in extra:
+        extra["fields"] = {
+            **extra["fields"],
+            **field_hashes({FIELD_STATUS: change.beads_status}),
+        }
+    service.mapping_manager.add_mapping(change.ws_id, change.beads_id, extra)
+
+
+def scan_workstreams(ws_root: Path) -> Dict[str, Tuple[Path, Optional[str], str]]:
+    """Map ws_id → (file, frontmatter status, content) for all workstreams."""
+    found: Dict[str, Tuple[Path, Optional[str], str]] = {}
+    for ws_file in sorted(ws_root.rglob("*.md")):
+        try:
+            ws_id, status, content = read_ws_header(ws_file)
+        except (OSError, UnicodeDecodeError):
+            continue
+        if ws_id:
+            found[ws_id] = (ws_file, status, content)
+    return found
+
+
+def plan_write_back(
+    entries: Mapping[str, Dict[str, Any]],
+    tasks: Mapping[str, BeadsTask],
+    ws_root: Path,
+    move_files: bool,
+) -> Tuple[WriteBackReport, List[Tuple[WriteBackChange, str]]]:
+    """Diff mapped Beads tasks with their workstream files.
+
+    A workstream whose status changed both in Beads and in markdown since
+    the last sync (``synced_status``) is a conflict; one changed only in
+    markdown is left for the forward sync.
+
+    Args:
+        entries: Mapping entries by ws_id
+        tasks: Beads tasks by ID
+        ws_root: Workstreams directory
+        move_files: Move files to the directory of their new status
+
+    Returns:
+        Report plus (change, new file content) pairs to write
+    """
+    files = scan_workstreams(ws_root)
+    report = WriteBackReport()
+    batch: List[Tuple[WriteBackChange, str]] = []
+    for ws_id, entry in sorted(entries.items()):
+        task = tasks.get(entry["beads_id"])
+        if task is None:
+            report.missing_tasks.append(ws_id)
+            continue
+        if ws_id not in files:
+            report.missing_files.append(ws_id)
+            continue
+
+        ws_file, file_status, content = files[ws_id]
+        beads_status = map_beads_status_to_sdp(task.status)
+        if file_status == beads_status:
+            report.unchanged += 1
+            continue
+
+        change = WriteBackChange(
+            ws_id=ws_id,
+            beads_id=task.id,
+            ws_file=ws_file,
+            file_status=file_status or "",
+            beads_status=beads_status,
+            target=target_path(ws_file, ws_root, beads_status, move_files),
+        )
+        baseline = entry.get("synced_status")
+        if baseline is not None and file_status != baseline:
+            if beads_status == baseline:
+                report.pending_push.append(ws_id)
+            else:
+                report.conflicts.append(change)
+            continue
+
+        report.updated.append(change)
+        batch.append((change, set_frontmatter_status(content, beads_status)))
+    return report, batch
@@ -5,12 +5,22 @@ Convert existing SDP markdown workstreams to Beads tasks.
 """
 
 from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import click
 
 from ..beads.client import create_beads_client
-from ..beads.sync import BeadsSyncService
+from ..beads.sync import (
+    BeadsSyncError,
+    BeadsSyncService,
+    MigrationEntry,
+    migrate_workstreams,
+    open_mapping_store,
+)
+from . import beads_sync
+from .beads_sync import SKIP_PATTERNS as _SKIP_PATTERNS
 
 
 @click.group()
@@ -19,6 +29,10 @@ def beads() -> None:
     pass
 
 
+beads.add_command(beads_sync.sync)
+beads.add_command(beads_sync.pull)
+
+
 @beads.command()
 @click.argument(
     "workstreams_dir",
@@ -38,10 +52,21 @@ def beads() -> None:
     default=None,
     help="Use mock Beads client (deprecated: use --real for real Beads)",
 )
-def migrate(workstreams_dir: Path, use_real: bool, use_mock: bool | None) -> None:
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Concurrent task creations per dependency level",
+)
+def migrate(
+    workstreams_dir: Path, use_real: bool, use_mock: bool | None, workers: int
+) -> None:
     """Migrate markdown workstreams to Beads tasks.
 
-    Reads all markdown workstream files and converts them to Beads tasks.
+    Reads all markdown workstream files, builds their dependency graph and
+    creates Beads tasks level by level in topological order, so every
+    dependency is linked in a single pass.
 
     Example:
         sdp beads migrate docs/workstreams/backlog/
@@ -61,10 +86,9 @@ def migrate(workstreams_dir: Path, use_real: bool, use_mock: bool | None) -> Non
 
     # Find all workstream markdown files (exclude feature overviews, epics)
     all_files = list(Path(workstreams_dir).rglob("*.md"))
-    skip_patterns = ("00-032-00-", "BEADS-001-")  # Feature overview, Epic (no ws_id)
     ws_files = [
         f for f in all_files
-        if not any(f.name.startswith(p) for p in skip_patterns)
+        if not any(f.name.startswith(p) for p in _SKIP_PATTERNS)
     ]
 
     if not ws_files:
@@ -73,32 +97,35 @@ def migrate(workstreams_dir: Path, use_real: bool, use_mock: bool | None) -> Non
 
     click.echo(f"Found {len(ws_files)} workstream files")
 
-    # Migrate each workstream
-    success = 0
-    failed = 0
+    # Parse everything first so the dependency graph is complete
+    from ..core.workstream import parse_workstream
 
-    for ws_file in ws_files:
-        click.echo(f"\n📄 Processing {ws_file.name}")
+    parsed = []
+    parse_failed = 0
 
-        # Parse workstream file
+    for ws_file in ws_files:
         try:
-            from ..core.workstream import parse_workstream
-
             ws = parse_workstream(ws_file)
+            parsed.append((ws_file, asdict(ws)))
+        except Exception as e:
+            click.echo(f"  ❌ {ws_file.name}: {e}")
+            parse_failed += 1
 
-            # Convert to Beads
-            result = sync.sync_workstream_to_beads(ws_file, asdict(ws))
+    def report_entry(entry: MigrationEntry) -> None:
+        click.echo(f"\n📄 Processing {entry.ws_file.name}")
+        if entry.result.success:
+            click.echo(f"  ✅ {entry.ws_id} → {entry.result.beads_id}")
+        else:
+            click.echo(f"  ❌ {entry.ws_id}: {entry.result.error}")
 
-            if result.success:
-                click.echo(f"  ✅ {ws.ws_id} → {result.beads_id}")
-                success += 1
-            else:
-                click.echo(f"  ❌ {ws.ws_id}: {result.error}")
-                failed += 1
+    # Migrate level by level in dependency order
+    report = migrate_workstreams(sync, parsed, max_workers=workers, on_result=report_entry)
 
-        except Exception as e:
-            click.echo(f"  ❌ {ws_file.name}: {e}")
-            failed += 1
+    for ws_id, missing in report.missing_dependencies.items():
+        click.echo(f"  ⚠️  {ws_id}: dependencies not found: {', '.join(missing)}")
+
+    success = report.succeeded
+    failed = report.failed + parse_failed
 
     # Persist deduplicated mapping (fixes legacy append-duplicates)
     sync.persist_mapping()
@@ -107,7 +134,7 @@ def migrate(workstreams_dir: Path, use_real: bool, use_mock: bool | None) -> Non
     click.echo(f"\n{'='*60}")
     click.echo("Migration complete!")
     click.echo(f"{'='*60}")
-    click.echo(f"Total: {len(ws_files)}")
+    click.echo(f"Total: {len(ws_files)} ({report.levels} dependency levels)")
     click.echo(f"Success: {success} ✅")
     click.echo(f"Failed: {failed} ❌")
 
@@ -122,6 +149,45 @@ def migrate(workstreams_dir: Path, use_real: bool, use_mock: bool | None) -> Non
         click.echo("   Fix issues and run migration again")
 
 
+@beads.command()
+@click.option("--last", "count", type=int, default=20, help="Show the N most recent entries")
+@click.option("--since", type=click.DateTime(), default=None, help="Earliest timestamp (UTC)")
+@click.option("--until", type=click.DateTime(), default=None, help="Latest timestamp (UTC)")
+@click.option(
+    "--audit-file",
+    type=click.Path(dir_okay=False),
+    default=".sdp/audit.log",
+    help="Audit log path",
+)
+def audit(
+    count: int, since: Optional[datetime], until: Optional[datetime], audit_file: str
+) -> None:
+    """Show --auto-approve execution audit entries.
+
+    Without --since/--until only the tail of the active log is read;
+    with them, only rotated segments overlapping the range are opened.
+
+    Example:
+        sdp beads audit --since 2026-01-01 --until 2026-01-31
+    """
+    from ..beads.execution import AuditLogger
+
+    logger = AuditLogger(audit_file=audit_file)
+    if since or until:
+        entries = logger.read_between(since, until)[-count:]
+    else:
+        entries = logger.read_recent(count)
+
+    if not entries:
+        click.echo("No audit entries")
+        return
+    for entry in entries:
+        click.echo(
+            f"{entry['timestamp']}  {entry['user']}  {entry['feature']}  "
+            f"{entry['mode']}  {entry['workstreams_executed']} ws  {entry['result']}"
+        )
+
+
 @beads.command()
 @click.option(
     "--format",
@@ -160,20 +226,13 @@ def status(format: str) -> None:
 
 
 def _count_migrated_workstreams() -> int:
-    """Count migrated workstreams from mapping file."""
+    """Count migrated workstreams from the indexed mapping store."""
     mapping_file = Path(".beads-sdp-mapping.jsonl")
 
     if not mapping_file.exists():
         return 0
 
-    count = 0
     try:
-        with open(mapping_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    count += 1
-    except FileNotFoundError:
-        # File doesn't exist yet
-        pass
-
-    return count
+        return open_mapping_store(mapping_file).count()
+    except BeadsSyncError:
+        return 0
@@ -0,0 +1,129 @@
+"""
+Beads sync commands.
+
+Push markdown workstreams to Beads tasks and pull task statuses back.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from ..beads.client import create_beads_client
+from ..beads.sync import BeadsSyncService
+
+# Feature overview, Epic (no ws_id)
+SKIP_PATTERNS = ("00-032-00-", "BEADS-001-")
+
+
+@click.command()
+@click.argument(
+    "workstreams_dir",
+    type=click.Path(exists=True),
+    default="docs/workstreams",
+)
+@click.option(
+    "--changed/--all",
+    "changed_only",
+    default=True,
+    show_default=True,
+    help="Only sync files whose content changed since the last sync",
+)
+@click.option(
+    "--real",
+    "use_real",
+    is_flag=True,
+    default=False,
+    help="Use real Beads CLI (default: mock)",
+)
+def sync(workstreams_dir: Path, changed_only: bool, use_real: bool) -> None:
+    """Sync markdown workstreams to Beads tasks.
+
+    Compares each file's content hash with the one recorded in
+    .beads-sdp-mapping.jsonl: unchanged files are skipped without
+    parsing, and changed files push only the fields that differ.
+
+    Example:
+        sdp beads sync --changed
+    """
+    client = create_beads_client(use_mock=not use_real)
+    service = BeadsSyncService(client)
+
+    ws_files = sorted(
+        f
+        for f in Path(workstreams_dir).rglob("*.md")
+        if not any(f.name.startswith(p) for p in SKIP_PATTERNS)
+    )
+
+    report = service.sync_workstreams_to_beads(ws_files, changed_only=changed_only)
+    service.persist_mapping()
+
+    for result in report.results:
+        if not result.success:
+            click.echo(f"  ❌ {result.task_id}: {result.error}")
+
+    click.echo(
+        f"Synced {len(ws_files)} workstreams: "
+        f"{report.created} created, {report.updated} updated, "
+        f"{report.unchanged} unchanged, {report.failed} failed"
+    )
+    if report.failed:
+        sys.exit(1)
+
+
+@click.command()
+@click.argument(
+    "workstreams_dir",
+    type=click.Path(exists=True),
+    default="docs/workstreams",
+)
+@click.option(
+    "--move/--no-move",
+    "move_files",
+    default=False,
+    help="Move files between backlog/, in_progress/ and completed/",
+)
+@click.option("--dry-run", is_flag=True, default=False, help="Show changes, write nothing")
+@click.option(
+    "--real",
+    "use_real",
+    is_flag=True,
+    default=False,
+    help="Use real Beads CLI (default: mock)",
+)
+def pull(workstreams_dir: Path, move_files: bool, dry_run: bool, use_real: bool) -> None:
+    """Write Beads task statuses back to workstream frontmatter.
+
+    Fetches all tasks in one call and rewrites every changed workstream
+    in a single atomic batch. Workstreams whose status changed on both
+    sides since the last sync are reported as conflicts and left alone.
+
+    Example:
+        sdp beads pull --move
+    """
+    client = create_beads_client(use_mock=not use_real)
+    service = BeadsSyncService(client)
+
+    report = service.sync_beads_to_workstreams(
+        Path(workstreams_dir), move_files=move_files, dry_run=dry_run
+    )
+    if not dry_run:
+        service.persist_mapping()
+
+    for change in report.updated:
+        moved = f" → {change.target.parent.name}/" if change.target != change.ws_file else ""
+        click.echo(f"  ✅ {change.ws_id}: {change.file_status} → {change.beads_status}{moved}")
+    for change in report.conflicts:
+        click.echo(
+            f"  ⚠️  {change.ws_id}: conflict (markdown: {change.file_status}, "
+            f"Beads: {change.beads_status})"
+        )
+
+    verb = "Would update" if dry_run else "Updated"
+    click.echo(
+        f"{verb} {len(report.updated)} workstreams "
+        f"({len(report.moved)} moved), {len(report.conflicts)} conflicts, "
+        f"{report.unchanged} unchanged"
+    )
+    if report.conflicts:
+        sys.exit(1)
@@ -0,0 +1,129 @@
+"""CLI commands for checkpoint maintenance."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from sdp.unified.checkpoint.archive import archived_features
+from sdp.unified.checkpoint.retention import CheckpointRetention, parse_age
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+
+_db_option = click.option(
+    "--db",
+    "db_path",
+    type=click.Path(path_type=Path),
+    default=".sdp/checkpoints.db",
+    show_default=True,
+    help="Checkpoint database",
+)
+_archive_dir_option = click.option(
+    "--archive-dir",
+    type=click.Path(path_type=Path),
+    default=".sdp/archive",
+    show_default=True,
+    help="Directory for compressed feature archives",
+)
+_checkpoint_dir_option = click.option(
+    "--checkpoint-dir",
+    type=click.Path(path_type=Path),
+    default=".oneshot",
+    show_default=True,
+    help="Orchestrator checkpoint file directory",
+)
+
+
+@click.group()
+def checkpoint() -> None:
+    """Checkpoint maintenance commands."""
+    pass
+
+
+def _open_retention(db_path: Path, archive_dir: Path, checkpoint_dir: Path) -> CheckpointRetention:
+    """Open the database for retention, exiting if it does not exist."""
+    if not db_path.exists():
+        click.echo(f"❌ No checkpoint database at {db_path}")
+        sys.exit(1)
+    db = CheckpointDatabase(str(db_path))
+    db.initialize()
+    return CheckpointRetention(db, archive_dir, checkpoint_dir)
+
+
+@checkpoint.command("gc")
+@click.option(
+    "--keep-last",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+    help="Always keep this many most recently completed features",
+)
+@click.option(
+    "--older-than",
+    default="30d",
+    show_default=True,
+    help="Archive completed features idle for longer than this (e.g. 30d, 12h, 2w)",
+)
+@click.option("--dry-run", is_flag=True, help="List features that would be archived")
+@_db_option
+@_archive_dir_option
+@_checkpoint_dir_option
+def gc(
+    keep_last: int,
+    older_than: str,
+    dry_run: bool,
+    db_path: Path,
+    archive_dir: Path,
+    checkpoint_dir: Path,
+) -> None:
+    """Archive completed features and compact the checkpoint database.
+
+    Archived features can be brought back with ``sdp checkpoint restore``.
+    """
+    try:
+        age = parse_age(older_than)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--older-than") from e
+
+    retention = _open_retention(db_path, archive_dir, checkpoint_dir)
+    try:
+        result = retention.gc(keep_last, age, dry_run=dry_run)
+    finally:
+        retention.db.close()
+
+    if not result.archived:
+        click.echo("✅ Nothing to archive")
+        return
+    verb = "Would archive" if dry_run else "Archived"
+    click.echo(f"{verb} {len(result.archived)} feature(s): {', '.join(result.archived)}")
+    if not dry_run:
+        click.echo(
+            f"   Deleted {result.checkpoints_deleted} checkpoint(s), "
+            f"{result.files_deleted} checkpoint file(s); freed {result.pages_freed} page(s)"
+        )
+        click.echo(f"   Archives: {archive_dir}")
+
+
+@checkpoint.command("restore")
+@click.argument("feature")
+@_db_option
+@_archive_dir_option
+@_checkpoint_dir_option
+def restore(feature: str, db_path: Path, archive_dir: Path, checkpoint_dir: Path) -> None:
+    """Restore an archived feature into the checkpoint database.
+
+    Args:
+        feature: Feature ID (e.g. F01)
+    """
+    retention = _open_retention(db_path, archive_dir, checkpoint_dir)
+    try:
+        restored = retention.restore(feature)
+    except FileNotFoundError:
+        available = archived_features(archive_dir)
+        click.echo(f"❌ No archive for {feature}")
+        if available:
+            click.echo(f"   Archived features: {', '.join(available)}")
+        sys.exit(1)
+    finally:
+        retention.db.close()
+
+    click.echo(f"✅ Restored {restored} checkpoint(s) of {feature}")
@@ -2,13 +2,18 @@
 
 import sys
 from datetime import datetime, timezone
+from pathlib import Path
 
 import click
 
 from sdp.beads import create_beads_client
 from sdp.beads.sync.mapping import resolve_ws_id_to_beads_id
+from sdp.guard.checker import GuardChecker
+from sdp.guard.daemon import GuardDaemon, daemon_check, default_socket_path
 from sdp.guard.skill import GuardSkill
+from sdp.guard.snapshot import ScopeSnapshot, clear_snapshot, load_snapshot, write_snapshot
 from sdp.guard.state import GuardState, StateManager
+from sdp.guard.statefile import StateConflictError
 
 
 @click.group()
@@ -38,14 +43,14 @@ def activate(ws_id: str) -> None:
         sys.exit(1)
 
     ws = client.get_task(task_id)
-    scope = ws.sdp_metadata.get("scope_files", []) if ws else []
+    activated_at = datetime.now(timezone.utc).isoformat()
+    snapshot = ScopeSnapshot.from_task(ws_id, ws, activated_at, root=Path.cwd())
+    snapshot.task_id = task_id
+    scope = snapshot.scope_files
 
-    state = GuardState(
-        active_ws=ws_id,
-        activated_at=datetime.now(timezone.utc).isoformat(),
-        scope_files=scope,
-    )
+    state = GuardState(active_ws=ws_id, activated_at=activated_at, scope_files=scope)
     StateManager.save(state)
+    write_snapshot(snapshot, StateManager.snapshot_dir())
 
     click.echo(f"✅ Activated WS: {ws_id}")
     if scope:
@@ -55,37 +60,76 @@ def activate(ws_id: str) -> None:
 
 
 @guard.command("check")
-@click.argument("file_path", type=click.Path())
-def check_file(file_path: str) -> None:
-    """Check if file edit is allowed.
+@click.argument("file_paths", nargs=-1, required=True, type=click.Path())
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    default=False,
+    help="Check in-process even if a guard daemon is running",
+)
+def check_file(file_paths: tuple[str, ...], no_daemon: bool) -> None:
+    """Check if file edits are allowed.
+
+    Asks the guard daemon (sdp guard serve) if one is running, otherwise
+    answers from the scope snapshot written by activate, without calling
+    Beads. Falls back to a Beads lookup if there is no snapshot.
 
     Args:
-        file_path: Path to file to check
+        file_paths: Paths of files to check (one batch)
+        no_daemon: Skip the daemon
     """
-    state = StateManager.load()
-
-    if not state.active_ws:
-        click.echo("❌ No active WS. Run: sdp guard activate <ws_id>")
-        sys.exit(1)
-
-    # Resolve ws_id (00-020-03) to beads_id (sdp-4qq) for get_task
-    task_id = resolve_ws_id_to_beads_id(state.active_ws) or state.active_ws
-
-    client = create_beads_client()
-    guard_skill = GuardSkill(client)
-    guard_skill._active_ws = task_id
-
-    result = guard_skill.check_edit(file_path)
-
-    if not result.allowed:
+    results = None if no_daemon else daemon_check(file_paths)
+    if results is None:
+        # Beads client is only built if there is no snapshot
+        results = GuardChecker(client_factory=lambda: create_beads_client()).check(file_paths)
+
+    denied = False
+    for file_path, result in zip(file_paths, results):
+        if result.allowed:
+            click.echo(f"✅ Edit allowed: {file_path}")
+            continue
+        denied = True
+        if result.ws_id is None:
+            click.echo(f"❌ {result.reason}")
+            break  # Same answer for every path
         click.echo(f"❌ {result.reason}")
         if result.scope_files:
             click.echo("   Allowed files:")
             for f in result.scope_files[:10]:
                 click.echo(f"     - {f}")
+
+    if denied:
+        sys.exit(1)
+
+
+@guard.command("serve")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix socket path (default: .sdp/guard/guard.sock or $SDP_GUARD_SOCKET)",
+)
+def serve(socket_path: Path | None) -> None:
+    """Run the guard daemon in the foreground.
+
+    Keeps the active workstream and compiled scope in memory and answers
+    sdp guard check over a unix socket. Stop with Ctrl-C.
+    """
+    path = socket_path or default_socket_path()
+    try:
+        daemon = GuardDaemon(path, GuardChecker(client_factory=lambda: create_beads_client()))
+    except RuntimeError as e:
+        click.echo(f"❌ {e}")
         sys.exit(1)
 
-    click.echo(f"✅ Edit allowed: {file_path}")
+    click.echo(f"Guard daemon listening on {path}")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
 
 
 @guard.command("status")
@@ -105,10 +149,52 @@ def status() -> None:
         click.echo("Scope: unrestricted")
 
 
+@guard.command("refresh")
+def refresh() -> None:
+    """Re-read the active workstream's scope if Beads has changed it.
+
+    Compares the task's update timestamp with the one recorded in the
+    scope snapshot and rewrites the snapshot only when they differ.
+    """
+    state = StateManager.load()
+    if not state.active_ws:
+        click.echo("No active workstream")
+        return
+
+    snapshot = load_snapshot(StateManager.snapshot_dir())
+    task_id = (
+        snapshot.task_id
+        if snapshot is not None and snapshot.ws_id == state.active_ws
+        else resolve_ws_id_to_beads_id(state.active_ws) or state.active_ws
+    )
+    ws = create_beads_client().get_task(task_id)
+    if ws is None:
+        click.echo(f"❌ WS not found: {task_id}")
+        sys.exit(1)
+
+    if snapshot is not None and snapshot.ws_id == state.active_ws and not snapshot.is_stale(ws):
+        click.echo("✅ Scope snapshot is up to date")
+        return
+
+    activated_at = state.activated_at or datetime.now(timezone.utc).isoformat()
+    fresh = ScopeSnapshot.from_task(state.active_ws, ws, activated_at, root=Path.cwd())
+    fresh.task_id = task_id
+    state.scope_files = fresh.scope_files
+    try:
+        # Don't overwrite an activate/deactivate that ran while Beads was queried
+        StateManager.save(state, expected_version=state.version)
+    except StateConflictError:
+        click.echo("❌ Guard state changed during refresh, run it again")
+        sys.exit(1)
+    write_snapshot(fresh, StateManager.snapshot_dir())
+    click.echo(f"✅ Scope snapshot refreshed: {len(fresh.scope_files)} entries")
+
+
 @guard.command("deactivate")
 def deactivate() -> None:
     """Deactivate current workstream."""
     StateManager.clear()
+    clear_snapshot(StateManager.snapshot_dir())
     click.echo("✅ Guard deactivated")
 
 
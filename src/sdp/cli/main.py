@@ -82,6 +82,12 @@ try:
 except ImportError:
     skill = None
 
+checkpoint: click.Group | None = None
+try:
+    from sdp.cli.checkpoint import checkpoint
+except ImportError:
+    checkpoint = None
+
 status: click.Command | None = None
 try:
     from sdp.cli.status.command import status
@@ -157,6 +163,10 @@ if prd_validate:
 if skill:
     main.add_command(skill)
 
+# Add checkpoint commands
+if checkpoint:
+    main.add_command(checkpoint)
+
 # Add status command
 if status:
     main.add_command(status)
@@ -3,6 +3,7 @@
 import json
 from pathlib import Path
 
+from sdp.beads.sync import BeadsSyncError, open_mapping_store
 from sdp.cli.status.models import (
     BeadsStatus,
     GuardStatus,
@@ -127,11 +128,26 @@ class StatusCollector:
                     available=True,
                     synced=True,
                     last_sync=data.get("last_sync"),
+                    mapped_workstreams=self._count_mapped_workstreams(),
                 )
             except (json.JSONDecodeError, KeyError):
                 pass
 
-        return BeadsStatus(available=True, synced=False)
+        return BeadsStatus(
+            available=True,
+            synced=False,
+            mapped_workstreams=self._count_mapped_workstreams(),
+        )
+
+    def _count_mapped_workstreams(self) -> int:
+        """Count workstreams mapped to Beads tasks (indexed lookup)."""
+        mapping_file = self.root / ".beads-sdp-mapping.jsonl"
+        if not mapping_file.exists():
+            return 0
+        try:
+            return open_mapping_store(mapping_file).count()
+        except BeadsSyncError:
+            return 0
 
     def _suggest_actions(self) -> list[str]:
         """Suggest next actions based on state.
@@ -93,6 +93,8 @@ def _add_beads_section(lines: list[str], beads: BeadsStatus, verbose: bool) -> N
         lines.append(f"  {sync_status}")
         if beads.ready_tasks:
             lines.append(f"  Ready: {len(beads.ready_tasks)} tasks")
+        if beads.mapped_workstreams:
+            lines.append(f"  Mapped: {beads.mapped_workstreams} workstreams")
         if verbose and beads.last_sync:
             lines.append(f"  Last sync: {beads.last_sync}")
         lines.append("")
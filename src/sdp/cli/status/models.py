@@ -32,6 +32,7 @@ class BeadsStatus:
     synced: bool
     ready_tasks: list[str] = field(default_factory=list)
     last_sync: Optional[str] = None
+    mapped_workstreams: int = 0
 
 
 @dataclass
@@ -105,13 +105,13 @@ def show_scope(ws_id: str) -> None:
 
 @scope.command("add")
 @click.argument("ws_id")
-@click.argument("file_path")
-def add_to_scope(ws_id: str, file_path: str) -> None:
-    """Add file to workstream scope.
+@click.argument("file_paths", nargs=-1, required=True)
+def add_to_scope(ws_id: str, file_paths: tuple[str, ...]) -> None:
+    """Add files to workstream scope.
 
     Args:
         ws_id: Workstream ID
-        file_path: File path to add
+        file_paths: File paths to add (applied as one update)
     """
     from sdp.beads import create_beads_client
     from sdp.beads.scope_manager import ScopeManager
@@ -119,8 +119,8 @@ def add_to_scope(ws_id: str, file_path: str) -> None:
     manager = ScopeManager(create_beads_client())
 
     try:
-        manager.add_file(ws_id, file_path)
-        click.echo(f"✅ Added {file_path} to {ws_id} scope")
+        manager.apply_scope_patch(ws_id, add=file_paths)
+        click.echo(f"✅ Added {', '.join(file_paths)} to {ws_id} scope")
     except ValueError as e:
         click.echo(f"❌ {e}", err=True)
         sys.exit(1)
@@ -128,13 +128,13 @@ def add_to_scope(ws_id: str, file_path: str) -> None:
 
 @scope.command("remove")
 @click.argument("ws_id")
-@click.argument("file_path")
-def remove_from_scope(ws_id: str, file_path: str) -> None:
-    """Remove file from workstream scope.
+@click.argument("file_paths", nargs=-1, required=True)
+def remove_from_scope(ws_id: str, file_paths: tuple[str, ...]) -> None:
+    """Remove files from workstream scope.
 
     Args:
         ws_id: Workstream ID
-        file_path: File path to remove
+        file_paths: File paths to remove (applied as one update)
     """
     from sdp.beads import create_beads_client
     from sdp.beads.scope_manager import ScopeManager
@@ -142,8 +142,8 @@ def remove_from_scope(ws_id: str, file_path: str) -> None:
     manager = ScopeManager(create_beads_client())
 
     try:
-        manager.remove_file(ws_id, file_path)
-        click.echo(f"✅ Removed {file_path} from {ws_id} scope")
+        manager.apply_scope_patch(ws_id, remove=file_paths)
+        click.echo(f"✅ Removed {', '.join(file_paths)} from {ws_id} scope")
     except ValueError as e:
         click.echo(f"❌ {e}", err=True)
         sys.exit(1)
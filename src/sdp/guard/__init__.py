@@ -1,7 +1,22 @@
 """Guard module for WS scope enforcement."""
 
+from .checker import GuardChecker
 from .models import GuardResult
+from .scope_trie import ScopeTrie
 from .skill import GuardSkill
+from .snapshot import ScopeSnapshot
+from .statefile import StateConflictError, StateFile, StateFileError
 from .tracker import WorkstreamInProgressError, WorkstreamTracker
 
-__all__ = ["GuardResult", "GuardSkill", "WorkstreamTracker", "WorkstreamInProgressError"]
+__all__ = [
+    "GuardChecker",
+    "GuardResult",
+    "GuardSkill",
+    "ScopeSnapshot",
+    "ScopeTrie",
+    "StateConflictError",
+    "StateFile",
+    "StateFileError",
+    "WorkstreamTracker",
+    "WorkstreamInProgressError",
+]
@@ -0,0 +1,94 @@
+"""Guard checks shared by the CLI and the guard daemon."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from sdp.beads.base import BeadsClient
+from sdp.guard.models import GuardResult
+from sdp.guard.snapshot import SNAPSHOT_FILE, ScopeSnapshot, load_snapshot
+from sdp.guard.state import GuardState, StateManager
+
+NO_ACTIVE_WS = "No active WS. Run: sdp guard activate <ws_id>"
+
+_Signature = Tuple[Optional[Tuple[int, int, int]], Optional[Tuple[int, int, int]]]
+
+
+class GuardChecker:
+    """Check edits against the active workstream's scope.
+
+    State and scope snapshot are cached and only re-read when their files
+    change (one ``stat`` each per check), so a long-lived checker answers
+    from memory. Without a snapshot, the Beads task is looked up through
+    ``client_factory`` (created once).
+    """
+
+    def __init__(self, client_factory: Optional[Callable[[], BeadsClient]] = None) -> None:
+        """Initialize checker.
+
+        Args:
+            client_factory: Creates the Beads client for the no-snapshot fallback
+        """
+        self._client_factory = client_factory
+        self._client: Optional[BeadsClient] = None
+        self._lock = threading.Lock()
+        self._signature: Optional[_Signature] = None
+        self._state = GuardState()
+        self._snapshot: Optional[ScopeSnapshot] = None
+
+    def check(self, file_paths: Sequence[str]) -> List[GuardResult]:
+        """Check a batch of file edits.
+
+        Args:
+            file_paths: Paths of files about to be edited
+
+        Returns:
+            One GuardResult per path, in order
+        """
+        state, snapshot = self._current()
+        if not state.active_ws:
+            return [
+                GuardResult(allowed=False, ws_id=None, reason=NO_ACTIVE_WS, scope_files=[])
+                for _ in file_paths
+            ]
+        if snapshot is not None and snapshot.ws_id == state.active_ws:
+            return [snapshot.check(path) for path in file_paths]
+        return self._check_with_beads(state.active_ws, file_paths)
+
+    def _current(self) -> Tuple[GuardState, Optional[ScopeSnapshot]]:
+        """State and snapshot, re-read if their files changed."""
+        state_file = StateManager.STATE_FILE
+        snapshot_file = StateManager.snapshot_dir() / SNAPSHOT_FILE
+        signature = (_stat_signature(state_file), _stat_signature(snapshot_file))
+        with self._lock:
+            if signature != self._signature:
+                self._state = StateManager.load()
+                self._snapshot = load_snapshot(snapshot_file.parent)
+                self._signature = signature
+            return self._state, self._snapshot
+
+    def _check_with_beads(self, ws_id: str, file_paths: Sequence[str]) -> List[GuardResult]:
+        """Fallback: read the scope from Beads (no snapshot)."""
+        from sdp.beads import create_beads_client
+        from sdp.beads.sync.mapping import resolve_ws_id_to_beads_id
+        from sdp.guard.skill import GuardSkill
+
+        with self._lock:
+            if self._client is None:
+                self._client = (self._client_factory or create_beads_client)()
+            client = self._client
+
+        # Resolve ws_id (00-020-03) to beads_id (sdp-4qq) for get_task
+        guard_skill = GuardSkill(client)
+        guard_skill._active_ws = resolve_ws_id_to_beads_id(ws_id) or ws_id
+        return [guard_skill.check_edit(path) for path in file_paths]
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, size, mtime_ns) of a file, or None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
@@ -0,0 +1,176 @@
+"""Resident guard daemon answering checks over a unix domain socket.
+
+``sdp guard serve`` keeps a GuardChecker (active workstream, compiled
+scope, Beads client for the fallback) in memory. Each request is one
+line of JSON and gets one line of JSON back; a connection may send any
+number of requests::
+
+    {"op": "check", "paths": ["src/a.py", "src/b.py"]}
+    {"results": [{"path": "src/a.py", "allowed": true, ...}, ...]}
+
+``scope_files`` is only filled in for denied paths.
+
+``daemon_check`` is the client side. It returns None when no daemon is
+listening, so callers fall back to checking in-process.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from sdp.guard.checker import GuardChecker
+from sdp.guard.models import GuardResult
+from sdp.guard.state import StateManager
+
+SOCKET_ENV = "SDP_GUARD_SOCKET"
+_MAX_SOCKET_PATH = 100  # sun_path is 104-108 bytes depending on platform
+
+
+def default_socket_path() -> Path:
+    """Socket path: $SDP_GUARD_SOCKET, else next to the scope snapshot.
+
+    Falls back to a per-project path in the temp directory when the
+    project path is too long for a unix socket.
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    path = (StateManager.snapshot_dir() / "guard.sock").absolute()
+    if len(str(path)) <= _MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha1(str(path).encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"sdp-guard-{digest}.sock"
+
+
+class GuardDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server wrapping one long-lived GuardChecker."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, checker: Optional[GuardChecker] = None) -> None:
+        """Bind the socket.
+
+        Args:
+            socket_path: Unix socket to listen on
+            checker: Checker to serve (default: a new GuardChecker)
+
+        Raises:
+            RuntimeError: If another daemon is already listening
+        """
+        self.socket_path = socket_path
+        self.checker = checker or GuardChecker()
+        self.requests_served = 0
+        _remove_stale_socket(socket_path)
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o177)  # Socket readable by the owner only
+        try:
+            super().__init__(str(socket_path), _GuardRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def handle_request_line(self, line: bytes) -> Dict[str, Any]:
+        """Answer one JSON request."""
+        try:
+            request = json.loads(line)
+            op = request.get("op")
+            if op == "ping":
+                return {"ok": True, "pid": os.getpid()}
+            if op == "check":
+                paths = request.get("paths")
+                if not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+                    return {"error": "paths must be a list of strings"}
+                results = self.checker.check(paths)
+                self.requests_served += 1
+                return {"results": [_encode(path, r) for path, r in zip(paths, results)]}
+            return {"error": f"Unknown op: {op}"}
+        except (ValueError, AttributeError) as e:
+            return {"error": f"Bad request: {e}"}
+
+    def server_close(self) -> None:
+        """Close and remove the socket file."""
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class _GuardRequestHandler(socketserver.StreamRequestHandler):
+    server: GuardDaemon
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.handle_request_line(line)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def daemon_check(
+    file_paths: Sequence[str],
+    socket_path: Optional[Path] = None,
+    timeout: float = 2.0,
+) -> Optional[List[GuardResult]]:
+    """Check paths through a running daemon.
+
+    Args:
+        file_paths: Paths to check
+        socket_path: Daemon socket (default: default_socket_path())
+        timeout: Seconds to wait for the daemon
+
+    Returns:
+        One GuardResult per path, or None if no daemon answered
+    """
+    path = socket_path or default_socket_path()
+    if not path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            request = {"op": "check", "paths": list(file_paths)}
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as reader:
+                response = json.loads(reader.readline())
+        return [
+            GuardResult(
+                allowed=item["allowed"],
+                ws_id=item["ws_id"],
+                reason=item["reason"],
+                scope_files=item["scope_files"],
+            )
+            for item in response["results"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _encode(path: str, result: GuardResult) -> Dict[str, Any]:
+    """Serialize a result; scope_files is only sent for denied paths."""
+    return {
+        "path": path,
+        "allowed": result.allowed,
+        "ws_id": result.ws_id,
+        "reason": result.reason,
+        "scope_files": [] if result.allowed else result.scope_files,
+    }
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Remove a socket left behind by a dead daemon."""
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    raise RuntimeError(f"Guard daemon already running on {socket_path}")
@@ -0,0 +1,142 @@
+"""Compiled scope matching for guard checks.
+
+Scope entries are split into exact files, directories and globs. Files
+and directories go into a path-component trie, so a check walks the
+path once; globs are combined into a single regex.
+"""
+
+import os
+import posixpath
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def normalize_path(path: str, root: Optional[str] = None) -> str:
+    """Normalize a path for scope matching.
+
+    Backslashes become slashes, ``./`` and ``..`` are collapsed, and
+    absolute paths inside ``root`` (default: cwd) are made relative.
+    """
+    path = path.replace("\\", "/")
+    if posixpath.isabs(path):
+        base = (root or os.getcwd()).replace("\\", "/")
+        relative = posixpath.relpath(path, base)
+        if not relative.startswith("../"):
+            path = relative
+    normalized = posixpath.normpath(path)
+    return "" if normalized == "." else normalized
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a scope glob to a regex.
+
+    ``*`` and ``?`` stay within one path segment, ``**`` spans
+    directories, ``[...]`` is a character class.
+    """
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[" and "]" in pattern[i + 1 :]:
+            end = pattern.index("]", i + 1)
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            out.append(f"[^{body[1:]}]" if body.startswith("!") else f"[{body}]")
+            i = end
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+class _TrieNode:
+    __slots__ = ("children", "file", "subtree")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.file = False  # Exact file in scope
+        self.subtree = False  # Everything below is in scope
+
+
+class ScopeTrie:
+    """Compiled scope: a path-component trie plus one combined glob regex."""
+
+    def __init__(
+        self,
+        files: Sequence[str] = (),
+        directories: Sequence[str] = (),
+        globs: Sequence[str] = (),
+    ) -> None:
+        self._root = _TrieNode()
+        for path in files:
+            self._insert(path).file = True
+        for path in directories:
+            self._insert(path).subtree = True
+        self._globs = (
+            re.compile("|".join(f"(?:{glob_to_regex(normalize_path(g))})" for g in globs))
+            if globs
+            else None
+        )
+
+    @classmethod
+    def from_scope(cls, scope: Sequence[str], root: Optional[Path] = None) -> "ScopeTrie":
+        """Build from raw scope entries (see classify_scope)."""
+        classified = classify_scope(scope, root)
+        return cls(classified["files"], classified["directories"], classified["globs"])
+
+    def matches(self, path: str) -> bool:
+        """Whether path is covered by the scope."""
+        normalized = normalize_path(path)
+        node = self._root
+        for part in normalized.split("/"):
+            if node.subtree:
+                return True
+            next_node = node.children.get(part)
+            if next_node is None:
+                break
+            node = next_node
+        else:
+            if node.file or node.subtree:
+                return True
+        return self._globs is not None and self._globs.fullmatch(normalized) is not None
+
+    def _insert(self, path: str) -> _TrieNode:
+        node = self._root
+        normalized = normalize_path(path)
+        if not normalized:
+            node.subtree = True  # "." or "/" covers everything
+            return node
+        for part in normalized.split("/"):
+            node = node.children.setdefault(part, _TrieNode())
+        return node
+
+
+def classify_scope(scope: Sequence[str], root: Optional[Path] = None) -> Dict[str, List[str]]:
+    """Split scope entries into files, directories and globs.
+
+    Entries with ``*``, ``?`` or ``[`` are globs; entries ending in ``/``
+    (or existing directories under ``root``) are directories.
+    """
+    classified: Dict[str, List[str]] = {"files": [], "directories": [], "globs": []}
+    for entry in scope:
+        if _GLOB_CHARS.search(entry):
+            classified["globs"].append(entry)
+        elif entry.endswith(("/", "\\")) or (root is not None and (root / entry).is_dir()):
+            classified["directories"].append(entry)
+        else:
+            classified["files"].append(entry)
+    return classified
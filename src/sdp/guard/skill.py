@@ -2,6 +2,7 @@
 
 from sdp.beads import BeadsClient
 from sdp.guard.models import GuardResult
+from sdp.guard.scope_trie import ScopeTrie
 
 
 class GuardSkill:
@@ -59,7 +60,7 @@ class GuardSkill:
                 scope_files=[],
             )
 
-        if file_path not in scope:
+        if not ScopeTrie.from_scope(scope).matches(file_path):
             return GuardResult(
                 allowed=False,
                 ws_id=self._active_ws,
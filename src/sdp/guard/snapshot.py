@@ -0,0 +1,140 @@
+"""Local scope snapshot for Beads-free guard checks.
+
+``sdp guard activate`` writes the active workstream's scope to
+``.sdp/guard/scope.json``. ``sdp guard check`` then answers from that
+snapshot through a compiled path trie, without building a Beads client.
+The snapshot records the task's ``updated_at`` so ``sdp guard refresh``
+can tell when Beads has a newer scope.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sdp.beads.models import BeadsTask
+from sdp.guard.models import GuardResult
+from sdp.guard.scope_trie import ScopeTrie, classify_scope
+
+SNAPSHOT_FILE = "scope.json"
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class ScopeSnapshot:
+    """Scope of the active workstream as of activation."""
+
+    ws_id: str
+    task_id: str
+    activated_at: str
+    task_updated_at: Optional[str] = None
+    scope_files: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+    directories: List[str] = field(default_factory=list)
+    globs: List[str] = field(default_factory=list)
+    version: int = SNAPSHOT_VERSION
+
+    @classmethod
+    def from_task(
+        cls,
+        ws_id: str,
+        task: Optional[BeadsTask],
+        activated_at: str,
+        root: Optional[Path] = None,
+    ) -> "ScopeSnapshot":
+        """Build a snapshot from the workstream's Beads task."""
+        scope = scope_of(task)
+        classified = classify_scope(scope, root)
+        updated_at = getattr(task, "updated_at", None)
+        task_id = getattr(task, "id", None)
+        return cls(
+            ws_id=ws_id,
+            task_id=task_id if isinstance(task_id, str) else ws_id,
+            activated_at=activated_at,
+            task_updated_at=updated_at.isoformat() if isinstance(updated_at, datetime) else None,
+            scope_files=scope,
+            files=classified["files"],
+            directories=classified["directories"],
+            globs=classified["globs"],
+        )
+
+    def check(self, file_path: str) -> GuardResult:
+        """Check if file edit is allowed, without Beads."""
+        if not self.scope_files:
+            return GuardResult(
+                allowed=True, ws_id=self.ws_id, reason="No scope restrictions", scope_files=[]
+            )
+        if not self.trie.matches(file_path):
+            return GuardResult(
+                allowed=False,
+                ws_id=self.ws_id,
+                reason=f"File {file_path} not in WS scope",
+                scope_files=self.scope_files,
+            )
+        return GuardResult(
+            allowed=True, ws_id=self.ws_id, reason="File in scope", scope_files=self.scope_files
+        )
+
+    @cached_property
+    def trie(self) -> ScopeTrie:
+        """Compiled scope (built once per snapshot)."""
+        return ScopeTrie(self.files, self.directories, self.globs)
+
+    def is_stale(self, task: Optional[BeadsTask]) -> bool:
+        """Whether Beads has changed the task since the snapshot was taken.
+
+        Compares ``updated_at``; when either side has no timestamp, the
+        scope itself is compared.
+        """
+        if task is None:
+            return True
+        updated_at = task.updated_at.isoformat() if task.updated_at else None
+        if updated_at and self.task_updated_at:
+            return updated_at != self.task_updated_at
+        return scope_of(task) != self.scope_files
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+def scope_of(task: Optional[BeadsTask]) -> List[str]:
+    """Scope entries stored in a task's SDP metadata."""
+    scope = task.sdp_metadata.get("scope_files", []) if task else []
+    return list(scope) if isinstance(scope, list) else []
+
+
+def write_snapshot(snapshot: ScopeSnapshot, directory: Path) -> Path:
+    """Atomically write the snapshot to ``directory``."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / SNAPSHOT_FILE
+    tmp = directory / f".{SNAPSHOT_FILE}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(snapshot.to_dict(), f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return path
+
+
+def load_snapshot(directory: Path) -> Optional[ScopeSnapshot]:
+    """Load the snapshot, or None if missing, unreadable or outdated."""
+    try:
+        with open(directory / SNAPSHOT_FILE) as f:
+            data = json.load(f)
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+        return ScopeSnapshot(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def clear_snapshot(directory: Path) -> None:
+    """Remove the snapshot (no active workstream)."""
+    try:
+        (directory / SNAPSHOT_FILE).unlink()
+    except FileNotFoundError:
+        pass
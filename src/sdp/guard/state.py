@@ -1,9 +1,10 @@
 """Guard state management."""
 
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
 
+from sdp.guard.statefile import StateFile
+
 
 @dataclass
 class GuardState:
@@ -12,6 +13,7 @@ class GuardState:
     active_ws: str | None = None
     activated_at: str | None = None
     scope_files: list[str] | None = None
+    version: int = 0  # State file version this was read at
 
 
 class StateManager:
@@ -25,24 +27,32 @@ class StateManager:
 
         Returns:
             GuardState instance
-        """
-        if not cls.STATE_FILE.exists():
-            return GuardState()
 
-        with open(cls.STATE_FILE) as f:
-            data = json.load(f)
-        return GuardState(**data)
+        Raises:
+            StateFileError: If the state file is corrupt
+        """
+        data = StateFile(cls.STATE_FILE).read()
+        known = {f.name for f in fields(GuardState)}
+        return GuardState(**{k: v for k, v in data.items() if k in known})
 
     @classmethod
-    def save(cls, state: GuardState) -> None:
-        """Save state to file.
+    def save(cls, state: GuardState, expected_version: int | None = None) -> None:
+        """Save state to file atomically.
 
         Args:
-            state: State to persist
+            state: State to persist (its version is updated)
+            expected_version: Fail if the file changed since this version
+
+        Raises:
+            StateConflictError: If expected_version does not match
         """
-        cls.STATE_FILE.parent.mkdir(exist_ok=True)
-        with open(cls.STATE_FILE, "w") as f:
-            json.dump(asdict(state), f, indent=2)
+        data = asdict(state)
+        state.version = StateFile(cls.STATE_FILE).write(data, expected_version)
+
+    @classmethod
+    def snapshot_dir(cls) -> Path:
+        """Directory holding the scope snapshot (next to the state file)."""
+        return cls.STATE_FILE.parent / "guard"
 
     @classmethod
     def clear(cls) -> None:
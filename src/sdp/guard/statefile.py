@@ -0,0 +1,176 @@
+"""Atomic, lock-protected JSON state files.
+
+Writes go to a temp file that is fsync'd and renamed over the target, so
+readers see either the old or the new document, never a truncated one.
+Read-modify-write sequences hold an ``fcntl`` advisory lock on a sidecar
+``.lock`` file, and every write bumps a ``version`` counter that callers
+can use for compare-and-swap.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None  # type: ignore[assignment]
+
+VERSION_KEY = "version"
+
+
+class StateFileError(ValueError):
+    """State file exists but is not a JSON object."""
+
+    pass
+
+
+class StateConflictError(RuntimeError):
+    """State file changed since it was read (version mismatch)."""
+
+    def __init__(self, path: Path, expected: int, actual: int) -> None:
+        super().__init__(f"{path} is at version {actual}, expected {expected}")
+        self.expected = expected
+        self.actual = actual
+
+
+class _PathLock:
+    """Process-wide reentrant lock for one state file.
+
+    flock locks belong to an open file description, so a second open of
+    the lock file in the same process would block on the first. Nesting
+    is tracked here and the flock is only taken at the outermost level.
+    """
+
+    _registry: Dict[str, "_PathLock"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, lock_file: Path) -> None:
+        self.lock_file = lock_file
+        self.rlock = threading.RLock()
+        self.depth = 0
+        self.handle: Optional[IO[str]] = None
+
+    @classmethod
+    def for_path(cls, lock_file: Path) -> "_PathLock":
+        key = os.path.abspath(lock_file)
+        with cls._registry_lock:
+            lock = cls._registry.get(key)
+            if lock is None:
+                lock = cls._registry[key] = cls(lock_file)
+            return lock
+
+    @contextmanager
+    def held(self) -> Iterator[None]:
+        with self.rlock:
+            if self.depth == 0 and fcntl is not None:
+                self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+                self.handle = open(self.lock_file, "a")
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX)
+            self.depth += 1
+            try:
+                yield
+            finally:
+                self.depth -= 1
+                if self.depth == 0 and self.handle is not None:
+                    fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+                    self.handle.close()
+                    self.handle = None
+
+
+class StateFile:
+    """A JSON object on disk with atomic writes and a version counter.
+
+    Example:
+        state = StateFile(Path(".sdp/state.json"))
+        data = state.read()
+        state.write({**data, "active_ws": "00-032-01"}, expected_version=data["version"])
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize state file.
+
+        Args:
+            path: JSON file; ``<path>.lock`` is used for locking
+        """
+        self.path = Path(path)
+        self.lock_file = self.path.with_name(f"{self.path.name}.lock")
+
+    def read(self) -> Dict[str, Any]:
+        """Read the current document (``{"version": 0}`` if missing).
+
+        Needs no lock: writes replace the file atomically.
+
+        Raises:
+            StateFileError: If the file is not a JSON object
+        """
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {VERSION_KEY: 0}
+        except ValueError as e:
+            raise StateFileError(f"Corrupt state file {self.path}: {e}") from e
+        if not isinstance(data, dict):
+            raise StateFileError(f"Corrupt state file {self.path}: not a JSON object")
+        version = data.get(VERSION_KEY)
+        data[VERSION_KEY] = version if isinstance(version, int) else 0
+        return data
+
+    def write(self, data: Dict[str, Any], expected_version: Optional[int] = None) -> int:
+        """Atomically replace the document.
+
+        Args:
+            data: New document (its ``version`` key is ignored)
+            expected_version: Fail unless the file is still at this version
+
+        Returns:
+            The new version
+
+        Raises:
+            StateConflictError: If expected_version does not match
+        """
+        with self.locked():
+            current: int = self.read()[VERSION_KEY]
+            if expected_version is not None and current != expected_version:
+                raise StateConflictError(self.path, expected_version, current)
+            version = current + 1
+            self._replace({**data, VERSION_KEY: version})
+            return version
+
+    def update(self, mutate: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        """Read, transform and write back under the lock.
+
+        Args:
+            mutate: Receives the current document, returns the new one
+
+        Returns:
+            The document as written (with its new version)
+        """
+        with self.locked():
+            data = mutate(self.read())
+            version = self.write(data)
+            return {**data, VERSION_KEY: version}
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the exclusive lock across several reads and writes (reentrant)."""
+        with _PathLock.for_path(self.lock_file).held():
+            yield
+
+    def _replace(self, data: Dict[str, Any]) -> None:
+        """Write to a temp file, fsync it and rename it over the target."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w") as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
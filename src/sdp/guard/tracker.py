@@ -1,12 +1,12 @@
 """Workstream tracking with Beads synchronization."""
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 from sdp.beads import BeadsClient
 from sdp.beads.models import BeadsStatus
 from sdp.errors import ErrorCategory, SDPError
+from sdp.guard.statefile import StateFile
 
 
 class WorkstreamInProgressError(SDPError):
@@ -32,7 +32,11 @@ class WorkstreamInProgressError(SDPError):
 
 
 class WorkstreamTracker:
-    """Track active workstream with Beads sync."""
+    """Track active workstream with Beads sync.
+
+    State transitions run under the state file's lock, so two agents
+    activating at once cannot both succeed.
+    """
 
     def __init__(
         self, client: BeadsClient, state_file: Path = Path(".sdp/state.json")
@@ -45,6 +49,7 @@ class WorkstreamTracker:
         """
         self._client = client
         self._state_file = state_file
+        self._state = StateFile(state_file)
 
     def get_active(self) -> str | None:
         """Get currently active WS ID.
@@ -52,11 +57,7 @@ class WorkstreamTracker:
         Returns:
             Active workstream ID or None
         """
-        if not self._state_file.exists():
-            return None
-        with open(self._state_file) as f:
-            state = json.load(f)
-        active = state.get("active_ws")
+        active = self._state.read().get("active_ws")
         return active if isinstance(active, str) else None
 
     def activate(self, ws_id: str) -> None:
@@ -68,26 +69,27 @@ class WorkstreamTracker:
         Raises:
             WorkstreamInProgressError: If another WS is already active
         """
-        # Check no other WS is active
-        current = self.get_active()
-        if current and current != ws_id:
-            raise WorkstreamInProgressError(current, ws_id)
-
-        # Update Beads status
-        self._client.update_task_status(ws_id, BeadsStatus.IN_PROGRESS)
-
-        # Get scope from WS metadata
-        ws = self._client.get_task(ws_id)
-        scope = ws.sdp_metadata.get("scope_files", []) if ws else []
-
-        # Save local state
-        self._save_state(
-            {
-                "active_ws": ws_id,
-                "started_at": datetime.now(timezone.utc).isoformat(),
-                "scope_files": scope,
-            }
-        )
+        with self._state.locked():
+            # Check no other WS is active
+            current = self.get_active()
+            if current and current != ws_id:
+                raise WorkstreamInProgressError(current, ws_id)
+
+            # Update Beads status
+            self._client.update_task_status(ws_id, BeadsStatus.IN_PROGRESS)
+
+            # Get scope from WS metadata
+            ws = self._client.get_task(ws_id)
+            scope = ws.sdp_metadata.get("scope_files", []) if ws else []
+
+            # Save local state
+            self._save_state(
+                {
+                    "active_ws": ws_id,
+                    "started_at": datetime.now(timezone.utc).isoformat(),
+                    "scope_files": scope,
+                }
+            )
 
     def complete(self, ws_id: str) -> None:
         """Mark WS as complete.
@@ -98,12 +100,13 @@ class WorkstreamTracker:
         Raises:
             ValueError: If WS is not active
         """
-        current = self.get_active()
-        if current != ws_id:
-            raise ValueError(f"WS {ws_id} is not active (active: {current})")
+        with self._state.locked():
+            current = self.get_active()
+            if current != ws_id:
+                raise ValueError(f"WS {ws_id} is not active (active: {current})")
 
-        self._client.update_task_status(ws_id, BeadsStatus.CLOSED)
-        self._clear_state()
+            self._client.update_task_status(ws_id, BeadsStatus.CLOSED)
+            self._clear_state()
 
     def abort(self, ws_id: str) -> None:
         """Abort WS without completing.
@@ -114,23 +117,22 @@ class WorkstreamTracker:
         Raises:
             ValueError: If WS is not active
         """
-        current = self.get_active()
-        if current != ws_id:
-            raise ValueError(f"WS {ws_id} is not active")
+        with self._state.locked():
+            current = self.get_active()
+            if current != ws_id:
+                raise ValueError(f"WS {ws_id} is not active")
 
-        # Return to OPEN status
-        self._client.update_task_status(ws_id, BeadsStatus.OPEN)
-        self._clear_state()
+            # Return to OPEN status
+            self._client.update_task_status(ws_id, BeadsStatus.OPEN)
+            self._clear_state()
 
     def _save_state(self, state: dict[str, str | list[str]]) -> None:
-        """Save state to file.
+        """Save state to file atomically.
 
         Args:
             state: State dictionary to save
         """
-        self._state_file.parent.mkdir(exist_ok=True)
-        with open(self._state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        self._state.write(state)
 
     def _clear_state(self) -> None:
         """Clear state."""
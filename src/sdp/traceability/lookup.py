@@ -0,0 +1,51 @@
+"""Find the Beads task of a workstream for traceability."""
+
+from sdp.beads.base import BeadsClient
+from sdp.beads.models import BeadsTask
+from sdp.beads.sync.mapping import BeadsSyncError, resolve_ws_id_to_beads_id
+from sdp.beads.sync.store import MappingStore
+
+
+def find_ws_task(
+    client: BeadsClient, ws_id: str, mapping_store: MappingStore | None = None
+) -> BeadsTask | None:
+    """Get Beads task for workstream.
+
+    Resolves the task through the indexed mapping store (one get_task
+    call); falls back to scanning for external_ref.
+
+    Args:
+        client: Beads client instance
+        ws_id: Workstream ID
+        mapping_store: ws_id ↔ beads_id store (default: shared store in cwd)
+
+    Returns:
+        Beads task or None if not found
+    """
+    beads_id = resolve_beads_id(ws_id, mapping_store)
+    if beads_id:
+        try:
+            task = client.get_task(beads_id)
+        except Exception:
+            task = None
+        if task:
+            return task
+
+    try:
+        # Streamed: stops reading as soon as the task is found
+        for task in client.iter_tasks():
+            if task.external_ref == ws_id:
+                return task
+    except Exception:
+        return None
+    return None
+
+
+def resolve_beads_id(ws_id: str, mapping_store: MappingStore | None = None) -> str | None:
+    """Look up the Beads ID mapped to a workstream, if any."""
+    if mapping_store is None:
+        return resolve_ws_id_to_beads_id(ws_id)
+    try:
+        return mapping_store.get_beads_id(ws_id)
+    except BeadsSyncError:
+        return None
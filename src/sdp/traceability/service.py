@@ -7,6 +7,8 @@ import yaml
 
 from sdp.beads.base import BeadsClient
 from sdp.beads.models import BeadsTask
+from sdp.beads.sync.store import MappingStore
+from sdp.traceability.lookup import find_ws_task
 from sdp.traceability.models import (
     ACTestMapping,
     MappingStatus,
@@ -17,13 +19,15 @@ from sdp.traceability.models import (
 class TraceabilityService:
     """Check and manage AC→Test traceability."""
 
-    def __init__(self, client: BeadsClient):
+    def __init__(self, client: BeadsClient, mapping_store: MappingStore | None = None):
         """Initialize service with Beads client.
 
         Args:
             client: Beads client instance
+            mapping_store: ws_id ↔ beads_id store (default: shared store in cwd)
         """
         self._client = client
+        self._mapping_store = mapping_store
 
     def check_traceability(self, ws_id: str) -> TraceabilityReport:
         """Check traceability for workstream.
@@ -172,26 +176,8 @@ class TraceabilityService:
         ws_path.write_text(f"---\n{new_fm}---\n\n{body}", encoding="utf-8")
 
     def _get_ws_task(self, ws_id: str) -> BeadsTask | None:
-        """Get Beads task for workstream.
-
-        Args:
-            ws_id: Workstream ID
-
-        Returns:
-            Beads task or None if not found
-
-        Note:
-            Currently uses external_ref to find task.
-            In future, may use dedicated WS index.
-        """
-        try:
-            tasks = self._client.list_tasks()
-        except Exception:
-            return None
-        for task in tasks:
-            if task.external_ref == ws_id:
-                return task
-        return None
+        """Get Beads task for workstream (None if not found)."""
+        return find_ws_task(self._client, ws_id, self._mapping_store)
 
     def _get_ws_file_path(self, ws_id: str) -> Path | None:
         """Get path to WS markdown file.
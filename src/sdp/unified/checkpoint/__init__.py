@@ -1,9 +1,24 @@
 """Checkpoint management for @oneshot execution."""
 
+from sdp.unified.checkpoint.errors import CheckpointConflictError
+from sdp.unified.checkpoint.event_log import CheckpointEventLog
+from sdp.unified.checkpoint.events import EventType, FeatureState
+from sdp.unified.checkpoint.progress import ChangeWatcher
 from sdp.unified.checkpoint.schema import (
     Checkpoint,
     CheckpointDatabase,
     CheckpointStatus,
 )
+from sdp.unified.checkpoint.writer import CheckpointWriter
 
-__all__ = ["Checkpoint", "CheckpointDatabase", "CheckpointStatus"]
+__all__ = [
+    "ChangeWatcher",
+    "Checkpoint",
+    "CheckpointConflictError",
+    "CheckpointDatabase",
+    "CheckpointEventLog",
+    "CheckpointStatus",
+    "CheckpointWriter",
+    "EventType",
+    "FeatureState",
+]
@@ -0,0 +1,63 @@
+"""
+Cold archive files for checkpoints.
+
+One gzip-compressed JSONL file per feature. Each line is a record
+``{"table": name, "row": {...}}`` for a database row. Older archives may
+also hold ``{"file": name, "content": {...}}`` records; they are ignored,
+since checkpoint files are re-exported from the restored rows.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+ARCHIVE_SUFFIX = ".jsonl.gz"
+
+
+def archive_path(archive_dir: Path, feature: str) -> Path:
+    """Archive file of a feature."""
+    return archive_dir / f"{feature}{ARCHIVE_SUFFIX}"
+
+
+def write_archive(path: Path, records: Iterable[dict[str, Any]]) -> int:
+    """Write records to an archive, keeping records already in it.
+
+    The file is replaced atomically, so an interrupted run leaves either
+    the old or the new archive.
+
+    Returns:
+        Number of records written by this call
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    with open(tmp_path, "wb") as raw:
+        with gzip.open(raw, "wt", encoding="utf-8") as f:
+            for record in read_archive(path):
+                f.write(json.dumps(record) + "\n")
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
+def read_archive(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream records of an archive (nothing if it does not exist)."""
+    if not path.exists():
+        return
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def archived_features(archive_dir: Path) -> list[str]:
+    """Features that have an archive in archive_dir."""
+    if not archive_dir.is_dir():
+        return []
+    return sorted(p.name[: -len(ARCHIVE_SUFFIX)] for p in archive_dir.glob(f"*{ARCHIVE_SUFFIX}"))
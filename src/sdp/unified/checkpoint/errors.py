@@ -0,0 +1,17 @@
+"""Checkpoint storage errors."""
+
+
+class CheckpointConflictError(RuntimeError):
+    """Checkpoint was changed by someone else (row version mismatch)."""
+
+    def __init__(self, checkpoint_id: int, expected: int, actual: int) -> None:
+        super().__init__(f"Checkpoint {checkpoint_id} is at version {actual}, expected {expected}")
+        self.checkpoint_id = checkpoint_id
+        self.expected = expected
+        self.actual = actual
+
+
+class RepositoryError(Exception):
+    """Repository operation failed."""
+
+    pass
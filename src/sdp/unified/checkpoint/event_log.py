@@ -0,0 +1,169 @@
+"""
+Append-only checkpoint event log.
+
+An append is an INSERT plus an indexed count of the feature's events
+since its last snapshot. Every ``snapshot_every`` events the folded state
+is stored in checkpoint_snapshots, so a replay reads one snapshot plus at
+most ``snapshot_every`` events, at any point in the feature's history.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from .events import CheckpointEvent, EventType, FeatureState
+from .storage import CheckpointDatabase
+
+SNAPSHOT_EVERY = 100
+
+# Upper bound for "replay to the end"
+_LAST_SEQ = 2**63 - 1
+
+
+class CheckpointEventLog:
+    """Event log and snapshots stored in the checkpoint database."""
+
+    def __init__(self, db: CheckpointDatabase, snapshot_every: int = SNAPSHOT_EVERY) -> None:
+        """Initialize event log.
+
+        Args:
+            db: Initialized checkpoint database
+            snapshot_every: Events per feature between snapshots
+        """
+        self.db = db
+        self.snapshot_every = snapshot_every
+
+    def append(
+        self,
+        feature: str,
+        event: EventType,
+        ws_id: Optional[str] = None,
+        payload: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Append an event.
+
+        Args:
+            feature: Feature ID
+            event: Event type
+            ws_id: Workstream the event is about, if any
+            payload: Event details (e.g. agent_id, gate and status, error)
+
+        Returns:
+            Sequence number of the event
+        """
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO checkpoint_events (feature, event, ws_id, payload, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    feature,
+                    event.value,
+                    ws_id,
+                    json.dumps(payload or {}),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+            seq = int(cursor.lastrowid or 0)
+            # Counted inside the write transaction, so concurrent writers
+            # (other instances or processes) cannot skip a snapshot
+            pending = conn.execute(
+                """
+                SELECT COUNT(*) FROM checkpoint_events WHERE feature = ? AND seq > COALESCE(
+                    (SELECT MAX(seq) FROM checkpoint_snapshots WHERE feature = ?), 0)
+            """,
+                (feature, feature),
+            ).fetchone()[0]
+            if pending >= self.snapshot_every:
+                self._write_snapshot(conn, self._replay(conn, feature, seq))
+        return seq
+
+    def events(
+        self, feature: str, after_seq: int = 0, until_seq: Optional[int] = None
+    ) -> list[CheckpointEvent]:
+        """Events of a feature in order, for inspecting a run step by step."""
+        with self.db.reading() as conn:
+            return self._events(conn, feature, after_seq, until_seq)
+
+    def replay(
+        self,
+        feature: str,
+        until_seq: Optional[int] = None,
+        until: Optional[datetime] = None,
+    ) -> FeatureState:
+        """Rebuild feature state as of an event or a point in time.
+
+        Args:
+            feature: Feature ID
+            until_seq: Last event to apply (default: all)
+            until: Apply only events recorded at or before this time
+
+        Returns:
+            Folded state (``seq`` is the last applied event, 0 if none)
+        """
+        with self.db.reading() as conn:
+            if until is not None:
+                row = conn.execute(
+                    "SELECT MAX(seq) FROM checkpoint_events WHERE feature = ? AND recorded_at <= ?",
+                    (feature, until.astimezone(timezone.utc).isoformat()),
+                ).fetchone()
+                bound = row[0] or 0
+                until_seq = bound if until_seq is None else min(until_seq, bound)
+            return self._replay(conn, feature, until_seq)
+
+    def snapshot(self, feature: str) -> FeatureState:
+        """Store a snapshot of the current state now."""
+        with self.db.transaction() as conn:
+            state = self._replay(conn, feature, None)
+            if state.seq:
+                self._write_snapshot(conn, state)
+        return state
+
+    def _replay(
+        self, conn: sqlite3.Connection, feature: str, until_seq: Optional[int]
+    ) -> FeatureState:
+        """Latest snapshot at or before until_seq plus the events after it."""
+        limit = _LAST_SEQ if until_seq is None else until_seq
+        row = conn.execute(
+            "SELECT state FROM checkpoint_snapshots WHERE feature = ? AND seq <= ? "
+            "ORDER BY seq DESC LIMIT 1",
+            (feature, limit),
+        ).fetchone()
+        state = FeatureState.from_dict(json.loads(row[0])) if row else FeatureState(feature)
+        for event in self._events(conn, feature, state.seq, limit):
+            state.apply(event)
+        return state
+
+    @staticmethod
+    def _events(
+        conn: sqlite3.Connection, feature: str, after_seq: int, until_seq: Optional[int]
+    ) -> list[CheckpointEvent]:
+        rows = conn.execute(
+            "SELECT seq, event, ws_id, payload, recorded_at FROM checkpoint_events "
+            "WHERE feature = ? AND seq > ? AND seq <= ? ORDER BY seq",
+            (feature, after_seq, _LAST_SEQ if until_seq is None else until_seq),
+        ).fetchall()
+        return [
+            CheckpointEvent(
+                seq=row[0],
+                feature=feature,
+                event=EventType(row[1]),
+                ws_id=row[2],
+                payload=json.loads(row[3]),
+                recorded_at=datetime.fromisoformat(row[4]),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _write_snapshot(conn: sqlite3.Connection, state: FeatureState) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO checkpoint_snapshots (feature, seq, state, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                state.feature,
+                state.seq,
+                json.dumps(state.to_dict()),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
@@ -0,0 +1,80 @@
+"""
+Checkpoint events and the state they fold into.
+
+A feature's run is recorded as a sequence of events; FeatureState.apply
+replays them one at a time, so state can be rebuilt at any point.
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+
+class EventType(Enum):
+    """Kinds of checkpoint events."""
+
+    AGENT_ASSIGNED = "agent_assigned"
+    WS_STARTED = "ws_started"
+    WS_COMPLETED = "ws_completed"
+    WS_FAILED = "ws_failed"
+    GATE_RESULT = "gate_result"
+    STATUS_CHANGED = "status_changed"
+
+
+@dataclass
+class CheckpointEvent:
+    """One entry of the checkpoint event log."""
+
+    seq: int
+    feature: str
+    event: EventType
+    recorded_at: datetime
+    ws_id: Optional[str] = None
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FeatureState:
+    """Feature state rebuilt from events (as of event ``seq``)."""
+
+    feature: str
+    seq: int = 0
+    agent_id: Optional[str] = None
+    status: Optional[str] = None
+    running: list[str] = field(default_factory=list)
+    completed_ws: list[str] = field(default_factory=list)
+    failed_ws: dict[str, Optional[str]] = field(default_factory=dict)
+    gates: dict[str, str] = field(default_factory=dict)
+    updated_at: Optional[str] = None
+
+    def apply(self, event: CheckpointEvent) -> None:
+        """Fold one event into the state."""
+        ws_id = event.ws_id
+        if event.event is EventType.AGENT_ASSIGNED:
+            self.agent_id = event.payload.get("agent_id")
+        elif event.event is EventType.STATUS_CHANGED:
+            self.status = event.payload.get("status")
+        elif event.event is EventType.GATE_RESULT:
+            self.gates[event.payload["gate"]] = event.payload["status"]
+        elif ws_id is not None:
+            if ws_id in self.running:
+                self.running.remove(ws_id)
+            if event.event is EventType.WS_STARTED:
+                self.running.append(ws_id)
+                self.failed_ws.pop(ws_id, None)
+            elif event.event is EventType.WS_COMPLETED and ws_id not in self.completed_ws:
+                self.completed_ws.append(ws_id)
+            elif event.event is EventType.WS_FAILED:
+                self.failed_ws[ws_id] = event.payload.get("error")
+        self.seq = event.seq
+        self.updated_at = event.recorded_at.isoformat()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for a snapshot."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FeatureState":
+        """Deserialize a snapshot."""
+        return cls(**data)
@@ -0,0 +1,144 @@
+"""
+Checkpoint database migrations.
+
+MIGRATIONS maps each schema version to the function that upgrades the
+previous version to it. SchemaManager runs each one in its own
+transaction.
+"""
+
+import sqlite3
+from typing import Callable
+
+
+def completed_ws_table(conn: sqlite3.Connection) -> None:
+    """v2: move completed workstreams from a JSON column to a child table.
+
+    Appending a completed workstream becomes one INSERT instead of a
+    rewrite of the whole array. The legacy ``checkpoints.completed_ws``
+    column is emptied and no longer written.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS checkpoint_completed_ws (
+            checkpoint_id INTEGER NOT NULL REFERENCES checkpoints(id) ON DELETE CASCADE,
+            ws_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            completed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (checkpoint_id, ws_id)
+        )
+    """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_completed_ws_ws_id
+        ON checkpoint_completed_ws(ws_id)
+    """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_completed_ws_position
+        ON checkpoint_completed_ws(checkpoint_id, position)
+    """
+    )
+    # Backfill; completed_at is not known per WS, use the checkpoint's time
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO checkpoint_completed_ws
+            (checkpoint_id, ws_id, position, completed_at)
+        SELECT c.id, j.value, j.key,
+               COALESCE(c.completed_at, c.created_at, c.started_at)
+        FROM checkpoints c, json_each(c.completed_ws) j
+        WHERE json_valid(c.completed_ws)
+    """
+    )
+    conn.execute("UPDATE checkpoints SET completed_ws = '[]' WHERE completed_ws != '[]'")
+
+
+def row_versions(conn: sqlite3.Connection) -> None:
+    """v3: add a row version for optimistic concurrency and updated_at."""
+    conn.execute("ALTER TABLE checkpoints ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+    conn.execute("ALTER TABLE checkpoints ADD COLUMN updated_at TEXT")
+
+
+def gate_results_table(conn: sqlite3.Connection) -> None:
+    """v4: record gate results in their own table.
+
+    Decided approval gates are copied out of ``metrics.approval_gates``;
+    the blob is kept, it still holds the current state of each gate.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS gate_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            feature TEXT NOT NULL,
+            ws_id TEXT,
+            gate TEXT NOT NULL,
+            status TEXT NOT NULL,
+            duration REAL,
+            payload TEXT NOT NULL DEFAULT '{}',
+            recorded_at TEXT NOT NULL
+        )
+    """
+    )
+    # Latest result per gate of a feature, and pass-rate history per gate
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_gate_results_feature ON gate_results(feature, gate, id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_gate_results_gate ON gate_results(gate, recorded_at)"
+    )
+    conn.execute(
+        """
+        INSERT INTO gate_results (feature, gate, status, payload, recorded_at)
+        SELECT c.feature,
+               json_extract(g.value, '$.gate_type'),
+               json_extract(g.value, '$.status'),
+               json_object(
+                   'approved_by', json_extract(g.value, '$.approved_by'),
+                   'comments', json_extract(g.value, '$.comments')
+               ),
+               COALESCE(json_extract(g.value, '$.approved_at'), c.created_at)
+        FROM checkpoints c, json_each(c.metrics, '$.approval_gates') g
+        WHERE json_valid(c.metrics) AND json_extract(g.value, '$.status') != 'pending'
+        ORDER BY c.id, g.key
+    """
+    )
+
+
+def event_log_tables(conn: sqlite3.Connection) -> None:
+    """v5: append-only checkpoint event log plus snapshots for replay."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS checkpoint_events (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            feature TEXT NOT NULL,
+            event TEXT NOT NULL,
+            ws_id TEXT,
+            payload TEXT NOT NULL DEFAULT '{}',
+            recorded_at TEXT NOT NULL
+        )
+    """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_checkpoint_events_feature "
+        "ON checkpoint_events(feature, seq)"
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS checkpoint_snapshots (
+            feature TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            state TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (feature, seq)
+        )
+    """
+    )
+
+
+MIGRATIONS: dict[int, Callable[[sqlite3.Connection], None]] = {
+    2: completed_ws_table,
+    3: row_versions,
+    4: gate_results_table,
+    5: event_log_tables,
+}
@@ -34,3 +34,7 @@ class Checkpoint:
     failed_tasks: list[str] = field(default_factory=list)
     error: Optional[str] = None
     metrics: dict[str, object] = field(default_factory=dict)
+    version: int = 0  # Row version, bumped by every update
+    # Set on checkpoints loaded from the database
+    id: Optional[int] = field(default=None, compare=False)
+    updated_at: Optional[datetime] = field(default=None, compare=False)
@@ -0,0 +1,183 @@
+"""
+Checkpoint database connections.
+
+Opens SQLite in WAL mode with tuned pragmas and pools read-only
+connections, so agents reading checkpoints never wait on the writer.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+BUSY_TIMEOUT_S = 10.0
+DEFAULT_MAX_READERS = 4
+
+# Applied to every connection. WAL lets readers run alongside the writer;
+# synchronous=NORMAL is durable in WAL mode except on power loss, where
+# the last commits may roll back (never corrupt).
+PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8192",  # KiB, i.e. 8 MiB page cache
+    "PRAGMA mmap_size=67108864",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def connect(db_path: Path, read_only: bool = False) -> sqlite3.Connection:
+    """Open a tuned connection to the checkpoint database.
+
+    Args:
+        db_path: SQLite database file
+        read_only: Open a reader (autocommit, ``query_only``)
+
+    Returns:
+        Connection usable from any thread (callers serialize access)
+    """
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=BUSY_TIMEOUT_S,
+        check_same_thread=False,
+        isolation_level=None if read_only else "DEFERRED",
+    )
+    conn.row_factory = sqlite3.Row
+    if not read_only:
+        # Persistent: recorded in the database file once set. auto_vacuum
+        # only takes effect on new databases (see retention.vacuum).
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    if read_only:
+        conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+class ReaderPool:
+    """Thread-safe pool of read-only connections.
+
+    At most ``size`` connections are open; further readers wait for one
+    to be returned. Connections are opened lazily.
+    """
+
+    def __init__(self, db_path: Path, size: int = DEFAULT_MAX_READERS) -> None:
+        """Initialize pool.
+
+        Args:
+            db_path: SQLite database file
+            size: Maximum number of reader connections
+        """
+        if size < 1:
+            raise ValueError("Reader pool size must be at least 1")
+        self.db_path = db_path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._closed = False
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a reader connection for the duration of the block."""
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = connect(self.db_path, read_only=True)
+            try:
+                yield conn
+            finally:
+                if self._closed:
+                    conn.close()
+                else:
+                    self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones close when returned."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class PooledDatabase:
+    """One locked writer connection plus a ReaderPool.
+
+    Safe to share between threads. Writes go through ``transaction()``;
+    reads through ``reading()``, which in WAL mode see the last committed
+    state without waiting for the writer.
+    """
+
+    def __init__(self, db_path: str, max_readers: int = DEFAULT_MAX_READERS):
+        """Initialize database connections (opened lazily).
+
+        Args:
+            db_path: Path to SQLite database file
+            max_readers: Maximum number of pooled read connections
+        """
+        self.db_path = Path(db_path)
+        self.max_readers = max_readers
+        self._conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        self._writer_thread: Optional[int] = None
+        self._readers = ReaderPool(self.db_path, max_readers)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the writer connection."""
+        with self._write_lock:
+            if self._conn is None:
+                self._conn = connect(self.db_path)
+            return self._conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group writes into one transaction (one commit).
+
+        Holds the write lock for the duration of the block. Nested blocks
+        join the outer transaction; it rolls back if the block raises.
+        """
+        with self._write_lock:
+            conn = self._get_connection()
+            self._write_depth += 1
+            self._writer_thread = threading.get_ident()
+            try:
+                yield conn
+            except BaseException:
+                if self._write_depth == 1:
+                    conn.rollback()
+                raise
+            else:
+                if self._write_depth == 1:
+                    conn.commit()
+            finally:
+                self._write_depth -= 1
+                if self._write_depth == 0:
+                    self._writer_thread = None
+
+    @contextmanager
+    def reading(self) -> Iterator[sqlite3.Connection]:
+        """Connection for reads: pooled, or the writer inside a transaction."""
+        if self._writer_thread == threading.get_ident() or str(self.db_path) == ":memory:":
+            with self._write_lock:
+                yield self._get_connection()
+            return
+        if self._conn is None:
+            self._get_connection()  # Creates the file and switches it to WAL
+        with self._readers.connection() as conn:
+            yield conn
+
+    def close(self) -> None:
+        """Close database connections."""
+        self._readers.close()
+        self._readers = ReaderPool(self.db_path, self.max_readers)
+        with self._write_lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
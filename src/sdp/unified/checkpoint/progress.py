@@ -0,0 +1,98 @@
+"""
+Aggregated checkpoint progress and change detection.
+
+``feature_progress`` reads the latest checkpoint of many features with
+one statement. ``ChangeWatcher`` polls ``PRAGMA data_version`` on its own
+connection: the value changes only when another connection commits, so
+a watcher re-queries only after a checkpoint write instead of on every
+refresh. Polling it is cheap (no table access). An in-memory database
+cannot be opened from a second connection, so its watcher reports a
+change on every check.
+"""
+
+import json
+import sqlite3
+from typing import Any, Optional, Sequence
+
+from .pool import PooledDatabase, connect
+
+# Latest checkpoint (highest id, as get_checkpoint_by_feature) per feature
+_PROGRESS_SQL = """
+    SELECT c.feature, c.status, c.current_ws, c.started_at, c.completed_at,
+           json_array_length(c.execution_order) AS total,
+           (SELECT COUNT(*) FROM checkpoint_completed_ws w WHERE w.checkpoint_id = c.id)
+               AS completed
+    FROM checkpoints c
+    WHERE c.id IN (
+        SELECT MAX(id) FROM checkpoints
+        WHERE feature IN (SELECT value FROM json_each(?))
+        GROUP BY feature
+    )
+"""
+
+
+def feature_progress(db: PooledDatabase, features: Sequence[str]) -> dict[str, dict[str, Any]]:
+    """Progress metrics of many features in one query.
+
+    Args:
+        db: Initialized checkpoint database
+        features: Feature identifiers
+
+    Returns:
+        Map of feature to metrics (as ProgressMonitor.get_progress);
+        features without a checkpoint are left out
+    """
+    with db.reading() as conn:
+        rows = conn.execute(_PROGRESS_SQL, (json.dumps(list(features)),)).fetchall()
+    return {
+        row["feature"]: {
+            "feature_id": row["feature"],
+            "total_workstreams": row["total"],
+            "completed_workstreams": row["completed"],
+            "current_workstream": row["current_ws"],
+            "status": row["status"],
+            "percentage": (row["completed"] / row["total"] * 100) if row["total"] > 0 else 0,
+            "started_at": row["started_at"],
+            "completed_at": row["completed_at"],
+        }
+        for row in rows
+    }
+
+
+class ChangeWatcher:
+    """Detects commits to a checkpoint database by any connection or process."""
+
+    def __init__(self, db: PooledDatabase) -> None:
+        """Open a dedicated read-only connection and record the current version.
+
+        Args:
+            db: Initialized checkpoint database
+        """
+        # A second connection to :memory: would be a separate, empty database
+        self._conn: Optional[sqlite3.Connection] = None
+        if str(db.db_path) != ":memory:":
+            self._conn = connect(db.db_path, read_only=True)
+        self._version = self._data_version()
+
+    def changed(self) -> bool:
+        """Check whether the database was written since the last call.
+
+        Always True for an in-memory database (changes cannot be observed).
+        """
+        if self._conn is None:
+            return True
+        version = self._data_version()
+        if version == self._version:
+            return False
+        self._version = version
+        return True
+
+    def close(self) -> None:
+        """Close the watcher's connection."""
+        if self._conn is not None:
+            self._conn.close()
+
+    def _data_version(self) -> int:
+        if self._conn is None:
+            return 0
+        return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
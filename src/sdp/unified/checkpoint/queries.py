@@ -0,0 +1,118 @@
+"""
+Checkpoint SQL helpers.
+
+Statements shared by CheckpointDatabase methods. Each helper runs on a
+connection inside the caller's transaction.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from typing import Optional
+
+from .errors import CheckpointConflictError
+from .serialization import UPDATABLE_COLUMNS, field_to_param
+
+# UPDATE ... RETURNING needs SQLite 3.35+
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# completed_ws lives in checkpoint_completed_ws (schema v2); it is folded
+# back into a JSON array so rows keep the shape row_to_checkpoint expects.
+SELECT_CHECKPOINTS = """
+    SELECT c.id, c.feature, c.agent_id, c.status, c.execution_order, c.started_at,
+           c.current_ws, c.completed_at, c.failed_tasks, c.error, c.metrics, c.created_at,
+           c.version, c.updated_at,
+           (SELECT json_group_array(ws_id) FROM (
+                SELECT ws_id FROM checkpoint_completed_ws
+                WHERE checkpoint_id = c.id
+                ORDER BY position
+           )) AS completed_ws
+    FROM checkpoints c
+"""
+
+_SELECT_VERSION = "SELECT version FROM checkpoints WHERE id = ?"
+
+
+def now() -> str:
+    """Current UTC time for updated_at/completed_at."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def update_fields(
+    conn: sqlite3.Connection,
+    checkpoint_id: int,
+    fields: dict[str, object],
+    expected_version: Optional[int] = None,
+) -> Optional[int]:
+    """Set selected columns with one UPDATE, bumping version and updated_at.
+
+    Returns:
+        New row version, or None if the checkpoint does not exist
+
+    Raises:
+        ValueError: If a column is not in UPDATABLE_COLUMNS
+        CheckpointConflictError: If expected_version does not match
+    """
+    unknown = set(fields) - UPDATABLE_COLUMNS
+    if unknown:
+        raise ValueError(f"Cannot update checkpoint columns: {sorted(unknown)}")
+
+    assignments = "".join(f"{name} = ?, " for name in fields)
+    sql = f"UPDATE checkpoints SET {assignments}updated_at = ?, version = version + 1 WHERE id = ?"
+    params = [field_to_param(value) for value in fields.values()]
+    params += [now(), checkpoint_id]
+    if expected_version is not None:
+        sql += " AND version = ?"
+        params.append(expected_version)
+
+    if HAS_RETURNING:
+        rows = conn.execute(sql + " RETURNING version", params).fetchall()
+        if rows:
+            return int(rows[0][0])
+    elif conn.execute(sql, params).rowcount:
+        return int(conn.execute(_SELECT_VERSION, (checkpoint_id,)).fetchone()[0])
+
+    current = conn.execute(_SELECT_VERSION, (checkpoint_id,)).fetchone()
+    if current is None or expected_version is None:
+        return None
+    raise CheckpointConflictError(checkpoint_id, expected_version, current[0])
+
+
+def sync_completed_ws(
+    conn: sqlite3.Connection, checkpoint_id: int, completed_ws: list[str]
+) -> None:
+    """Store completed_ws, inserting only the new tail when the list grew."""
+    wanted = list(dict.fromkeys(completed_ws))
+    existing = [
+        row[0]
+        for row in conn.execute(
+            "SELECT ws_id FROM checkpoint_completed_ws WHERE checkpoint_id = ? ORDER BY position",
+            (checkpoint_id,),
+        )
+    ]
+    if wanted[: len(existing)] == existing:
+        start = len(existing)
+    else:
+        conn.execute(
+            "DELETE FROM checkpoint_completed_ws WHERE checkpoint_id = ?", (checkpoint_id,)
+        )
+        start = 0
+    timestamp = now()
+    conn.executemany(
+        "INSERT INTO checkpoint_completed_ws (checkpoint_id, ws_id, position, completed_at) "
+        "VALUES (?, ?, ?, ?)",
+        [(checkpoint_id, ws_id, start + i, timestamp) for i, ws_id in enumerate(wanted[start:])],
+    )
+
+
+def append_completed_ws(conn: sqlite3.Connection, checkpoint_id: int, ws_id: str) -> bool:
+    """Append one completed workstream; False if already recorded."""
+    cursor = conn.execute(
+        """
+        INSERT OR IGNORE INTO checkpoint_completed_ws
+            (checkpoint_id, ws_id, position, completed_at)
+        SELECT ?, ?, COALESCE(MAX(position) + 1, 0), ?
+        FROM checkpoint_completed_ws WHERE checkpoint_id = ?
+    """,
+        (checkpoint_id, ws_id, now(), checkpoint_id),
+    )
+    return cursor.rowcount > 0
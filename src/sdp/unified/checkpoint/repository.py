@@ -8,28 +8,28 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from sdp.unified.checkpoint.errors import CheckpointConflictError, RepositoryError
+from sdp.unified.checkpoint.event_log import CheckpointEventLog
 from sdp.unified.checkpoint.schema import Checkpoint, CheckpointDatabase, CheckpointStatus
 
 logger = logging.getLogger(__name__)
 
-
-class RepositoryError(Exception):
-    """Repository operation failed."""
-
-    pass
+_ACTIVE = (CheckpointStatus.IN_PROGRESS, CheckpointStatus.FAILED)
 
 
 class CheckpointRepository:
     """Repository for checkpoint management with error handling."""
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, db: Optional[CheckpointDatabase] = None) -> None:
         """Initialize repository.
 
         Args:
             db_path: Path to SQLite database file
+            db: Already initialized database to use (initialize() is then not needed)
         """
         self.db_path = Path(db_path)
-        self._db: Optional[CheckpointDatabase] = None
+        self._db: Optional[CheckpointDatabase] = db
+        self._events: Optional[CheckpointEventLog] = None
 
     def initialize(self) -> None:
         """Initialize database schema."""
@@ -41,6 +41,20 @@ class CheckpointRepository:
             logger.error(f"Failed to initialize repository: {e}")
             raise RepositoryError(f"Failed to initialize repository: {e}") from e
 
+    @property
+    def database(self) -> CheckpointDatabase:
+        """Underlying checkpoint database, for queries beyond this interface."""
+        if self._db is None:
+            raise RepositoryError("Repository not initialized")
+        return self._db
+
+    @property
+    def events(self) -> CheckpointEventLog:
+        """Event log of checkpoint changes (agents, workstreams, gates)."""
+        if self._events is None or self._events.db is not self.database:
+            self._events = CheckpointEventLog(self.database)
+        return self._events
+
     def save_checkpoint(self, checkpoint: Checkpoint) -> int:
         """Save checkpoint to database.
 
@@ -53,11 +67,10 @@ class CheckpointRepository:
         Raises:
             RepositoryError: If save operation fails
         """
-        if self._db is None:
-            raise RepositoryError("Repository not initialized")
+        db = self.database
 
         try:
-            checkpoint_id = self._db.create_checkpoint(checkpoint)
+            checkpoint_id = db.create_checkpoint(checkpoint)
             logger.info(
                 f"Checkpoint saved: {checkpoint.feature} "
                 f"(ID: {checkpoint_id}, agent: {checkpoint.agent_id})"
@@ -76,13 +89,11 @@ class CheckpointRepository:
         Returns:
             Checkpoint or None if not found
         """
-        if self._db is None:
-            raise RepositoryError("Repository not initialized")
+        db = self.database
 
         try:
             logger.info(f"Loading checkpoint for feature: {feature}")
-            checkpoint = self._db.get_checkpoint_by_feature(feature)
-            return checkpoint
+            return db.get_checkpoint_by_feature(feature)
         except Exception as e:
             logger.error(f"Failed to load checkpoint for {feature}: {e}")
             raise RepositoryError(f"Failed to load checkpoint: {e}") from e
@@ -96,15 +107,11 @@ class CheckpointRepository:
         Returns:
             Latest active checkpoint or None
         """
-        if self._db is None:
-            raise RepositoryError("Repository not initialized")
+        db = self.database
 
         try:
-            checkpoint = self._db.get_checkpoint_by_feature(feature)
-            if checkpoint and checkpoint.status in (
-                CheckpointStatus.IN_PROGRESS,
-                CheckpointStatus.FAILED,
-            ):
+            checkpoint = db.get_checkpoint_by_feature(feature)
+            if checkpoint and checkpoint.status in _ACTIVE:
                 logger.info(f"Latest active checkpoint found for {feature}")
                 return checkpoint
             return None
@@ -117,50 +124,98 @@ class CheckpointRepository:
         checkpoint_id: int,
         new_status: CheckpointStatus,
         completed_ws: list[str],
-    ) -> None:
+        expected_version: Optional[int] = None,
+    ) -> int:
         """Update checkpoint status and completed workstreams.
 
         Args:
             checkpoint_id: Checkpoint ID
             new_status: New status
             completed_ws: List of completed workstream IDs
+            expected_version: Fail instead of overwriting a newer update
+
+        Returns:
+            New checkpoint version
+
+        Raises:
+            RepositoryError: If the checkpoint does not exist or the update fails
+            CheckpointConflictError: If expected_version does not match
         """
-        if self._db is None:
-            raise RepositoryError("Repository not initialized")
+        db = self.database
 
         try:
-            # Load existing checkpoint
-            checkpoint = self._db.get_checkpoint(checkpoint_id)
-            if checkpoint is None:
+            version = db.update_status(checkpoint_id, new_status, completed_ws, expected_version)
+            if version is None:
                 raise RepositoryError(f"Checkpoint {checkpoint_id} not found")
-
-            # Update fields
-            checkpoint.status = new_status
-            checkpoint.completed_ws = completed_ws
-
-            # Save back
-            self._db.update_checkpoint(checkpoint_id, checkpoint)
             logger.info(
-                f"Checkpoint updated: {checkpoint.feature} "
+                f"Checkpoint updated: {checkpoint_id} "
                 f"(status: {new_status.value}, completed: {len(completed_ws)} WS)"
             )
-        except RepositoryError:
+            return version
+        except (RepositoryError, CheckpointConflictError):
             raise
         except Exception as e:
             logger.error(f"Failed to update checkpoint {checkpoint_id}: {e}")
             raise RepositoryError(f"Failed to update checkpoint: {e}") from e
 
-    def list_active_checkpoints(self) -> list[Checkpoint]:
-        """List all in_progress or failed checkpoints.
+    def update_checkpoint(self, checkpoint: Checkpoint) -> int:
+        """Write back all updatable fields of a loaded checkpoint.
 
-        Returns:
-            List of active checkpoints
+        Fails with CheckpointConflictError if the row changed since it was
+        loaded; returns the new version (errors as in update_checkpoint_status).
         """
-        if self._db is None:
-            raise RepositoryError("Repository not initialized")
+        if self._db is None or checkpoint.id is None:
+            raise RepositoryError("Repository not initialized or checkpoint not loaded")
+
+        try:
+            self._db.update_checkpoint(checkpoint.id, checkpoint, checkpoint.version)
+            return checkpoint.version
+        except CheckpointConflictError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to update checkpoint {checkpoint.id}: {e}")
+            raise RepositoryError(f"Failed to update checkpoint: {e}") from e
+
+    def update_checkpoint_progress(
+        self,
+        checkpoint_id: int,
+        current_ws: Optional[str],
+        completed_ws: Optional[list[str]] = None,
+        expected_version: Optional[int] = None,
+    ) -> int:
+        """Update the current workstream (and completed workstreams, if given).
+
+        Returns the new version; errors as in update_checkpoint_status.
+        """
+        db = self.database
+
+        try:
+            version = db.update_progress(checkpoint_id, current_ws, completed_ws, expected_version)
+            if version is None:
+                raise RepositoryError(f"Checkpoint {checkpoint_id} not found")
+            return version
+        except (RepositoryError, CheckpointConflictError):
+            raise
+        except Exception as e:
+            logger.error(f"Failed to update checkpoint progress {checkpoint_id}: {e}")
+            raise RepositoryError(f"Failed to update checkpoint progress: {e}") from e
+
+    def find_checkpoints_with_ws(self, ws_id: str) -> list[Checkpoint]:
+        """List checkpoints in which a workstream was completed, oldest first."""
+        db = self.database
+
+        try:
+            return db.get_checkpoints_with_ws(ws_id)
+        except Exception as e:
+            logger.error(f"Failed to find checkpoints with {ws_id}: {e}")
+            raise RepositoryError(f"Failed to find checkpoints: {e}") from e
+
+    def list_active_checkpoints(self) -> list[Checkpoint]:
+        """List all in_progress or failed checkpoints."""
+        db = self.database
 
         try:
-            return self._db.get_active_checkpoints()
+            return db.get_active_checkpoints()
         except Exception as e:
             logger.error(f"Failed to list active checkpoints: {e}")
             raise RepositoryError(f"Failed to list active checkpoints: {e}") from e
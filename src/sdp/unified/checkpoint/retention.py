@@ -0,0 +1,237 @@
+"""
+Checkpoint retention: archive finished features and compact the database.
+
+Completed features past the retention window are written to a cold
+archive (see archive.py), deleted in batches, and the freed pages are
+returned to the file system with an incremental VACUUM.
+"""
+
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from sdp.unified.orchestrator.checkpoint import CheckpointFileManager
+from sdp.unified.orchestrator.checkpoint_store import CheckpointStore
+
+from .archive import archive_path, read_archive, write_archive
+from .repository import CheckpointRepository
+from .storage import CheckpointDatabase
+
+logger = logging.getLogger(__name__)
+
+# Rows deleted per write transaction, so agents are never blocked for long
+BATCH_SIZE = 500
+
+# Archived tables, parents first (the order rows are restored in)
+# (event snapshots are not archived; they are rebuilt from the events)
+ARCHIVED_TABLES = ("checkpoints", "checkpoint_completed_ws", "gate_results", "checkpoint_events")
+
+# PRAGMA auto_vacuum value for INCREMENTAL
+_AUTO_VACUUM_INCREMENTAL = 2
+
+_AGE_UNITS = {"h": "hours", "d": "days", "w": "weeks"}
+
+_COMPLETED_FEATURES = """
+    SELECT feature FROM (
+        SELECT c.feature,
+               (SELECT MAX(julianday(COALESCE(o.updated_at, o.completed_at, o.created_at)))
+                FROM checkpoints o WHERE o.feature = c.feature) AS last_seen
+        FROM checkpoints c
+        WHERE c.id IN (SELECT MAX(id) FROM checkpoints GROUP BY feature)
+          AND c.status = 'completed'
+        ORDER BY last_seen DESC
+        LIMIT -1 OFFSET ?
+    )
+    WHERE last_seen < julianday('now') - ?
+    ORDER BY feature
+"""
+
+
+def parse_age(value: str) -> timedelta:
+    """Parse an age like ``30d``, ``12h`` or ``2w`` (a bare number is days).
+
+    Raises:
+        ValueError: If the value is not a valid age
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([hdw]?)\s*", value.lower())
+    if match is None:
+        raise ValueError(f"Invalid age {value!r}, expected e.g. 30d, 12h or 2w")
+    return timedelta(**{_AGE_UNITS[match.group(2) or "d"]: float(match.group(1))})
+
+
+@dataclass
+class GcResult:
+    """Outcome of a retention run."""
+
+    archived: list[str] = field(default_factory=list)
+    checkpoints_deleted: int = 0
+    files_deleted: int = 0
+    pages_freed: int = 0
+
+
+class CheckpointRetention:
+    """Archive, delete and restore checkpoints of completed features."""
+
+    def __init__(
+        self,
+        db: CheckpointDatabase,
+        archive_dir: Path,
+        checkpoint_dir: Optional[Path] = None,
+    ) -> None:
+        """Initialize retention.
+
+        Args:
+            db: Initialized checkpoint database
+            archive_dir: Directory for ``<feature>.jsonl.gz`` archives
+            checkpoint_dir: Orchestrator checkpoint file directory (.oneshot)
+        """
+        self.db = db
+        self.archive_dir = Path(archive_dir)
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+
+    def select_features(self, keep_last: int, older_than: timedelta) -> list[str]:
+        """Completed features to archive.
+
+        The ``keep_last`` most recently active completed features are always
+        kept; of the others, those idle for longer than ``older_than``.
+        """
+        with self.db.reading() as conn:
+            rows = conn.execute(
+                _COMPLETED_FEATURES, (keep_last, older_than.total_seconds() / 86400)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def gc(self, keep_last: int, older_than: timedelta, dry_run: bool = False) -> GcResult:
+        """Archive and delete completed features, then compact the database."""
+        result = GcResult(archived=self.select_features(keep_last, older_than))
+        if dry_run:
+            return result
+
+        for feature in result.archived:
+            # The archive is durable before anything is deleted
+            with self.db.transaction() as conn:
+                records = list(self._export(conn, feature))
+            write_archive(archive_path(self.archive_dir, feature), records)
+            result.checkpoints_deleted += self._delete(records)
+            checkpoint_file = self._checkpoint_file(feature)
+            if checkpoint_file and checkpoint_file.exists():
+                checkpoint_file.unlink()
+                result.files_deleted += 1
+            logger.info(f"Archived checkpoints of {feature}")
+
+        result.pages_freed = self.vacuum()
+        return result
+
+    def restore(self, feature: str) -> int:
+        """Load an archived feature back and remove its archive.
+
+        Returns:
+            Number of checkpoints restored
+
+        Raises:
+            FileNotFoundError: If the feature has no archive
+        """
+        path = archive_path(self.archive_dir, feature)
+        if not path.exists():
+            raise FileNotFoundError(f"No archive for feature {feature}: {path}")
+
+        records = list(read_archive(path))
+        restored = 0
+        with self.db.transaction() as conn:
+            for table in ARCHIVED_TABLES:
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                for record in records:
+                    if record.get("table") != table:
+                        continue
+                    # Columns dropped since archiving are skipped
+                    row = {k: v for k, v in record["row"].items() if k in columns}
+                    cursor = conn.execute(
+                        f"INSERT OR IGNORE INTO {table} ({', '.join(row)}) "
+                        f"VALUES ({', '.join('?' * len(row))})",
+                        list(row.values()),
+                    )
+                    if table == "checkpoints":
+                        restored += cursor.rowcount
+
+        # The checkpoint file is an export of the restored rows, written atomically
+        if self.checkpoint_dir is not None:
+            repo = CheckpointRepository(str(self.db.db_path), self.db)
+            CheckpointStore(repo, CheckpointFileManager(str(self.checkpoint_dir))).export(feature)
+
+        path.unlink()
+        logger.info(f"Restored {restored} checkpoints of {feature}")
+        return restored
+
+    def vacuum(self) -> int:
+        """Return free pages to the file system.
+
+        Databases created before incremental auto-vacuum was enabled are
+        converted with one full VACUUM.
+
+        Returns:
+            Number of pages freed
+        """
+        # VACUUM cannot run in a transaction; the block only takes the write lock
+        with self.db.transaction() as conn:
+            before = conn.execute("PRAGMA page_count").fetchone()[0]
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != _AUTO_VACUUM_INCREMENTAL:
+                conn.execute(f"PRAGMA auto_vacuum={_AUTO_VACUUM_INCREMENTAL}")
+                conn.execute("VACUUM")
+            else:
+                conn.execute("PRAGMA incremental_vacuum").fetchall()
+            after = conn.execute("PRAGMA page_count").fetchone()[0]
+        return int(before - after)
+
+    def _export(self, conn: sqlite3.Connection, feature: str) -> Iterator[dict[str, Any]]:
+        """Archive records of a feature (its rows; the checkpoint file is re-exported)."""
+        queries = {
+            "checkpoints": "SELECT * FROM checkpoints WHERE feature = ? ORDER BY id",
+            "checkpoint_completed_ws": """
+                SELECT * FROM checkpoint_completed_ws WHERE checkpoint_id IN (
+                    SELECT id FROM checkpoints WHERE feature = ?
+                ) ORDER BY checkpoint_id, position
+            """,
+            "gate_results": "SELECT * FROM gate_results WHERE feature = ? ORDER BY id",
+            "checkpoint_events": "SELECT * FROM checkpoint_events WHERE feature = ? ORDER BY seq",
+        }
+        for table in ARCHIVED_TABLES:
+            for row in conn.execute(queries[table], (feature,)):
+                yield {"table": table, "row": dict(row)}
+
+    def _delete(self, records: list[dict[str, Any]]) -> int:
+        """Delete the exported rows in batches; returns checkpoints deleted.
+
+        Only archived rows are deleted, never rows written after the export.
+        """
+        keys = {"checkpoints": "id", "gate_results": "id", "checkpoint_events": "seq"}
+        ids = {
+            table: [r["row"][key] for r in records if r.get("table") == table]
+            for table, key in keys.items()
+        }
+        deletes = [
+            ("DELETE FROM checkpoint_completed_ws WHERE checkpoint_id IN ({})", ids["checkpoints"]),
+            ("DELETE FROM checkpoints WHERE id IN ({})", ids["checkpoints"]),
+            ("DELETE FROM gate_results WHERE id IN ({})", ids["gate_results"]),
+            ("DELETE FROM checkpoint_events WHERE seq IN ({})", ids["checkpoint_events"]),
+        ]
+        for sql, table_ids in deletes:
+            for start in range(0, len(table_ids), BATCH_SIZE):
+                batch = table_ids[start : start + BATCH_SIZE]
+                with self.db.transaction() as conn:
+                    conn.execute(sql.format(", ".join("?" * len(batch))), batch)
+        features = {r["row"]["feature"] for r in records if r.get("table") == "checkpoint_events"}
+        with self.db.transaction() as conn:
+            conn.executemany(
+                "DELETE FROM checkpoint_snapshots WHERE feature = ?", [(f,) for f in features]
+            )
+        return len(ids["checkpoints"])
+
+    def _checkpoint_file(self, feature: str) -> Optional[Path]:
+        """Orchestrator checkpoint file (named as by CheckpointFileManager)."""
+        if self.checkpoint_dir is None:
+            return None
+        return self.checkpoint_dir / f"{feature}-checkpoint.json"
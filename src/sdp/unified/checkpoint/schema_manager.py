@@ -6,11 +6,13 @@ Handles schema creation, versioning, and migrations.
 
 import sqlite3
 
+from .migrations import MIGRATIONS
+
 
 class SchemaManager:
     """Manages database schema and migrations."""
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = max(MIGRATIONS)
 
     def __init__(self, conn: sqlite3.Connection):
         """Initialize schema manager.
@@ -55,13 +57,12 @@ class SchemaManager:
         """
         )
 
-        # Insert schema version if not exists
+        # New databases start at version 1 and migrate up from there
         cursor.execute(
             """
-            INSERT OR IGNORE INTO schema_version (version)
-            VALUES (?)
-        """,
-            (self.SCHEMA_VERSION,),
+            INSERT INTO schema_version (version)
+            SELECT 1 WHERE NOT EXISTS (SELECT 1 FROM schema_version)
+        """
         )
 
         # Create indexes for performance
@@ -69,6 +70,25 @@ class SchemaManager:
 
         self.conn.commit()
 
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Apply pending migrations, each in its own transaction.
+
+        The write lock is taken before the version is checked, so agents
+        starting together apply each migration once.
+        """
+        for version in range(2, self.SCHEMA_VERSION + 1):
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self.get_schema_version() < version:
+                    MIGRATIONS[version](self.conn)
+                    self.conn.execute("INSERT INTO schema_version (version) VALUES (?)", (version,))
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+
     def _create_indexes(self) -> None:
         """Create database indexes for query performance."""
         cursor = self.conn.cursor()
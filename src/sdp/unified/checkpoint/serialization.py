@@ -7,9 +7,23 @@ Handles conversion between database rows and Checkpoint objects.
 import json
 import sqlite3
 from datetime import datetime
+from enum import Enum
 
 from .models import Checkpoint, CheckpointStatus
 
+# Columns that can be set individually (see CheckpointDatabase.update_fields)
+UPDATABLE_COLUMNS = frozenset(
+    {
+        "status",
+        "execution_order",
+        "current_ws",
+        "completed_at",
+        "failed_tasks",
+        "error",
+        "metrics",
+    }
+)
+
 
 def row_to_checkpoint(row: sqlite3.Row) -> Checkpoint:
     """Convert database row to Checkpoint object.
@@ -34,9 +48,30 @@ def row_to_checkpoint(row: sqlite3.Row) -> Checkpoint:
         failed_tasks=json.loads(row["failed_tasks"]),
         error=row["error"],
         metrics=json.loads(row["metrics"]),
+        version=row["version"],
+        id=row["id"],
+        updated_at=datetime.fromisoformat(row["updated_at"]) if row["updated_at"] else None,
     )
 
 
+def field_to_param(value: object) -> object:
+    """Convert one checkpoint field value to its column value.
+
+    Args:
+        value: Field value (enum, datetime, list, dict or scalar)
+
+    Returns:
+        Value for an UPDATE/INSERT parameter
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
 def checkpoint_to_insert_params(checkpoint: Checkpoint) -> tuple:
     """Convert Checkpoint to database insert parameters.
 
@@ -44,13 +79,13 @@ def checkpoint_to_insert_params(checkpoint: Checkpoint) -> tuple:
         checkpoint: Checkpoint to serialize
 
     Returns:
-        Tuple of values for INSERT query
+        Tuple of values for INSERT query (completed_ws is stored in
+        the checkpoint_completed_ws table)
     """
     return (
         checkpoint.feature,
         checkpoint.agent_id,
         checkpoint.status.value,
-        json.dumps(checkpoint.completed_ws),
         json.dumps(checkpoint.execution_order),
         checkpoint.started_at.isoformat(),
         checkpoint.current_ws,
@@ -69,11 +104,11 @@ def checkpoint_to_update_params(checkpoint: Checkpoint, checkpoint_id: int) -> t
         checkpoint_id: ID of checkpoint to update
 
     Returns:
-        Tuple of values for UPDATE query
+        Tuple of values for UPDATE query (completed_ws is stored in
+        the checkpoint_completed_ws table)
     """
     return (
         checkpoint.status.value,
-        json.dumps(checkpoint.completed_ws),
         json.dumps(checkpoint.execution_order),
         checkpoint.current_ws,
         checkpoint.completed_at.isoformat() if checkpoint.completed_at else None,
@@ -4,30 +4,27 @@ Checkpoint database storage operations.
 Implements SQLite-based checkpoint CRUD operations.
 """
 
-import sqlite3
-from pathlib import Path
 from typing import Optional
 
+from . import queries
 from .models import Checkpoint, CheckpointStatus
+from .pool import DEFAULT_MAX_READERS, PooledDatabase
+from .queries import SELECT_CHECKPOINTS
 from .schema_manager import SchemaManager
-from .serialization import (
-    checkpoint_to_insert_params,
-    checkpoint_to_update_params,
-    row_to_checkpoint,
-)
+from .serialization import UPDATABLE_COLUMNS, checkpoint_to_insert_params, row_to_checkpoint
 
 
-class CheckpointDatabase:
-    """SQLite database for checkpoint storage."""
+class CheckpointDatabase(PooledDatabase):
+    """SQLite database for checkpoint storage (thread-safe, see PooledDatabase)."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, max_readers: int = DEFAULT_MAX_READERS):
         """Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            max_readers: Maximum number of pooled read connections
         """
-        self.db_path = Path(db_path)
-        self._conn: Optional[sqlite3.Connection] = None
+        super().__init__(db_path, max_readers)
         self._schema_manager: Optional[SchemaManager] = None
 
     def initialize(self) -> None:
@@ -36,13 +33,6 @@ class CheckpointDatabase:
         self._schema_manager = SchemaManager(conn)
         self._schema_manager.ensure_schema()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
-
     def get_schema_version(self) -> int:
         """Get current schema version."""
         if self._schema_manager is None:
@@ -59,24 +49,22 @@ class CheckpointDatabase:
         Returns:
             ID of created checkpoint
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO checkpoints (
-                feature, agent_id, status, completed_ws, execution_order,
-                started_at, current_ws, completed_at, failed_tasks, error, metrics
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            checkpoint_to_insert_params(checkpoint),
-        )
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO checkpoints (
+                    feature, agent_id, status, execution_order,
+                    started_at, current_ws, completed_at, failed_tasks, error, metrics
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                checkpoint_to_insert_params(checkpoint),
+            )
+            lastrowid = cursor.lastrowid
+            if lastrowid is None:
+                raise RuntimeError("Failed to get checkpoint ID after insert")
+            queries.sync_completed_ws(conn, lastrowid, checkpoint.completed_ws)
 
-        conn.commit()
-
-        lastrowid = cursor.lastrowid
-        if lastrowid is None:
-            raise RuntimeError("Failed to get checkpoint ID after insert")
         return lastrowid
 
     def get_checkpoint(self, checkpoint_id: int) -> Optional[Checkpoint]:
@@ -88,17 +76,8 @@ class CheckpointDatabase:
         Returns:
             Checkpoint or None if not found
         """
-
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM checkpoints WHERE id = ?", (checkpoint_id,))
-        row = cursor.fetchone()
-
-        if not row:
-            return None
-
-        return row_to_checkpoint(row)
+        found = self._select("WHERE c.id = ?", (checkpoint_id,))
+        return found[0] if found else None
 
     def get_checkpoint_by_feature(self, feature: str) -> Optional[Checkpoint]:
         """Get latest checkpoint for a feature.
@@ -109,66 +88,104 @@ class CheckpointDatabase:
         Returns:
             Latest checkpoint or None
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        found = self._select("WHERE c.feature = ? ORDER BY c.id DESC LIMIT 1", (feature,))
+        return found[0] if found else None
 
-        cursor.execute(
-            """
-            SELECT * FROM checkpoints
-            WHERE feature = ?
-            ORDER BY id DESC
-            LIMIT 1
-        """,
-            (feature,),
-        )
+    def update_checkpoint(
+        self,
+        checkpoint_id: int,
+        checkpoint: Checkpoint,
+        expected_version: Optional[int] = None,
+    ) -> None:
+        """Update existing checkpoint.
 
-        row = cursor.fetchone()
+        Args:
+            checkpoint_id: Checkpoint ID
+            checkpoint: Updated checkpoint data (its version is updated)
+            expected_version: Only update if the row is still at this version
 
-        if not row:
-            return None
+        Raises:
+            CheckpointConflictError: If expected_version does not match
+        """
+        fields = {name: getattr(checkpoint, name) for name in sorted(UPDATABLE_COLUMNS)}
+        version = self._update(checkpoint_id, fields, checkpoint.completed_ws, expected_version)
+        if version is not None:
+            checkpoint.version = version
 
-        return row_to_checkpoint(row)
+    def update_status(
+        self,
+        checkpoint_id: int,
+        status: CheckpointStatus,
+        completed_ws: Optional[list[str]] = None,
+        expected_version: Optional[int] = None,
+    ) -> Optional[int]:
+        """Set the status with one UPDATE (plus new completed_ws rows), see update_fields."""
+        return self._update(checkpoint_id, {"status": status}, completed_ws, expected_version)
+
+    def update_progress(
+        self,
+        checkpoint_id: int,
+        current_ws: Optional[str],
+        completed_ws: Optional[list[str]] = None,
+        expected_version: Optional[int] = None,
+    ) -> Optional[int]:
+        """Set the current workstream with one UPDATE (see update_status)."""
+        fields: dict[str, object] = {"current_ws": current_ws}
+        return self._update(checkpoint_id, fields, completed_ws, expected_version)
+
+    def update_fields(
+        self,
+        checkpoint_id: int,
+        fields: dict[str, object],
+        expected_version: Optional[int] = None,
+    ) -> Optional[int]:
+        """Set selected columns in a single UPDATE, bumping version and updated_at.
 
-    def update_checkpoint(self, checkpoint_id: int, checkpoint: Checkpoint) -> None:
-        """Update existing checkpoint.
+        With expected_version, concurrent agents get a conflict instead of
+        a lost update.
 
         Args:
             checkpoint_id: Checkpoint ID
-            checkpoint: Updated checkpoint data
+            fields: Column name to new value (see UPDATABLE_COLUMNS)
+            expected_version: Only update if the row is still at this version
+
+        Returns:
+            New row version, or None if the checkpoint does not exist
+
+        Raises:
+            ValueError, CheckpointConflictError: see queries.update_fields
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        return self._update(checkpoint_id, fields, None, expected_version)
+
+    def add_completed_ws(self, checkpoint_id: int, ws_id: str) -> bool:
+        """Append one completed workstream (a single INSERT).
+
+        Returns False if the workstream was already recorded.
+        """
+        with self.transaction() as conn:
+            return queries.append_completed_ws(conn, checkpoint_id, ws_id)
 
-        cursor.execute(
+    def get_checkpoints_with_ws(self, ws_id: str) -> list[Checkpoint]:
+        """List checkpoints that record a workstream as completed, oldest first."""
+        return self._select(
             """
-            UPDATE checkpoints SET
-                status = ?,
-                completed_ws = ?,
-                execution_order = ?,
-                current_ws = ?,
-                completed_at = ?,
-                failed_tasks = ?,
-                error = ?,
-                metrics = ?
-            WHERE id = ?
+            WHERE c.id IN (SELECT checkpoint_id FROM checkpoint_completed_ws WHERE ws_id = ?)
+            ORDER BY c.id
         """,
-            checkpoint_to_update_params(checkpoint, checkpoint_id),
+            (ws_id,),
         )
 
-        conn.commit()
-
     def delete_checkpoint(self, checkpoint_id: int) -> None:
         """Delete checkpoint by ID.
 
         Args:
             checkpoint_id: Checkpoint ID
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM checkpoints WHERE id = ?", (checkpoint_id,))
-
-        conn.commit()
+        with self.transaction() as conn:
+            conn.execute(
+                "DELETE FROM checkpoint_completed_ws WHERE checkpoint_id = ?", (checkpoint_id,)
+            )
+            conn.execute("DELETE FROM checkpoints WHERE id = ?", (checkpoint_id,))
 
     def list_checkpoints_by_status(self, status: CheckpointStatus) -> list[Checkpoint]:
         """List all checkpoints with given status.
@@ -179,15 +196,7 @@ class CheckpointDatabase:
         Returns:
             List of checkpoints
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT * FROM checkpoints WHERE status = ? ORDER BY created_at DESC",
-            (status.value,),
-        )
-
-        return [row_to_checkpoint(row) for row in cursor.fetchall()]
+        return self._select("WHERE c.status = ? ORDER BY c.created_at DESC", (status.value,))
 
     def get_active_checkpoints(self) -> list[Checkpoint]:
         """Get checkpoints that need attention (in_progress or failed).
@@ -195,24 +204,29 @@ class CheckpointDatabase:
         Returns:
             List of active checkpoints
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT * FROM checkpoints
-            WHERE status IN ('in_progress', 'failed')
-            ORDER BY created_at DESC
-        """
+        return self._select(
+            "WHERE c.status IN ('in_progress', 'failed') ORDER BY c.created_at DESC"
         )
 
-        return [row_to_checkpoint(row) for row in cursor.fetchall()]
+    def _select(self, where: str, params: tuple[object, ...] = ()) -> list[Checkpoint]:
+        """Run SELECT_CHECKPOINTS with a WHERE/ORDER clause on a reader."""
+        with self.reading() as conn:
+            rows = conn.execute(SELECT_CHECKPOINTS + where, params).fetchall()
+        return [row_to_checkpoint(row) for row in rows]
 
-    def close(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+    def _update(
+        self,
+        checkpoint_id: int,
+        fields: dict[str, object],
+        completed_ws: Optional[list[str]],
+        expected_version: Optional[int],
+    ) -> Optional[int]:
+        """update_fields plus completed_ws, in one transaction."""
+        with self.transaction() as conn:
+            version = queries.update_fields(conn, checkpoint_id, fields, expected_version)
+            if version is not None and completed_ws is not None:
+                queries.sync_completed_ws(conn, checkpoint_id, completed_ws)
+            return version
 
     def __enter__(self) -> "CheckpointDatabase":
         """Context manager entry."""
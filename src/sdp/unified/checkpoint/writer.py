@@ -0,0 +1,198 @@
+"""
+Group-commit checkpoint writer.
+
+A background thread collects checkpoint mutations from any number of
+producers and applies them in one transaction per batch, so many agents
+share one commit instead of paying for one each. Mutations are applied
+as they arrive. A batch with a durable write (``submit``) is committed as
+soon as no more writes are queued, so it collects exactly the writes that
+arrived during the previous commit; a fire-and-forget batch (``post``)
+stays open for up to ``max_delay`` seconds. Either way a batch is
+committed once it holds ``max_batch`` writes.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, TypeVar
+
+from .pool import PooledDatabase
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_DELAY_S = 0.005
+DEFAULT_MAX_BATCH = 256
+
+
+@dataclass
+class _Write:
+    """A queued mutation and the future reporting its outcome."""
+
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    durable: bool
+    flush: bool = False
+    future: "Future[Any]" = field(default_factory=Future)
+
+
+_STOP = object()
+
+
+class CheckpointWriter:
+    """Background group-commit writer for a checkpoint database.
+
+    Mutations are callables run on the writer thread, typically
+    CheckpointDatabase methods (their own ``transaction()`` blocks join the
+    batch transaction). A mutation that raises is rolled back alone; the
+    rest of the batch still commits. The writer holds the database write
+    lock while a batch is open (at most ``max_delay``); readers are not
+    blocked.
+    """
+
+    def __init__(
+        self,
+        db: PooledDatabase,
+        max_delay: float = DEFAULT_MAX_DELAY_S,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Start the writer thread.
+
+        Args:
+            db: Initialized checkpoint database
+            max_delay: Seconds a fire-and-forget batch stays open
+            max_batch: Mutations per batch that trigger an immediate commit
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.db = db
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.commits = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Queue a mutation whose result is needed once it is durable.
+
+        Returns:
+            Future resolved with ``fn``'s result after the batch commits,
+            or with its exception (or the commit's) if it failed
+        """
+        return self._enqueue(_Write(fn, args, kwargs, durable=True))
+
+    def post(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Queue a fire-and-forget mutation.
+
+        Returns:
+            Future resolved as soon as ``fn`` has run, before the commit;
+            failures are also logged, so the handle can be dropped
+        """
+        return self._enqueue(_Write(fn, args, kwargs, durable=False))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Commit everything queued so far now and wait for it."""
+        self._enqueue(_Write(lambda: None, (), {}, durable=True, flush=True)).result(timeout)
+
+    def close(self) -> None:
+        """Commit queued mutations and stop the writer thread."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def __enter__(self) -> "CheckpointWriter":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Context manager exit: commit and stop."""
+        self.close()
+
+    def _enqueue(self, write: _Write) -> "Future[Any]":
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("CheckpointWriter is closed")
+            self._queue.put(write)
+        return write.future
+
+    def _run(self) -> None:
+        """Writer loop: apply and commit batches until stopped."""
+        while True:
+            first = self._queue.get()
+            if first is _STOP or self._commit(first):
+                break
+
+    def _commit(self, first: _Write) -> bool:
+        """Apply writes as they arrive in one transaction, then commit.
+
+        Each write runs in a savepoint. Returns True if close() was called.
+        """
+        applied: list[tuple[_Write, Any, Optional[BaseException]]] = []
+        stopping = waited_on = False
+        deadline = time.monotonic() + self.max_delay
+        try:
+            with self.db.transaction() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                write: Any = first
+                while True:
+                    applied.append((write, None, None))
+                    applied[-1] = self._apply(conn, write)
+                    waited_on = waited_on or write.durable
+                    if write.flush or len(applied) >= self.max_batch:
+                        break
+                    # Producers blocked on a future: commit once the queue is drained
+                    timeout = 0.0 if waited_on else deadline - time.monotonic()
+                    try:
+                        write = self._queue.get(timeout=max(0.0, timeout))
+                    except queue.Empty:
+                        break
+                    if write is _STOP:
+                        stopping = True
+                        break
+            self.commits += 1
+        except Exception as e:  # noqa: BLE001 - the commit failed for every durable write
+            logger.error(f"Checkpoint batch of {len(applied)} write(s) failed: {e}")
+            applied = [(write, None, e) for write, _, _ in applied]
+        for write, result, error in applied:
+            if write.durable or not write.future.done():
+                _resolve(write, result, error)
+        return stopping
+
+    @staticmethod
+    def _apply(
+        conn: sqlite3.Connection, write: _Write
+    ) -> tuple[_Write, Any, Optional[BaseException]]:
+        """Run one write; it is rolled back alone if it raises."""
+        conn.execute("SAVEPOINT checkpoint_write")
+        try:
+            result, error = write.fn(*write.args, **write.kwargs), None
+        except Exception as e:  # noqa: BLE001 - reported through the future
+            conn.execute("ROLLBACK TO checkpoint_write")
+            result, error = None, e
+        conn.execute("RELEASE checkpoint_write")
+        if not write.durable:
+            _resolve(write, result, error)
+        return write, result, error
+
+
+def _resolve(write: _Write, result: Any, error: Optional[BaseException]) -> None:
+    """Complete a write's future; fire-and-forget failures are logged."""
+    if error is None:
+        write.future.set_result(result)
+        return
+    if not write.durable:
+        logger.error(f"Checkpoint write {getattr(write.fn, '__name__', write.fn)} failed: {error}")
+    write.future.set_exception(error)
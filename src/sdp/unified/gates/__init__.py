@@ -1,13 +1,23 @@
 """Approval gate management for @oneshot workflow."""
 
+from sdp.unified.gates.database import GateDatabase
 from sdp.unified.gates.manager import ApprovalGateManager
-from sdp.unified.gates.models import ApprovalGate, ApprovalStatus, GateType
+from sdp.unified.gates.models import (
+    ApprovalGate,
+    ApprovalStatus,
+    GatePassRate,
+    GateResult,
+    GateType,
+)
 from sdp.unified.gates.parser import SkipFlagParser
 
 __all__ = [
     "ApprovalGate",
     "ApprovalStatus",
     "GateType",
+    "GateDatabase",
+    "GatePassRate",
+    "GateResult",
     "ApprovalGateManager",
     "SkipFlagParser",
 ]
@@ -0,0 +1,155 @@
+"""Gate results table stored in the checkpoint database."""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any
+
+from sdp.unified.checkpoint.event_log import CheckpointEventLog
+from sdp.unified.checkpoint.events import EventType
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+from sdp.unified.gates.models import GatePassRate, GateResult
+
+# Statuses counted as a pass (quality gates and approval gates)
+PASSING_STATUSES = ("passed", "approved")
+
+# SQL expression grouping recorded_at into pass-rate periods
+PERIODS = {
+    "day": "substr(recorded_at, 1, 10)",
+    "week": "strftime('%Y-W%W', recorded_at)",
+    "month": "substr(recorded_at, 1, 7)",
+}
+
+
+class GateDatabase:
+    """Gate results stored in the checkpoint database.
+
+    Gate operations use the repository's own connection (see
+    ``for_repository``) instead of opening a second writer on the file.
+    """
+
+    def __init__(
+        self, db: CheckpointDatabase | str, events: CheckpointEventLog | None = None
+    ) -> None:
+        """Use a checkpoint database, opening it if a path is given.
+
+        Args:
+            db: Initialized checkpoint database, or path to SQLite database file
+            events: Event log to append gate_result events to
+        """
+        self._owns_db = isinstance(db, str)
+        if isinstance(db, str):
+            db = CheckpointDatabase(db)
+            db.initialize()
+        self.db = db
+        self.events = events if events is not None else CheckpointEventLog(db)
+
+    @classmethod
+    def for_repository(cls, checkpoint_repo: CheckpointRepository) -> "GateDatabase":
+        """Get gate storage on the repository's database connection."""
+        return cls(checkpoint_repo.database, checkpoint_repo.events)
+
+    def record_result(
+        self,
+        feature: str,
+        gate: str,
+        status: str,
+        ws_id: str | None = None,
+        duration: float | None = None,
+        payload: dict[str, Any] | None = None,
+    ) -> int:
+        """Append a gate result (and a gate_result checkpoint event).
+
+        Args:
+            feature: Feature ID
+            gate: Gate name (e.g. an approval GateType value)
+            status: Outcome, see PASSING_STATUSES
+            ws_id: Workstream the gate ran for, if any
+            duration: Gate run time in seconds
+            payload: Extra details stored as JSON
+
+        Returns:
+            ID of the result row
+        """
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO gate_results
+                    (feature, ws_id, gate, status, duration, payload, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    feature,
+                    ws_id,
+                    gate,
+                    status,
+                    duration,
+                    json.dumps(payload or {}),
+                    datetime.now(timezone.utc).isoformat(),
+                ),
+            )
+            self.events.append(
+                feature, EventType.GATE_RESULT, ws_id, {"gate": gate, "status": status}
+            )
+        return int(cursor.lastrowid or 0)
+
+    def latest_results(self, feature: str) -> dict[str, GateResult]:
+        """Get the most recent result of each gate for a feature."""
+        with self.db.reading() as conn:
+            rows = conn.execute(
+                """
+                SELECT * FROM gate_results WHERE id IN (
+                    SELECT MAX(id) FROM gate_results WHERE feature = ? GROUP BY gate
+                )
+            """,
+                (feature,),
+            ).fetchall()
+        return {row["gate"]: _row_to_result(row) for row in rows}
+
+    def pass_rate_history(
+        self, gate: str, feature: str | None = None, period: str = "day"
+    ) -> list[GatePassRate]:
+        """Get the pass rate of a gate per period, oldest first.
+
+        Args:
+            gate: Gate name
+            feature: Only count results of this feature
+            period: One of PERIODS
+
+        Raises:
+            ValueError: If period is unknown
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period {period!r}, expected one of {sorted(PERIODS)}")
+        sql = f"""
+            SELECT {PERIODS[period]} AS period, COUNT(*) AS total,
+                   SUM(status IN ({", ".join("?" * len(PASSING_STATUSES))})) AS passed
+            FROM gate_results WHERE gate = ?
+        """
+        params: list[Any] = [*PASSING_STATUSES, gate]
+        if feature is not None:
+            sql += " AND feature = ?"
+            params.append(feature)
+        with self.db.reading() as conn:
+            rows = conn.execute(sql + " GROUP BY 1 ORDER BY 1", params).fetchall()
+        return [GatePassRate(gate, row["period"], row["total"], row["passed"]) for row in rows]
+
+    def close(self) -> None:
+        """Close the connection if it was opened by this instance."""
+        if self._owns_db:
+            self.db.close()
+
+
+def _row_to_result(row: sqlite3.Row) -> GateResult:
+    """Convert a gate_results row to a GateResult."""
+    return GateResult(
+        id=row["id"],
+        feature=row["feature"],
+        ws_id=row["ws_id"],
+        gate=row["gate"],
+        status=row["status"],
+        duration=row["duration"],
+        payload=json.loads(row["payload"]),
+        recorded_at=datetime.fromisoformat(row["recorded_at"]),
+    )
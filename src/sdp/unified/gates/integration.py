@@ -107,7 +107,7 @@ class SkipFlagIntegration:
         if checkpoint is None:
             return True
 
-        gates = GateStorage.extract_gates_from_checkpoint(checkpoint)
+        gates = GateStorage.load_gates(self.checkpoint_repo, checkpoint)
         gate = GateStorage.find_gate(gates, gate_type)
 
         # If gate is skipped, approve should not proceed
@@ -95,7 +95,7 @@ class ApprovalGateManager:
             if checkpoint is None:
                 return False
 
-            gates = GateStorage.extract_gates_from_checkpoint(checkpoint)
+            gates = GateStorage.load_gates(self.checkpoint_repo, checkpoint)
             gate = GateStorage.find_gate(gates, gate_type)
 
             return gate is not None and gate.status == ApprovalStatus.SKIPPED
@@ -111,7 +111,7 @@ class ApprovalGateManager:
         if checkpoint is None:
             raise GateManagerError(f"No checkpoint found for feature: {feature}")
 
-        gates = GateStorage.extract_gates_from_checkpoint(checkpoint)
+        gates = GateStorage.load_gates(self.checkpoint_repo, checkpoint)
         gate = GateStorage.find_gate(gates, gate_type)
 
         if gate is None:
@@ -125,7 +125,7 @@ class ApprovalGateManager:
         if checkpoint is None:
             raise GateManagerError(f"No checkpoint found for feature: {feature}")
 
-        return GateStorage.extract_gates_from_checkpoint(checkpoint)
+        return GateStorage.load_gates(self.checkpoint_repo, checkpoint)
 
     def request_approval(
         self, feature: str, gate_type: GateType, requestor: str
@@ -1,8 +1,9 @@
 """Approval gate data models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 
 class GateType(Enum):
@@ -31,3 +32,32 @@ class ApprovalGate:
     approved_by: str | None = None
     approved_at: datetime | None = None
     comments: str | None = None
+
+
+@dataclass
+class GateResult:
+    """One recorded gate outcome (a row of ``gate_results``)."""
+
+    feature: str
+    gate: str
+    status: str
+    recorded_at: datetime
+    ws_id: str | None = None
+    duration: float | None = None
+    payload: dict[str, Any] = field(default_factory=dict)
+    id: int | None = None
+
+
+@dataclass
+class GatePassRate:
+    """Pass rate of a gate over one period (day, week or month)."""
+
+    gate: str
+    period: str
+    total: int
+    passed: int
+
+    @property
+    def rate(self) -> float:
+        """Fraction of results that passed."""
+        return self.passed / self.total if self.total else 0.0
@@ -14,6 +14,28 @@ logger = logging.getLogger(__name__)
 class GateOperations:
     """Operations for approval gates."""
 
+    @staticmethod
+    def _find_gate(
+        checkpoint_repo: CheckpointRepository, feature: str, gate_type: GateType
+    ) -> ApprovalGate:
+        """Get the current state of a gate.
+
+        Raises:
+            GateManagerError: If the feature has no checkpoint
+        """
+        checkpoint = checkpoint_repo.load_checkpoint(feature)
+        if checkpoint is None:
+            raise GateManagerError(f"No checkpoint found for feature: {feature}")
+
+        gates = GateStorage.load_gates(checkpoint_repo, checkpoint)
+        gate = GateStorage.find_gate(gates, gate_type)
+        if gate is None:
+            gate = ApprovalGate(
+                gate_type=gate_type,
+                status=ApprovalStatus.PENDING,
+            )
+        return gate
+
     @staticmethod
     def approve_gate(
         checkpoint_repo: CheckpointRepository,
@@ -34,37 +56,14 @@ class GateOperations:
         Raises:
             GateManagerError: If approval fails
         """
-        checkpoint = checkpoint_repo.load_checkpoint(feature)
-        if checkpoint is None:
-            raise GateManagerError(f"No checkpoint found for feature: {feature}")
-
-        # Get checkpoint ID from database
-        checkpoint_id = GateStorage.get_checkpoint_id(checkpoint_repo, feature)
-
-        # Extract existing gates
-        gates = GateStorage.extract_gates_from_checkpoint(checkpoint)
-
-        # Find and update the target gate
-        gate = GateStorage.find_gate(gates, gate_type)
-        if gate is None:
-            gate = ApprovalGate(
-                gate_type=gate_type,
-                status=ApprovalStatus.PENDING,
-            )
-            gates.append(gate)
-
+        gate = GateOperations._find_gate(checkpoint_repo, feature, gate_type)
         gate.status = ApprovalStatus.APPROVED
         gate.approved_by = approved_by
         gate.approved_at = datetime.now()
         gate.comments = comments
 
-        # Save back to checkpoint
-        GateStorage.save_gates_to_checkpoint(checkpoint, gates)
-
         # Persist to database
-        GateStorage.update_checkpoint_in_db(
-            checkpoint_repo, checkpoint_id, checkpoint
-        )
+        GateStorage.record_gate(checkpoint_repo, feature, gate)
 
         logger.info(f"Gate approved: {feature} - {gate_type.value} by {approved_by}")
 
@@ -88,37 +87,14 @@ class GateOperations:
         Raises:
             GateManagerError: If rejection fails
         """
-        checkpoint = checkpoint_repo.load_checkpoint(feature)
-        if checkpoint is None:
-            raise GateManagerError(f"No checkpoint found for feature: {feature}")
-
-        # Get checkpoint ID from database
-        checkpoint_id = GateStorage.get_checkpoint_id(checkpoint_repo, feature)
-
-        # Extract existing gates
-        gates = GateStorage.extract_gates_from_checkpoint(checkpoint)
-
-        # Find and update the target gate
-        gate = GateStorage.find_gate(gates, gate_type)
-        if gate is None:
-            gate = ApprovalGate(
-                gate_type=gate_type,
-                status=ApprovalStatus.PENDING,
-            )
-            gates.append(gate)
-
+        gate = GateOperations._find_gate(checkpoint_repo, feature, gate_type)
         gate.status = ApprovalStatus.REJECTED
         gate.approved_by = rejected_by
         gate.approved_at = datetime.now()
         gate.comments = comments
 
-        # Save back to checkpoint
-        GateStorage.save_gates_to_checkpoint(checkpoint, gates)
-
         # Persist to database
-        GateStorage.update_checkpoint_in_db(
-            checkpoint_repo, checkpoint_id, checkpoint
-        )
+        GateStorage.record_gate(checkpoint_repo, feature, gate)
 
         logger.info(f"Gate rejected: {feature} - {gate_type.value} by {rejected_by}")
 
@@ -140,36 +116,13 @@ class GateOperations:
         Raises:
             GateManagerError: If skip fails
         """
-        checkpoint = checkpoint_repo.load_checkpoint(feature)
-        if checkpoint is None:
-            raise GateManagerError(f"No checkpoint found for feature: {feature}")
-
-        # Get checkpoint ID from database
-        checkpoint_id = GateStorage.get_checkpoint_id(checkpoint_repo, feature)
-
-        # Extract existing gates
-        gates = GateStorage.extract_gates_from_checkpoint(checkpoint)
-
-        # Find and update the target gate
-        gate = GateStorage.find_gate(gates, gate_type)
-        if gate is None:
-            gate = ApprovalGate(
-                gate_type=gate_type,
-                status=ApprovalStatus.PENDING,
-            )
-            gates.append(gate)
-
+        gate = GateOperations._find_gate(checkpoint_repo, feature, gate_type)
         gate.status = ApprovalStatus.SKIPPED
         gate.approved_by = None
         gate.approved_at = datetime.now()
         gate.comments = reason
 
-        # Save back to checkpoint
-        GateStorage.save_gates_to_checkpoint(checkpoint, gates)
-
         # Persist to database
-        GateStorage.update_checkpoint_in_db(
-            checkpoint_repo, checkpoint_id, checkpoint
-        )
+        GateStorage.record_gate(checkpoint_repo, feature, gate)
 
         logger.info(f"Gate skipped: {feature} - {gate_type.value}")
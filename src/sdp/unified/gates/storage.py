@@ -4,8 +4,8 @@ import logging
 from datetime import datetime
 
 from sdp.unified.checkpoint.repository import CheckpointRepository
-from sdp.unified.checkpoint.schema import Checkpoint, CheckpointDatabase
-from sdp.unified.gates.errors import GateManagerError
+from sdp.unified.checkpoint.schema import Checkpoint
+from sdp.unified.gates.database import GateDatabase
 from sdp.unified.gates.models import ApprovalGate, ApprovalStatus, GateType
 
 logger = logging.getLogger(__name__)
@@ -86,78 +86,48 @@ class GateStorage:
         return None
 
     @staticmethod
-    def save_gates_to_checkpoint(
-        checkpoint: Checkpoint, gates: list[ApprovalGate]
-    ) -> None:
-        """Save gates to checkpoint metrics.
+    def load_gates(
+        checkpoint_repo: CheckpointRepository, checkpoint: Checkpoint
+    ) -> list[ApprovalGate]:
+        """Get the current gates of a checkpoint's feature.
 
-        Args:
-            checkpoint: Checkpoint to update
-            gates: Gates to save
-        """
-        gates_data = []
-        for gate in gates:
-            gate_dict = {
-                "gate_type": gate.gate_type.value,
-                "status": gate.status.value,
-                "approved_by": gate.approved_by,
-                "approved_at": (
-                    gate.approved_at.isoformat() if gate.approved_at else None
-                ),
-                "comments": gate.comments,
-            }
-            gates_data.append(gate_dict)
-
-        checkpoint.metrics[GateStorage.GATES_METRIC_KEY] = gates_data
-
-    @staticmethod
-    def get_checkpoint_id(
-        checkpoint_repo: CheckpointRepository, feature: str
-    ) -> int:
-        """Get checkpoint ID from database.
+        Decisions recorded in gate_results take precedence over gates
+        stored in checkpoint metrics by older versions.
 
         Args:
             checkpoint_repo: Checkpoint repository
-            feature: Feature ID
+            checkpoint: Checkpoint of the feature
 
         Returns:
-            Checkpoint ID
-
-        Raises:
-            GateManagerError: If checkpoint not found
+            List of approval gates
         """
-        db = CheckpointDatabase(str(checkpoint_repo.db_path))
-
-        # Query the checkpoint table to get the ID
-        conn = db._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT id FROM checkpoints
-            WHERE feature = ?
-            ORDER BY id DESC
-            LIMIT 1
-        """,
-            (feature,),
+        gates = GateStorage.extract_gates_from_checkpoint(checkpoint)
+        latest = GateDatabase.for_repository(checkpoint_repo).latest_results(
+            checkpoint.feature
         )
-        row = cursor.fetchone()
-
-        if row is None:
-            raise GateManagerError(f"Checkpoint ID not found for feature: {feature}")
-
-        checkpoint_id = row[0]
-        return int(checkpoint_id)
+        for gate in gates:
+            result = latest.get(gate.gate_type.value)
+            if result is not None:
+                gate.status = ApprovalStatus(result.status)
+                gate.approved_by = result.payload.get("approved_by")
+                gate.approved_at = result.recorded_at
+                gate.comments = result.payload.get("comments")
+        return gates
 
     @staticmethod
-    def update_checkpoint_in_db(
-        checkpoint_repo: CheckpointRepository, checkpoint_id: int, checkpoint: Checkpoint
+    def record_gate(
+        checkpoint_repo: CheckpointRepository, feature: str, gate: ApprovalGate
     ) -> None:
-        """Update checkpoint in database.
+        """Append an approval gate decision to the gate_results table.
 
         Args:
             checkpoint_repo: Checkpoint repository
-            checkpoint_id: Checkpoint ID
-            checkpoint: Updated checkpoint data
+            feature: Feature ID
+            gate: Gate after the decision
         """
-        db = CheckpointDatabase(str(checkpoint_repo.db_path))
-        db.update_checkpoint(checkpoint_id, checkpoint)
+        GateDatabase.for_repository(checkpoint_repo).record_result(
+            feature,
+            gate.gate_type.value,
+            gate.status.value,
+            payload={"approved_by": gate.approved_by, "comments": gate.comments},
+        )
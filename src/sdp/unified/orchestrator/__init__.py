@@ -3,13 +3,18 @@
 from sdp.unified.orchestrator.agent import OrchestratorAgent
 from sdp.unified.orchestrator.agent_extension import AgentCheckpointExtension
 from sdp.unified.orchestrator.checkpoint import CheckpointFileManager
+from sdp.unified.orchestrator.checkpoint_store import CheckpointStore
 from sdp.unified.orchestrator.errors import ExecutionError
 from sdp.unified.orchestrator.models import ExecutionResult
+from sdp.unified.orchestrator.scheduler import ScheduleResult, WorkstreamScheduler
 
 __all__ = [
     "OrchestratorAgent",
     "AgentCheckpointExtension",
     "CheckpointFileManager",
+    "CheckpointStore",
     "ExecutionResult",
     "ExecutionError",
+    "ScheduleResult",
+    "WorkstreamScheduler",
 ]
@@ -6,7 +6,9 @@ Implements core logic for @oneshot workflow with checkpoint management.
 
 import logging
 from datetime import datetime
+from typing import Any, Optional, Sequence
 
+from sdp.unified.checkpoint.events import EventType
 from sdp.unified.checkpoint.repository import CheckpointRepository
 from sdp.unified.checkpoint.schema import Checkpoint, CheckpointStatus
 from sdp.unified.orchestrator.agent_extension import AgentCheckpointExtension
@@ -14,6 +16,12 @@ from sdp.unified.orchestrator.dispatcher import WorkstreamDispatcher
 from sdp.unified.orchestrator.errors import ExecutionError
 from sdp.unified.orchestrator.models import ExecutionResult
 from sdp.unified.orchestrator.monitor import ProgressMonitor
+from sdp.unified.orchestrator.resume import plan_resume
+from sdp.unified.orchestrator.scheduler import (
+    DEFAULT_MAX_WORKERS,
+    Dependencies,
+    WorkstreamScheduler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +29,14 @@ logger = logging.getLogger(__name__)
 class OrchestratorAgent:
     """Orchestrates autonomous feature execution with checkpoint management."""
 
-    def __init__(self, repo: CheckpointRepository) -> None:
+    def __init__(
+        self, repo: CheckpointRepository, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
         """Initialize orchestrator.
 
         Args:
             repo: CheckpointRepository for state management
+            max_workers: Maximum workstreams dispatched at once
 
         Raises:
             TypeError: If repo is not CheckpointRepository
@@ -33,6 +44,7 @@ class OrchestratorAgent:
         if not isinstance(repo, CheckpointRepository):
             raise TypeError("repo must be CheckpointRepository")
         self.repo = repo
+        self.max_workers = max_workers
         self.dispatcher = WorkstreamDispatcher()
         self.monitor = ProgressMonitor(repo)
         self.checkpoint_ext = AgentCheckpointExtension(repo)
@@ -42,6 +54,7 @@ class OrchestratorAgent:
         feature_id: str,
         workstreams: list[str],
         agent_id: str,
+        dependencies: Optional[Dependencies] = None,
     ) -> ExecutionResult:
         """Execute feature with workstream orchestration.
 
@@ -49,6 +62,8 @@ class OrchestratorAgent:
             feature_id: Feature identifier (e.g., "F01")
             workstreams: List of workstream IDs in execution order
             agent_id: Agent identifier
+            dependencies: Workstream prerequisites (e.g. the feature's
+                ``dependency_graph``) to run independent workstreams in parallel
 
         Returns:
             ExecutionResult with execution details
@@ -65,24 +80,13 @@ class OrchestratorAgent:
 
             previously_completed: list[str] = []
             checkpoint_id = 0
-            start_index = 0
 
             if existing_checkpoint:
-                logger.info(f"Resuming from checkpoint: {existing_checkpoint.current_ws}")
-                checkpoint_id = (
-                    existing_checkpoint.id if hasattr(existing_checkpoint, "id") else 0
-                )
-                previously_completed = (
-                    list(existing_checkpoint.completed_ws)
-                    if existing_checkpoint.completed_ws
-                    else []
-                )
-
-                # Find current position
-                if previously_completed:
-                    last_completed = previously_completed[-1]
-                    if last_completed in workstreams:
-                        start_index = workstreams.index(last_completed) + 1
+                # Resume with exactly the workstreams not completed yet
+                checkpoint_id = existing_checkpoint.id or 0
+                plan = plan_resume(workstreams, existing_checkpoint.completed_ws, dependencies)
+                previously_completed = plan.completed
+                logger.info(f"Resuming {feature_id}: {plan.remaining} left, {plan.ready} ready")
             else:
                 # Create new checkpoint
                 checkpoint = Checkpoint(
@@ -94,12 +98,19 @@ class OrchestratorAgent:
                     started_at=started_at,
                 )
                 checkpoint_id = self.repo.save_checkpoint(checkpoint)
+            self._log_event(
+                feature_id, EventType.AGENT_ASSIGNED, agent_id=agent_id, checkpoint_id=checkpoint_id
+            )
+            self._log_event(feature_id, EventType.STATUS_CHANGED, status="in_progress")
 
             # Dispatch workstreams
             newly_completed_ws = self.dispatch_workstreams(
                 workstreams=workstreams,
                 checkpoint_id=checkpoint_id,
-                start_index=start_index,
+                start_index=0,
+                feature_id=feature_id,
+                dependencies=dependencies,
+                completed=previously_completed,
             )
 
             # Combine previous and new completions
@@ -114,6 +125,7 @@ class OrchestratorAgent:
                 new_status=CheckpointStatus.COMPLETED,
                 completed_ws=all_completed_ws,
             )
+            self._log_event(feature_id, EventType.STATUS_CHANGED, status="completed")
 
             logger.info(f"Feature execution completed: {feature_id}")
 
@@ -130,6 +142,7 @@ class OrchestratorAgent:
 
         except Exception as e:
             logger.error(f"Failed to execute feature {feature_id}: {e}")
+            self._log_event(feature_id, EventType.STATUS_CHANGED, status="failed", error=str(e))
             raise ExecutionError(f"Failed to execute feature: {e}") from e
 
     def dispatch_workstreams(
@@ -137,43 +150,71 @@ class OrchestratorAgent:
         workstreams: list[str],
         checkpoint_id: int,
         start_index: int,
+        feature_id: Optional[str] = None,
+        dependencies: Optional[Dependencies] = None,
+        completed: Sequence[str] = (),
     ) -> list[str]:
-        """Dispatch workstreams for execution.
+        """Dispatch workstreams for execution along their dependency DAG.
+
+        A failed workstream cancels only the workstreams depending on it.
 
         Args:
             workstreams: List of workstream IDs
             checkpoint_id: Checkpoint ID for updates
             start_index: Index to start from (for resume)
+            feature_id: Feature to record workstream events for, if any
+            dependencies: Map of workstream ID to prerequisites (default: list order)
+            completed: Workstreams completed earlier; skipped, and kept in the checkpoint
 
         Returns:
-            List of completed workstream IDs
+            List of newly completed workstream IDs, in completion order
 
         Raises:
             ExecutionError: If dispatch fails
         """
-        completed_ws: list[str] = []
-
-        try:
-            for i in range(start_index, len(workstreams)):
-                ws_id = workstreams[i]
-                logger.info(f"Dispatching workstream: {ws_id}")
-
-                # Dispatch single workstream
-                self._dispatch_single_workstream(ws_id)
-                completed_ws.append(ws_id)
-
-                # Update checkpoint progress
-                self.repo.update_checkpoint_status(
-                    checkpoint_id=checkpoint_id,
-                    new_status=CheckpointStatus.IN_PROGRESS,
-                    completed_ws=completed_ws,
-                )
+        done = set(completed)
+        pending = [ws_id for ws_id in workstreams[start_index:] if ws_id not in done]
+        completed_ws = list(completed)
 
-            return completed_ws
+        def complete(ws_id: str) -> None:
+            completed_ws.append(ws_id)
+            self._log_event(feature_id, EventType.WS_COMPLETED, ws_id)
+            self.repo.update_checkpoint_status(
+                checkpoint_id=checkpoint_id,
+                new_status=CheckpointStatus.IN_PROGRESS,
+                completed_ws=completed_ws,
+            )
 
+        try:
+            result = WorkstreamScheduler(pending, dependencies, self.max_workers).run(
+                self._dispatch_single_workstream,
+                on_start=lambda ws_id: self._log_event(feature_id, EventType.WS_STARTED, ws_id),
+                on_complete=complete,
+                on_failure=lambda ws_id, e: self._log_event(
+                    feature_id, EventType.WS_FAILED, ws_id, error=str(e)
+                ),
+            )
+            if result.failed:
+                raise RuntimeError("; ".join(f"{w}: {e}" for w, e in result.failed.items()))
         except Exception as e:
             logger.error(f"Workstream dispatch failed: {e}")
             raise ExecutionError(f"Workstream dispatch failed: {e}") from e
+        return result.completed
+
+    def _log_event(
+        self,
+        feature_id: Optional[str],
+        event: EventType,
+        ws_id: Optional[str] = None,
+        **payload: Any,
+    ) -> None:
+        """Append to the checkpoint event log; logging never fails execution."""
+        if feature_id is None:
+            return
+        try:
+            self.repo.events.append(feature_id, event, ws_id, payload)
+        except Exception as e:
+            logger.warning(f"Failed to record {event.value} for {feature_id}: {e}")
 
     def _dispatch_single_workstream(self, ws_id: str) -> None:
         """Dispatch a single workstream.
@@ -41,11 +41,18 @@ class AgentCheckpointExtension:
     ) -> None:
         """Set checkpoint file manager.
 
+        Checkpoint files that diverged from the database (e.g. after a
+        crash) are repaired first.
+
         Args:
             checkpoint_manager: Checkpoint file manager instance
         """
         self.checkpoint_manager = checkpoint_manager
         self.checkpoint_ops = CheckpointOperations(checkpoint_manager, self.repo)
+        try:
+            self.checkpoint_ops.store.reconcile()
+        except Exception as e:
+            logger.warning(f"Failed to reconcile checkpoint files: {e}")
 
         # Configure checkpoint_ops with gate and team managers if available
         if self.gate_manager:
@@ -82,7 +89,7 @@ class AgentCheckpointExtension:
         current_workstream: str,
         status: CheckpointStatus,
     ) -> None:
-        """Save checkpoint to file for resumption.
+        """Save checkpoint to the database and its checkpoint file.
 
         Args:
             feature_id: Feature identifier
@@ -110,7 +117,7 @@ class AgentCheckpointExtension:
     def resume_from_checkpoint(
         self, feature_id: str, agent_id: str
     ) -> Optional[dict[str, Any]]:
-        """Resume execution from checkpoint file.
+        """Resume execution from the feature's checkpoint.
 
         Args:
             feature_id: Feature identifier
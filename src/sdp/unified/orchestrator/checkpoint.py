@@ -6,11 +6,15 @@ approval gate state and team configuration persistence.
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+CHECKPOINT_SUFFIX = "-checkpoint.json"
+
 
 class CheckpointFileManager:
     """Manager for checkpoint file operations.
@@ -46,11 +50,14 @@ class CheckpointFileManager:
         Returns:
             Path to checkpoint file
         """
-        return self.base_path / f"{feature_id}-checkpoint.json"
+        return self.base_path / f"{feature_id}{CHECKPOINT_SUFFIX}"
 
     def save_checkpoint(self, feature_id: str, checkpoint_data: dict[str, Any]) -> None:
         """Save checkpoint data to file.
 
+        Written to a temporary file and renamed over the checkpoint file,
+        so readers and crashes see either the old or the new checkpoint.
+
         Args:
             feature_id: Feature identifier
             checkpoint_data: Checkpoint data dictionary
@@ -59,16 +66,44 @@ class CheckpointFileManager:
             OSError: If file write fails
         """
         checkpoint_file = self._get_checkpoint_file(feature_id)
+        temp_file = checkpoint_file.with_name(
+            f".{checkpoint_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
 
         try:
-            with open(checkpoint_file, "w") as f:
+            with open(temp_file, "w") as f:
                 json.dump(checkpoint_data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, checkpoint_file)
 
             logger.info(f"Checkpoint saved: {feature_id} -> {checkpoint_file}")
         except OSError as e:
             logger.error(f"Failed to save checkpoint for {feature_id}: {e}")
+            temp_file.unlink(missing_ok=True)
             raise
 
+    def list_features(self) -> list[str]:
+        """Feature IDs that have a checkpoint file, sorted."""
+        return sorted(
+            path.name[: -len(CHECKPOINT_SUFFIX)]
+            for path in self.base_path.glob(f"*{CHECKPOINT_SUFFIX}")
+        )
+
+    def remove_temp_files(self) -> int:
+        """Delete temporary files left by interrupted saves.
+
+        Only safe while no checkpoint is being saved (e.g. at startup).
+
+        Returns:
+            Number of files deleted
+        """
+        removed = 0
+        for temp_file in self.base_path.glob(f".*{CHECKPOINT_SUFFIX}.*.tmp"):
+            temp_file.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
     def load_checkpoint(self, feature_id: str) -> Optional[dict[str, Any]]:
         """Load checkpoint data from file.
 
@@ -5,13 +5,13 @@ approval gate and team configuration integration.
 """
 
 import logging
-from datetime import datetime
 from typing import Any, Optional
 
 from sdp.unified.checkpoint.repository import CheckpointRepository
 from sdp.unified.checkpoint.schema import CheckpointStatus
 from sdp.unified.gates.manager import ApprovalGateManager
 from sdp.unified.orchestrator.checkpoint import CheckpointFileManager
+from sdp.unified.orchestrator.checkpoint_store import CheckpointStore
 from sdp.unified.team.manager import TeamManager
 
 logger = logging.getLogger(__name__)
@@ -20,8 +20,9 @@ logger = logging.getLogger(__name__)
 class CheckpointOperations:
     """Operations for checkpoint save/resume.
 
-    Handles file-based checkpoint persistence with integration
-    for approval gates and team configuration.
+    Checkpoints are saved to the checkpoint database through a
+    CheckpointStore, which exports them to checkpoint files, with
+    integration for approval gates and team configuration.
     """
 
     def __init__(
@@ -37,6 +38,7 @@ class CheckpointOperations:
         """
         self.checkpoint_manager = checkpoint_manager
         self.repo = repo
+        self.store = CheckpointStore(repo, checkpoint_manager)
         self.gate_manager: Optional[ApprovalGateManager] = None
         self.team_manager: Optional[TeamManager] = None
 
@@ -65,7 +67,7 @@ class CheckpointOperations:
         current_workstream: str,
         status: CheckpointStatus,
     ) -> None:
-        """Save checkpoint to file for resumption.
+        """Save checkpoint to the database and its checkpoint file.
 
         Args:
             feature_id: Feature identifier
@@ -74,28 +76,12 @@ class CheckpointOperations:
             completed_workstreams: List of completed workstream IDs
             current_workstream: Current workstream ID
             status: Checkpoint status
+
+        Note:
+            Approval gate state is kept in the checkpoint's metrics by the
+            gate manager and exported along with it.
         """
-        started_at = datetime.now().isoformat()
-
-        checkpoint_data: dict[str, Any] = {
-            "feature_id": feature_id,
-            "agent_id": agent_id,
-            "workstreams": workstreams,
-            "completed_workstreams": completed_workstreams,
-            "current_workstream": current_workstream,
-            "status": status.value,
-            "started_at": started_at,
-            "last_updated": started_at,
-        }
-
-        # Include approval gate state if available
-        if self.gate_manager:
-            try:
-                checkpoint = self.repo.load_checkpoint(feature_id)
-                if checkpoint and checkpoint.metrics:
-                    checkpoint_data["gates"] = checkpoint.metrics.get("gates", {})
-            except Exception as e:
-                logger.warning(f"Failed to load gate state: {e}")
+        metrics: dict[str, Any] = {}
 
         # Include team state if available
         if self.team_manager:
@@ -110,17 +96,25 @@ class CheckpointOperations:
                     }
                     for role in self.team_manager.roles.values()
                 ]
-                checkpoint_data["team"] = {"roles": roles_data}
+                metrics["team"] = {"roles": roles_data}
             except Exception as e:
                 logger.warning(f"Failed to load team state: {e}")
 
-        self.checkpoint_manager.save_checkpoint(feature_id, checkpoint_data)
+        self.store.save(
+            feature_id,
+            agent_id,
+            workstreams,
+            completed_workstreams,
+            current_workstream,
+            status,
+            metrics,
+        )
         logger.info(f"Checkpoint saved for feature: {feature_id}")
 
     def resume_from_checkpoint(
         self, feature_id: str, agent_id: str
     ) -> Optional[dict[str, Any]]:
-        """Resume execution from checkpoint file.
+        """Resume execution from the feature's checkpoint.
 
         Args:
             feature_id: Feature identifier
@@ -130,9 +124,10 @@ class CheckpointOperations:
             Checkpoint data dictionary or None if not found/invalid
 
         Note:
-            Verifies agent ID matches checkpoint before resuming.
+            Verifies agent ID matches checkpoint before resuming. State is
+            read from the database (a legacy checkpoint file is imported).
         """
-        checkpoint_data = self.checkpoint_manager.load_checkpoint(feature_id)
+        checkpoint_data = self.store.load(feature_id)
 
         if checkpoint_data is None:
             logger.debug(f"No checkpoint found for feature: {feature_id}")
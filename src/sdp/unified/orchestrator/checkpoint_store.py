@@ -0,0 +1,184 @@
+"""Unified checkpoint store for @oneshot workflow.
+
+The checkpoint database is the source of truth; checkpoint files in
+.oneshot are exports of it, rewritten atomically after each save. A
+crash between the database commit and the export leaves a stale file,
+which reconcile() repairs on startup.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.checkpoint.schema import Checkpoint, CheckpointStatus
+from sdp.unified.orchestrator.checkpoint import CheckpointFileManager
+
+logger = logging.getLogger(__name__)
+
+# Checkpoint metrics that are exported to checkpoint files
+EXPORTED_METRICS = ("gates", "team")
+
+_ACTIVE = (CheckpointStatus.IN_PROGRESS, CheckpointStatus.FAILED)
+
+
+@dataclass
+class ReconcileResult:
+    """Outcome of reconciling checkpoint files with the database."""
+
+    imported: list[str] = field(default_factory=list)
+    repaired: list[str] = field(default_factory=list)
+    temp_files_removed: int = 0
+
+
+def to_file_data(checkpoint: Checkpoint) -> dict[str, Any]:
+    """Checkpoint file contents for a database checkpoint."""
+    data: dict[str, Any] = {
+        "feature_id": checkpoint.feature,
+        "agent_id": checkpoint.agent_id,
+        "workstreams": checkpoint.execution_order,
+        "completed_workstreams": checkpoint.completed_ws,
+        "current_workstream": checkpoint.current_ws,
+        "status": checkpoint.status.value,
+        "started_at": checkpoint.started_at.isoformat(),
+        "last_updated": (checkpoint.updated_at or checkpoint.started_at).isoformat(),
+        "version": checkpoint.version,
+    }
+    for key in EXPORTED_METRICS:
+        if key in checkpoint.metrics:
+            data[key] = checkpoint.metrics[key]
+    return data
+
+
+def from_file_data(data: dict[str, Any]) -> Checkpoint:
+    """Checkpoint for the contents of a checkpoint file.
+
+    Raises:
+        KeyError, ValueError: If the file is not a valid checkpoint
+    """
+    started_at = data.get("started_at")
+    return Checkpoint(
+        feature=data["feature_id"],
+        agent_id=data["agent_id"],
+        status=CheckpointStatus(data.get("status", CheckpointStatus.IN_PROGRESS.value)),
+        completed_ws=list(data.get("completed_workstreams", [])),
+        execution_order=list(data.get("workstreams", [])),
+        started_at=datetime.fromisoformat(started_at) if started_at else datetime.now(),
+        current_ws=data.get("current_workstream"),
+        metrics={key: data[key] for key in EXPORTED_METRICS if key in data},
+    )
+
+
+class CheckpointStore:
+    """Checkpoint state in the database, exported to checkpoint files."""
+
+    def __init__(self, repo: CheckpointRepository, files: CheckpointFileManager) -> None:
+        """Initialize store.
+
+        Args:
+            repo: Checkpoint repository (source of truth)
+            files: Checkpoint file manager for exports
+        """
+        self.repo = repo
+        self.files = files
+
+    def save(
+        self,
+        feature_id: str,
+        agent_id: str,
+        workstreams: list[str],
+        completed_workstreams: list[str],
+        current_workstream: Optional[str],
+        status: CheckpointStatus,
+        metrics: Optional[dict[str, Any]] = None,
+    ) -> Checkpoint:
+        """Write checkpoint state to the database, then export it.
+
+        The feature's active checkpoint is updated in place (keeping its
+        metrics, e.g. approval gates); otherwise a new one is created.
+
+        Args:
+            metrics: Metrics to set (merged into existing metrics)
+
+        Returns:
+            Saved checkpoint
+        """
+        checkpoint = self.repo.load_checkpoint(feature_id)
+        if checkpoint is not None and checkpoint.status in _ACTIVE:
+            checkpoint.status = status
+            checkpoint.execution_order = workstreams
+            checkpoint.completed_ws = completed_workstreams
+            checkpoint.current_ws = current_workstream
+            checkpoint.metrics.update(metrics or {})
+            self.repo.update_checkpoint(checkpoint)
+        else:
+            checkpoint = Checkpoint(
+                feature=feature_id,
+                agent_id=agent_id,
+                status=status,
+                completed_ws=completed_workstreams,
+                execution_order=workstreams,
+                started_at=datetime.now(),
+                current_ws=current_workstream,
+                metrics=dict(metrics or {}),
+            )
+            self.repo.save_checkpoint(checkpoint)
+        return self.export(feature_id) or checkpoint
+
+    def load(self, feature_id: str) -> Optional[dict[str, Any]]:
+        """Checkpoint file data of a feature, read from the database.
+
+        A checkpoint file without a database checkpoint (written before
+        the store existed) is imported first.
+        """
+        checkpoint = self.repo.load_checkpoint(feature_id)
+        if checkpoint is None and self._import(feature_id):
+            checkpoint = self.repo.load_checkpoint(feature_id)
+        return to_file_data(checkpoint) if checkpoint else None
+
+    def export(self, feature_id: str) -> Optional[Checkpoint]:
+        """Rewrite a feature's checkpoint file from the database."""
+        checkpoint = self.repo.load_checkpoint(feature_id)
+        if checkpoint is not None:
+            self.files.save_checkpoint(feature_id, to_file_data(checkpoint))
+        return checkpoint
+
+    def reconcile(self) -> ReconcileResult:
+        """Repair checkpoint files that diverged from the database.
+
+        Run at startup. Files without a database checkpoint are imported;
+        files that differ from the database, and active checkpoints
+        without a file, are re-exported.
+        """
+        result = ReconcileResult(temp_files_removed=self.files.remove_temp_files())
+        features = set(self.files.list_features())
+        features.update(c.feature for c in self.repo.list_active_checkpoints())
+        for feature_id in sorted(features):
+            checkpoint = self.repo.load_checkpoint(feature_id)
+            if checkpoint is None:
+                if self._import(feature_id):
+                    result.imported.append(feature_id)
+                continue
+            if self.files.load_checkpoint(feature_id) != to_file_data(checkpoint):
+                self.files.save_checkpoint(feature_id, to_file_data(checkpoint))
+                result.repaired.append(feature_id)
+        if result.imported or result.repaired:
+            logger.info(
+                f"Reconciled checkpoints: imported {result.imported}, repaired {result.repaired}"
+            )
+        return result
+
+    def _import(self, feature_id: str) -> bool:
+        """Import a checkpoint file into the database and re-export it."""
+        data = self.files.load_checkpoint(feature_id)
+        if data is None:
+            return False
+        try:
+            checkpoint = from_file_data(data)
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Skipping invalid checkpoint file for {feature_id}: {e}")
+            return False
+        self.repo.save_checkpoint(checkpoint)
+        self.export(feature_id)
+        return True
@@ -1,14 +1,24 @@
 """
 Progress monitoring for feature execution.
+
+Dashboards watching many features query them together with
+``progress_for_features`` and ``subscribe`` to be called back only when
+a checkpoint write changes their progress.
 """
 
 import logging
-from typing import Any
+import threading
+from typing import Any, Callable, Sequence
 
+from sdp.unified.checkpoint.progress import ChangeWatcher, feature_progress
 from sdp.unified.checkpoint.repository import CheckpointRepository
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POLL_INTERVAL_S = 0.1
+
+ProgressCallback = Callable[[dict[str, dict[str, Any]]], None]
+
 
 class ProgressMonitor:
     """Monitors execution progress for features."""
@@ -60,3 +70,79 @@ class ProgressMonitor:
                 checkpoint.completed_at.isoformat() if checkpoint.completed_at else None
             ),
         }
+
+    def progress_for_features(self, feature_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Get progress metrics for many features with one query.
+
+        Args:
+            feature_ids: Feature identifiers
+
+        Returns:
+            Map of feature ID to metrics (as get_progress); features
+            without a checkpoint are left out
+        """
+        return feature_progress(self.repo.database, feature_ids)
+
+    def subscribe(
+        self,
+        feature_ids: Sequence[str],
+        callback: ProgressCallback,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_S,
+    ) -> "ProgressSubscription":
+        """Call back with the features whose progress changed.
+
+        Args:
+            feature_ids: Feature identifiers to watch
+            callback: Called on a background thread with changed metrics
+            poll_interval: Seconds between database change checks
+
+        Returns:
+            Running subscription; close() it to stop
+        """
+        return ProgressSubscription(self, feature_ids, callback, poll_interval)
+
+
+class ProgressSubscription:
+    """Background watcher that reports progress changes of features.
+
+    Checks the database's data_version every ``poll_interval`` seconds and
+    re-runs the progress query only after a commit; the callback gets just
+    the features whose metrics differ from the last report.
+    """
+
+    def __init__(
+        self,
+        monitor: ProgressMonitor,
+        feature_ids: Sequence[str],
+        callback: ProgressCallback,
+        poll_interval: float,
+    ) -> None:
+        """Take the initial progress and start the watcher thread."""
+        self.feature_ids = list(feature_ids)
+        self._monitor = monitor
+        self._callback = callback
+        self._poll_interval = poll_interval
+        self._watcher = ChangeWatcher(monitor.repo.database)
+        self._last = monitor.progress_for_features(self.feature_ids)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="progress-watch", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop watching."""
+        self._stop.set()
+        self._thread.join()
+        self._watcher.close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._poll_interval):
+            if not self._watcher.changed():
+                continue
+            try:
+                current = self._monitor.progress_for_features(self.feature_ids)
+                changed = {f: p for f, p in current.items() if self._last.get(f) != p}
+                self._last = current
+                if changed:
+                    self._callback(changed)
+            except Exception as e:
+                logger.warning(f"Progress subscription update failed: {e}")
@@ -0,0 +1,87 @@
+"""
+Resume planning for interrupted feature execution.
+
+The remaining work is the set of workstreams not completed in the
+checkpoint, checked against the current workstream list and dependency
+graph, so resuming stays correct when workstreams ran in parallel or the
+list was edited between runs.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+from sdp.unified.orchestrator.scheduler import Dependencies, WorkstreamScheduler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResumePlan:
+    """What to keep and what to run when resuming a feature."""
+
+    completed: list[str] = field(default_factory=list)
+    remaining: list[str] = field(default_factory=list)
+    ready: list[str] = field(default_factory=list)
+    stale: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+
+
+def plan_resume(
+    workstreams: Sequence[str],
+    completed: Sequence[str],
+    dependencies: Optional[Dependencies] = None,
+) -> ResumePlan:
+    """Compute the work left for a feature, in O(V+E).
+
+    Completions of workstreams no longer in the list are dropped. With
+    ``dependencies``, a completed workstream whose prerequisites are not
+    all (still) completed - e.g. a prerequisite added since the last
+    run - is stale and runs again.
+
+    Args:
+        workstreams: Current workstream IDs, in list order
+        completed: Completed workstream IDs from the checkpoint
+        dependencies: Map of workstream ID to prerequisites; without it
+            workstreams run in list order and every completion is kept
+
+    Returns:
+        ResumePlan; ``remaining`` is in list order, ``ready`` are the
+        remaining workstreams whose prerequisites are all completed
+
+    Raises:
+        ValueError: If a dependency is not in ``workstreams`` or the
+            dependencies have a cycle
+    """
+    members = list(dict.fromkeys(workstreams))
+    done = set(completed) & set(members)
+    plan = ResumePlan(dropped=[ws_id for ws_id in dict.fromkeys(completed) if ws_id not in done])
+
+    if dependencies is None:
+        valid = done
+        plan.remaining = [ws_id for ws_id in members if ws_id not in valid]
+        plan.ready = plan.remaining[:1]
+    else:
+        unknown = {dep for ws_id in members for dep in dependencies.get(ws_id, ())}
+        unknown.difference_update(members)
+        if unknown:
+            raise ValueError(f"Unknown workstream dependencies: {sorted(unknown)}")
+        valid = set()
+        for ws_id in WorkstreamScheduler(members, dependencies).order:
+            if ws_id in done and all(dep in valid for dep in dependencies.get(ws_id, ())):
+                valid.add(ws_id)
+        plan.remaining = [ws_id for ws_id in members if ws_id not in valid]
+        plan.ready = [
+            ws_id
+            for ws_id in plan.remaining
+            if all(dep in valid for dep in dependencies.get(ws_id, ()))
+        ]
+
+    plan.completed = [ws_id for ws_id in dict.fromkeys(completed) if ws_id in valid]
+    plan.stale = [ws_id for ws_id in dict.fromkeys(completed) if ws_id in done - valid]
+    if plan.dropped or plan.stale:
+        logger.warning(
+            f"Resume: dropped completions {plan.dropped} (not in the feature), "
+            f"re-running {plan.stale} (prerequisites not completed)"
+        )
+    return plan
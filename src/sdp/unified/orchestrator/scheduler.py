@@ -0,0 +1,166 @@
+"""
+Dependency-aware workstream scheduler.
+
+Runs workstreams on a thread pool in dependency order: every workstream
+whose prerequisites have finished is started as soon as a worker is free.
+A failed workstream cancels only its downstream subtree; independent
+branches keep running.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+Dependencies = Mapping[str, Sequence[str]]
+
+
+@dataclass
+class ScheduleResult:
+    """Outcome of running a set of workstreams."""
+
+    completed: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    cancelled: list[str] = field(default_factory=list)
+
+    @property
+    def is_success(self) -> bool:
+        """Check if every workstream completed."""
+        return not self.failed and not self.cancelled
+
+
+def _ignore(*args: object) -> None:
+    """Default callback."""
+
+
+class WorkstreamScheduler:
+    """Runs workstreams concurrently along their dependency DAG."""
+
+    def __init__(
+        self,
+        workstreams: Sequence[str],
+        dependencies: Optional[Dependencies] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Build the DAG.
+
+        Dependencies on workstreams outside ``workstreams`` are treated as
+        already satisfied (e.g. completed in an earlier run).
+
+        Args:
+            workstreams: Workstream IDs to run, in preferred start order
+            dependencies: Map of workstream ID to its prerequisites
+                (e.g. ``Feature.dependency_graph``); None runs the
+                workstreams one after another in list order
+            max_workers: Maximum workstreams running at once
+
+        Raises:
+            ValueError: If max_workers < 1 or the dependencies have a cycle
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.workstreams = list(dict.fromkeys(workstreams))
+        self.max_workers = max_workers
+        if dependencies is None:
+            dependencies = {
+                ws: self.workstreams[i - 1 : i] for i, ws in enumerate(self.workstreams)
+            }
+        members = set(self.workstreams)
+        self._in_degree = dict.fromkeys(self.workstreams, 0)
+        self._dependents: dict[str, list[str]] = {ws_id: [] for ws_id in self.workstreams}
+        for ws_id in self.workstreams:
+            for dep in dict.fromkeys(dependencies.get(ws_id, ())):
+                if dep in members:
+                    self._dependents[dep].append(ws_id)
+                    self._in_degree[ws_id] += 1
+        self.order = self._topological_order()
+
+    def run(
+        self,
+        execute: Callable[[str], None],
+        on_start: Callable[[str], None] = _ignore,
+        on_complete: Callable[[str], None] = _ignore,
+        on_failure: Callable[[str, Exception], None] = _ignore,
+    ) -> ScheduleResult:
+        """Run every workstream, ``execute`` on worker threads.
+
+        Callbacks run on the calling thread, one at a time, so they can
+        update checkpoints without extra locking. An exception raised by
+        ``on_complete`` is treated as that workstream's failure.
+
+        Returns:
+            ScheduleResult; ``completed`` is in completion order
+        """
+        result = ScheduleResult()
+        in_degree = dict(self._in_degree)
+        ready = deque(ws_id for ws_id, degree in in_degree.items() if degree == 0)
+        running: dict[Future[None], str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while ready or running:
+                while ready and len(running) < self.max_workers:
+                    ws_id = ready.popleft()
+                    on_start(ws_id)
+                    running[executor.submit(execute, ws_id)] = ws_id
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ws_id = running.pop(future)
+                    try:
+                        future.result()
+                        on_complete(ws_id)
+                    except Exception as e:
+                        result.failed[ws_id] = str(e)
+                        cancelled = set(result.cancelled)
+                        result.cancelled += [
+                            w for w in self._downstream(ws_id) if w not in cancelled
+                        ]
+                        on_failure(ws_id, e)
+                        continue
+                    result.completed.append(ws_id)
+                    for dependent in self._dependents[ws_id]:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            ready.append(dependent)
+
+        if result.cancelled:
+            logger.warning(f"Cancelled after failures {list(result.failed)}: {result.cancelled}")
+        return result
+
+    def _downstream(self, ws_id: str) -> list[str]:
+        """Workstreams that transitively depend on ``ws_id`` (BFS order)."""
+        seen = {ws_id}
+        queue = deque([ws_id])
+        subtree: list[str] = []
+        while queue:
+            for dependent in self._dependents[queue.popleft()]:
+                if dependent not in seen:
+                    seen.add(dependent)
+                    subtree.append(dependent)
+                    queue.append(dependent)
+        return subtree
+
+    def _topological_order(self) -> list[str]:
+        """Kahn's algorithm over the DAG, O(V+E).
+
+        Raises:
+            ValueError: If the dependencies have a cycle
+        """
+        in_degree = dict(self._in_degree)
+        queue = deque(ws_id for ws_id, degree in in_degree.items() if degree == 0)
+        order: list[str] = []
+        while queue:
+            order.append(queue.popleft())
+            for dependent in self._dependents[order[-1]]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+        if len(order) != len(in_degree):
+            cycle = [ws_id for ws_id, degree in in_degree.items() if degree > 0]
+            raise ValueError(f"Circular dependency among workstreams: {cycle}")
+        return order
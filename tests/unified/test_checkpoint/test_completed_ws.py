@@ -0,0 +1,167 @@
+"""
+Tests for the checkpoint_completed_ws table and the v2 migration.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from sdp.unified.checkpoint.models import Checkpoint, CheckpointStatus
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.checkpoint.schema_manager import SchemaManager
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+
+V1_SCHEMA = """
+CREATE TABLE checkpoints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    feature TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    completed_ws TEXT NOT NULL DEFAULT '[]',
+    execution_order TEXT NOT NULL DEFAULT '[]',
+    started_at TEXT NOT NULL,
+    current_ws TEXT,
+    completed_at TEXT,
+    failed_tasks TEXT NOT NULL DEFAULT '[]',
+    error TEXT,
+    metrics TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE schema_version (
+    version INTEGER PRIMARY KEY,
+    applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+INSERT INTO schema_version (version) VALUES (1);
+"""
+
+
+@pytest.fixture
+def temp_db_path(tmp_path):
+    """Create temporary database path."""
+    return str(tmp_path / "test_completed_ws.db")
+
+
+@pytest.fixture
+def checkpoint_db(temp_db_path):
+    """Create initialized checkpoint database."""
+    db = CheckpointDatabase(temp_db_path)
+    db.initialize()
+    yield db
+    db.close()
+
+
+def _checkpoint(feature: str = "F01", completed_ws: list[str] | None = None) -> Checkpoint:
+    return Checkpoint(
+        feature=feature,
+        agent_id="agent-001",
+        status=CheckpointStatus.IN_PROGRESS,
+        completed_ws=completed_ws or [],
+        execution_order=["WS-001", "WS-002", "WS-003"],
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+def _child_rows(db_path: str) -> list[tuple]:
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT rowid, checkpoint_id, ws_id, position FROM checkpoint_completed_ws "
+        "ORDER BY checkpoint_id, position"
+    ).fetchall()
+    conn.close()
+    return rows
+
+
+class TestMigration:
+    """Test the v1 -> v2 migration."""
+
+    def test_backfills_existing_rows(self, temp_db_path):
+        """Should move JSON arrays into the child table, keeping order."""
+        conn = sqlite3.connect(temp_db_path)
+        conn.executescript(V1_SCHEMA)
+        conn.execute(
+            "INSERT INTO checkpoints (feature, agent_id, status, completed_ws, started_at) "
+            "VALUES ('F01', 'a', 'in_progress', '[\"WS-002\", \"WS-001\"]', '2026-01-01T00:00:00')"
+        )
+        conn.execute(
+            "INSERT INTO checkpoints (feature, agent_id, status, completed_ws, started_at) "
+            "VALUES ('F02', 'a', 'completed', '[\"WS-001\"]', '2026-01-02T00:00:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        db = CheckpointDatabase(temp_db_path)
+        db.initialize()
+
+        assert db.get_schema_version() == SchemaManager.SCHEMA_VERSION
+        assert db.get_checkpoint_by_feature("F01").completed_ws == ["WS-002", "WS-001"]
+        assert [c.feature for c in db.get_checkpoints_with_ws("WS-001")] == ["F01", "F02"]
+        legacy = db._get_connection().execute("SELECT DISTINCT completed_ws FROM checkpoints")
+        assert [row[0] for row in legacy] == ["[]"]
+        db.close()
+
+    def test_migration_runs_once(self, temp_db_path):
+        """Should not reapply migrations on later initializations."""
+        for _ in range(2):
+            db = CheckpointDatabase(temp_db_path)
+            db.initialize()
+            db.close()
+
+        conn = sqlite3.connect(temp_db_path)
+        versions = [row[0] for row in conn.execute("SELECT version FROM schema_version")]
+        conn.close()
+        assert versions == list(range(1, SchemaManager.SCHEMA_VERSION + 1))
+
+
+class TestCompletedWs:
+    """Test completed workstream storage."""
+
+    def test_appending_keeps_existing_rows(self, checkpoint_db, temp_db_path):
+        """Should insert only new workstreams when the list grows."""
+        checkpoint = _checkpoint(completed_ws=["WS-001"])
+        checkpoint_id = checkpoint_db.create_checkpoint(checkpoint)
+        before = _child_rows(temp_db_path)
+
+        checkpoint.completed_ws = ["WS-001", "WS-002"]
+        checkpoint_db.update_checkpoint(checkpoint_id, checkpoint)
+
+        after = _child_rows(temp_db_path)
+        assert after[0] == before[0]
+        assert after[1][2:] == ("WS-002", 1)
+
+    def test_reordering_rewrites_rows(self, checkpoint_db):
+        """Should store the new order when the list is not an extension."""
+        checkpoint = _checkpoint(completed_ws=["WS-001", "WS-002"])
+        checkpoint_id = checkpoint_db.create_checkpoint(checkpoint)
+
+        checkpoint.completed_ws = ["WS-002"]
+        checkpoint_db.update_checkpoint(checkpoint_id, checkpoint)
+
+        assert checkpoint_db.get_checkpoint(checkpoint_id).completed_ws == ["WS-002"]
+
+    def test_add_completed_ws(self, checkpoint_db):
+        """Should append one workstream and ignore duplicates."""
+        checkpoint_id = checkpoint_db.create_checkpoint(_checkpoint(completed_ws=["WS-001"]))
+
+        assert checkpoint_db.add_completed_ws(checkpoint_id, "WS-002") is True
+        assert checkpoint_db.add_completed_ws(checkpoint_id, "WS-001") is False
+        assert checkpoint_db.get_checkpoint(checkpoint_id).completed_ws == ["WS-001", "WS-002"]
+
+    def test_delete_removes_completed_ws(self, checkpoint_db, temp_db_path):
+        """Should delete child rows with the checkpoint."""
+        checkpoint_id = checkpoint_db.create_checkpoint(_checkpoint(completed_ws=["WS-001"]))
+
+        checkpoint_db.delete_checkpoint(checkpoint_id)
+
+        assert _child_rows(temp_db_path) == []
+
+    def test_repository_finds_checkpoints_with_ws(self, temp_db_path):
+        """Should expose the WS lookup through the repository."""
+        with CheckpointRepository(temp_db_path) as repo:
+            repo.initialize()
+            repo.save_checkpoint(_checkpoint("F01", ["WS-001"]))
+            repo.save_checkpoint(_checkpoint("F02", ["WS-002"]))
+
+            found = repo.find_checkpoints_with_ws("WS-002")
+
+        assert [c.feature for c in found] == ["F02"]
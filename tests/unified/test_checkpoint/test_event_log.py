@@ -0,0 +1,194 @@
+"""
+Tests for the checkpoint event log: appends, snapshots and replay.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sdp.unified.checkpoint.event_log import CheckpointEventLog
+from sdp.unified.checkpoint.events import EventType, FeatureState
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+from sdp.unified.gates.database import GateDatabase
+from sdp.unified.orchestrator.agent import OrchestratorAgent
+from sdp.unified.orchestrator.errors import ExecutionError
+
+
+@pytest.fixture
+def checkpoint_db(tmp_path):
+    """Create initialized checkpoint database."""
+    db = CheckpointDatabase(str(tmp_path / "checkpoints.db"))
+    db.initialize()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def log(checkpoint_db):
+    """Event log snapshotting every 3 events."""
+    return CheckpointEventLog(checkpoint_db, snapshot_every=3)
+
+
+def _run(log, feature="F01", count=4):
+    log.append(feature, EventType.AGENT_ASSIGNED, payload={"agent_id": "agent-001"})
+    for i in range(1, count + 1):
+        ws_id = f"WS-{i:03d}"
+        log.append(feature, EventType.WS_STARTED, ws_id)
+        log.append(feature, EventType.WS_COMPLETED, ws_id)
+
+
+def _snapshot_seqs(db, feature="F01"):
+    with db.reading() as conn:
+        rows = conn.execute(
+            "SELECT seq FROM checkpoint_snapshots WHERE feature = ? ORDER BY seq", (feature,)
+        )
+        return [row[0] for row in rows]
+
+
+class TestAppend:
+    """Test appending events."""
+
+    def test_append_is_one_insert(self, checkpoint_db, log):
+        """Should write a single row per event between snapshots."""
+        log.append("F01", EventType.WS_STARTED, "WS-001")
+        statements = []
+        checkpoint_db._get_connection().set_trace_callback(statements.append)
+
+        seq = log.append("F01", EventType.WS_COMPLETED, "WS-001")
+
+        writes = [s for s in statements if s.startswith(("INSERT", "UPDATE", "DELETE"))]
+        assert len(writes) == 1
+        assert [e.seq for e in log.events("F01")][-1] == seq
+
+    def test_snapshots_every_n_events(self, checkpoint_db, log):
+        """Should store the folded state every snapshot_every events per feature."""
+        _run(log, count=4)
+        log.append("F02", EventType.WS_STARTED, "WS-100")
+
+        assert _snapshot_seqs(checkpoint_db) == [3, 6, 9]
+        assert _snapshot_seqs(checkpoint_db, "F02") == []
+
+    def test_pending_count_survives_reopen(self, checkpoint_db, log):
+        """Should count events since the last snapshot when a new log is opened."""
+        _run(log, count=2)  # 5 events, snapshot at 3
+        reopened = CheckpointEventLog(checkpoint_db, snapshot_every=3)
+
+        reopened.append("F01", EventType.WS_STARTED, "WS-003")
+
+        assert _snapshot_seqs(checkpoint_db) == [3, 6]
+
+    def test_interleaved_logs_keep_snapshotting(self, checkpoint_db, log):
+        """Should snapshot on time when two logs append to the same feature."""
+        other = CheckpointEventLog(checkpoint_db, snapshot_every=3)
+
+        for i in range(9):
+            (log if i % 2 else other).append("F01", EventType.WS_STARTED, f"WS-{i:03d}")
+
+        assert _snapshot_seqs(checkpoint_db) == [3, 6, 9]
+
+
+class TestReplay:
+    """Test rebuilding state."""
+
+    def test_replay_matches_folding_all_events(self, log):
+        """Should give the same state from snapshots as from raw events."""
+        _run(log, count=4)
+        log.append("F01", EventType.WS_STARTED, "WS-005")
+
+        expected = FeatureState("F01")
+        for event in log.events("F01"):
+            expected.apply(event)
+        state = log.replay("F01")
+
+        assert state == expected
+        assert state.agent_id == "agent-001"
+        assert state.completed_ws == ["WS-001", "WS-002", "WS-003", "WS-004"]
+        assert state.running == ["WS-005"]
+
+    def test_replay_until_seq(self, log):
+        """Should rebuild state as of an earlier event."""
+        _run(log, count=4)
+
+        state = log.replay("F01", until_seq=4)
+
+        assert state.seq == 4
+        assert state.completed_ws == ["WS-001"]
+        assert state.running == ["WS-002"]
+
+    def test_replay_until_time(self, log):
+        """Should apply only events recorded at or before the given time."""
+        _run(log, count=1)
+        cutoff = datetime.now(timezone.utc)
+        log.append("F01", EventType.WS_STARTED, "WS-002")
+
+        assert log.replay("F01", until=cutoff).running == []
+        assert log.replay("F01", until=cutoff - timedelta(days=1)) == FeatureState("F01")
+
+    def test_failed_run(self, log):
+        """Should show which workstream failed and why, and clear it on retry."""
+        log.append("F01", EventType.WS_STARTED, "WS-001")
+        log.append("F01", EventType.WS_FAILED, "WS-001", {"error": "tests failed"})
+        failed_at = log.append("F01", EventType.STATUS_CHANGED, payload={"status": "failed"})
+        log.append("F01", EventType.WS_STARTED, "WS-001")
+
+        at_failure = log.replay("F01", until_seq=failed_at)
+
+        assert at_failure.failed_ws == {"WS-001": "tests failed"}
+        assert at_failure.status == "failed"
+        assert log.replay("F01").failed_ws == {}
+
+    def test_snapshot_now(self, checkpoint_db, log):
+        """Should store a snapshot on demand."""
+        log.append("F01", EventType.WS_STARTED, "WS-001")
+
+        state = log.snapshot("F01")
+
+        assert _snapshot_seqs(checkpoint_db) == [state.seq]
+
+
+class TestEventSources:
+    """Test events recorded by the orchestrator and gates."""
+
+    def test_orchestrator_records_run(self, tmp_path):
+        """Should log assignment, workstreams and status changes."""
+        repo = CheckpointRepository(str(tmp_path / "checkpoints.db"))
+        repo.initialize()
+
+        OrchestratorAgent(repo).execute_feature("F01", ["WS-001", "WS-002"], "agent-001")
+
+        state = repo.events.replay("F01")
+        assert state.agent_id == "agent-001"
+        assert state.status == "completed"
+        assert state.completed_ws == ["WS-001", "WS-002"]
+        repo.close()
+
+    def test_orchestrator_records_failure(self, tmp_path, monkeypatch):
+        """Should log the failed workstream with its error."""
+        repo = CheckpointRepository(str(tmp_path / "checkpoints.db"))
+        repo.initialize()
+        agent = OrchestratorAgent(repo)
+
+        def dispatch(ws_id):
+            if ws_id == "WS-002":
+                raise RuntimeError("boom")
+
+        monkeypatch.setattr(agent, "_dispatch_single_workstream", dispatch)
+        with pytest.raises(ExecutionError):
+            agent.execute_feature("F01", ["WS-001", "WS-002"], "agent-001")
+
+        state = repo.events.replay("F01")
+        assert state.completed_ws == ["WS-001"]
+        assert state.failed_ws == {"WS-002": "boom"}
+        assert state.status == "failed"
+        repo.close()
+
+    def test_gate_results_are_events(self, tmp_path):
+        """Should log each recorded gate result."""
+        gates = GateDatabase(str(tmp_path / "checkpoints.db"))
+
+        gates.record_result("F01", "lint", "failed")
+        gates.record_result("F01", "lint", "passed")
+
+        assert gates.events.replay("F01").gates == {"lint": "passed"}
+        gates.close()
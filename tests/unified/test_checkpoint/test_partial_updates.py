@@ -0,0 +1,153 @@
+"""
+Tests for single-statement, versioned checkpoint updates.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from sdp.unified.checkpoint import queries
+from sdp.unified.checkpoint.errors import CheckpointConflictError
+from sdp.unified.checkpoint.models import Checkpoint, CheckpointStatus
+from sdp.unified.checkpoint.repository import CheckpointRepository, RepositoryError
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+
+
+@pytest.fixture
+def temp_db_path(tmp_path):
+    """Create temporary database path."""
+    return str(tmp_path / "test_partial_updates.db")
+
+
+@pytest.fixture
+def checkpoint_db(temp_db_path):
+    """Create initialized checkpoint database."""
+    db = CheckpointDatabase(temp_db_path)
+    db.initialize()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def checkpoint_id(checkpoint_db):
+    """Create one in-progress checkpoint."""
+    return checkpoint_db.create_checkpoint(
+        Checkpoint(
+            feature="F01",
+            agent_id="agent-001",
+            status=CheckpointStatus.IN_PROGRESS,
+            completed_ws=[],
+            execution_order=["WS-001", "WS-002"],
+            started_at=datetime.now(timezone.utc),
+        )
+    )
+
+
+class TestUpdateStatus:
+    """Test column-targeted status and progress updates."""
+
+    def test_status_update_is_one_statement(self, checkpoint_db, checkpoint_id):
+        """Should flip the status with a single UPDATE and no prior SELECT."""
+        statements = []
+        checkpoint_db._get_connection().set_trace_callback(statements.append)
+
+        version = checkpoint_db.update_status(checkpoint_id, CheckpointStatus.COMPLETED)
+
+        executed = [s for s in statements if s.split()[0] not in ("BEGIN", "COMMIT")]
+        assert len(executed) == 1
+        assert executed[0].startswith("UPDATE checkpoints SET status = ")
+        assert version == 1
+        assert checkpoint_db.get_checkpoint(checkpoint_id).status == CheckpointStatus.COMPLETED
+
+    def test_progress_update_stores_completed_ws(self, checkpoint_db, checkpoint_id):
+        """Should set current_ws and append completed workstreams."""
+        checkpoint_db.update_progress(checkpoint_id, "WS-002", completed_ws=["WS-001"])
+
+        checkpoint = checkpoint_db.get_checkpoint(checkpoint_id)
+        assert checkpoint.current_ws == "WS-002"
+        assert checkpoint.completed_ws == ["WS-001"]
+        assert checkpoint.version == 1
+
+    def test_missing_checkpoint_returns_none(self, checkpoint_db):
+        """Should report a missing row instead of a conflict."""
+        assert checkpoint_db.update_status(999, CheckpointStatus.FAILED) is None
+        assert checkpoint_db.update_status(999, CheckpointStatus.FAILED, expected_version=0) is None
+
+    def test_rejects_unknown_columns(self, checkpoint_db, checkpoint_id):
+        """Should only update whitelisted columns."""
+        with pytest.raises(ValueError, match="feature"):
+            checkpoint_db.update_fields(checkpoint_id, {"feature": "F02"})
+
+    @pytest.mark.parametrize("returning", [True, False])
+    def test_stale_version_conflicts(self, checkpoint_db, checkpoint_id, monkeypatch, returning):
+        """Should refuse to overwrite a newer update (with and without RETURNING)."""
+        monkeypatch.setattr(queries, "HAS_RETURNING", returning)
+        read = checkpoint_db.get_checkpoint(checkpoint_id)
+        assert checkpoint_db.update_progress(checkpoint_id, "WS-001", expected_version=0) == 1
+
+        with pytest.raises(CheckpointConflictError) as exc_info:
+            checkpoint_db.update_status(
+                checkpoint_id, CheckpointStatus.FAILED, expected_version=read.version
+            )
+
+        assert (exc_info.value.expected, exc_info.value.actual) == (0, 1)
+        assert checkpoint_db.get_checkpoint(checkpoint_id).status == CheckpointStatus.IN_PROGRESS
+
+    def test_update_checkpoint_checks_version(self, checkpoint_db, checkpoint_id):
+        """Should bump the version of full updates and honor expected_version."""
+        checkpoint = checkpoint_db.get_checkpoint(checkpoint_id)
+        checkpoint.current_ws = "WS-001"
+        checkpoint_db.update_checkpoint(checkpoint_id, checkpoint, expected_version=0)
+        assert checkpoint.version == 1
+
+        with pytest.raises(CheckpointConflictError):
+            checkpoint_db.update_checkpoint(checkpoint_id, checkpoint, expected_version=0)
+
+    def test_concurrent_agents_detect_conflict(self, temp_db_path, checkpoint_id):
+        """Two agents updating from the same read: the second one conflicts."""
+        first, second = CheckpointDatabase(temp_db_path), CheckpointDatabase(temp_db_path)
+        seen = first.get_checkpoint(checkpoint_id).version
+        assert second.get_checkpoint(checkpoint_id).version == seen
+
+        first.update_status(checkpoint_id, CheckpointStatus.COMPLETED, expected_version=seen)
+        with pytest.raises(CheckpointConflictError):
+            second.update_status(checkpoint_id, CheckpointStatus.FAILED, expected_version=seen)
+
+        assert second.get_checkpoint(checkpoint_id).status == CheckpointStatus.COMPLETED
+        first.close()
+        second.close()
+
+
+class TestRepositoryPartialUpdates:
+    """Test repository status/progress updates."""
+
+    def test_update_status_returns_version(self, temp_db_path):
+        """Should return the new version and raise on conflicts."""
+        with CheckpointRepository(temp_db_path) as repo:
+            repo.initialize()
+            checkpoint_id = repo.save_checkpoint(
+                Checkpoint(
+                    feature="F01",
+                    agent_id="agent-001",
+                    status=CheckpointStatus.IN_PROGRESS,
+                    completed_ws=[],
+                    execution_order=[],
+                    started_at=datetime.now(timezone.utc),
+                )
+            )
+
+            version = repo.update_checkpoint_progress(checkpoint_id, "WS-001")
+            assert repo.update_checkpoint_status(
+                checkpoint_id, CheckpointStatus.COMPLETED, ["WS-001"], expected_version=version
+            ) == version + 1
+            with pytest.raises(CheckpointConflictError):
+                repo.update_checkpoint_status(
+                    checkpoint_id, CheckpointStatus.FAILED, ["WS-001"], expected_version=version
+                )
+
+    def test_update_progress_missing_checkpoint(self, temp_db_path):
+        """Should raise RepositoryError for unknown checkpoints."""
+        with CheckpointRepository(temp_db_path) as repo:
+            repo.initialize()
+            with pytest.raises(RepositoryError, match="not found"):
+                repo.update_checkpoint_progress(999, "WS-001")
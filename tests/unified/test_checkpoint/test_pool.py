@@ -0,0 +1,185 @@
+"""
+Tests for checkpoint database connections: WAL, pragmas, reader pool.
+
+Includes a 16-thread concurrent update test.
+"""
+
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from sdp.unified.checkpoint.models import Checkpoint, CheckpointStatus
+from sdp.unified.checkpoint.pool import ReaderPool, connect
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+
+THREADS = 16
+UPDATES_PER_THREAD = 50
+
+
+@pytest.fixture
+def temp_db_path(tmp_path):
+    """Create temporary database path."""
+    return str(tmp_path / "test_pool.db")
+
+
+@pytest.fixture
+def checkpoint_db(temp_db_path):
+    """Create initialized checkpoint database."""
+    db = CheckpointDatabase(temp_db_path)
+    db.initialize()
+    yield db
+    db.close()
+
+
+def _checkpoint(feature: str) -> Checkpoint:
+    return Checkpoint(
+        feature=feature,
+        agent_id="agent-001",
+        status=CheckpointStatus.IN_PROGRESS,
+        completed_ws=[],
+        execution_order=["WS-001", "WS-002"],
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+class TestConnect:
+    """Test connection settings."""
+
+    def test_writer_uses_wal_and_pragmas(self, tmp_path):
+        """Should enable WAL, synchronous=NORMAL and a busy timeout."""
+        conn = connect(tmp_path / "c.db")
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 10000
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -8192
+        conn.close()
+
+    def test_reader_is_query_only(self, tmp_path):
+        """Should refuse writes on reader connections."""
+        connect(tmp_path / "c.db").close()
+        reader = connect(tmp_path / "c.db", read_only=True)
+
+        with pytest.raises(Exception, match="readonly"):
+            reader.execute("CREATE TABLE t (x)")
+        reader.close()
+
+
+class TestReaderPool:
+    """Test reader pool behavior."""
+
+    def test_reuses_connections(self, tmp_path):
+        """Should hand out an idle connection before opening a new one."""
+        pool = ReaderPool(tmp_path / "c.db", size=2)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        pool.close()
+
+    def test_limits_open_connections(self, tmp_path):
+        """Should block borrowers beyond the pool size."""
+        pool = ReaderPool(tmp_path / "c.db", size=1)
+        acquired = threading.Event()
+
+        def borrow():
+            with pool.connection():
+                acquired.set()
+
+        with pool.connection():
+            thread = threading.Thread(target=borrow)
+            thread.start()
+            assert not acquired.wait(0.1)
+        thread.join(timeout=5)
+
+        assert acquired.is_set()
+        pool.close()
+
+    def test_rejects_empty_pool(self, tmp_path):
+        """Should require at least one connection."""
+        with pytest.raises(ValueError):
+            ReaderPool(tmp_path / "c.db", size=0)
+
+
+class TestTransactions:
+    """Test write transactions and read isolation."""
+
+    def test_transaction_commits_once(self, checkpoint_db):
+        """Should commit grouped writes together."""
+        with checkpoint_db.transaction():
+            first = checkpoint_db.create_checkpoint(_checkpoint("F01"))
+            second = checkpoint_db.create_checkpoint(_checkpoint("F02"))
+            # Visible inside the transaction to the writing thread
+            assert checkpoint_db.get_checkpoint(first) is not None
+
+        assert checkpoint_db.get_checkpoint(second).feature == "F02"
+
+    def test_transaction_rolls_back_on_error(self, checkpoint_db):
+        """Should discard all writes of a failed transaction."""
+        with pytest.raises(RuntimeError):
+            with checkpoint_db.transaction():
+                checkpoint_db.create_checkpoint(_checkpoint("F01"))
+                raise RuntimeError("boom")
+
+        assert checkpoint_db.get_checkpoint_by_feature("F01") is None
+
+    def test_readers_do_not_wait_for_writer(self, checkpoint_db):
+        """Should read the last committed state while a write is open."""
+        checkpoint_id = checkpoint_db.create_checkpoint(_checkpoint("F01"))
+        seen = []
+
+        with checkpoint_db.transaction():
+            checkpoint_db.update_checkpoint(
+                checkpoint_id,
+                Checkpoint(**{**vars(_checkpoint("F01")), "completed_ws": ["WS-001"]}),
+            )
+            reader = threading.Thread(
+                target=lambda: seen.append(checkpoint_db.get_checkpoint(checkpoint_id))
+            )
+            reader.start()
+            reader.join(timeout=2)
+
+        assert not reader.is_alive()
+        assert seen[0].completed_ws == []
+        assert checkpoint_db.get_checkpoint(checkpoint_id).completed_ws == ["WS-001"]
+
+
+class TestConcurrentUpdates:
+    """Concurrent checkpoint updates from 16 agents."""
+
+    @pytest.mark.parametrize("shared", [True, False], ids=["shared-db", "db-per-agent"])
+    def test_sixteen_threads_update_without_lock_errors(self, temp_db_path, shared):
+        """16 agents updating checkpoints: no 'database is locked', no lost writes."""
+        setup = CheckpointDatabase(temp_db_path)
+        setup.initialize()
+        ids = [setup.create_checkpoint(_checkpoint(f"F{i:02d}")) for i in range(THREADS)]
+        errors = []
+
+        def agent(index: int) -> None:
+            db = setup if shared else CheckpointDatabase(temp_db_path)
+            try:
+                for n in range(UPDATES_PER_THREAD):
+                    checkpoint = db.get_checkpoint(ids[index])
+                    checkpoint.completed_ws = checkpoint.completed_ws + [f"WS-{n:03d}"]
+                    db.update_checkpoint(ids[index], checkpoint)
+                    db.get_active_checkpoints()
+            except Exception as e:  # noqa: BLE001 - collected for the assertion
+                errors.append(e)
+            finally:
+                if not shared:
+                    db.close()
+
+        threads = [threading.Thread(target=agent, args=(i,)) for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        for checkpoint_id in ids:
+            assert len(setup.get_checkpoint(checkpoint_id).completed_ws) == UPDATES_PER_THREAD
+        setup.close()
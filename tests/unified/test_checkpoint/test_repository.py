@@ -390,7 +390,7 @@ class TestErrorHandling:
         checkpoint_id = repo.save_checkpoint(checkpoint)
 
         # Mock database to raise exception during update
-        repo._db.update_checkpoint = MagicMock(side_effect=Exception("Update failed"))
+        repo._db.update_status = MagicMock(side_effect=Exception("Update failed"))
 
         with pytest.raises(RepositoryError) as exc_info:
             repo.update_checkpoint_status(
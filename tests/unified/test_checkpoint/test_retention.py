@@ -0,0 +1,223 @@
+"""
+Tests for checkpoint retention: archive, batched delete, vacuum, restore.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sdp.unified.checkpoint import retention as retention_module
+from sdp.unified.checkpoint.archive import archive_path, read_archive, write_archive
+from sdp.unified.checkpoint.event_log import CheckpointEventLog
+from sdp.unified.checkpoint.events import EventType
+from sdp.unified.checkpoint.models import Checkpoint, CheckpointStatus
+from sdp.unified.checkpoint.retention import CheckpointRetention, parse_age
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+from sdp.unified.orchestrator.checkpoint_store import to_file_data
+
+
+@pytest.fixture
+def checkpoint_db(tmp_path):
+    """Create initialized checkpoint database."""
+    db = CheckpointDatabase(str(tmp_path / "checkpoints.db"))
+    db.initialize()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def retention(checkpoint_db, tmp_path):
+    """Retention with archive and orchestrator checkpoint directories."""
+    return CheckpointRetention(checkpoint_db, tmp_path / "archive", tmp_path / ".oneshot")
+
+
+def _add(db, feature, status=CheckpointStatus.COMPLETED, days_ago=60, completed_ws=None):
+    checkpoint_id = db.create_checkpoint(
+        Checkpoint(
+            feature=feature,
+            agent_id="agent-001",
+            status=status,
+            completed_ws=completed_ws or [],
+            execution_order=["WS-001", "WS-002"],
+            started_at=datetime.now(timezone.utc),
+            metrics={"duration": 12},
+        )
+    )
+    touched = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    with db.transaction() as conn:
+        conn.execute(
+            "UPDATE checkpoints SET updated_at = ? WHERE id = ?",
+            (touched.isoformat(), checkpoint_id),
+        )
+    return checkpoint_id
+
+
+def _features(db):
+    with db.reading() as conn:
+        return sorted({row[0] for row in conn.execute("SELECT feature FROM checkpoints")})
+
+
+class TestParseAge:
+    """Test --older-than parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("30d", timedelta(days=30)),
+            ("12h", timedelta(hours=12)),
+            ("2w", timedelta(weeks=2)),
+            ("7", timedelta(days=7)),
+        ],
+    )
+    def test_units(self, value, expected):
+        """Should accept hours, days and weeks (days by default)."""
+        assert parse_age(value) == expected
+
+    def test_rejects_garbage(self):
+        """Should raise ValueError for unknown formats."""
+        with pytest.raises(ValueError):
+            parse_age("soon")
+
+
+class TestSelection:
+    """Test which features are archived."""
+
+    def test_only_old_completed_features_beyond_keep_last(self, checkpoint_db, retention):
+        """Should keep recent, active and the newest N completed features."""
+        _add(checkpoint_db, "F01", days_ago=90)
+        _add(checkpoint_db, "F02", days_ago=60)
+        _add(checkpoint_db, "F03", days_ago=50)
+        _add(checkpoint_db, "F04", days_ago=1)
+        _add(checkpoint_db, "F05", status=CheckpointStatus.FAILED, days_ago=90)
+        # Completed once, then resumed: the latest checkpoint decides
+        _add(checkpoint_db, "F06", days_ago=90)
+        _add(checkpoint_db, "F06", status=CheckpointStatus.IN_PROGRESS, days_ago=90)
+
+        selected = retention.select_features(keep_last=1, older_than=timedelta(days=30))
+
+        assert selected == ["F01", "F02", "F03"]
+        assert retention.select_features(2, timedelta(days=30)) == ["F01", "F02"]
+
+
+class TestGc:
+    """Test archive + delete + restore round trip."""
+
+    def test_archives_deletes_and_restores(self, checkpoint_db, retention, tmp_path):
+        """Should move a feature to the archive and bring it back intact."""
+        first = _add(checkpoint_db, "F01", completed_ws=["WS-001", "WS-002"])
+        _add(checkpoint_db, "F02", days_ago=1)
+        with checkpoint_db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO gate_results (feature, gate, status, recorded_at) "
+                "VALUES ('F01', 'lint', 'passed', '2026-01-01')"
+            )
+        events = CheckpointEventLog(checkpoint_db)
+        events.append("F01", EventType.WS_COMPLETED, "WS-001")
+        events.snapshot("F01")
+        checkpoint_file = tmp_path / ".oneshot" / "F01-checkpoint.json"
+        checkpoint_file.parent.mkdir()
+        checkpoint_file.write_text(json.dumps({"feature_id": "F01"}))
+        before = checkpoint_db.get_checkpoint(first)
+
+        result = retention.gc(keep_last=0, older_than=timedelta(days=30))
+
+        assert result.archived == ["F01"]
+        assert (result.checkpoints_deleted, result.files_deleted) == (1, 1)
+        assert _features(checkpoint_db) == ["F02"]
+        assert not checkpoint_file.exists()
+        tables = [r["table"] for r in read_archive(archive_path(retention.archive_dir, "F01"))]
+        assert tables == [
+            "checkpoints",
+            "checkpoint_completed_ws",
+            "checkpoint_completed_ws",
+            "gate_results",
+            "checkpoint_events",
+        ]
+        with checkpoint_db.reading() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM checkpoint_snapshots").fetchone()[0] == 0
+
+        assert retention.restore("F01") == 1
+
+        restored = checkpoint_db.get_checkpoint(first)
+        assert restored == before
+        assert json.loads(checkpoint_file.read_text()) == to_file_data(restored)
+        assert not archive_path(retention.archive_dir, "F01").exists()
+        with checkpoint_db.reading() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM gate_results").fetchone()[0] == 1
+        assert events.replay("F01").completed_ws == ["WS-001"]
+
+    def test_dry_run_changes_nothing(self, checkpoint_db, retention):
+        """Should only report the selection."""
+        _add(checkpoint_db, "F01")
+
+        result = retention.gc(keep_last=0, older_than=timedelta(days=30), dry_run=True)
+
+        assert result.archived == ["F01"]
+        assert _features(checkpoint_db) == ["F01"]
+        assert not retention.archive_dir.exists()
+
+    def test_deletes_in_batches(self, checkpoint_db, retention, monkeypatch):
+        """Should split deletes into transactions of BATCH_SIZE rows."""
+        monkeypatch.setattr(retention_module, "BATCH_SIZE", 2)
+        for _ in range(5):
+            _add(checkpoint_db, "F01")
+        statements = []
+        checkpoint_db._get_connection().set_trace_callback(statements.append)
+
+        assert retention.gc(keep_last=0, older_than=timedelta(days=30)).checkpoints_deleted == 5
+
+        deletes = [s for s in statements if s.startswith("DELETE FROM checkpoints")]
+        assert len(deletes) == 3
+
+    def test_restore_ignores_archived_file_contents(self, checkpoint_db, retention, tmp_path):
+        """Should export the restored rows, not a checkpoint file stored in an old archive."""
+        first = _add(checkpoint_db, "F01")
+        retention.gc(keep_last=0, older_than=timedelta(days=30))
+        path = archive_path(retention.archive_dir, "F01")
+        records = list(read_archive(path)) + [
+            {"file": "F01-checkpoint.json", "content": {"feature_id": "stale"}}
+        ]
+        write_archive(path, records)
+
+        retention.restore("F01")
+
+        checkpoint_file = tmp_path / ".oneshot" / "F01-checkpoint.json"
+        data = json.loads(checkpoint_file.read_text())
+        assert data == to_file_data(checkpoint_db.get_checkpoint(first))
+        assert list(checkpoint_file.parent.glob("*.tmp")) == []
+
+    def test_restore_unknown_feature(self, retention):
+        """Should raise FileNotFoundError without an archive."""
+        with pytest.raises(FileNotFoundError):
+            retention.restore("F99")
+
+
+class TestVacuum:
+    """Test space reclamation."""
+
+    def test_new_databases_use_incremental_vacuum(self, checkpoint_db):
+        """Should create databases with auto_vacuum=INCREMENTAL."""
+        with checkpoint_db.reading() as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    def test_converts_legacy_database(self, tmp_path):
+        """Should switch databases without auto_vacuum and shrink them."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE filler (data TEXT)")
+        conn.executemany("INSERT INTO filler VALUES (?)", [("x" * 1000,)] * 500)
+        conn.commit()
+        conn.execute("DELETE FROM filler")
+        conn.commit()
+        conn.close()
+        db = CheckpointDatabase(str(db_path))
+        db.initialize()
+
+        freed = CheckpointRetention(db, tmp_path / "archive").vacuum()
+
+        with db.reading() as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert freed > 100
+        db.close()
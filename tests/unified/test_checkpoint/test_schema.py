@@ -38,7 +38,7 @@ class TestCheckpointDatabaseInit:
 
         version = db.get_schema_version()
 
-        assert version == 1  # First schema version
+        assert version == 5  # v5: checkpoint event log
 
     def test_creates_checkpoints_table(self, tmp_path):
         """Checkpoints table should exist with correct columns."""
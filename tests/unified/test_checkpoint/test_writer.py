@@ -0,0 +1,154 @@
+"""
+Tests for the group-commit checkpoint writer.
+
+Includes a 16-thread test that concurrent updates share commits.
+"""
+
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from sdp.unified.checkpoint.models import Checkpoint, CheckpointStatus
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+from sdp.unified.checkpoint.writer import CheckpointWriter
+
+THREADS = 16
+UPDATES_PER_THREAD = 50
+
+
+@pytest.fixture
+def checkpoint_db(tmp_path):
+    """Create initialized checkpoint database."""
+    db = CheckpointDatabase(str(tmp_path / "checkpoints.db"))
+    db.initialize()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def writer(checkpoint_db):
+    """Writer with a long window, so tests control batching."""
+    writer = CheckpointWriter(checkpoint_db, max_delay=0.05)
+    yield writer
+    writer.close()
+
+
+def _checkpoint(feature: str) -> Checkpoint:
+    return Checkpoint(
+        feature=feature,
+        agent_id="agent-001",
+        status=CheckpointStatus.IN_PROGRESS,
+        completed_ws=[],
+        execution_order=[],
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+def _fail() -> None:
+    raise ValueError("bad write")
+
+
+class TestCheckpointWriter:
+    """Test batching, futures and error isolation."""
+
+    def test_groups_writes_into_one_commit(self, checkpoint_db, writer):
+        """Should commit writes queued during a commit together."""
+        with checkpoint_db.transaction():  # Writer waits for the lock
+            futures = [
+                writer.submit(checkpoint_db.create_checkpoint, _checkpoint(f"F{i:02d}"))
+                for i in range(10)
+            ]
+
+        ids = [future.result(timeout=5) for future in futures]
+
+        assert writer.commits == 1
+        assert [checkpoint_db.get_checkpoint(i).feature for i in ids] == [
+            f"F{i:02d}" for i in range(10)
+        ]
+
+    def test_commits_when_batch_is_full(self, checkpoint_db):
+        """Should not wait for max_delay once max_batch writes are queued."""
+        with CheckpointWriter(checkpoint_db, max_delay=60, max_batch=2) as writer:
+            futures = [
+                writer.submit(checkpoint_db.create_checkpoint, _checkpoint("F01")) for _ in range(2)
+            ]
+
+            assert [f.result(timeout=5) for f in futures] == [1, 2]
+
+    def test_failed_write_is_rolled_back_alone(self, checkpoint_db, writer):
+        """Should report the failure and still commit the rest of the batch."""
+
+        def half_write() -> None:
+            checkpoint_db.create_checkpoint(_checkpoint("F99"))
+            _fail()
+
+        with checkpoint_db.transaction():
+            ok = writer.submit(checkpoint_db.create_checkpoint, _checkpoint("F01"))
+            failed = writer.submit(half_write)
+
+        assert ok.result(timeout=5) == 1
+        with pytest.raises(ValueError, match="bad write"):
+            failed.result(timeout=5)
+        assert checkpoint_db.get_checkpoint_by_feature("F99") is None
+        assert writer.commits == 1
+
+    def test_post_resolves_before_commit(self, checkpoint_db):
+        """Should complete fire-and-forget handles without waiting for the commit."""
+        with CheckpointWriter(checkpoint_db, max_delay=60, max_batch=2) as writer:
+            handle = writer.post(checkpoint_db.create_checkpoint, _checkpoint("F01"))
+            assert handle.result(timeout=5) == 1 and writer.commits == 0
+            writer.flush(timeout=5)
+
+            assert writer.commits == 1
+            assert checkpoint_db.get_checkpoint(1).feature == "F01"
+
+    def test_post_failure_is_logged(self, writer, caplog):
+        """Should log fire-and-forget failures."""
+        writer.post(_fail)
+        writer.flush(timeout=5)
+
+        assert "_fail failed: bad write" in caplog.text
+
+    def test_close_commits_pending_writes(self, checkpoint_db):
+        """Should commit queued writes and then refuse new ones."""
+        writer = CheckpointWriter(checkpoint_db, max_delay=60)
+        handle = writer.post(checkpoint_db.create_checkpoint, _checkpoint("F01"))
+
+        writer.close()
+
+        assert handle.done()
+        assert checkpoint_db.get_checkpoint_by_feature("F01") is not None
+        with pytest.raises(RuntimeError):
+            writer.submit(checkpoint_db.create_checkpoint, _checkpoint("F02"))
+
+
+class TestGroupCommit:
+    """16 agents reporting progress through one writer."""
+
+    def test_durable_group_commit(self, checkpoint_db):
+        """Every update durable before returning, sharing commits across agents."""
+        status = CheckpointStatus.IN_PROGRESS
+        ids = [checkpoint_db.create_checkpoint(_checkpoint(f"F{i:02d}")) for i in range(THREADS)]
+
+        with CheckpointWriter(checkpoint_db) as writer:
+
+            def agent(index: int) -> None:
+                for n in range(UPDATES_PER_THREAD):
+                    completed = [f"WS-{k:03d}" for k in range(n + 1)]
+                    writer.submit(
+                        checkpoint_db.update_status, ids[index], status, completed
+                    ).result()
+
+            threads = [threading.Thread(target=agent, args=(i,)) for i in range(THREADS)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            commits = writer.commits
+
+        for checkpoint_id in ids:
+            assert (
+                len(checkpoint_db.get_checkpoint(checkpoint_id).completed_ws) == UPDATES_PER_THREAD
+            )
+        assert commits < THREADS * UPDATES_PER_THREAD
@@ -185,3 +185,110 @@ class TestMappingManager:
         assert manager.get_beads_id("00-001-01") == "bd-xyz"
         assert manager.get_sdp_id("bd-xyz") == "00-001-01"
         # Note: Old reverse mapping persists (bd-abc still points to 00-001-01)
+
+
+def _append_mappings(mapping_file: Path, worker: int, count: int) -> None:
+    """Append mappings from a separate process (module-level for pickling)."""
+    manager = MappingManager(mapping_file, batch_size=7)
+    for i in range(count):
+        manager.add_mapping(f"{worker:02d}-001-{i:02d}", f"bd-{worker}-{i}")
+    manager.flush()
+
+
+class TestMappingJournal:
+    """Test append-only journal behaviour of MappingManager."""
+
+    def test_add_mapping_is_buffered_until_flush(self, tmp_path: Path) -> None:
+        """add_mapping does not touch the file until flush."""
+        mapping_file = tmp_path / "mapping.jsonl"
+        manager = MappingManager(mapping_file)
+
+        manager.add_mapping("00-001-01", "bd-abc")
+        assert not mapping_file.exists()
+
+        assert manager.flush() == 1
+        assert manager.flush() == 0
+        assert len(mapping_file.read_text().splitlines()) == 1
+
+    def test_batch_size_triggers_flush(self, tmp_path: Path) -> None:
+        """Reaching batch_size appends the whole batch."""
+        mapping_file = tmp_path / "mapping.jsonl"
+        manager = MappingManager(mapping_file, batch_size=3)
+
+        for i in range(3):
+            manager.add_mapping(f"00-001-0{i}", f"bd-{i}")
+
+        assert len(mapping_file.read_text().splitlines()) == 3
+
+    def test_each_mapping_written_once(self, tmp_path: Path) -> None:
+        """Creating N mappings writes N journal lines, not O(N^2)."""
+        mapping_file = tmp_path / "mapping.jsonl"
+        manager = MappingManager(mapping_file, batch_size=16)
+
+        for i in range(500):
+            manager.add_mapping(f"00-{i:03d}-01", f"bd-{i}")
+        manager.persist()
+
+        assert len(mapping_file.read_text().splitlines()) == 500
+
+    def test_last_write_wins(self, tmp_path: Path) -> None:
+        """Later journal lines override earlier ones."""
+        mapping_file = tmp_path / "mapping.jsonl"
+        mapping_file.write_text(
+            '{"sdp_id": "00-001-01", "beads_id": "bd-old"}\n'
+            '{"sdp_id": "00-001-01", "beads_id": "bd-new"}\n'
+        )
+
+        manager = MappingManager(mapping_file)
+        manager.load()
+
+        assert manager.get_beads_id("00-001-01") == "bd-new"
+        assert resolve_ws_id_to_beads_id("00-001-01", mapping_file) == "bd-new"
+
+    def test_persist_compacts_bloated_journal(self, tmp_path: Path) -> None:
+        """persist compacts once stale lines exceed the ratio."""
+        mapping_file = tmp_path / "mapping.jsonl"
+        manager = MappingManager(mapping_file, compact_min_lines=10)
+
+        for i in range(12):
+            manager.add_mapping("00-001-01", f"bd-{i}")
+        manager.persist()
+
+        lines = mapping_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["beads_id"] == "bd-11"
+
+    def test_compact_keeps_entries_from_other_writers(self, tmp_path: Path) -> None:
+        """Compaction re-reads the journal so concurrent appends survive."""
+        mapping_file = tmp_path / "mapping.jsonl"
+        first = MappingManager(mapping_file)
+        second = MappingManager(mapping_file)
+
+        first.add_mapping("00-001-01", "bd-a")
+        first.flush()
+        second.add_mapping("00-001-02", "bd-b")
+        second.flush()
+        first.compact()
+
+        reloaded = MappingManager(mapping_file)
+        reloaded.load()
+        assert reloaded.get_beads_id("00-001-01") == "bd-a"
+        assert reloaded.get_beads_id("00-001-02") == "bd-b"
+
+    def test_concurrent_processes_do_not_corrupt(self, tmp_path: Path) -> None:
+        """Locked appends from several processes stay line-atomic."""
+        import multiprocessing
+
+        mapping_file = tmp_path / "mapping.jsonl"
+        procs = [
+            multiprocessing.Process(target=_append_mappings, args=(mapping_file, w, 40))
+            for w in range(4)
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+
+        lines = mapping_file.read_text().splitlines()
+        assert len(lines) == 160
+        assert all(json.loads(line)["beads_id"].startswith("bd-") for line in lines)
@@ -0,0 +1,117 @@
+"""Unit tests for beads/sync/migration.py."""
+
+from pathlib import Path
+
+from sdp.beads.client import MockBeadsClient
+from sdp.beads.models import BeadsSyncResult
+from sdp.beads.sync import BeadsSyncService, migrate_workstreams, plan_migration
+
+
+class TestPlanMigration:
+    """Test plan_migration levelling."""
+
+    def test_levels_follow_dependencies(self) -> None:
+        plan = plan_migration(
+            {
+                "00-001-04": ["00-001-02", "00-001-03"],
+                "00-001-03": ["00-001-01"],
+                "00-001-02": ["00-001-01"],
+                "00-001-01": [],
+            }
+        )
+
+        assert plan.levels == [["00-001-01"], ["00-001-02", "00-001-03"], ["00-001-04"]]
+        assert plan.cyclic == []
+
+    def test_external_dependencies_do_not_block(self) -> None:
+        plan = plan_migration({"00-001-02": ["00-000-99"]})
+
+        assert plan.levels == [["00-001-02"]]
+        assert plan.external == {"00-001-02": ["00-000-99"]}
+
+    def test_cycle_members_reported(self) -> None:
+        plan = plan_migration(
+            {"00-001-01": [], "00-001-02": ["00-001-03"], "00-001-03": ["00-001-02"]}
+        )
+
+        assert plan.levels == [["00-001-01"]]
+        assert plan.cyclic == ["00-001-02", "00-001-03"]
+
+
+class TestMigrateWorkstreams:
+    """Test dependency-ordered migration."""
+
+    def test_all_dependencies_preserved_in_one_pass(self, tmp_path: Path) -> None:
+        client = MockBeadsClient()
+        sync = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+
+        # Dependents listed before their prerequisites (rglob order is arbitrary)
+        items = [
+            (tmp_path / "c.md", {"ws_id": "00-001-03", "dependencies": ["00-001-02"]}),
+            (tmp_path / "b.md", {"ws_id": "00-001-02", "dependencies": ["00-001-01"]}),
+            (tmp_path / "d.md", {"ws_id": "00-001-04", "dependencies": ["00-001-01"]}),
+            (tmp_path / "a.md", {"ws_id": "00-001-01", "dependencies": []}),
+        ]
+
+        report = migrate_workstreams(sync, items, max_workers=4)
+
+        assert report.levels == 3
+        assert report.failed == 0
+        manager = sync.mapping_manager
+        for ws_id, dep_id in [
+            ("00-001-02", "00-001-01"),
+            ("00-001-03", "00-001-02"),
+            ("00-001-04", "00-001-01"),
+        ]:
+            task = client.get_task(manager.get_beads_id(ws_id) or "")
+            assert task is not None
+            assert [d.task_id for d in task.dependencies] == [manager.get_beads_id(dep_id)]
+
+    def test_missing_and_cyclic_reported(self, tmp_path: Path) -> None:
+        client = MockBeadsClient()
+        sync = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+        items = [
+            (tmp_path / "a.md", {"ws_id": "00-001-01", "dependencies": ["00-009-09"]}),
+            (tmp_path / "b.md", {"ws_id": "00-001-02", "dependencies": ["00-001-03"]}),
+            (tmp_path / "c.md", {"ws_id": "00-001-03", "dependencies": ["00-001-02"]}),
+            (tmp_path / "x.md", {"title": "no id"}),
+        ]
+        seen = []
+
+        report = migrate_workstreams(sync, items, on_result=seen.append)
+
+        assert report.missing_dependencies == {"00-001-01": ["00-009-09"]}
+        assert report.succeeded == 1
+        assert report.failed == 3
+        assert len(seen) == 4
+        errors = {e.ws_id: e.result.error for e in report.entries if not e.result.success}
+        assert "Dependency cycle" in (errors["00-001-02"] or "")
+        assert "Missing ws_id" in (errors[None] or "")
+
+    def test_dependents_of_failed_workstream_are_blocked(self, tmp_path: Path) -> None:
+        client = MockBeadsClient()
+        sync = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+        items = [
+            (tmp_path / "a.md", {"ws_id": "00-001-01", "dependencies": []}),
+            (tmp_path / "b.md", {"ws_id": "00-001-02", "dependencies": ["00-001-01"]}),
+            (tmp_path / "c.md", {"ws_id": "00-001-03", "dependencies": ["00-001-02"]}),
+            (tmp_path / "d.md", {"ws_id": "00-001-04", "dependencies": []}),
+        ]
+        original = sync.sync_workstream_to_beads
+        created = []
+
+        def failing_sync(ws_file, ws_data):  # type: ignore[no-untyped-def]
+            created.append(ws_data["ws_id"])
+            if ws_data["ws_id"] == "00-001-01":
+                return BeadsSyncResult(success=False, task_id="00-001-01", error="bd create failed")
+            return original(ws_file, ws_data)
+
+        sync.sync_workstream_to_beads = failing_sync  # type: ignore[method-assign]
+
+        report = migrate_workstreams(sync, items)
+
+        assert sorted(created) == ["00-001-01", "00-001-04"]
+        assert report.succeeded == 1
+        errors = {e.ws_id: e.result.error for e in report.entries if not e.result.success}
+        assert errors["00-001-02"] == "Blocked by failed dependencies: 00-001-01"
+        assert errors["00-001-03"] == "Blocked by failed dependencies: 00-001-02"
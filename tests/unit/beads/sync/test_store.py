@@ -0,0 +1,150 @@
+"""Tests for the indexed MappingStore."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sdp.beads.client import MockBeadsClient
+from sdp.beads.models import BeadsTaskCreate
+from sdp.beads.sync import BeadsSyncError, MappingManager, MappingStore, open_mapping_store
+from sdp.traceability.service import TraceabilityService
+
+
+def _write(mapping_file: Path, *entries: tuple[str, str]) -> None:
+    with open(mapping_file, "a") as f:
+        for sdp_id, beads_id in entries:
+            f.write(json.dumps({"sdp_id": sdp_id, "beads_id": beads_id}) + "\n")
+
+
+class TestMappingStore:
+    """Test MappingStore lookups and index maintenance."""
+
+    def test_bidirectional_lookup(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        _write(mapping_file, ("00-001-01", "bd-a"), ("00-001-02", "bd-b"))
+
+        store = MappingStore(mapping_file)
+
+        assert store.get_beads_id("00-001-02") == "bd-b"
+        assert store.get_sdp_id("bd-a") == "00-001-01"
+        assert store.get_beads_id("00-999-99") is None
+        assert store.count() == 2
+        assert store.index_file.exists()
+
+    def test_picks_up_appends_from_other_writers(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        _write(mapping_file, ("00-001-01", "bd-a"))
+        store = MappingStore(mapping_file)
+        assert store.count() == 1
+
+        writer = MappingManager(mapping_file)
+        writer.add_mapping("00-001-02", "bd-b")
+        writer.add_mapping("00-001-01", "bd-c")
+        writer.flush()
+
+        assert store.get_beads_id("00-001-02") == "bd-b"
+        assert store.get_beads_id("00-001-01") == "bd-c"
+        assert store.get_sdp_id("bd-a") is None
+        assert store.count() == 2
+
+    def test_index_survives_restart_incrementally(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        _write(mapping_file, *[(f"00-{i:03d}-01", f"bd-{i}") for i in range(50)])
+        MappingStore(mapping_file).load()
+
+        _write(mapping_file, ("00-100-01", "bd-100"))
+        store = MappingStore(mapping_file)
+
+        assert store.get_beads_id("00-100-01") == "bd-100"
+        assert store.get_beads_id("00-007-01") == "bd-7"
+        assert store.count() == 51
+
+    def test_rebuilds_after_rewrite(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        _write(mapping_file, ("00-001-01", "bd-a"), ("00-001-02", "bd-b"))
+        store = MappingStore(mapping_file)
+        assert store.count() == 2
+
+        mapping_file.write_text(json.dumps({"sdp_id": "00-002-01", "beads_id": "bd-z"}) + "\n")
+
+        assert store.get_beads_id("00-001-01") is None
+        assert store.get_beads_id("00-002-01") == "bd-z"
+        assert store.count() == 1
+
+    def test_pending_mappings_visible_before_flush(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        store = MappingStore(mapping_file)
+
+        store.add_mapping("00-001-01", "bd-a")
+
+        assert not mapping_file.exists()
+        assert store.get_beads_id("00-001-01") == "bd-a"
+        assert store.get_sdp_id("bd-a") == "00-001-01"
+        assert store.count() == 1
+
+        store.flush()
+        assert store.get_beads_id("00-001-01") == "bd-a"
+        assert list(store.items()) == [("00-001-01", "bd-a")]
+
+    def test_compact_keeps_indexed_mappings(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        store = MappingStore(mapping_file, compact_min_lines=10)
+
+        for i in range(12):
+            store.add_mapping("00-001-01", f"bd-{i}")
+        store.add_mapping("00-001-02", "bd-x")
+        store.persist()
+
+        lines = mapping_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert store.get_beads_id("00-001-01") == "bd-11"
+        assert store.get_beads_id("00-001-02") == "bd-x"
+
+    def test_save_writes_full_state(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        _write(mapping_file, ("00-001-01", "bd-a"))
+        store = MappingStore(mapping_file)
+        store.add_mapping("00-001-02", "bd-b")
+
+        store.save()
+
+        ids = {json.loads(line)["sdp_id"] for line in mapping_file.read_text().splitlines()}
+        assert ids == {"00-001-01", "00-001-02"}
+
+    def test_malformed_journal_raises(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        mapping_file.write_text("not json\n")
+
+        with pytest.raises(BeadsSyncError, match="Failed to index mapping file"):
+            MappingStore(mapping_file).load()
+
+    def test_corrupt_index_is_rebuilt(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        _write(mapping_file, ("00-001-01", "bd-a"))
+        (tmp_path / "mapping.jsonl.idx").write_bytes(b"garbage" * 100)
+
+        assert MappingStore(mapping_file).get_beads_id("00-001-01") == "bd-a"
+
+    def test_open_mapping_store_is_shared(self, tmp_path: Path) -> None:
+        mapping_file = tmp_path / "mapping.jsonl"
+        _write(mapping_file, ("00-001-01", "bd-a"))
+
+        assert open_mapping_store(mapping_file) is open_mapping_store(mapping_file)
+
+
+class TestTraceabilityUsesStore:
+    """Traceability resolves workstreams through the mapping store."""
+
+    def test_get_ws_task_without_listing(self, tmp_path: Path) -> None:
+        client = MockBeadsClient()
+        task = client.create_task(BeadsTaskCreate(title="WS"))
+        mapping_file = tmp_path / "mapping.jsonl"
+        _write(mapping_file, ("00-032-01", task.id))
+
+        service = TraceabilityService(client, MappingStore(mapping_file))
+        client.list_tasks = None  # type: ignore[assignment,method-assign]
+
+        found = service._get_ws_task("00-032-01")
+        assert found is not None
+        assert found.id == task.id
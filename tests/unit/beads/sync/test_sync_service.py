@@ -9,6 +9,7 @@ import pytest
 
 from sdp.beads.mock import MockBeadsClient
 from sdp.beads.models import BeadsStatus, BeadsTaskCreate
+from sdp.beads.scope_manager import ScopeManager
 from sdp.beads.sync.sync_service import BeadsSyncService
 
 
@@ -304,3 +305,259 @@ class TestSyncBeadsToWorkstream:
         
         assert result.success is False
         assert "Failed to sync" in result.error
+
+
+class CountingClient(MockBeadsClient):
+    """MockBeadsClient that counts update calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+
+    def update_task_status(self, task_id: str, status: BeadsStatus) -> None:
+        self.calls.append("status")
+        super().update_task_status(task_id, status)
+
+    def update_metadata(self, task_id: str, metadata: dict[str, object]) -> None:
+        self.calls.append("metadata")
+        super().update_metadata(task_id, metadata)
+
+
+class ReplacingMetadataClient(MockBeadsClient):
+    """MockBeadsClient whose update_metadata replaces the blob, like bd."""
+
+    def update_metadata(self, task_id: str, metadata: dict[str, object]) -> None:
+        task = self.get_task(task_id)
+        assert task is not None
+        task.sdp_metadata.clear()
+        task.sdp_metadata.update(metadata)
+
+
+def _write_ws(ws_file: Path, ws_id: str, status: str = "backlog", note: str = "") -> None:
+    ws_file.write_text(
+        f"---\nws_id: {ws_id}\nfeature: F001\nstatus: {status}\nsize: SMALL\n---\n\n"
+        f"## {ws_id}: Title\n\n### Goal\n\nGoal {note}\n"
+    )
+
+
+class TestSyncWorkstreamsToBeads:
+    """Test incremental content-hash sync."""
+
+    def test_noop_sync_skips_without_parsing(self, tmp_path: Path) -> None:
+        files = []
+        for i in range(50):
+            ws_file = tmp_path / f"00-001-{i:02d}.md"
+            _write_ws(ws_file, f"00-001-{i:02d}")
+            files.append(ws_file)
+
+        client = CountingClient()
+        sync = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+        first = sync.sync_workstreams_to_beads(files)
+        sync.persist_mapping()
+        assert first.created == 50
+
+        def fail_parse(ws_file: Path) -> dict:
+            raise AssertionError(f"parsed unchanged file {ws_file}")
+
+        again = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+        report = again.sync_workstreams_to_beads(files, parse=fail_parse)
+
+        assert report.unchanged == 50
+        assert report.results == []
+        assert client.calls == []
+
+    def test_pushes_only_changed_fields(self, tmp_path: Path) -> None:
+        ws_file = tmp_path / "00-001-01.md"
+        _write_ws(ws_file, "00-001-01")
+        client = CountingClient()
+        sync = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+        sync.sync_workstreams_to_beads([ws_file])
+
+        _write_ws(ws_file, "00-001-01", note="reworded")
+        body_only = sync.sync_workstreams_to_beads([ws_file])
+        assert body_only.unchanged == 1
+        assert client.calls == []
+
+        _write_ws(ws_file, "00-001-01", status="completed", note="reworded")
+        report = sync.sync_workstreams_to_beads([ws_file])
+
+        assert report.updated == 1
+        assert report.results[0].message == "Updated fields: status"
+        assert client.calls == ["status"]
+        beads_id = sync.mapping_manager.get_beads_id("00-001-01")
+        assert client.get_task(beads_id).status == BeadsStatus.CLOSED  # type: ignore[arg-type,union-attr]
+
+    def test_metadata_update_keeps_other_keys(self, tmp_path: Path) -> None:
+        ws_file = tmp_path / "00-001-01.md"
+        _write_ws(ws_file, "00-001-01")
+        client = ReplacingMetadataClient()
+        sync = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+        sync.sync_workstreams_to_beads([ws_file])
+        beads_id = sync.mapping_manager.get_beads_id("00-001-01")
+        assert beads_id is not None
+        ScopeManager(client).set_scope(beads_id, ["src/a.py"])
+
+        moved = tmp_path / "completed" / "00-001-01.md"
+        moved.parent.mkdir()
+        ws_file.rename(moved)
+        report = sync.sync_workstreams_to_beads([moved])
+
+        assert report.results[0].message == "Updated fields: metadata"
+        task = client.get_task(beads_id)
+        assert task is not None
+        assert task.sdp_metadata["file_path"] == str(moved)
+        assert task.sdp_metadata["scope_files"] == ["src/a.py"]
+
+    def test_all_resyncs_every_file(self, tmp_path: Path) -> None:
+        ws_file = tmp_path / "00-001-01.md"
+        _write_ws(ws_file, "00-001-01")
+        client = CountingClient()
+        sync = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+        sync.sync_workstreams_to_beads([ws_file])
+
+        report = sync.sync_workstreams_to_beads([ws_file], changed_only=False)
+
+        assert report.updated == 1
+        assert client.calls == ["status"]
+
+    def test_hashes_survive_compaction(self, tmp_path: Path) -> None:
+        ws_file = tmp_path / "00-001-01.md"
+        _write_ws(ws_file, "00-001-01")
+        sync = BeadsSyncService(MockBeadsClient(), mapping_file=tmp_path / "mapping.jsonl")
+        sync.sync_workstreams_to_beads([ws_file])
+        sync.mapping_manager.compact()
+
+        entry = sync.mapping_manager.get_entry("00-001-01")
+
+        assert entry is not None
+        assert entry["file_path"] == "00-001-01.md"
+        assert set(entry["fields"]) == {"status", "dependencies", "metadata"}
+
+    def test_parse_error_reported(self, tmp_path: Path) -> None:
+        ws_file = tmp_path / "broken.md"
+        ws_file.write_text("no frontmatter")
+        sync = BeadsSyncService(MockBeadsClient(), mapping_file=tmp_path / "mapping.jsonl")
+
+        report = sync.sync_workstreams_to_beads([ws_file])
+
+        assert report.failed == 1
+        assert report.results[0].task_id == "broken.md"
+
+
+class TestSyncBeadsToWorkstreams:
+    """Test bulk Beads → markdown write-back."""
+
+    @staticmethod
+    def _setup(tmp_path: Path, count: int = 3) -> tuple[CountingClient, BeadsSyncService, Path]:
+        ws_root = tmp_path / "workstreams"
+        (ws_root / "backlog").mkdir(parents=True)
+        client = CountingClient()
+        sync = BeadsSyncService(client, mapping_file=tmp_path / "mapping.jsonl")
+        files = []
+        for i in range(count):
+            ws_file = ws_root / "backlog" / f"00-001-{i:02d}-ws.md"
+            _write_ws(ws_file, f"00-001-{i:02d}")
+            files.append(ws_file)
+        sync.sync_workstreams_to_beads(files)
+        sync.persist_mapping()
+        return client, sync, ws_root
+
+    def test_writes_back_closed_tasks_with_one_list_call(self, tmp_path: Path) -> None:
+        client, sync, ws_root = self._setup(tmp_path)
+        beads_id = sync.mapping_manager.get_beads_id("00-001-01")
+        client.update_task_status(beads_id, BeadsStatus.CLOSED)  # type: ignore[arg-type]
+        list_calls = []
+        original = client.iter_tasks
+        client.get_task = None  # type: ignore[assignment,method-assign]
+        client.iter_tasks = lambda *a, **k: list_calls.append(1) or original(*a, **k)  # type: ignore[method-assign]
+
+        report = sync.sync_beads_to_workstreams(ws_root)
+
+        assert list_calls == [1]
+        assert [c.ws_id for c in report.updated] == ["00-001-01"]
+        assert report.unchanged == 2
+        content = (ws_root / "backlog" / "00-001-01-ws.md").read_text()
+        assert "status: completed" in content
+        assert "## 00-001-01: Title" in content
+
+    def test_move_files_between_status_dirs(self, tmp_path: Path) -> None:
+        client, sync, ws_root = self._setup(tmp_path)
+        client.update_task_status(
+            sync.mapping_manager.get_beads_id("00-001-00"), BeadsStatus.CLOSED  # type: ignore[arg-type]
+        )
+        client.update_task_status(
+            sync.mapping_manager.get_beads_id("00-001-02"), BeadsStatus.IN_PROGRESS  # type: ignore[arg-type]
+        )
+
+        report = sync.sync_beads_to_workstreams(ws_root, move_files=True)
+
+        assert len(report.moved) == 2
+        assert (ws_root / "completed" / "00-001-00-ws.md").exists()
+        assert (ws_root / "in_progress" / "00-001-02-ws.md").exists()
+        assert not (ws_root / "backlog" / "00-001-00-ws.md").exists()
+        assert not list(ws_root.rglob(".*.tmp"))
+
+    def test_dry_run_writes_nothing(self, tmp_path: Path) -> None:
+        client, sync, ws_root = self._setup(tmp_path, count=1)
+        ws_file = ws_root / "backlog" / "00-001-00-ws.md"
+        before = ws_file.read_text()
+        client.update_task_status(
+            sync.mapping_manager.get_beads_id("00-001-00"), BeadsStatus.CLOSED  # type: ignore[arg-type]
+        )
+
+        report = sync.sync_beads_to_workstreams(ws_root, move_files=True, dry_run=True)
+
+        assert len(report.updated) == 1
+        assert ws_file.read_text() == before
+
+    def test_conflict_when_both_sides_changed(self, tmp_path: Path) -> None:
+        client, sync, ws_root = self._setup(tmp_path, count=2)
+        client.update_task_status(
+            sync.mapping_manager.get_beads_id("00-001-00"), BeadsStatus.CLOSED  # type: ignore[arg-type]
+        )
+        client.update_task_status(
+            sync.mapping_manager.get_beads_id("00-001-01"), BeadsStatus.BLOCKED  # type: ignore[arg-type]
+        )
+        _write_ws(ws_root / "backlog" / "00-001-00-ws.md", "00-001-00", status="active")
+        _write_ws(ws_root / "backlog" / "00-001-01-ws.md", "00-001-01", status="blocked")
+
+        report = sync.sync_beads_to_workstreams(ws_root)
+
+        assert [c.ws_id for c in report.conflicts] == ["00-001-00"]
+        assert report.updated == []
+        assert report.unchanged == 1
+        assert "status: active" in (ws_root / "backlog" / "00-001-00-ws.md").read_text()
+
+    def test_markdown_only_change_left_for_forward_sync(self, tmp_path: Path) -> None:
+        _, sync, ws_root = self._setup(tmp_path, count=1)
+        _write_ws(ws_root / "backlog" / "00-001-00-ws.md", "00-001-00", status="active")
+
+        report = sync.sync_beads_to_workstreams(ws_root)
+
+        assert report.pending_push == ["00-001-00"]
+        assert report.updated == []
+
+    def test_written_files_are_not_resynced(self, tmp_path: Path) -> None:
+        client, sync, ws_root = self._setup(tmp_path, count=1)
+        client.update_task_status(
+            sync.mapping_manager.get_beads_id("00-001-00"), BeadsStatus.CLOSED  # type: ignore[arg-type]
+        )
+        sync.sync_beads_to_workstreams(ws_root, move_files=True)
+        client.calls.clear()
+
+        report = sync.sync_workstreams_to_beads(list(ws_root.rglob("*.md")))
+
+        assert report.unchanged == 1
+        assert client.calls == []
+
+    def test_single_task_write_back(self, tmp_path: Path) -> None:
+        client, sync, ws_root = self._setup(tmp_path, count=1)
+        beads_id = sync.mapping_manager.get_beads_id("00-001-00")
+        client.update_task_status(beads_id, BeadsStatus.CLOSED)  # type: ignore[arg-type]
+        ws_file = ws_root / "backlog" / "00-001-00-ws.md"
+
+        result = sync.sync_beads_to_workstream(beads_id, ws_file)  # type: ignore[arg-type]
+
+        assert result.success is True
+        assert result.message == "Status updated to: completed"
+        assert "status: completed" in ws_file.read_text()
@@ -232,3 +232,90 @@ class TestCLIBeadsClientErrorHandling:
             with pytest.raises(BeadsClientError) as exc_info:
                 client._run_command(["bd", "create", "test"], capture_output=True)
             assert "Invalid JSON response" in str(exc_info.value)
+
+
+@pytest.fixture
+def fake_bd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Install a fake `bd` on PATH whose `list` output is controlled by a file."""
+    import os
+    import stat
+    import sys
+
+    output = tmp_path / "list_output.txt"
+    script = tmp_path / "bin" / "bd"
+    script.parent.mkdir()
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import os, sys, time\n"
+        f"data = open({str(output)!r}).read()\n"
+        "for part in data.split('<SLEEP>'):\n"
+        "    sys.stdout.write(part)\n"
+        "    sys.stdout.flush()\n"
+        "    if part is not data.split('<SLEEP>')[-1]:\n"
+        "        time.sleep(30)\n"
+        "sys.exit(int(os.environ.get('FAKE_BD_EXIT', '0')))\n"
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{script.parent}{os.pathsep}{os.environ['PATH']}")
+
+    client = CLIBeadsClient.__new__(CLIBeadsClient)
+    client.project_dir = tmp_path
+    return client, output
+
+
+def _task_json(i: int) -> dict:
+    return {"id": f"bd-{i:04d}", "title": f"Task {i}", "status": "open", "priority": 2}
+
+
+class TestCLIBeadsClientIterTasks:
+    """Test streaming iter_tasks on the CLI client."""
+
+    def test_streams_array_in_pages(self, fake_bd) -> None:
+        client, output = fake_bd
+        output.write_text(json.dumps([_task_json(i) for i in range(2500)], indent=2))
+
+        tasks = list(client.iter_tasks(page_size=100))
+
+        assert len(tasks) == 2500
+        assert tasks[0].id == "bd-0000"
+        assert tasks[-1].title == "Task 2499"
+
+    def test_early_stop_terminates_bd(self, fake_bd) -> None:
+        import time
+
+        client, output = fake_bd
+        output.write_text(
+            "[" + json.dumps(_task_json(1)) + ",<SLEEP>" + json.dumps(_task_json(2)) + "]"
+        )
+
+        start = time.monotonic()
+        iterator = client.iter_tasks(page_size=1)
+        first = next(iterator)
+        iterator.close()
+
+        assert first.id == "bd-0001"
+        assert time.monotonic() - start < 10
+
+    def test_dict_wrapper_and_empty_output(self, fake_bd) -> None:
+        client, output = fake_bd
+        output.write_text(json.dumps({"tasks": [_task_json(1)]}))
+        assert [t.id for t in client.iter_tasks()] == ["bd-0001"]
+
+        output.write_text("")
+        assert list(client.iter_tasks()) == []
+
+    def test_invalid_json_and_failed_command(self, fake_bd, monkeypatch) -> None:
+        client, output = fake_bd
+        output.write_text('[{"id": "bd-1", ')
+        with pytest.raises(BeadsClientError, match="Invalid JSON"):
+            list(client.iter_tasks())
+
+        output.write_text("[]")
+        monkeypatch.setenv("FAKE_BD_EXIT", "2")
+        with pytest.raises(BeadsClientError, match="Command failed"):
+            list(client.iter_tasks())
+
+    def test_invalid_page_size(self, fake_bd) -> None:
+        client, _ = fake_bd
+        with pytest.raises(ValueError):
+            list(client.iter_tasks(page_size=0))
@@ -184,6 +184,113 @@ class TestDestructiveOperationDetector:
         assert len(destructive.operation_types) == 0
 
 
+class TestContentAwareDestructiveDetection:
+    """Test rule-pack scanning of added content and unified diffs."""
+
+    DIFF = """diff --git a/db/cleanup.sql b/db/cleanup.sql
+index 1111111..2222222 100644
+--- a/db/cleanup.sql
++++ b/db/cleanup.sql
+@@ -1,3 +1,4 @@
+ SELECT 1;
+--- DROP TABLE removed_earlier;
++DROP TABLE users;
+ SELECT 2;
+diff --git a/scripts/remove_helpers.py b/scripts/remove_helpers.py
+new file mode 100644
+--- /dev/null
++++ b/scripts/remove_helpers.py
+@@ -0,0 +1,3 @@
++import shutil
++
++shutil.rmtree(build_dir)
+diff --git a/old.txt b/old.txt
+deleted file mode 100644
+--- a/old.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-rm -rf /
+"""
+
+    def test_check_diff_scans_added_lines_only(self):
+        """Removed lines and paths don't flag; added content does."""
+        result = DestructiveOperationDetector().check_diff(self.DIFF)
+
+        assert result.has_destructive_operations is True
+        assert set(result.operation_types) == {"data_loss", "file_deletion"}
+        assert set(result.files_affected) == {
+            "db/cleanup.sql",
+            "scripts/remove_helpers.py",
+            "old.txt",
+        }
+        findings = {(f.file_path, f.line, f.rule) for f in result.findings}
+        assert findings == {
+            ("db/cleanup.sql", 2, "sql_drop"),
+            ("scripts/remove_helpers.py", 3, "shutil_rmtree"),
+        }
+
+    def test_path_keywords_alone_are_not_destructive(self):
+        """A 'remove'/'drop' path with harmless content is not flagged."""
+        detector = DestructiveOperationDetector()
+
+        result = detector.check_operations(
+            files_to_create=["src/remove_duplicates.py"],
+            files_to_modify=["src/dropdown.py"],
+            files_to_delete=[],
+            changes={"src/remove_duplicates.py": "def dedupe(items):\n    return set(items)\n"},
+        )
+
+        assert result.has_destructive_operations is False
+
+    def test_innocuous_file_with_ddl_is_flagged(self):
+        """Content is checked even when the path looks harmless."""
+        detector = DestructiveOperationDetector()
+
+        result = detector.check_operations(
+            files_to_create=[],
+            files_to_modify=["src/utils.py"],
+            files_to_delete=[],
+            changes={"src/utils.py": 'cursor.execute("truncate table events")\n'},
+        )
+
+        assert result.operation_types == ["data_loss"]
+        assert result.findings[0].rule == "sql_truncate"
+
+    def test_rule_packs_are_compiled_once(self):
+        """Detectors with the same rule packs share one compiled matcher."""
+        from sdp.beads.execution.destructive import DestructiveRule
+
+        assert DestructiveOperationDetector()._matcher is DestructiveOperationDetector()._matcher
+
+        custom = DestructiveOperationDetector(
+            rule_packs=["sql"],
+            extra_rules=[DestructiveRule("purge", "data_loss", r"\bpurge_all\(")],
+        )
+        result = custom.check_operations([], ["a.py"], [], changes={"a.py": "purge_all()"})
+        assert [f.rule for f in result.findings] == ["purge"]
+
+        with pytest.raises(ValueError, match="Unknown rule packs"):
+            DestructiveOperationDetector(rule_packs=["nope"])
+
+    def test_ten_thousand_file_changeset(self):
+        """A 10k-file diff yields every finding, attributed to its file."""
+        parts = []
+        for i in range(10_000):
+            body = "\n".join(f"+    value_{j} = compute({j})" for j in range(20))
+            if i % 1000 == 0:
+                body += "\n+    os.remove(path)"
+            parts.append(
+                f"diff --git a/src/m{i}.py b/src/m{i}.py\n--- a/src/m{i}.py\n"
+                f"+++ b/src/m{i}.py\n@@ -1,1 +1,21 @@\n def f():\n{body}\n"
+            )
+        diff = "".join(parts)
+
+        result = DestructiveOperationDetector().check_diff(diff)
+
+        assert len(result.findings) == 10
+        assert result.files_affected[0] == "src/m0.py"
+
+
 class TestMultiAgentExecutorWithModes:
     """Test MultiAgentExecutor with execution modes."""
 
@@ -335,3 +442,113 @@ class TestMultiAgentExecutorWithModes:
         assert logs[0]["mode"] == "auto_approve"
         assert logs[0]["feature"] == "bd-0001"
         assert logs[0]["workstreams_executed"] == 1
+
+
+class TestAuditLoggerRotation:
+    """Test tail reads, rotation and time-range reads of the audit log."""
+
+    @staticmethod
+    def _log(logger, count, start=0):
+        for i in range(start, start + count):
+            logger.log_execution(
+                feature_id=f"bd-{i:04d}",
+                mode=ExecutionMode.AUTO_APPROVE,
+                workstreams_executed=1,
+                result="success",
+                user="dev",
+            )
+
+    def test_read_recent_from_large_file(self, tmp_path):
+        """Tail reads span block boundaries and ignore blank lines."""
+        logger = AuditLogger(audit_file=str(tmp_path / "audit.log"), max_bytes=None)
+        self._log(logger, 500)
+        with open(tmp_path / "audit.log", "a") as f:
+            f.write("\n")
+
+        recent = logger.read_recent(count=120)
+
+        assert len(recent) == 120
+        assert recent[0]["feature"] == "bd-0380"
+        assert recent[-1]["feature"] == "bd-0499"
+        assert len(logger.read_recent(count=10_000)) == 500
+
+    def test_size_rotation_gzips_segments(self, tmp_path):
+        """Active file is rotated into indexed gzip segments by size."""
+        import gzip
+
+        logger = AuditLogger(audit_file=str(tmp_path / "audit.log"), max_bytes=2000)
+        self._log(logger, 60)
+
+        segments = sorted(tmp_path.glob("audit.log.*.gz"))
+        assert len(segments) >= 2
+        assert (tmp_path / "audit.log").stat().st_size < 2000 + 400
+        with gzip.open(segments[0], "rt") as f:
+            assert json.loads(f.readline())["feature"] == "bd-0000"
+        index = (tmp_path / "audit.log.idx").read_text().splitlines()
+        assert len(index) == len(segments)
+
+        recent = logger.read_recent(count=60)
+        assert [e["feature"] for e in recent] == [f"bd-{i:04d}" for i in range(60)]
+
+    def test_time_rotation(self, tmp_path):
+        """Active file is rotated once its oldest entry is too old."""
+        from datetime import timedelta
+
+        logger = AuditLogger(
+            audit_file=str(tmp_path / "audit.log"),
+            max_bytes=None,
+            rotate_after=timedelta(0),
+        )
+        self._log(logger, 3)
+
+        assert len(list(tmp_path.glob("audit.log.*.gz"))) == 2
+        assert len((tmp_path / "audit.log").read_text().splitlines()) == 1
+
+    def test_read_between_skips_unrelated_segments(self, tmp_path, monkeypatch):
+        """Time-range reads only open overlapping segments."""
+        from sdp.beads.execution import audit
+
+        logger = AuditLogger(audit_file=str(tmp_path / "audit.log"), max_bytes=None)
+        self._log(logger, 10)
+        logger.rotate()
+        middle = datetime.now(timezone.utc)
+        self._log(logger, 10, start=10)
+        logger.rotate()
+        self._log(logger, 5, start=20)
+
+        opened = []
+        original = audit._read_segment
+
+        def tracking(path):
+            opened.append(path)
+            return original(path)
+
+        monkeypatch.setattr(audit, "_read_segment", tracking)
+        entries = logger.read_between(start=middle)
+
+        assert [e["feature"] for e in entries] == [f"bd-{i:04d}" for i in range(10, 25)]
+        assert opened == [str(tmp_path / "audit.log.000002.gz")]
+        assert len(logger.read_between(end=middle)) == 10
+
+    def test_keep_segments_prunes_oldest(self, tmp_path):
+        """Old segments beyond keep_segments are deleted."""
+        logger = AuditLogger(audit_file=str(tmp_path / "audit.log"), keep_segments=2)
+        for i in range(4):
+            self._log(logger, 2, start=i * 2)
+            logger.rotate()
+
+        segments = sorted(p.name for p in tmp_path.glob("audit.log.*.gz"))
+        assert segments == ["audit.log.000003.gz", "audit.log.000004.gz"]
+        assert len(logger.read_between()) == 4
+
+    def test_index_rebuilt_when_missing(self, tmp_path):
+        """Segments are found even if the index file is lost."""
+        logger = AuditLogger(audit_file=str(tmp_path / "audit.log"))
+        self._log(logger, 3)
+        logger.rotate()
+        (tmp_path / "audit.log.idx").unlink()
+
+        assert len(logger.read_between()) == 3
+        assert len(logger.read_recent(count=5)) == 3
+        index = (tmp_path / "audit.log.idx").read_text().splitlines()
+        assert [json.loads(line)["segment"] for line in index] == ["000001"]
@@ -0,0 +1,172 @@
+"""Tests for process-isolated workstream execution."""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from sdp.beads.client import MockBeadsClient
+from sdp.beads.execution_mode import ExecutionMode
+from sdp.beads.models import BeadsStatus, BeadsTaskCreate
+from sdp.beads.oneshot import (
+    IsolatedWorkstreamExecutor,
+    MultiAgentExecutor,
+    ResourceLimits,
+    TaskIsolationError,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="process limits require POSIX"
+)
+
+
+class BehaviourExecutor(IsolatedWorkstreamExecutor):
+    """Isolated executor whose cycle behaviour depends on the task title."""
+
+    def run_tdd_cycle(self, task_id: str, mock_tdd_success: bool = True) -> bool:
+        task = self.client.get_task(task_id)
+        assert task is not None
+        if task.title == "hang":
+            time.sleep(60)
+        if task.title == "oom":
+            _ = bytearray(2048 * 1024 * 1024)
+        if task.title == "crash":
+            raise RuntimeError("boom")
+        if task.title == "exit":
+            os._exit(3)
+        if task.title == "write":
+            with open("built.txt", "w") as f:  # Relative: resolves in project_dir
+                f.write(task_id)
+        return mock_tdd_success
+
+
+def _task(client: MockBeadsClient, title: str, parent_id: str | None = None) -> str:
+    return client.create_task(BeadsTaskCreate(title=title, parent_id=parent_id)).id
+
+
+class TestIsolatedWorkstreamExecutor:
+    """Test IsolatedWorkstreamExecutor."""
+
+    def test_success_reported_over_pipe(self) -> None:
+        client = MockBeadsClient()
+        task_id = _task(client, "ok")
+        executor = BehaviourExecutor(client, ResourceLimits(timeout=10))
+
+        result = executor.execute(task_id)
+
+        assert result.success is True
+        assert client.get_task(task_id).status == BeadsStatus.CLOSED  # type: ignore[union-attr]
+
+    def test_does_not_fork_by_default(self) -> None:
+        executor = BehaviourExecutor(MockBeadsClient())
+
+        assert executor.start_method in ("forkserver", "spawn")
+
+    def test_cycle_failure_is_not_isolation_error(self) -> None:
+        client = MockBeadsClient()
+        task_id = _task(client, "ok")
+        executor = BehaviourExecutor(client, ResourceLimits(timeout=10))
+
+        assert executor.execute_tdd_cycle(task_id, mock_tdd_success=False) is False
+
+    def test_child_builds_in_project_dir(self, tmp_path: Path) -> None:
+        client = MockBeadsClient()
+        task_id = _task(client, "write")
+        executor = BehaviourExecutor(client, ResourceLimits(timeout=10)).for_workdir(tmp_path)
+
+        assert executor.execute(task_id).success is True
+        assert (tmp_path / "built.txt").read_text() == task_id
+
+    def test_timeout_blocks_task(self) -> None:
+        client = MockBeadsClient()
+        task_id = _task(client, "hang")
+        executor = BehaviourExecutor(client, ResourceLimits(timeout=0.5))
+
+        start = time.monotonic()
+        result = executor.execute(task_id)
+
+        assert time.monotonic() - start < 10
+        assert result.success is False
+        assert result.error is not None
+        assert "wall-clock timeout" in result.error
+        assert client.get_task(task_id).status == BeadsStatus.BLOCKED  # type: ignore[union-attr]
+        assert executor.running_tasks() == []
+
+    def test_memory_limit_blocks_task(self) -> None:
+        client = MockBeadsClient()
+        task_id = _task(client, "oom")
+        executor = BehaviourExecutor(
+            client, ResourceLimits(timeout=30, max_memory_mb=1024)
+        )
+
+        result = executor.execute(task_id)
+
+        assert result.success is False
+        assert result.error is not None
+        assert "memory limit" in result.error
+
+    def test_exception_diagnostics(self) -> None:
+        client = MockBeadsClient()
+        task_id = _task(client, "crash")
+        executor = BehaviourExecutor(client, ResourceLimits(timeout=10))
+
+        with pytest.raises(TaskIsolationError, match="RuntimeError: boom"):
+            executor.execute_tdd_cycle(task_id)
+
+    def test_silent_exit_diagnostics(self) -> None:
+        client = MockBeadsClient()
+        task_id = _task(client, "exit")
+        executor = BehaviourExecutor(client, ResourceLimits(timeout=10))
+
+        with pytest.raises(TaskIsolationError, match="exited with code 3"):
+            executor.execute_tdd_cycle(task_id)
+
+    def test_cancel_running_task(self) -> None:
+        client = MockBeadsClient()
+        task_id = _task(client, "hang")
+        executor = BehaviourExecutor(client, ResourceLimits(timeout=30))
+
+        def cancel_when_started() -> None:
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                if executor.cancel(task_id):
+                    return
+                time.sleep(0.05)
+
+        canceller = threading.Thread(target=cancel_when_started)
+        canceller.start()
+        result = executor.execute(task_id)
+        canceller.join()
+
+        assert result.success is False
+        assert result.error == f"Task {task_id} cancelled"
+        assert executor.cancel(task_id) is False
+
+
+class TestMultiAgentExecutorIsolation:
+    """Test MultiAgentExecutor with process isolation."""
+
+    def test_limits_enable_isolated_executor(self) -> None:
+        executor = MultiAgentExecutor(MockBeadsClient(), limits=ResourceLimits(timeout=5))
+        assert isinstance(executor.build_executor, IsolatedWorkstreamExecutor)
+
+    def test_hung_task_does_not_stall_others(self) -> None:
+        client = MockBeadsClient()
+        feature_id = _task(client, "Feature")
+        hung = _task(client, "hang", feature_id)
+        ok1 = _task(client, "ok", feature_id)
+        ok2 = _task(client, "ok", feature_id)
+
+        executor = MultiAgentExecutor(client, num_agents=3)
+        executor.build_executor = BehaviourExecutor(client, ResourceLimits(timeout=1))
+
+        result = executor.execute_feature(feature_id, mode=ExecutionMode.SANDBOX)
+
+        assert result.success is False
+        assert result.failed_tasks == [hung]
+        assert client.get_task(hung).status == BeadsStatus.BLOCKED  # type: ignore[union-attr]
+        for task_id in (ok1, ok2):
+            assert client.get_task(task_id).status == BeadsStatus.CLOSED  # type: ignore[union-attr]
@@ -308,3 +308,23 @@ class TestMockBeadsClientEdgeCases:
 
         assert len(dependent.dependencies) == 1
         assert dependent.dependencies[0].task_id == blocker.id
+
+
+class TestMockIterTasks:
+    """Test lazy iter_tasks on the mock client."""
+
+    def test_iter_tasks_filters_and_pages(self) -> None:
+        client = MockBeadsClient()
+        parent = client.create_task(BeadsTaskCreate(title="Parent"))
+        children = [
+            client.create_task(BeadsTaskCreate(title=f"Child {i}", parent_id=parent.id))
+            for i in range(5)
+        ]
+        client.update_task_status(children[0].id, BeadsStatus.CLOSED)
+
+        open_children = list(
+            client.iter_tasks(status=BeadsStatus.OPEN, parent_id=parent.id, page_size=2)
+        )
+
+        assert [t.id for t in open_children] == [c.id for c in children[1:]]
+        assert next(client.iter_tasks()).id == parent.id
@@ -0,0 +1,233 @@
+"""Tests for isolated worktree execution in @oneshot."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from sdp.beads.client import MockBeadsClient
+from sdp.beads.execution_mode import ExecutionMode
+from sdp.beads.models import (
+    BeadsDependency,
+    BeadsDependencyType,
+    BeadsStatus,
+    BeadsTaskCreate,
+)
+from sdp.beads.oneshot import MultiAgentExecutor, WorktreeError, WorktreePool
+from sdp.beads.oneshot.task_filter import execute_task_in_worktree
+from sdp.beads.skills_build import WorkstreamExecutor
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a git repo with one commit."""
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    _git(repo_dir, "init", "-q", "-b", "main")
+    _git(repo_dir, "config", "user.email", "test@example.com")
+    _git(repo_dir, "config", "user.name", "Test")
+    (repo_dir / "README.md").write_text("base\n")
+    (repo_dir / ".gitignore").write_text(".sdp/\n")
+    _git(repo_dir, "add", "-A")
+    _git(repo_dir, "commit", "-q", "-m", "init")
+    return repo_dir
+
+
+class FileWritingExecutor(WorkstreamExecutor):
+    """Executor whose TDD cycle writes files into its checkout."""
+
+    files: dict[str, tuple[str, str]] = {}
+
+    def execute_tdd_cycle(self, task_id: str, mock_tdd_success: bool = True) -> bool:
+        assert self.project_dir is not None
+        name, content = self.files[task_id]
+        (Path(self.project_dir) / name).write_text(content)
+        return mock_tdd_success
+
+
+class TestWorktreePool:
+    """Test WorktreePool lifecycle."""
+
+    def test_invalid_arguments(self, repo: Path) -> None:
+        with pytest.raises(ValueError):
+            WorktreePool(repo, size=0)
+        with pytest.raises(ValueError):
+            WorktreePool(repo, strategy="squash")
+
+    def test_acquire_reuses_worktrees(self, repo: Path) -> None:
+        pool = WorktreePool(repo, size=1)
+
+        first = pool.acquire("bd-0001")
+        assert (first.path / "README.md").exists()
+        assert first.branch == "sdp/ws/bd-0001"
+        pool.release(first)
+
+        second = pool.acquire("bd-0002")
+        assert second.path == first.path
+        pool.release(second)
+        pool.cleanup()
+
+        assert not first.path.exists()
+
+    def test_commit_and_merge(self, repo: Path) -> None:
+        pool = WorktreePool(repo, size=2)
+
+        wt = pool.acquire("bd-0001")
+        (wt.path / "feature.py").write_text("x = 1\n")
+        assert pool.commit(wt) is not None
+        pool.release(wt)
+
+        result = pool.integrate("bd-0001")
+        pool.cleanup()
+
+        assert result.success is True
+        assert (repo / "feature.py").read_text() == "x = 1\n"
+        assert "sdp/ws/bd-0001" not in _git(repo, "branch")
+
+    def test_commit_without_changes(self, repo: Path) -> None:
+        pool = WorktreePool(repo, size=1)
+        wt = pool.acquire("bd-0001")
+
+        assert pool.commit(wt) is None
+
+        pool.release(wt)
+        assert pool.integrate("bd-0001").success is True
+        pool.cleanup()
+
+    @pytest.mark.parametrize("strategy", ["merge", "rebase"])
+    def test_conflict_reported_per_task(self, repo: Path, strategy: str) -> None:
+        pool = WorktreePool(repo, size=2, strategy=strategy)
+
+        first = pool.acquire("bd-0001")
+        second = pool.acquire("bd-0002")
+        (first.path / "README.md").write_text("first\n")
+        (second.path / "README.md").write_text("second\n")
+        pool.commit(first)
+        pool.commit(second)
+        pool.release(first)
+        pool.release(second)
+
+        ok = pool.integrate("bd-0001")
+        conflict = pool.integrate("bd-0002")
+        pool.cleanup()
+
+        assert ok.success is True
+        assert conflict.success is False
+        assert conflict.conflicts == ["README.md"]
+        assert (repo / "README.md").read_text() == "first\n"
+        assert _git(repo, "status", "--porcelain").strip() == ""
+        assert _git(repo, "rev-parse", "--abbrev-ref", "HEAD").strip() == "main"
+
+    @pytest.mark.parametrize("strategy", ["merge", "rebase"])
+    def test_dirty_main_checkout_is_left_alone(self, repo: Path, strategy: str) -> None:
+        pool = WorktreePool(repo, size=1, strategy=strategy)
+        wt = pool.acquire("bd-0001")
+        (wt.path / "feature.py").write_text("x = 1\n")
+        pool.commit(wt)
+        pool.release(wt)
+        (repo / "README.md").write_text("local edit\n")
+
+        result = pool.integrate("bd-0001")
+        pool.cleanup()
+
+        assert result.success is False
+        assert "uncommitted changes: README.md" in (result.error or "")
+        assert (repo / "README.md").read_text() == "local edit\n"
+        assert not (repo / "feature.py").exists()
+        assert "sdp/ws/bd-0001" in _git(repo, "branch")
+
+
+
+class TestMultiAgentExecutorWorktrees:
+    """Test MultiAgentExecutor with worktree isolation."""
+
+    def test_parallel_tasks_merged_in_dependency_order(self, repo: Path) -> None:
+        client = MockBeadsClient()
+        feature = client.create_task(BeadsTaskCreate(title="Feature"))
+        ws1 = client.create_task(BeadsTaskCreate(title="WS1", parent_id=feature.id))
+        ws2 = client.create_task(BeadsTaskCreate(title="WS2", parent_id=feature.id))
+        ws3 = client.create_task(
+            BeadsTaskCreate(
+                title="WS3",
+                parent_id=feature.id,
+                dependencies=[BeadsDependency(ws1.id, BeadsDependencyType.BLOCKS)],
+            )
+        )
+
+        pool = WorktreePool(repo, size=2)
+        executor = MultiAgentExecutor(client, num_agents=2, worktree_pool=pool)
+        builder = FileWritingExecutor(client)
+        builder.files = {
+            ws1.id: ("a.txt", "a\n"),
+            ws2.id: ("b.txt", "b\n"),
+            ws3.id: ("c.txt", "c\n"),
+        }
+        executor.build_executor = builder
+
+        result = executor.execute_feature(feature.id, mode=ExecutionMode.SANDBOX)
+        pool.cleanup()
+
+        assert result.success is True
+        assert result.total_executed == 3
+        assert result.merge_conflicts == {}
+        for name in ("a.txt", "b.txt", "c.txt"):
+            assert (repo / name).exists()
+        assert not (repo / ".sdp" / "worktrees" / "agent-0").exists()
+
+    def test_task_without_worktree_is_blocked(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        client = MockBeadsClient()
+        task = client.create_task(BeadsTaskCreate(title="WS1"))
+        pool = WorktreePool(repo, size=1)
+
+        def no_worktree(task_id: str, timeout: float | None = None) -> None:
+            raise WorktreeError("No free worktree after 1s")
+
+        monkeypatch.setattr(pool, "acquire", no_worktree)
+
+        assert execute_task_in_worktree(WorkstreamExecutor(client), pool, task.id, True) is False
+        assert client.get_task(task.id).status == BeadsStatus.BLOCKED  # type: ignore[union-attr]
+
+    def test_for_workdir_copies_executor(self, tmp_path: Path) -> None:
+        executor = WorkstreamExecutor(MockBeadsClient())
+
+        copy = executor.for_workdir(tmp_path)
+
+        assert copy.project_dir == tmp_path
+        assert copy.client is executor.client
+        assert executor.project_dir is None
+
+    def test_merge_conflict_marks_task_blocked(self, repo: Path) -> None:
+        client = MockBeadsClient()
+        feature = client.create_task(BeadsTaskCreate(title="Feature"))
+        ws1 = client.create_task(BeadsTaskCreate(title="WS1", parent_id=feature.id))
+        ws2 = client.create_task(BeadsTaskCreate(title="WS2", parent_id=feature.id))
+
+        pool = WorktreePool(repo, size=2)
+        executor = MultiAgentExecutor(client, num_agents=2, worktree_pool=pool)
+        builder = FileWritingExecutor(client)
+        builder.files = {
+            ws1.id: ("README.md", "one\n"),
+            ws2.id: ("README.md", "two\n"),
+        }
+        executor.build_executor = builder
+
+        result = executor.execute_feature(feature.id, mode=ExecutionMode.SANDBOX)
+        pool.cleanup()
+
+        assert result.success is False
+        assert result.failed_tasks == [ws2.id]
+        assert result.merge_conflicts == {ws2.id: ["README.md"]}
+        task = client.get_task(ws2.id)
+        assert task is not None
+        assert task.status == BeadsStatus.BLOCKED
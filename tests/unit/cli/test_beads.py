@@ -349,3 +349,92 @@ def test_count_migrated_workstreams_empty_lines(tmp_path):
         count = _count_migrated_workstreams()
         # Should only count non-empty lines
         assert count >= 0
+
+
+def test_migrate_links_dependencies_in_one_pass(runner, tmp_path, monkeypatch):
+    """Dependents sorted before prerequisites still get their blocks edge."""
+    from sdp.beads.client import MockBeadsClient
+
+    ws_dir = tmp_path / "workstreams"
+    ws_dir.mkdir()
+    # "00-001-01-a" sorts before its prerequisite "00-001-02-b"
+    (ws_dir / "00-001-01-a.md").write_text(
+        "---\nws_id: 00-001-01\nfeature: F001\nstatus: backlog\nsize: SMALL\n"
+        "depends_on:\n  - 00-001-02\n---\n\n## 00-001-01: A\n"
+    )
+    (ws_dir / "00-001-02-b.md").write_text(
+        "---\nws_id: 00-001-02\nfeature: F001\nstatus: backlog\nsize: SMALL\n"
+        "---\n\n## 00-001-02: B\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    client = MockBeadsClient()
+
+    with patch("sdp.cli.beads.create_beads_client", return_value=client):
+        result = runner.invoke(beads, ["migrate", str(ws_dir)])
+
+    assert result.exit_code == 0, result.output
+    assert "2 dependency levels" in result.output
+    tasks = {t.title.split(":")[0]: t for t in client.list_tasks()}
+    assert [d.task_id for d in tasks["00-001-01"].dependencies] == [tasks["00-001-02"].id]
+
+
+def test_sync_changed_skips_unchanged_files(runner, temp_ws_dir, tmp_path, monkeypatch):
+    """Second `sync --changed` run finds nothing to push."""
+    from sdp.beads.client import MockBeadsClient
+
+    monkeypatch.chdir(tmp_path)
+    client = MockBeadsClient()
+
+    with patch("sdp.cli.beads_sync.create_beads_client", return_value=client):
+        first = runner.invoke(beads, ["sync", str(temp_ws_dir)])
+        second = runner.invoke(beads, ["sync", str(temp_ws_dir), "--changed"])
+
+    assert first.exit_code == 0, first.output
+    assert "2 created" in first.output
+    assert second.exit_code == 0, second.output
+    assert "0 created, 0 updated, 2 unchanged, 0 failed" in second.output
+
+
+def test_pull_writes_back_closed_task(runner, tmp_path, monkeypatch):
+    """`sdp beads pull --move` updates frontmatter and moves the file."""
+    from sdp.beads.client import MockBeadsClient
+    from sdp.beads.models import BeadsStatus
+
+    ws_root = tmp_path / "workstreams"
+    (ws_root / "backlog").mkdir(parents=True)
+    (ws_root / "backlog" / "00-001-01-a.md").write_text(
+        "---\nws_id: 00-001-01\nfeature: F001\nstatus: backlog\nsize: SMALL\n"
+        "---\n\n## 00-001-01: A\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    client = MockBeadsClient()
+
+    with patch("sdp.cli.beads_sync.create_beads_client", return_value=client):
+        runner.invoke(beads, ["sync", str(ws_root)])
+        client.update_task_status(client.list_tasks()[0].id, BeadsStatus.CLOSED)
+        result = runner.invoke(beads, ["pull", str(ws_root), "--move"])
+
+    assert result.exit_code == 0, result.output
+    assert "Updated 1 workstreams (1 moved)" in result.output
+    assert "status: completed" in (ws_root / "completed" / "00-001-01-a.md").read_text()
+
+
+def test_audit_shows_recent_and_range(runner, tmp_path):
+    """Test audit command reads the tail and time ranges."""
+    from sdp.beads.execution import AuditLogger, ExecutionMode
+
+    audit_file = tmp_path / "audit.log"
+    logger = AuditLogger(audit_file=str(audit_file))
+    for i in range(3):
+        logger.log_execution(f"bd-{i:04d}", ExecutionMode.AUTO_APPROVE, 2, "success", user="dev")
+
+    result = runner.invoke(beads, ["audit", "--last", "2", "--audit-file", str(audit_file)])
+    assert result.exit_code == 0
+    assert "bd-0000" not in result.output
+    assert "bd-0002" in result.output
+
+    result = runner.invoke(
+        beads, ["audit", "--until", "2000-01-01", "--audit-file", str(audit_file)]
+    )
+    assert result.exit_code == 0
+    assert "No audit entries" in result.output
@@ -0,0 +1,87 @@
+"""Tests for CLI checkpoint commands."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from sdp.cli.checkpoint import checkpoint
+from sdp.unified.checkpoint.models import Checkpoint, CheckpointStatus
+from sdp.unified.checkpoint.storage import CheckpointDatabase
+
+
+def _make_db(db_path: Path) -> None:
+    db = CheckpointDatabase(str(db_path))
+    db.initialize()
+    db.create_checkpoint(
+        Checkpoint(
+            feature="F01",
+            agent_id="agent-001",
+            status=CheckpointStatus.COMPLETED,
+            completed_ws=["WS-001"],
+            execution_order=["WS-001"],
+            started_at=datetime.now(timezone.utc),
+        )
+    )
+    db.close()
+
+
+class TestCheckpointGc:
+    """Test checkpoint gc and restore commands."""
+
+    def test_gc_then_restore(self, tmp_path: Path) -> None:
+        """Should archive the feature and restore it on demand."""
+        db_path = tmp_path / "checkpoints.db"
+        _make_db(db_path)
+        paths = ["--db", str(db_path), "--archive-dir", str(tmp_path / "archive")]
+        runner = CliRunner()
+
+        dry = runner.invoke(
+            checkpoint, ["gc", "--keep-last", "0", "--older-than", "0h", "--dry-run", *paths]
+        )
+        result = runner.invoke(checkpoint, ["gc", "--keep-last", "0", "--older-than", "0h", *paths])
+        restored = runner.invoke(checkpoint, ["restore", "F01", *paths])
+
+        assert "Would archive 1 feature(s): F01" in dry.output
+        assert result.exit_code == 0
+        assert "Archived 1 feature(s): F01" in result.output
+        assert not (tmp_path / "archive" / "F01.jsonl.gz").exists()
+        assert "Restored 1 checkpoint(s) of F01" in restored.output
+
+    def test_keeps_recent_features_by_default(self, tmp_path: Path) -> None:
+        """Should not archive features completed within 30 days."""
+        db_path = tmp_path / "checkpoints.db"
+        _make_db(db_path)
+
+        result = CliRunner().invoke(checkpoint, ["gc", "--keep-last", "0", "--db", str(db_path)])
+
+        assert "Nothing to archive" in result.output
+
+    def test_invalid_age(self, tmp_path: Path) -> None:
+        """Should reject unparsable --older-than values."""
+        result = CliRunner().invoke(
+            checkpoint, ["gc", "--older-than", "soon", "--db", str(tmp_path / "x.db")]
+        )
+
+        assert result.exit_code == 2
+        assert "Invalid age" in result.output
+
+    def test_restore_unknown_feature(self, tmp_path: Path) -> None:
+        """Should fail when the feature has no archive."""
+        db_path = tmp_path / "checkpoints.db"
+        _make_db(db_path)
+
+        result = CliRunner().invoke(
+            checkpoint,
+            ["restore", "F99", "--db", str(db_path), "--archive-dir", str(tmp_path / "a")],
+        )
+
+        assert result.exit_code == 1
+        assert "No archive for F99" in result.output
+
+    def test_missing_database(self, tmp_path: Path) -> None:
+        """Should fail without a checkpoint database."""
+        result = CliRunner().invoke(checkpoint, ["gc", "--db", str(tmp_path / "missing.db")])
+
+        assert result.exit_code == 1
+        assert "No checkpoint database" in result.output
@@ -0,0 +1,140 @@
+"""Tests for the guard daemon and its socket client."""
+
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from sdp.beads.models import BeadsTask
+from sdp.cli.main import main
+from sdp.guard.checker import GuardChecker
+from sdp.guard.daemon import GuardDaemon, daemon_check, default_socket_path
+from sdp.guard.snapshot import ScopeSnapshot, write_snapshot
+from sdp.guard.state import GuardState, StateManager
+
+
+@pytest.fixture(autouse=True)
+def mock_state_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Mock StateManager.STATE_FILE and the socket path for all tests."""
+    monkeypatch.setattr(StateManager, "STATE_FILE", tmp_path / ".sdp" / "state.json")
+    monkeypatch.setenv("SDP_GUARD_SOCKET", f"/tmp/sdp-guard-test-{id(tmp_path)}.sock")
+
+
+def _activate(scope: list[str], ws_id: str = "00-032-01") -> None:
+    task = BeadsTask(id="sdp-abc", title="WS", sdp_metadata={"scope_files": scope})
+    StateManager.save(GuardState(active_ws=ws_id, activated_at="now", scope_files=scope))
+    write_snapshot(ScopeSnapshot.from_task(ws_id, task, "now"), StateManager.snapshot_dir())
+
+
+@pytest.fixture
+def daemon() -> Iterator[GuardDaemon]:
+    """Run a guard daemon in a background thread."""
+    server = GuardDaemon(default_socket_path(), GuardChecker(client_factory=Mock))
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestGuardDaemon:
+    """Test daemon request handling."""
+
+    def test_batch_check(self, daemon: GuardDaemon) -> None:
+        _activate(["src/", "README.md"])
+
+        results = daemon_check(["src/a.py", "README.md", "setup.py"])
+
+        assert results is not None
+        assert [r.allowed for r in results] == [True, True, False]
+        assert results[2].scope_files == ["src/", "README.md"]
+
+    def test_picks_up_reactivation(self, daemon: GuardDaemon) -> None:
+        _activate(["a.py"])
+        assert daemon_check(["b.py"])[0].allowed is False  # type: ignore[index]
+
+        time.sleep(0.01)  # Distinct mtime
+        _activate(["b.py"], ws_id="00-032-02")
+        result = daemon_check(["b.py"])[0]  # type: ignore[index]
+
+        assert result.allowed is True
+        assert result.ws_id == "00-032-02"
+
+    def test_no_active_ws(self, daemon: GuardDaemon) -> None:
+        results = daemon_check(["a.py"])
+
+        assert results is not None
+        assert results[0].allowed is False
+        assert "No active WS" in results[0].reason
+
+    def test_bad_requests(self, daemon: GuardDaemon) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(daemon.socket_path))
+            reader = sock.makefile("rb")
+            for request in (b"not json\n", b'{"op": "nope"}\n', b'{"op": "check", "paths": 1}\n'):
+                sock.sendall(request)
+                assert "error" in json.loads(reader.readline())
+            sock.sendall(b'{"op": "ping"}\n')
+            assert json.loads(reader.readline())["ok"] is True
+
+    def test_refuses_second_daemon(self, daemon: GuardDaemon) -> None:
+        with pytest.raises(RuntimeError, match="already running"):
+            GuardDaemon(daemon.socket_path)
+
+    def test_stale_socket_is_replaced(self) -> None:
+        path = default_socket_path()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(str(path))  # Bound but never listening: a dead daemon
+
+        server = GuardDaemon(path)
+        server.server_close()
+        assert not path.exists()
+
+    def test_many_checks_over_one_connection(self, daemon: GuardDaemon) -> None:
+        _activate([f"src/pkg{i}/" for i in range(200)] + ["docs/**/*.md"])
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(daemon.socket_path))
+            reader = sock.makefile("rb")
+            request = json.dumps({"op": "check", "paths": ["src/pkg150/mod.py"]}).encode() + b"\n"
+            for _ in range(1000):
+                sock.sendall(request)
+                assert json.loads(reader.readline())["results"][0]["allowed"] is True
+
+
+class TestCheckCommandClientMode:
+    """The CLI asks the daemon first and falls back in-process."""
+
+    def test_cli_uses_daemon(self, daemon: GuardDaemon) -> None:
+        _activate(["a.py"])
+
+        result = CliRunner().invoke(main, ["guard", "check", "a.py", "b.py"])
+
+        assert result.exit_code == 1
+        assert "Edit allowed: a.py" in result.output
+        assert "File b.py not in WS scope" in result.output
+        assert daemon.requests_served == 1
+
+    @patch("sdp.cli.guard.create_beads_client")
+    def test_cli_falls_back_without_daemon(self, mock_create_client: Mock) -> None:
+        _activate(["a.py"])
+        assert not default_socket_path().exists()
+
+        result = CliRunner().invoke(main, ["guard", "check", "a.py"])
+
+        assert result.exit_code == 0
+        mock_create_client.assert_not_called()
+
+    def test_no_daemon_flag(self, daemon: GuardDaemon) -> None:
+        _activate(["a.py"])
+
+        result = CliRunner().invoke(main, ["guard", "check", "--no-daemon", "a.py"])
+
+        assert result.exit_code == 0
+        assert daemon.requests_served == 0
@@ -0,0 +1,148 @@
+"""Tests for the guard scope snapshot and path trie."""
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from sdp.beads.models import BeadsTask
+from sdp.cli.main import main
+from sdp.guard.scope_trie import ScopeTrie, normalize_path
+from sdp.guard.snapshot import ScopeSnapshot, load_snapshot, write_snapshot
+from sdp.guard.state import StateManager
+
+
+@pytest.fixture(autouse=True)
+def mock_state_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Mock StateManager.STATE_FILE for all tests."""
+    monkeypatch.setattr(StateManager, "STATE_FILE", tmp_path / ".sdp" / "state.json")
+
+
+def _task(scope: list[str], updated: int = 1) -> BeadsTask:
+    return BeadsTask(
+        id="sdp-abc",
+        title="WS",
+        updated_at=datetime(2026, 1, updated, tzinfo=timezone.utc),
+        sdp_metadata={"scope_files": scope},
+    )
+
+
+class TestScopeTrie:
+    """Test path trie matching."""
+
+    def test_files_directories_and_globs(self) -> None:
+        trie = ScopeTrie.from_scope(
+            ["src/sdp/guard/skill.py", "docs/", "tests/**/test_*.py", "src/*.toml"]
+        )
+
+        assert trie.matches("src/sdp/guard/skill.py")
+        assert trie.matches("./src/sdp/guard/../guard/skill.py")
+        assert not trie.matches("src/sdp/guard/state.py")
+        assert not trie.matches("src/sdp/guard")
+        assert trie.matches("docs/a/b/c.md")
+        assert trie.matches("tests/test_x.py")
+        assert trie.matches("tests/unit/deep/test_y.py")
+        assert not trie.matches("tests/unit/helper.py")
+        assert trie.matches("src/pyproject.toml")
+        assert not trie.matches("src/nested/pyproject.toml")
+
+    def test_existing_directory_without_slash(self, tmp_path: Path) -> None:
+        (tmp_path / "pkg").mkdir()
+
+        trie = ScopeTrie.from_scope(["pkg"], root=tmp_path)
+
+        assert trie.matches("pkg/module.py")
+
+    def test_absolute_paths_are_relativized(self, tmp_path: Path) -> None:
+        assert normalize_path(str(tmp_path / "src" / "a.py"), root=str(tmp_path)) == "src/a.py"
+        assert normalize_path("/elsewhere/a.py", root=str(tmp_path)) == "/elsewhere/a.py"
+
+        trie = ScopeTrie(files=["src/a.py"])
+        assert trie.matches(os.path.join(os.getcwd(), "src", "a.py"))
+
+
+class TestScopeSnapshot:
+    """Test snapshot persistence and staleness."""
+
+    def test_roundtrip_and_check(self, tmp_path: Path) -> None:
+        snapshot = ScopeSnapshot.from_task("00-032-01", _task(["src/", "a.py"]), "now")
+        write_snapshot(snapshot, tmp_path)
+
+        loaded = load_snapshot(tmp_path)
+
+        assert loaded is not None
+        assert loaded.directories == ["src/"]
+        assert loaded.task_updated_at == "2026-01-01T00:00:00+00:00"
+        assert loaded.check("src/x.py").allowed is True
+        result = loaded.check("b.py")
+        assert result.allowed is False
+        assert "not in WS scope" in result.reason
+
+    def test_is_stale_uses_updated_at(self) -> None:
+        snapshot = ScopeSnapshot.from_task("00-032-01", _task(["a.py"]), "now")
+
+        assert snapshot.is_stale(_task(["a.py"])) is False
+        assert snapshot.is_stale(_task(["a.py"], updated=2)) is True
+        assert snapshot.is_stale(None) is True
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / "scope.json").write_text("{not json")
+
+        assert load_snapshot(tmp_path) is None
+
+
+class TestGuardCheckFastPath:
+    """Check answers from the snapshot without touching Beads."""
+
+    @patch("sdp.cli.guard.create_beads_client")
+    def test_check_does_not_call_beads(self, mock_create_client: Mock) -> None:
+        runner = CliRunner()
+        mock_client = Mock()
+        mock_client.get_task.return_value = _task(["src/sdp/guard/", "*.md"])
+        mock_create_client.return_value = mock_client
+
+        result = runner.invoke(main, ["guard", "activate", "00-032-01"])
+        assert result.exit_code == 0
+        mock_create_client.reset_mock()
+        mock_create_client.side_effect = AssertionError("Beads used on hot path")
+
+        allowed = runner.invoke(main, ["guard", "check", "src/sdp/guard/state.py"])
+        denied = runner.invoke(main, ["guard", "check", "src/sdp/cli/guard.py"])
+        glob = runner.invoke(main, ["guard", "check", "README.md"])
+
+        assert allowed.exit_code == 0
+        assert denied.exit_code == 1
+        assert glob.exit_code == 0
+        mock_create_client.assert_not_called()
+
+    @patch("sdp.cli.guard.create_beads_client")
+    def test_refresh_rewrites_stale_snapshot(self, mock_create_client: Mock) -> None:
+        runner = CliRunner()
+        mock_client = Mock()
+        mock_client.get_task.return_value = _task(["a.py"])
+        mock_create_client.return_value = mock_client
+        runner.invoke(main, ["guard", "activate", "00-032-01"])
+
+        result = runner.invoke(main, ["guard", "refresh"])
+        assert "up to date" in result.output
+
+        mock_client.get_task.return_value = _task(["a.py", "b.py"], updated=2)
+        result = runner.invoke(main, ["guard", "refresh"])
+        assert result.exit_code == 0
+        assert "refreshed" in result.output
+        assert runner.invoke(main, ["guard", "check", "b.py"]).exit_code == 0
+
+    @patch("sdp.cli.guard.create_beads_client")
+    def test_deactivate_removes_snapshot(self, mock_create_client: Mock) -> None:
+        runner = CliRunner()
+        mock_client = Mock()
+        mock_client.get_task.return_value = _task(["a.py"])
+        mock_create_client.return_value = mock_client
+        runner.invoke(main, ["guard", "activate", "00-032-01"])
+
+        runner.invoke(main, ["guard", "deactivate"])
+
+        assert load_snapshot(StateManager.snapshot_dir()) is None
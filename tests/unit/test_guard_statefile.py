@@ -0,0 +1,144 @@
+"""Tests for atomic, lock-protected guard state files."""
+
+import json
+import multiprocessing
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from sdp.beads.mock import MockBeadsClient
+from sdp.beads.models import BeadsTaskCreate
+from sdp.guard.state import GuardState, StateManager
+from sdp.guard.statefile import StateConflictError, StateFile, StateFileError
+from sdp.guard.tracker import WorkstreamTracker
+
+PROCESSES = 50
+INCREMENTS = 20
+
+
+def _increment(path: str, count: int) -> None:
+    state = StateFile(Path(path))
+    for _ in range(count):
+        state.update(lambda data: {**data, "counter": data.get("counter", 0) + 1})
+
+
+def _read_loop(path: str, reads: int, errors: "multiprocessing.Queue[str]") -> None:
+    for _ in range(reads):
+        try:
+            with open(path) as f:
+                json.load(f)
+        except FileNotFoundError:
+            continue
+        except ValueError as e:
+            errors.put(str(e))
+
+
+class TestStateFile:
+    """Test StateFile reads, writes and versions."""
+
+    def test_missing_file_reads_version_zero(self, tmp_path: Path) -> None:
+        assert StateFile(tmp_path / "state.json").read() == {"version": 0}
+
+    def test_write_bumps_version(self, tmp_path: Path) -> None:
+        state = StateFile(tmp_path / ".sdp" / "state.json")
+
+        assert state.write({"active_ws": "00-001-01"}) == 1
+        assert state.write({"active_ws": "00-001-02", "version": 99}) == 2
+        assert state.read() == {"active_ws": "00-001-02", "version": 2}
+        assert not list(tmp_path.glob(".sdp/.state.json.*.tmp"))
+
+    def test_expected_version_conflict(self, tmp_path: Path) -> None:
+        state = StateFile(tmp_path / "state.json")
+        version = state.write({"active_ws": "00-001-01"})
+        state.write({"active_ws": "00-001-02"})
+
+        with pytest.raises(StateConflictError) as exc_info:
+            state.write({"active_ws": "00-001-03"}, expected_version=version)
+
+        assert exc_info.value.expected == 1
+        assert exc_info.value.actual == 2
+        assert state.read()["active_ws"] == "00-001-02"
+
+    def test_corrupt_file_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        path.write_text('{"active_ws": "00-0')
+
+        with pytest.raises(StateFileError, match="Corrupt state file"):
+            StateFile(path).read()
+
+    def test_lock_is_reentrant(self, tmp_path: Path) -> None:
+        state = StateFile(tmp_path / "state.json")
+
+        with state.locked():
+            with StateFile(tmp_path / "state.json").locked():
+                state.update(lambda data: {"n": 1})
+
+        assert state.read() == {"n": 1, "version": 1}
+
+    def test_threads_do_not_lose_updates(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        threads = [threading.Thread(target=_increment, args=(str(path), 25)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert StateFile(path).read() == {"counter": 200, "version": 200}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl locks are POSIX only")
+def test_concurrent_processes_stress(tmp_path: Path) -> None:
+    """50 writer processes and readers: no lost updates, no torn reads."""
+    path = str(tmp_path / "state.json")
+    ctx = multiprocessing.get_context("fork")
+    errors: "multiprocessing.Queue[str]" = ctx.Queue()
+    workers = [ctx.Process(target=_increment, args=(path, INCREMENTS)) for _ in range(PROCESSES)]
+    readers = [ctx.Process(target=_read_loop, args=(path, 500, errors)) for _ in range(4)]
+
+    for process in workers + readers:
+        process.start()
+    for process in workers + readers:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+
+    assert errors.empty()
+    data = StateFile(Path(path)).read()
+    assert data["counter"] == PROCESSES * INCREMENTS
+    assert data["version"] == PROCESSES * INCREMENTS
+
+
+class TestGuardStateFiles:
+    """StateManager and WorkstreamTracker share the state file format."""
+
+    def test_state_manager_round_trip(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(StateManager, "STATE_FILE", tmp_path / ".sdp" / "state.json")
+        state = GuardState(active_ws="00-001-01", scope_files=["src/a.py"])
+
+        StateManager.save(state)
+
+        assert state.version == 1
+        loaded = StateManager.load()
+        assert loaded.active_ws == "00-001-01"
+        assert loaded.version == 1
+
+    def test_state_manager_cas(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(StateManager, "STATE_FILE", tmp_path / ".sdp" / "state.json")
+        stale = StateManager.load()
+        StateManager.save(GuardState(active_ws="00-001-01"))
+
+        with pytest.raises(StateConflictError):
+            StateManager.save(GuardState(active_ws="00-001-02"), expected_version=stale.version)
+
+    def test_state_manager_reads_tracker_state(self, tmp_path: Path) -> None:
+        path = tmp_path / ".sdp" / "state.json"
+        client = MockBeadsClient()
+        task = client.create_task(BeadsTaskCreate(title="WS"))
+        WorkstreamTracker(client, path).activate(task.id)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(StateManager, "STATE_FILE", path)
+            assert StateManager.load().active_ws == task.id
@@ -4,7 +4,7 @@ import pytest
 
 from sdp.beads.mock import MockBeadsClient
 from sdp.beads.models import BeadsTaskCreate
-from sdp.beads.scope_manager import ScopeManager
+from sdp.beads.scope_manager import ScopeConflictError, ScopeManager
 
 
 class TestScopeManager:
@@ -158,3 +158,152 @@ class TestScopeManager:
         scope = manager.get_scope(task.id)
         assert scope == []
         assert manager.is_in_scope(task.id, "any/file.py") is True
+
+
+class CountingClient(MockBeadsClient):
+    """Mock client that counts Beads round trips."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+        self.writes = 0
+
+    def get_task(self, task_id):  # type: ignore[no-untyped-def]
+        self.reads += 1
+        return super().get_task(task_id)
+
+    def update_metadata(self, task_id, metadata):  # type: ignore[no-untyped-def]
+        self.writes += 1
+        super().update_metadata(task_id, metadata)
+
+
+class TestApplyScopePatch:
+    """Test batched scope patches with optimistic concurrency."""
+
+    def test_large_patch_costs_one_write(self) -> None:
+        """A 200-file patch is one read and one write."""
+        client = CountingClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+        files = [f"src/file{i}.py" for i in range(200)]
+
+        version = manager.apply_scope_patch(task.id, add=files)
+
+        assert version == 1
+        assert client.writes == 1
+        assert client.reads == 1
+        assert manager.get_scope(task.id) == files
+
+    @pytest.mark.parametrize("method", ["add_file", "remove_file"])
+    def test_single_file_costs_one_read_and_one_write(self, method: str) -> None:
+        client = CountingClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+        manager.set_scope(task.id, ["a.py"])
+        client.reads = client.writes = 0
+
+        getattr(manager, method)(task.id, "b.py" if method == "add_file" else "a.py")
+
+        assert (client.reads, client.writes) == (1, 1)
+
+    def test_verify_reads_back(self) -> None:
+        client = CountingClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+
+        assert manager.apply_scope_patch(task.id, add=["a.py"], verify=True) == 1
+        assert (client.reads, client.writes) == (2, 1)
+
+    def test_add_and_remove_keep_order(self) -> None:
+        client = MockBeadsClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+        manager.set_scope(task.id, ["a.py", "b.py", "c.py"])
+
+        version = manager.apply_scope_patch(
+            task.id, add=["d.py", "a.py", "d.py"], remove=["b.py", "zzz.py"]
+        )
+
+        assert manager.get_scope(task.id) == ["a.py", "c.py", "d.py"]
+        assert version == 2
+
+    def test_noop_patch_does_not_write(self) -> None:
+        client = CountingClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+        manager.set_scope(task.id, ["a.py"])
+        client.writes = 0
+
+        assert manager.apply_scope_patch(task.id, add=["a.py"], remove=["b.py"]) == 1
+        assert client.writes == 0
+
+    def test_overlapping_add_remove_rejected(self) -> None:
+        client = MockBeadsClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+
+        with pytest.raises(ValueError, match="both added and removed"):
+            manager.apply_scope_patch(task.id, add=["a.py"], remove=["a.py"])
+
+    def test_expected_version_mismatch(self) -> None:
+        client = MockBeadsClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+        version = manager.get_scope_version(task.id)
+        manager.add_file(task.id, "other.py")  # Another agent
+
+        with pytest.raises(ScopeConflictError):
+            manager.apply_scope_patch(task.id, add=["a.py"], expected_version=version)
+        assert manager.get_scope(task.id) == ["other.py"]
+
+    def test_lost_update_is_reapplied(self) -> None:
+        """A concurrent write landing after ours is merged, not lost."""
+        client = MockBeadsClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+        other = ScopeManager(client)
+        original = client.update_metadata
+        raced = []
+
+        def racing_update(task_id, metadata):  # type: ignore[no-untyped-def]
+            original(task_id, metadata)
+            if not raced:
+                raced.append(True)
+                original(task_id, {"scope_files": ["theirs.py"], "scope_version": 1})
+
+        client.update_metadata = racing_update  # type: ignore[method-assign]
+
+        version = manager.apply_scope_patch(task.id, add=["ours.py"], verify=True)
+        client.update_metadata = original  # type: ignore[method-assign]
+
+        assert version == 2
+        assert other.get_scope(task.id) == ["theirs.py", "ours.py"]
+
+    def test_same_version_and_scope_from_other_writer_is_detected(self) -> None:
+        """Another writer storing the same version and scope is not mistaken for us."""
+        client = CountingClient()
+        task = client.create_task(BeadsTaskCreate(title="Test Task"))
+        manager = ScopeManager(client)
+        original = MockBeadsClient.update_metadata
+        raced = []
+
+        def racing_update(task_id, metadata):  # type: ignore[no-untyped-def]
+            client.writes += 1
+            original(client, task_id, metadata)
+            if not raced:
+                raced.append(True)
+                original(
+                    client,
+                    task_id,
+                    {"scope_files": ["a.py"], "scope_version": 1, "scope_writer": "other"},
+                )
+
+        client.update_metadata = racing_update  # type: ignore[method-assign]
+
+        version = manager.apply_scope_patch(task.id, add=["a.py"], verify=True)
+
+        assert version == 1
+        assert client.reads == 2
+        stored = MockBeadsClient.get_task(client, task.id)
+        assert stored is not None
+        assert stored.sdp_metadata["scope_writer"] == "other"
@@ -115,9 +115,7 @@ class TestApprovalGateManager:
         updated_checkpoint = checkpoint_repo.load_checkpoint("F01")
         assert updated_checkpoint is not None
 
-        gates = GateStorage.extract_gates_from_checkpoint(
-            updated_checkpoint
-        )
+        gates = GateStorage.load_gates(checkpoint_repo, updated_checkpoint)
         requirements_gate = next(
             (g for g in gates if g.gate_type == GateType.REQUIREMENTS),
             None,
@@ -146,9 +144,7 @@ class TestApprovalGateManager:
         updated_checkpoint = checkpoint_repo.load_checkpoint("F01")
         assert updated_checkpoint is not None
 
-        gates = GateStorage.extract_gates_from_checkpoint(
-            updated_checkpoint
-        )
+        gates = GateStorage.load_gates(checkpoint_repo, updated_checkpoint)
         architecture_gate = next(
             (g for g in gates if g.gate_type == GateType.ARCHITECTURE),
             None,
@@ -171,9 +167,7 @@ class TestApprovalGateManager:
         )
 
         updated_checkpoint = checkpoint_repo.load_checkpoint("F01")
-        gates = GateStorage.extract_gates_from_checkpoint(
-            updated_checkpoint
-        )
+        gates = GateStorage.load_gates(checkpoint_repo, updated_checkpoint)
         uat_gate = next(
             (g for g in gates if g.gate_type == GateType.UAT),
             None,
@@ -198,9 +192,7 @@ class TestApprovalGateManager:
         )
 
         updated_checkpoint = checkpoint_repo.load_checkpoint("F01")
-        gates = GateStorage.extract_gates_from_checkpoint(
-            updated_checkpoint
-        )
+        gates = GateStorage.load_gates(checkpoint_repo, updated_checkpoint)
         requirements_gate = next(
             (g for g in gates if g.gate_type == GateType.REQUIREMENTS),
             None,
@@ -226,9 +218,7 @@ class TestApprovalGateManager:
         )
 
         updated_checkpoint = checkpoint_repo.load_checkpoint("F01")
-        gates = GateStorage.extract_gates_from_checkpoint(
-            updated_checkpoint
-        )
+        gates = GateStorage.load_gates(checkpoint_repo, updated_checkpoint)
         architecture_gate = next(
             (g for g in gates if g.gate_type == GateType.ARCHITECTURE),
             None,
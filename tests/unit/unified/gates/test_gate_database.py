@@ -0,0 +1,152 @@
+"""Tests for the gate_results table and the gate database."""
+
+import json
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.checkpoint.schema import Checkpoint, CheckpointStatus
+from sdp.unified.gates.database import GateDatabase
+from sdp.unified.gates.manager import ApprovalGateManager
+from sdp.unified.gates.models import GateType
+
+
+@pytest.fixture
+def checkpoint_repo(tmp_path):
+    """Create checkpoint repository with one checkpoint for F01."""
+    repo = CheckpointRepository(str(tmp_path / "test.db"))
+    repo.initialize()
+    repo.save_checkpoint(
+        Checkpoint(
+            feature="F01",
+            agent_id="agent-001",
+            status=CheckpointStatus.IN_PROGRESS,
+            completed_ws=[],
+            execution_order=["WS-001"],
+            started_at=datetime.now(),
+        )
+    )
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def gate_db(checkpoint_repo):
+    """Gate database on the repository's connection."""
+    db = GateDatabase.for_repository(checkpoint_repo)
+    yield db
+    db.close()
+
+
+class TestGateDatabase:
+    """Tests for GateDatabase."""
+
+    def test_uses_repository_connection(self, checkpoint_repo, gate_db):
+        """Should write through the repository's connection and leave it open."""
+        assert gate_db.db is checkpoint_repo.database
+        assert gate_db.events is checkpoint_repo.events
+
+        gate_db.close()
+
+        assert checkpoint_repo.load_checkpoint("F01") is not None
+
+    def test_latest_results_per_gate(self, gate_db):
+        """Should return the newest result of each gate of the feature."""
+        gate_db.record_result("F01", "lint", "failed", ws_id="WS-001", duration=1.5)
+        gate_db.record_result("F01", "lint", "passed", ws_id="WS-001", payload={"warnings": 2})
+        gate_db.record_result("F01", "tests", "passed")
+        gate_db.record_result("F02", "lint", "failed")
+
+        latest = gate_db.latest_results("F01")
+
+        assert set(latest) == {"lint", "tests"}
+        assert latest["lint"].status == "passed"
+        assert latest["lint"].payload == {"warnings": 2}
+        assert latest["lint"].ws_id == "WS-001"
+
+    def test_pass_rate_history(self, gate_db):
+        """Should group results per period and count passes."""
+        for status in ("passed", "failed", "passed", "approved"):
+            gate_db.record_result("F01", "lint", status)
+        gate_db.record_result("F02", "lint", "failed")
+
+        [overall] = gate_db.pass_rate_history("lint")
+        [feature] = gate_db.pass_rate_history("lint", feature="F01", period="month")
+
+        assert (overall.total, overall.passed) == (5, 3)
+        assert feature.rate == 0.75
+        assert len(feature.period) == 7  # YYYY-MM
+
+    def test_rejects_unknown_period(self, gate_db):
+        """Should only accept known periods."""
+        with pytest.raises(ValueError, match="period"):
+            gate_db.pass_rate_history("lint", period="year")
+
+
+class TestApprovalGateResults:
+    """Tests for approval decisions landing in gate_results."""
+
+    def test_decisions_are_recorded(self, checkpoint_repo, gate_db):
+        """Should append one row per approve/reject/skip decision."""
+        manager = ApprovalGateManager(checkpoint_repo)
+
+        manager.reject("F01", GateType.REQUIREMENTS, "alice", comments="Missing AC")
+        manager.approve("F01", GateType.REQUIREMENTS, "bob")
+        manager.skip("F01", GateType.UAT, reason="internal tool")
+
+        latest = gate_db.latest_results("F01")
+        assert latest["requirements"].status == "approved"
+        assert latest["requirements"].payload["approved_by"] == "bob"
+        assert latest["uat"].status == "skipped"
+        assert gate_db.pass_rate_history("requirements")[0].total == 2
+        assert manager.get_gate_status("F01", GateType.UAT).value == "skipped"
+        checkpoint = checkpoint_repo.load_checkpoint("F01")
+        assert "approval_gates" not in checkpoint.metrics
+
+
+def test_migration_backfills_gate_results(tmp_path):
+    """Should copy decided gates out of checkpoint metrics on upgrade."""
+    db_path = tmp_path / "old.db"
+    repo = CheckpointRepository(str(db_path))
+    repo.initialize()
+    gates = [
+        {
+            "gate_type": "requirements",
+            "status": "approved",
+            "approved_by": "bob",
+            "approved_at": "2026-01-05T10:00:00",
+            "comments": None,
+        },
+        {
+            "gate_type": "uat",
+            "status": "pending",
+            "approved_by": None,
+            "approved_at": None,
+            "comments": None,
+        },
+    ]
+    repo.save_checkpoint(
+        Checkpoint(
+            feature="F01",
+            agent_id="agent-001",
+            status=CheckpointStatus.COMPLETED,
+            completed_ws=[],
+            execution_order=[],
+            started_at=datetime.now(),
+            metrics={"approval_gates": gates},
+        )
+    )
+    repo.close()
+    conn = sqlite3.connect(db_path)
+    conn.executescript("DROP TABLE gate_results; DELETE FROM schema_version WHERE version >= 4;")
+    conn.close()
+
+    db = GateDatabase(str(db_path))
+    latest = db.latest_results("F01")
+    db.close()
+
+    assert list(latest) == ["requirements"]
+    assert latest["requirements"].recorded_at == datetime(2026, 1, 5, 10)
+    assert json.dumps(latest["requirements"].payload) == '{"approved_by": "bob", "comments": null}'
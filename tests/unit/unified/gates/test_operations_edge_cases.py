@@ -45,8 +45,7 @@ class TestApproveGate:
     def test_approve_gate_creates_new_gate(self, mock_storage, mock_checkpoint_repo, mock_checkpoint):
         """Test creates new gate if not found."""
         mock_checkpoint_repo.load_checkpoint.return_value = mock_checkpoint
-        mock_storage.get_checkpoint_id.return_value = "checkpoint123"
-        mock_storage.extract_gates_from_checkpoint.return_value = []
+        mock_storage.load_gates.return_value = []
         mock_storage.find_gate.return_value = None
 
         GateOperations.approve_gate(
@@ -57,12 +56,11 @@ class TestApproveGate:
             comments="LGTM",
         )
 
-        # Verify new gate was added to gates list
-        save_call = mock_storage.save_gates_to_checkpoint.call_args
-        saved_gates = save_call[0][1]
-        assert len(saved_gates) == 1
-        assert saved_gates[0].gate_type == GateType.REQUIREMENTS
-        assert saved_gates[0].status == ApprovalStatus.APPROVED
+        # Verify the new gate was recorded
+        record_call = mock_storage.record_gate.call_args
+        recorded_gate = record_call[0][2]
+        assert recorded_gate.gate_type == GateType.REQUIREMENTS
+        assert recorded_gate.status == ApprovalStatus.APPROVED
 
     @patch('sdp.unified.gates.operations.GateStorage')
     def test_approve_gate_updates_existing_gate(self, mock_storage, mock_checkpoint_repo, mock_checkpoint):
@@ -73,8 +71,7 @@ class TestApproveGate:
         )
 
         mock_checkpoint_repo.load_checkpoint.return_value = mock_checkpoint
-        mock_storage.get_checkpoint_id.return_value = "checkpoint123"
-        mock_storage.extract_gates_from_checkpoint.return_value = [existing_gate]
+        mock_storage.load_gates.return_value = [existing_gate]
         mock_storage.find_gate.return_value = existing_gate
 
         GateOperations.approve_gate(
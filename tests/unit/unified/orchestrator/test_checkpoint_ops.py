@@ -11,7 +11,7 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from sdp.unified.checkpoint.repository import CheckpointRepository
-from sdp.unified.checkpoint.schema import CheckpointStatus
+from sdp.unified.checkpoint.schema import Checkpoint, CheckpointStatus
 from sdp.unified.orchestrator.checkpoint_ops import CheckpointOperations
 from sdp.unified.orchestrator.checkpoint import CheckpointFileManager
 from sdp.unified.gates.manager import ApprovalGateManager
@@ -27,10 +27,12 @@ def temp_checkpoint_dir(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def mock_repo() -> MagicMock:
-    """Create mock CheckpointRepository."""
-    repo = MagicMock(spec=CheckpointRepository)
-    return repo
+def checkpoint_repo(tmp_path: Path) -> CheckpointRepository:
+    """Create initialized CheckpointRepository."""
+    repo = CheckpointRepository(str(tmp_path / "checkpoints.db"))
+    repo.initialize()
+    yield repo
+    repo.close()
 
 
 @pytest.fixture
@@ -40,49 +42,75 @@ def checkpoint_file_manager(temp_checkpoint_dir: Path) -> CheckpointFileManager:
 
 
 @pytest.fixture
-def checkpoint_ops(mock_repo: MagicMock, checkpoint_file_manager: CheckpointFileManager) -> CheckpointOperations:
+def checkpoint_ops(
+    checkpoint_repo: CheckpointRepository, checkpoint_file_manager: CheckpointFileManager
+) -> CheckpointOperations:
     """Create CheckpointOperations instance."""
-    return CheckpointOperations(checkpoint_file_manager, mock_repo)
+    return CheckpointOperations(checkpoint_file_manager, checkpoint_repo)
+
+
+def _save_db_checkpoint(repo: CheckpointRepository, metrics: dict) -> None:
+    repo.save_checkpoint(
+        Checkpoint(
+            feature="F01",
+            agent_id="agent-123",
+            status=CheckpointStatus.IN_PROGRESS,
+            completed_ws=[],
+            execution_order=["WS-001"],
+            started_at=datetime.now(),
+            metrics=metrics,
+        )
+    )
 
 
 class TestCheckpointOperationsSaveCheckpoint:
     """Test save_checkpoint error handling."""
 
-    def test_save_checkpoint_handles_gate_manager_exception(
-        self, checkpoint_ops: CheckpointOperations, mock_repo: MagicMock
+    def test_save_checkpoint_writes_database_then_file(
+        self, checkpoint_ops: CheckpointOperations, checkpoint_repo: CheckpointRepository
     ):
-        """Should handle exception when loading gate state."""
-        gate_manager = MagicMock(spec=ApprovalGateManager)
-        checkpoint_ops.set_gate_manager(gate_manager)
-
-        # Mock load_checkpoint to raise exception
-        mock_repo.load_checkpoint.side_effect = Exception("Load failed")
-
-        # Should not raise, just log warning
+        """Should store the checkpoint in the database and export it."""
         checkpoint_ops.save_checkpoint(
             feature_id="F01",
             agent_id="agent-123",
-            workstreams=["WS-001"],
-            completed_workstreams=[],
-            current_workstream="WS-001",
+            workstreams=["WS-001", "WS-002"],
+            completed_workstreams=["WS-001"],
+            current_workstream="WS-002",
             status=CheckpointStatus.IN_PROGRESS,
         )
 
-        # Checkpoint should still be saved
+        checkpoint = checkpoint_repo.load_checkpoint("F01")
+        assert checkpoint.completed_ws == ["WS-001"]
+        assert checkpoint.current_ws == "WS-002"
         checkpoint_file = checkpoint_ops.checkpoint_manager.base_path / "F01-checkpoint.json"
-        assert checkpoint_file.exists()
+        data = json.loads(checkpoint_file.read_text())
+        assert data["version"] == checkpoint.version
 
-    def test_save_checkpoint_handles_gate_manager_without_metrics(
-        self, checkpoint_ops: CheckpointOperations, mock_repo: MagicMock
+    def test_save_checkpoint_updates_active_checkpoint(
+        self, checkpoint_ops: CheckpointOperations, checkpoint_repo: CheckpointRepository
+    ):
+        """Should update the active checkpoint in place instead of adding rows."""
+        for completed in ([], ["WS-001"]):
+            checkpoint_ops.save_checkpoint(
+                feature_id="F01",
+                agent_id="agent-123",
+                workstreams=["WS-001", "WS-002"],
+                completed_workstreams=completed,
+                current_workstream="WS-002",
+                status=CheckpointStatus.IN_PROGRESS,
+            )
+
+        checkpoint = checkpoint_repo.load_checkpoint("F01")
+        assert checkpoint.id == 1
+        assert checkpoint.completed_ws == ["WS-001"]
+
+    def test_save_checkpoint_without_gate_metrics(
+        self, checkpoint_ops: CheckpointOperations, checkpoint_repo: CheckpointRepository
     ):
-        """Should handle checkpoint without metrics."""
+        """Should not include gates when the checkpoint has none."""
         gate_manager = MagicMock(spec=ApprovalGateManager)
         checkpoint_ops.set_gate_manager(gate_manager)
-
-        # Mock checkpoint without metrics
-        mock_checkpoint = MagicMock()
-        mock_checkpoint.metrics = None
-        mock_repo.load_checkpoint.return_value = mock_checkpoint
+        _save_db_checkpoint(checkpoint_repo, {})
 
         checkpoint_ops.save_checkpoint(
             feature_id="F01",
@@ -126,16 +154,12 @@ class TestCheckpointOperationsSaveCheckpoint:
         assert checkpoint_file.exists()
 
     def test_save_checkpoint_includes_gates_when_available(
-        self, checkpoint_ops: CheckpointOperations, mock_repo: MagicMock
+        self, checkpoint_ops: CheckpointOperations, checkpoint_repo: CheckpointRepository
     ):
-        """Should include gates when checkpoint has metrics."""
+        """Should keep and export gates stored in the checkpoint metrics."""
         gate_manager = MagicMock(spec=ApprovalGateManager)
         checkpoint_ops.set_gate_manager(gate_manager)
-
-        # Mock checkpoint with gates in metrics
-        mock_checkpoint = MagicMock()
-        mock_checkpoint.metrics = {"gates": {"requirements": {"status": "approved"}}}
-        mock_repo.load_checkpoint.return_value = mock_checkpoint
+        _save_db_checkpoint(checkpoint_repo, {"gates": {"requirements": {"status": "approved"}}})
 
         checkpoint_ops.save_checkpoint(
             feature_id="F01",
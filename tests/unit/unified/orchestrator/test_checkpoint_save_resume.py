@@ -9,7 +9,8 @@ import json
 import pytest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, Mock
+from typing import Iterator
+from unittest.mock import Mock
 
 from sdp.unified.checkpoint.repository import CheckpointRepository
 from sdp.unified.checkpoint.schema import Checkpoint, CheckpointStatus
@@ -31,11 +32,12 @@ def temp_checkpoint_dir(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def mock_repo() -> MagicMock:
-    """Create mock CheckpointRepository."""
-    repo = MagicMock(spec=CheckpointRepository)
-    repo.initialize = MagicMock()
-    return repo
+def checkpoint_repo(tmp_path: Path) -> Iterator[CheckpointRepository]:
+    """Create initialized CheckpointRepository."""
+    repo = CheckpointRepository(str(tmp_path / "checkpoints.db"))
+    repo.initialize()
+    yield repo
+    repo.close()
 
 
 @pytest.fixture
@@ -45,11 +47,13 @@ def checkpoint_file_manager(temp_checkpoint_dir: Path) -> CheckpointFileManager:
 
 
 @pytest.fixture
-def checkpoint_extension(mock_repo: MagicMock, temp_checkpoint_dir: Path) -> AgentCheckpointExtension:
+def checkpoint_extension(
+    checkpoint_repo: CheckpointRepository, temp_checkpoint_dir: Path
+) -> AgentCheckpointExtension:
     """Create AgentCheckpointExtension with checkpoint file manager."""
     from sdp.unified.orchestrator.agent_extension import AgentCheckpointExtension
 
-    extension = AgentCheckpointExtension(mock_repo)
+    extension = AgentCheckpointExtension(checkpoint_repo)
     checkpoint_manager = CheckpointFileManager(str(temp_checkpoint_dir))
     extension.set_checkpoint_manager(checkpoint_manager)
     return extension
@@ -229,7 +233,7 @@ class TestOrchestratorAgentSaveCheckpoint:
         gate_manager = ApprovalGateManager(checkpoint_extension.repo)
         checkpoint_extension.set_gate_manager(gate_manager)
 
-        # Mock checkpoint repo to return gates
+        # Gate state stored in the database checkpoint
         mock_checkpoint = Checkpoint(
             feature="F01",
             agent_id="agent-123",
@@ -239,7 +243,7 @@ class TestOrchestratorAgentSaveCheckpoint:
             started_at=datetime.now(),
             metrics={"gates": {"requirements": {"status": "approved"}}},
         )
-        checkpoint_extension.repo.load_checkpoint.return_value = mock_checkpoint
+        checkpoint_extension.repo.save_checkpoint(mock_checkpoint)
 
         checkpoint_extension.save_checkpoint(
             feature_id="F01",
@@ -385,7 +389,7 @@ class TestOrchestratorAgentResumeCheckpoint:
         gate_manager = ApprovalGateManager(checkpoint_extension.repo)
         checkpoint_extension.set_gate_manager(gate_manager)
 
-        # Mock checkpoint repo
+        # Gate state stored in the database checkpoint
         mock_checkpoint = Checkpoint(
             feature="F01",
             agent_id="agent-123",
@@ -395,7 +399,7 @@ class TestOrchestratorAgentResumeCheckpoint:
             started_at=datetime.now(),
             metrics={"gates": checkpoint_data["gates"]},
         )
-        checkpoint_extension.repo.load_checkpoint.return_value = mock_checkpoint
+        checkpoint_extension.repo.save_checkpoint(mock_checkpoint)
 
         resumed_data = checkpoint_extension.resume_from_checkpoint(
             feature_id="F01", agent_id="agent-123"
@@ -470,7 +474,7 @@ class TestOrchestratorAgentCheckpointIntegration:
         with open(checkpoint_file, "w") as f:
             json.dump(checkpoint_data, f)
 
-        # Mock checkpoint repo
+        # Gate state stored in the database checkpoint
         mock_checkpoint = Checkpoint(
             feature="F01",
             agent_id="agent-123",
@@ -480,7 +484,7 @@ class TestOrchestratorAgentCheckpointIntegration:
             started_at=datetime.now(),
             metrics={"gates": checkpoint_data["gates"]},
         )
-        checkpoint_extension.repo.load_checkpoint.return_value = mock_checkpoint
+        checkpoint_extension.repo.save_checkpoint(mock_checkpoint)
 
         # Resume and verify gate is still skipped
         resumed_data = checkpoint_extension.resume_from_checkpoint(
@@ -0,0 +1,139 @@
+"""Tests for CheckpointStore: database source of truth, file exports, reconcile."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.checkpoint.schema import CheckpointStatus
+from sdp.unified.orchestrator.agent_extension import AgentCheckpointExtension
+from sdp.unified.orchestrator.checkpoint import CheckpointFileManager
+from sdp.unified.orchestrator.checkpoint_store import CheckpointStore, to_file_data
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> CheckpointRepository:
+    """Create initialized CheckpointRepository."""
+    repo = CheckpointRepository(str(tmp_path / "checkpoints.db"))
+    repo.initialize()
+    yield repo
+    repo.close()
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> CheckpointFileManager:
+    """Create CheckpointFileManager in a temporary .oneshot directory."""
+    return CheckpointFileManager(str(tmp_path / ".oneshot"))
+
+
+@pytest.fixture
+def store(repo: CheckpointRepository, files: CheckpointFileManager) -> CheckpointStore:
+    """Create CheckpointStore."""
+    return CheckpointStore(repo, files)
+
+
+def _save(store: CheckpointStore, feature_id: str = "F01", completed=None):
+    return store.save(
+        feature_id,
+        "agent-123",
+        ["WS-001", "WS-002"],
+        completed or [],
+        "WS-001",
+        CheckpointStatus.IN_PROGRESS,
+    )
+
+
+def _legacy_file(files: CheckpointFileManager, feature_id: str, **data) -> Path:
+    path = files.base_path / f"{feature_id}-checkpoint.json"
+    path.write_text(json.dumps({"feature_id": feature_id, "agent_id": "agent-123", **data}))
+    return path
+
+
+class TestAtomicExport:
+    """Test checkpoint file writes."""
+
+    def test_save_leaves_no_temp_files(self, store, files):
+        """Should rename the temporary file over the checkpoint file."""
+        _save(store)
+
+        assert [p.name for p in files.base_path.iterdir()] == ["F01-checkpoint.json"]
+
+    def test_failed_write_keeps_previous_file(self, store, files):
+        """Should leave the old file intact if the new one cannot be written."""
+        _save(store)
+        before = files.load_checkpoint("F01")
+
+        with patch("json.dump", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                _save(store, completed=["WS-001"])
+
+        assert files.load_checkpoint("F01") == before
+        assert files.remove_temp_files() == 0
+        # The database commit went through; the next startup re-exports it
+        assert store.reconcile().repaired == ["F01"]
+
+
+class TestReconcile:
+    """Test repairing divergence between files and the database."""
+
+    def test_repairs_file_behind_database(self, store, repo, files):
+        """Should re-export a file missing the last commit (crash before export)."""
+        checkpoint = _save(store)
+        repo.update_checkpoint_status(checkpoint.id, CheckpointStatus.FAILED, ["WS-001"])
+
+        result = store.reconcile()
+
+        assert result.repaired == ["F01"]
+        assert files.load_checkpoint("F01") == to_file_data(repo.load_checkpoint("F01"))
+        assert store.reconcile().repaired == []
+
+    def test_exports_active_checkpoint_without_file(self, store, files):
+        """Should recreate a deleted checkpoint file."""
+        _save(store)
+        files.delete_checkpoint("F01")
+
+        assert store.reconcile().repaired == ["F01"]
+        assert files.checkpoint_exists("F01")
+
+    def test_imports_legacy_files(self, store, repo, files):
+        """Should load files without a database checkpoint into the database."""
+        _legacy_file(files, "F02", completed_workstreams=["WS-001"], workstreams=["WS-001"])
+        _legacy_file(files, "F03", status="bogus")
+
+        result = store.reconcile()
+
+        assert result.imported == ["F02"]
+        assert repo.load_checkpoint("F02").completed_ws == ["WS-001"]
+        assert repo.load_checkpoint("F03") is None
+
+    def test_removes_temp_files(self, store, files):
+        """Should delete temporary files of interrupted saves."""
+        (files.base_path / ".F01-checkpoint.json.1.2.tmp").write_text("{")
+
+        assert store.reconcile().temp_files_removed == 1
+
+    def test_runs_when_checkpointing_starts(self, repo, files):
+        """Should reconcile when the extension gets its checkpoint manager."""
+        _legacy_file(files, "F01")
+        extension = AgentCheckpointExtension(repo)
+
+        extension.set_checkpoint_manager(files)
+
+        assert repo.load_checkpoint("F01") is not None
+
+
+class TestLoad:
+    """Test reading checkpoints."""
+
+    def test_database_wins_over_file(self, store, files):
+        """Should return database state even if the file says otherwise."""
+        _save(store, completed=["WS-001"])
+        _legacy_file(files, "F01", completed_workstreams=[])
+
+        assert store.load("F01")["completed_workstreams"] == ["WS-001"]
+
+    def test_missing(self, store):
+        """Should return None without a checkpoint."""
+        assert store.load("F99") is None
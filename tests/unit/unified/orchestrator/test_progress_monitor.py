@@ -0,0 +1,109 @@
+"""Tests for multi-feature progress queries and change subscriptions."""
+
+import queue
+from datetime import datetime
+
+import pytest
+
+from sdp.unified.checkpoint.events import EventType
+from sdp.unified.checkpoint.progress import ChangeWatcher
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.checkpoint.schema import Checkpoint, CheckpointStatus
+from sdp.unified.orchestrator.monitor import ProgressMonitor
+
+
+@pytest.fixture
+def repo(tmp_path) -> CheckpointRepository:
+    """Create initialized CheckpointRepository."""
+    repo = CheckpointRepository(str(tmp_path / "checkpoints.db"))
+    repo.initialize()
+    yield repo
+    repo.close()
+
+
+def _save(repo: CheckpointRepository, feature: str, completed: list[str]) -> int:
+    return repo.save_checkpoint(
+        Checkpoint(
+            feature=feature,
+            agent_id="agent-123",
+            status=CheckpointStatus.IN_PROGRESS,
+            completed_ws=completed,
+            execution_order=["WS-001", "WS-002", "WS-003", "WS-004"],
+            started_at=datetime.now(),
+            current_ws="WS-002",
+        )
+    )
+
+
+class TestProgressForFeatures:
+    """Test the aggregated progress query."""
+
+    def test_matches_single_feature_progress(self, repo):
+        """Should return the same metrics as get_progress for each feature."""
+        _save(repo, "F01", ["WS-001"])
+        _save(repo, "F02", [])
+        monitor = ProgressMonitor(repo)
+
+        progress = monitor.progress_for_features(["F01", "F02", "F99"])
+
+        assert progress == {f: monitor.get_progress(f) for f in ("F01", "F02")}
+        assert progress["F01"]["percentage"] == 25
+
+    def test_uses_latest_checkpoint(self, repo):
+        """Should report the newest checkpoint of a feature."""
+        _save(repo, "F01", ["WS-001"])
+        latest = _save(repo, "F01", [])
+        repo.update_checkpoint_status(latest, CheckpointStatus.COMPLETED, ["WS-001", "WS-002"])
+
+        progress = ProgressMonitor(repo).progress_for_features(["F01"])["F01"]
+
+        assert progress["completed_workstreams"] == 2
+        assert progress["status"] == "completed"
+
+
+class TestChangeSubscription:
+    """Test data_version based change detection."""
+
+    def test_watcher_sees_commits(self, repo):
+        """Should report a change once per commit by another connection."""
+        watcher = ChangeWatcher(repo.database)
+        assert not watcher.changed()
+
+        _save(repo, "F01", [])
+
+        assert watcher.changed()
+        assert not watcher.changed()
+        watcher.close()
+
+    def test_subscriber_gets_only_changed_features(self, repo):
+        """Should call back with features whose progress changed."""
+        f01 = _save(repo, "F01", [])
+        _save(repo, "F02", [])
+        updates: queue.Queue = queue.Queue()
+        subscription = ProgressMonitor(repo).subscribe(
+            ["F01", "F02"], updates.put, poll_interval=0.01
+        )
+
+        repo.events.append("F02", EventType.WS_STARTED, "WS-001")  # No progress change
+        repo.update_checkpoint_status(f01, CheckpointStatus.IN_PROGRESS, ["WS-001"])
+        update = updates.get(timeout=5)
+        subscription.close()
+
+        assert list(update) == ["F01"]
+        assert update["F01"]["completed_workstreams"] == 1
+        assert updates.empty()
+
+    def test_subscriber_on_in_memory_database(self):
+        """Should fall back to re-querying every interval for :memory:."""
+        repo = CheckpointRepository(":memory:")
+        repo.initialize()
+        f01 = _save(repo, "F01", [])
+        updates: queue.Queue = queue.Queue()
+        subscription = ProgressMonitor(repo).subscribe(["F01"], updates.put, poll_interval=0.01)
+
+        repo.update_checkpoint_status(f01, CheckpointStatus.IN_PROGRESS, ["WS-001"])
+        update = updates.get(timeout=5)
+        subscription.close()
+        repo.close()
+
+        assert update["F01"]["completed_workstreams"] == 1
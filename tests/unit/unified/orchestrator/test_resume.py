@@ -0,0 +1,108 @@
+"""Tests for set-based resume of orchestrated features."""
+
+from datetime import datetime
+
+import pytest
+
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.checkpoint.schema import Checkpoint, CheckpointStatus
+from sdp.unified.orchestrator.agent import OrchestratorAgent
+from sdp.unified.orchestrator.errors import ExecutionError
+from sdp.unified.orchestrator.resume import plan_resume
+
+WORKSTREAMS = ["WS-001", "WS-002", "WS-003", "WS-004"]
+DEPENDENCIES = {"WS-002": ["WS-001"], "WS-003": ["WS-001"], "WS-004": ["WS-002", "WS-003"]}
+
+
+@pytest.fixture
+def repo(tmp_path) -> CheckpointRepository:
+    """Create initialized CheckpointRepository."""
+    repo = CheckpointRepository(str(tmp_path / "checkpoints.db"))
+    repo.initialize()
+    yield repo
+    repo.close()
+
+
+def _interrupted(repo: CheckpointRepository, completed: list[str]) -> None:
+    repo.save_checkpoint(
+        Checkpoint(
+            feature="F01",
+            agent_id="agent-123",
+            status=CheckpointStatus.IN_PROGRESS,
+            completed_ws=completed,
+            execution_order=WORKSTREAMS,
+            started_at=datetime.now(),
+        )
+    )
+
+
+class TestPlanResume:
+    """Test computing the remaining work."""
+
+    def test_out_of_order_completions(self):
+        """Should keep completions that finished out of list order."""
+        plan = plan_resume(WORKSTREAMS, ["WS-001", "WS-003"], DEPENDENCIES)
+
+        assert plan.completed == ["WS-001", "WS-003"]
+        assert plan.remaining == ["WS-002", "WS-004"]
+        assert plan.ready == ["WS-002"]
+
+    def test_list_order_without_dependencies(self):
+        """Should run exactly the uncompleted workstreams, not those after the last one."""
+        plan = plan_resume(WORKSTREAMS, ["WS-003", "WS-001"])
+
+        assert plan.completed == ["WS-003", "WS-001"]
+        assert plan.remaining == ["WS-002", "WS-004"]
+        assert plan.ready == ["WS-002"]
+
+    def test_edited_list(self):
+        """Should drop removed workstreams and re-run ones with a new prerequisite."""
+        workstreams = ["WS-001", "WS-000", "WS-002", "WS-003"]
+        dependencies = {"WS-002": ["WS-000", "WS-001"], "WS-003": ["WS-002"]}
+
+        plan = plan_resume(workstreams, ["WS-001", "WS-002", "WS-003", "WS-009"], dependencies)
+
+        assert plan.completed == ["WS-001"]
+        assert plan.dropped == ["WS-009"]
+        assert plan.stale == ["WS-002", "WS-003"]
+        assert plan.remaining == ["WS-000", "WS-002", "WS-003"]
+        assert plan.ready == ["WS-000"]
+
+    def test_rejects_unknown_dependencies(self):
+        """Should reject prerequisites missing from the workstream list."""
+        with pytest.raises(ValueError, match="WS-404"):
+            plan_resume(["WS-001"], [], {"WS-001": ["WS-404"]})
+
+
+class TestAgentResume:
+    """Test OrchestratorAgent resuming from the checkpoint."""
+
+    def test_runs_only_remaining_workstreams(self, repo):
+        """Should skip every completed workstream and keep them in the checkpoint."""
+        _interrupted(repo, ["WS-001", "WS-003"])
+        agent = OrchestratorAgent(repo)
+        dispatched = []
+        agent._dispatch_single_workstream = dispatched.append
+
+        result = agent.execute_feature("F01", WORKSTREAMS, "agent-123", DEPENDENCIES)
+
+        assert dispatched == ["WS-002", "WS-004"]
+        assert result.completed_workstreams == WORKSTREAMS[:1] + ["WS-003", "WS-002", "WS-004"]
+        assert repo.load_checkpoint("F01").status == CheckpointStatus.COMPLETED
+
+    def test_progress_keeps_earlier_completions(self, repo):
+        """Should not lose resumed-over completions if the run fails again."""
+        _interrupted(repo, ["WS-001"])
+        agent = OrchestratorAgent(repo)
+
+        def dispatch(ws_id):
+            if ws_id == "WS-004":
+                raise RuntimeError("boom")
+
+        agent._dispatch_single_workstream = dispatch
+        with pytest.raises(ExecutionError):
+            agent.execute_feature("F01", WORKSTREAMS, "agent-123", DEPENDENCIES)
+
+        completed = repo.load_checkpoint("F01").completed_ws
+        assert completed[0] == "WS-001"
+        assert sorted(completed) == ["WS-001", "WS-002", "WS-003"]
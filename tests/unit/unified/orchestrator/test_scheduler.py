@@ -0,0 +1,124 @@
+"""Tests for dependency-aware workstream scheduling."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from sdp.unified.checkpoint.repository import CheckpointRepository
+from sdp.unified.orchestrator.agent import OrchestratorAgent
+from sdp.unified.orchestrator.errors import ExecutionError
+from sdp.unified.orchestrator.scheduler import WorkstreamScheduler
+
+# WS-001 -> WS-002 -> WS-004, WS-001 -> WS-003, WS-005 independent
+DEPENDENCIES = {
+    "WS-002": ["WS-001"],
+    "WS-003": ["WS-001"],
+    "WS-004": ["WS-002"],
+}
+WORKSTREAMS = ["WS-001", "WS-002", "WS-003", "WS-004", "WS-005"]
+
+
+class Recorder:
+    """Records start/finish order and peak concurrency of executed workstreams."""
+
+    def __init__(self, fail=(), delay=0.02):
+        self.fail = set(fail)
+        self.delay = delay
+        self.finished: list[str] = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, ws_id: str) -> None:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+            self.finished.append(ws_id)
+        if ws_id in self.fail:
+            raise RuntimeError(f"{ws_id} broke")
+
+
+class TestWorkstreamScheduler:
+    """Test DAG-driven execution."""
+
+    def test_runs_independent_workstreams_concurrently(self):
+        """Should run ready workstreams in parallel, dependents after prerequisites."""
+        recorder = Recorder()
+
+        result = WorkstreamScheduler(WORKSTREAMS, DEPENDENCIES, max_workers=4).run(recorder)
+
+        assert result.is_success
+        assert sorted(result.completed) == WORKSTREAMS
+        assert recorder.peak >= 2
+        order = recorder.finished
+        assert order.index("WS-001") < order.index("WS-002") < order.index("WS-004")
+        assert order.index("WS-001") < order.index("WS-003")
+
+    def test_respects_worker_limit(self):
+        """Should never run more than max_workers workstreams at once."""
+        recorder = Recorder()
+
+        WorkstreamScheduler([f"WS-{i:03d}" for i in range(8)], {}, max_workers=3).run(recorder)
+
+        assert recorder.peak == 3
+
+    def test_defaults_to_list_order(self):
+        """Should run one after another without dependencies."""
+        recorder = Recorder(delay=0)
+
+        result = WorkstreamScheduler(WORKSTREAMS, max_workers=4).run(recorder)
+
+        assert result.completed == WORKSTREAMS
+        assert recorder.peak == 1
+
+    def test_failure_cancels_only_downstream(self):
+        """Should skip dependents of a failed workstream and finish the rest."""
+        failures = []
+        recorder = Recorder(fail={"WS-002"})
+
+        result = WorkstreamScheduler(WORKSTREAMS, DEPENDENCIES).run(
+            recorder, on_failure=lambda ws_id, e: failures.append(ws_id)
+        )
+
+        assert result.failed == {"WS-002": "WS-002 broke"}
+        assert result.cancelled == ["WS-004"]
+        assert sorted(result.completed) == ["WS-001", "WS-003", "WS-005"]
+        assert "WS-004" not in recorder.finished
+        assert failures == ["WS-002"]
+
+    def test_external_dependencies_are_satisfied(self):
+        """Should treat prerequisites outside the run as done."""
+        result = WorkstreamScheduler(["WS-002"], DEPENDENCIES).run(Recorder(delay=0))
+
+        assert result.completed == ["WS-002"]
+
+    def test_rejects_cycles(self):
+        """Should refuse circular dependencies before running anything."""
+        with pytest.raises(ValueError, match="Circular dependency"):
+            WorkstreamScheduler(["WS-001", "WS-002"], {"WS-001": ["WS-002"], "WS-002": ["WS-001"]})
+
+    def test_rejects_invalid_worker_limit(self):
+        """Should require at least one worker."""
+        with pytest.raises(ValueError):
+            WorkstreamScheduler(WORKSTREAMS, max_workers=0)
+
+
+class TestAgentDispatch:
+    """Test OrchestratorAgent dispatch along dependencies."""
+
+    def test_checkpoint_records_completions_of_surviving_branches(self):
+        """Should checkpoint independent work before reporting the failure."""
+        mock_repo = Mock(spec=CheckpointRepository)
+        agent = OrchestratorAgent(mock_repo, max_workers=2)
+        agent._dispatch_single_workstream = Recorder(fail={"WS-001"})
+
+        with pytest.raises(ExecutionError, match="WS-001: WS-001 broke"):
+            agent.dispatch_workstreams(WORKSTREAMS, 1, 0, dependencies=DEPENDENCIES)
+
+        last = mock_repo.update_checkpoint_status.call_args.kwargs
+        assert last["completed_ws"] == ["WS-005"]